@@ -0,0 +1,253 @@
+"""
+🚦 ADMISSION CONTROL MODULE
+Concurrency limit, bounded wait queue and load shedding for analyses
+
+Flask runs every request on its own thread, and each analysis tokenizes
+all paragraphs and may lazy-load models, so unbounded concurrency ends in
+swap or OOM. Analysis requests now pass through an admission controller:
+
+- At most ADMISSION_MAX_CONCURRENT analyses run at once; up to
+  ADMISSION_MAX_QUEUE more wait (FIFO) for a slot
+- A full queue, or a wait longer than ADMISSION_QUEUE_TIMEOUT (or the
+  request budget), is answered at once with 503 and a Retry-After
+  estimated from recent analysis times
+- A client with ADMISSION_MAX_PER_CLIENT analyses already running or
+  waiting gets 429
+- When ADMISSION_DEGRADE_QUEUE or more requests are waiting, newly admitted
+  analyses run degraded: the expensive optional stages (Groq agents, image
+  analysis, claim web search) are skipped so the backlog drains faster
+
+Queued jobs and the batch CLI have their own bounded workers and do not go
+through admission.
+
+Author: AI Misinformation Detector
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+# Configuration
+ADMISSION_MAX_CONCURRENT = int(os.getenv('ADMISSION_MAX_CONCURRENT', '4'))
+ADMISSION_MAX_QUEUE = int(os.getenv('ADMISSION_MAX_QUEUE', '16'))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv('ADMISSION_QUEUE_TIMEOUT', '30'))  # Seconds a request may wait for a slot
+ADMISSION_DEGRADE_QUEUE = int(os.getenv('ADMISSION_DEGRADE_QUEUE', '4'))  # Waiting requests that trigger degraded mode (0 = never)
+ADMISSION_MAX_PER_CLIENT = int(os.getenv('ADMISSION_MAX_PER_CLIENT', '0'))  # Analyses per client address (0 = no limit)
+ADMISSION_TRUSTED_PROXIES = int(os.getenv('ADMISSION_TRUSTED_PROXIES', '0'))  # Reverse proxies that append X-Forwarded-For
+RETRY_AFTER_MIN = 1
+RETRY_AFTER_MAX = 120
+SERVICE_TIME_ALPHA = 0.2  # Weight of the newest analysis in the moving average
+
+
+class Overloaded(Exception):
+    """The request was shed; carries the HTTP status and Retry-After seconds"""
+
+    def __init__(self, reason: str, status: int = 503, retry_after: int = RETRY_AFTER_MIN):
+        super().__init__(reason)
+        self.status = status
+        self.retry_after = retry_after
+
+
+@dataclass
+class Ticket:
+    """An admitted analysis; release() frees its slot"""
+    controller: 'AdmissionController'
+    client: str
+    degraded: bool
+    waited: float
+    admitted_at: float
+    released: bool = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.controller._release(self)
+
+
+class AdmissionController:
+    """
+    Counting semaphore with a bounded FIFO wait queue
+
+    A released slot is handed straight to the oldest waiter, so late
+    arrivals cannot overtake queued requests.
+    """
+
+    def __init__(self, max_concurrent: int = ADMISSION_MAX_CONCURRENT, max_queue: int = ADMISSION_MAX_QUEUE,
+                 queue_timeout: float = ADMISSION_QUEUE_TIMEOUT, degrade_queue: int = ADMISSION_DEGRADE_QUEUE,
+                 max_per_client: int = ADMISSION_MAX_PER_CLIENT):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self.degrade_queue = degrade_queue
+        self.max_per_client = max_per_client
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: Deque[threading.Event] = deque()
+        self._per_client: Dict[str, int] = {}
+        self._service_time = 10.0  # Seconds, moving average of admitted analyses
+
+        self.stats = {'admitted': 0, 'degraded': 0, 'rejected_queue_full': 0,
+                      'rejected_timeout': 0, 'rejected_client_limit': 0}
+
+    def admit(self, client: str = '', timeout: Optional[float] = None) -> Ticket:
+        """
+        Wait for a slot (at most `timeout` or the queue timeout)
+
+        Raises:
+            Overloaded: 429 if the client is over its limit, 503 if the
+                queue is full or no slot freed up in time
+        """
+        timeout = self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+        started = time.monotonic()
+
+        with self._lock:
+            if self.max_per_client and self._per_client.get(client, 0) >= self.max_per_client:
+                self.stats['rejected_client_limit'] += 1
+                raise Overloaded(f"Too many concurrent analyses from this client (limit {self.max_per_client})",
+                                 status=429, retry_after=self._retry_after_locked())
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                return self._ticket_locked(client, started)
+            if len(self._waiters) >= self.max_queue:
+                self.stats['rejected_queue_full'] += 1
+                raise Overloaded('Server is at capacity, try again later', retry_after=self._retry_after_locked())
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+            self._per_client[client] = self._per_client.get(client, 0) + 1
+
+        granted = waiter.wait(max(0.0, timeout))
+        with self._lock:
+            if not granted and not waiter.is_set():
+                self._waiters.remove(waiter)
+                self._drop_client_locked(client)
+                self.stats['rejected_timeout'] += 1
+                raise Overloaded('Timed out waiting for an analysis slot', retry_after=self._retry_after_locked())
+            # The releasing thread handed its slot over (self._active unchanged)
+            self._drop_client_locked(client)
+            return self._ticket_locked(client, started)
+
+    def _ticket_locked(self, client: str, started: float) -> Ticket:
+        degraded = self.should_degrade()
+        self._per_client[client] = self._per_client.get(client, 0) + 1
+        self.stats['admitted'] += 1
+        if degraded:
+            self.stats['degraded'] += 1
+        now = time.monotonic()
+        return Ticket(controller=self, client=client, degraded=degraded, waited=now - started, admitted_at=now)
+
+    def _release(self, ticket: Ticket):
+        with self._lock:
+            self._drop_client_locked(ticket.client)
+            elapsed = time.monotonic() - ticket.admitted_at
+            self._service_time += SERVICE_TIME_ALPHA * (elapsed - self._service_time)
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._active -= 1
+
+    def _drop_client_locked(self, client: str):
+        count = self._per_client.get(client, 0) - 1
+        if count > 0:
+            self._per_client[client] = count
+        else:
+            self._per_client.pop(client, None)
+
+    def _retry_after_locked(self) -> int:
+        """Seconds until the current queue has likely drained"""
+        estimate = self._service_time * (len(self._waiters) + 1) / self.max_concurrent
+        return int(min(RETRY_AFTER_MAX, max(RETRY_AFTER_MIN, math.ceil(estimate))))
+
+    def should_degrade(self) -> bool:
+        """True while the wait queue is at or above the degrade threshold"""
+        return bool(self.degrade_queue) and len(self._waiters) >= self.degrade_queue
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'active': self._active,
+                'waiting': len(self._waiters),
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'degraded_mode': self.should_degrade(),
+                'avg_service_seconds': round(self._service_time, 2),
+                **self.stats,
+            }
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get or create the admission controller singleton"""
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AdmissionController()
+    return _controller
+
+
+def client_address(headers, remote_addr: Optional[str], trusted_proxies: int = ADMISSION_TRUSTED_PROXIES) -> str:
+    """
+    Client key for per-client limits
+
+    The socket peer address, unless the server sits behind trusted_proxies
+    reverse proxies: then the X-Forwarded-For hop the outermost of them
+    appended (counted from the right). Hops further left are sent by the
+    client and never used.
+    """
+    if trusted_proxies > 0:
+        hops = [hop.strip() for hop in headers.get('X-Forwarded-For', '').split(',') if hop.strip()]
+        if len(hops) >= trusted_proxies:
+            return hops[-trusted_proxies]
+    return remote_addr or ''
+
+
+# Test function
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("ADMISSION CONTROL TEST")
+    print("=" * 60)
+
+    controller = AdmissionController(max_concurrent=2, max_queue=2, queue_timeout=0.5, degrade_queue=1,
+                                     max_per_client=2)
+    held = [controller.admit('a'), controller.admit('b')]
+    print(f"Admitted 2: {controller.get_stats()['active']} active")
+
+    results = []
+
+    def waiter(name):
+        try:
+            ticket = controller.admit(name)
+            results.append((name, 'admitted', ticket.degraded, round(ticket.waited, 2)))
+            time.sleep(0.05)
+            ticket.release()
+        except Overloaded as e:
+            results.append((name, e.status, e.retry_after))
+
+    threads = [threading.Thread(target=waiter, args=(f"w{i}",)) for i in range(2)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    try:
+        controller.admit('late')
+    except Overloaded as e:
+        print(f"Queue full -> {e.status}, Retry-After {e.retry_after}s")
+    held[0].release()
+    held[1].release()
+    for t in threads:
+        t.join()
+    print(f"Waiters: {results}")
+
+    try:
+        tickets = [controller.admit('greedy') for _ in range(3)]
+    except Overloaded as e:
+        print(f"Per-client limit -> {e.status}")
+    print(f"Stats: {controller.get_stats()}")
+    print("=" * 60)
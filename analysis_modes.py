@@ -0,0 +1,190 @@
+"""
+🎚️ ANALYSIS MODES MODULE
+Fast, standard and deep analysis tiers
+
+A client picks a tier with "mode" (body field or ?mode=). Every tier
+returns the same response schema; the 'components' field lists what ran,
+so the extension can show a fast verdict at once and upgrade it by asking
+again in a deeper mode.
+
+- fast: RoBERTa on the whole text plus the regex phases (linguistic,
+  sources, entities, propaganda, network patterns). No lazy-loaded models,
+  spaCy, per-paragraph scoring or outbound calls; targets < 200 ms warm
+- standard: the full model ensemble and classifiers, per-paragraph
+  scoring and every local phase (claims without web search, verification
+  against the local knowledge snapshot, contradictions). No external I/O
+- deep: everything, including Groq agents, claim web search, live
+  verification APIs and image analysis (the behaviour before tiers)
+
+Each tier has its own default time budget, used when the client sends no
+deadline.
+
+Progressive analysis ("progressive": true or ?progressive=1) answers with
+a fast first pass and queues a deep refinement job; the response carries
+its analysis id (the job id) for polling or the SSE event stream. The
+first-pass phase results travel with the job and are reused there, not
+computed again.
+
+Author: AI Misinformation Detector
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+from request_context import REQUEST_DEADLINE_DEFAULT
+
+# Configuration
+ANALYSIS_MODE_DEFAULT = os.getenv('ANALYSIS_MODE_DEFAULT', 'deep').lower()
+ANALYSIS_FAST_BUDGET = float(os.getenv('ANALYSIS_FAST_BUDGET', '5'))  # Seconds
+ANALYSIS_STANDARD_BUDGET = float(os.getenv('ANALYSIS_STANDARD_BUDGET', '30'))  # Seconds
+
+# ========================================
+# COMPONENTS
+# ========================================
+
+# Local, cheap (regex/keyword) phases - run in every tier
+FAST_COMPONENTS = frozenset({
+    'fake_news_model',    # RoBERTa score of the whole text
+    'linguistic',         # Phase 1.1
+    'sources',            # Phase 1.3
+    'entities',           # Phase 2.1
+    'propaganda',         # Phase 2.2
+    'network_analysis',   # Phase 3.2
+})
+
+# Local but heavier: lazy-loaded models, spaCy, SQLite snapshot
+STANDARD_COMPONENTS = FAST_COMPONENTS | {
+    'ensemble',              # BERT #2, Pulk17 and custom model votes
+    'classifiers',           # Emotion, NER, hate speech, clickbait, bias
+    'paragraphs',            # Per-paragraph scoring (chunks)
+    'claims',                # Phase 1.2 claim extraction
+    'verification_network',  # Phase 2.3 against the local knowledge snapshot
+    'contradictions',        # Phase 3.1
+}
+
+# Everything that calls out to other services
+DEEP_COMPONENTS = STANDARD_COMPONENTS | {
+    'groq_agents',        # Research, analysis and conclusion agents
+    'ai_explanations',    # Groq explanations of the detection phases
+    'ai_summary',         # Groq combined summary
+    'claim_web_search',   # Fact-checker and web searches per claim
+    'live_verification',  # Live Wikipedia/Wikidata/PubMed/arXiv fallback
+    'images',             # Image download and AI-image detection
+}
+
+
+@dataclass(frozen=True)
+class AnalysisMode:
+    """One analysis tier"""
+    name: str
+    budget: float  # Default time budget (seconds)
+    components: FrozenSet[str]
+    description: str
+
+    def to_dict(self) -> Dict:
+        return {
+            'budget_seconds': self.budget,
+            'components': sorted(self.components),
+            'description': self.description,
+        }
+
+
+ANALYSIS_MODES: Dict[str, AnalysisMode] = {
+    'fast': AnalysisMode('fast', ANALYSIS_FAST_BUDGET, FAST_COMPONENTS,
+                         'RoBERTa and regex phases, no external I/O (instant verdict)'),
+    'standard': AnalysisMode('standard', ANALYSIS_STANDARD_BUDGET, STANDARD_COMPONENTS,
+                             'Model ensemble and all local phases, no external I/O'),
+    'deep': AnalysisMode('deep', REQUEST_DEADLINE_DEFAULT, DEEP_COMPONENTS,
+                         'Everything, including Groq agents, web search and image analysis'),
+}
+
+
+def get_mode(name: Optional[str]) -> AnalysisMode:
+    """
+    Mode by name (empty means ANALYSIS_MODE_DEFAULT)
+
+    Raises:
+        ValueError: unknown mode
+    """
+    key = str(name or ANALYSIS_MODE_DEFAULT).strip().lower()
+    if key not in ANALYSIS_MODES:
+        raise ValueError(f"Unknown analysis mode '{name}' (expected one of: {', '.join(ANALYSIS_MODES)})")
+    return ANALYSIS_MODES[key]
+
+
+def requested_mode(args: Mapping, body: Optional[Dict] = None) -> AnalysisMode:
+    """Mode asked for by the client (?mode= or body field), else the default"""
+    value = args.get('mode') if args is not None else None
+    if value is None and isinstance(body, dict):
+        value = body.get('mode')
+    return get_mode(value)
+
+
+# ========================================
+# PROGRESSIVE ANALYSIS
+# ========================================
+
+PROGRESSIVE_FIRST_PASS = 'fast'
+PROGRESSIVE_REFINEMENT = 'deep'
+FIRST_PASS_KEY = '_first_pass'  # Job payload field with the reusable first-pass results
+
+# Component -> response field holding its result, for the phases a
+# refinement can take over unchanged from the first pass
+REUSABLE_RESULTS = {
+    'linguistic': 'linguistic_fingerprint',
+    'sources': 'source_credibility',
+    'entities': 'entity_verification',
+    'propaganda': 'propaganda_analysis',
+    'network_analysis': 'network_analysis',
+}
+
+
+def progressive_requested(args: Mapping, body: Optional[Dict] = None) -> bool:
+    """True if the client asked for a progressive analysis (?progressive=1 or body field)"""
+    value = args.get('progressive') if args is not None else None
+    if value is None and isinstance(body, dict):
+        value = body.get('progressive')
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def first_pass_results(completed: Dict[str, Any], roberta_score: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Results of a first pass that a refinement can reuse
+
+    completed holds the phase results that finished (RequestContext.completed);
+    phases that failed or ran out of time are not in it, so their fallback
+    values are never handed on. roberta_score is the whole-text RoBERTa
+    score if one was computed (the refinement's ensemble reuses it as the
+    RoBERTa vote).
+    """
+    results = {key: completed[key] for key in REUSABLE_RESULTS.values() if key in completed}
+    if roberta_score is not None:
+        results['fake_news_model'] = roberta_score
+    return results
+
+
+def describe_modes() -> Dict:
+    """Tiers for /health"""
+    return {'default': get_mode(None).name, **{name: mode.to_dict() for name, mode in ANALYSIS_MODES.items()}}
+
+
+# Test function
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("ANALYSIS MODES TEST")
+    print("=" * 60)
+
+    for mode in ANALYSIS_MODES.values():
+        print(f"{mode.name:9} {mode.budget:5.0f}s  {len(mode.components):2} components - {mode.description}")
+    print(f"Only in deep: {sorted(DEEP_COMPONENTS - STANDARD_COMPONENTS)}")
+    print(f"From query: {requested_mode({'mode': 'FAST'}).name}, from body: {requested_mode({}, {'mode': 'standard'}).name}")
+    print(f"Default: {requested_mode({}, {}).name}")
+    print(f"Progressive: {progressive_requested({'progressive': '1'})}, {progressive_requested({}, {'progressive': False})}")
+    completed = {'linguistic_fingerprint': {'fingerprint_score': 12}, 'claim_verification': {'total_claims': 0}}
+    print(f"Reusable: {first_pass_results(completed, 41.5)}")
+    try:
+        get_mode('turbo')
+    except ValueError as e:
+        print(f"Invalid: {e}")
+    print("=" * 60)
@@ -0,0 +1,600 @@
+"""
+⏱️ LINKSCOUT BENCHMARK
+End-to-end performance benchmark with offline service stubs
+
+    python benchmark.py --iterations 3 --concurrency 1,4,8
+    python benchmark.py --latency groq=1.2 --compare benchmark_results/previous.json
+
+Groq, Google, DuckDuckGo, Wikipedia/Wikidata, PubMed and arXiv are
+replaced by local stubs: a transport adapter mounted on the shared HTTP
+session answers every outbound request with a canned response after a
+fixed, configurable latency (a latency above the call's read timeout
+raises a timeout, like the real service would). Runs are repeatable and
+never touch the network or the API quotas.
+
+Workloads: HARD_TEST_SAMPLES from accuracy_test_real.py plus synthetic
+long articles (seeded), run through
+
+- each analysis phase function on its own (per-phase latency)
+- /api/v1/analyze-chunks and /quick-test (end-to-end latency)
+- /api/v1/analyze-chunks with N concurrent clients (throughput)
+
+Reports p50/p95 latency, requests/s and peak RSS, and writes the results
+as JSON for comparison with earlier runs (--compare).
+
+In-process caches (ML predictions, claim verdicts, Google results) are
+cleared before every measured phase and endpoint call unless --warm-caches
+is given. Throughput runs clear them once per run only: concurrent clients
+then share warm caches as on a live server, so with --iterations > 1 the
+repeated samples are cache hits.
+
+Author: AI Misinformation Detector
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Stub latencies (seconds), roughly the median of the real services
+STUB_LATENCY = {
+    'groq': 0.6,
+    'google': 0.15,
+    'duckduckgo': 0.2,
+    'wikipedia': 0.08,
+    'wikidata': 0.08,
+    'pubmed': 0.15,
+    'arxiv': 0.2,
+    'default': 0.1
+}
+
+BENCHMARK_SEED = 1337
+BENCHMARK_RESULTS_DIR = 'benchmark_results'
+LONG_ARTICLE_PARAGRAPHS = 40
+
+
+# ========================================
+# SERVICE STUBS
+# ========================================
+
+def _service(host: str) -> str:
+    for name in ('groq', 'google', 'duckduckgo', 'wikipedia', 'wikidata', 'arxiv'):
+        if name in host:
+            return name
+    if host.endswith('ncbi.nlm.nih.gov'):
+        return 'pubmed'
+    return 'default'
+
+
+_GROQ_REPLY = """**WHAT IS CORRECT:**
+Some of the named organisations and events exist.
+
+**WHAT IS WRONG:**
+The central claims are not supported by any credible source.
+
+**WHAT THE INTERNET SAYS:**
+Fact-checkers have reviewed similar claims and rated them false.
+
+**MY RECOMMENDATION:**
+Verify the claims with primary sources before sharing.
+
+**WHY THIS MATTERS:**
+Unverified claims spread quickly and shape public opinion."""
+
+_ARXIV_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>arXiv Query</title>
+<entry><title>A Study of Benchmark Claims</title><summary>Benchmark stub abstract.</summary></entry>
+</feed>"""
+
+_DDG_PAGE = """<html><body>
+<a href="https://www.snopes.com/fact-check/example">snopes.com fact check</a>
+<a href="https://en.wikipedia.org/wiki/Example">wikipedia.org</a>
+<a href="https://www.cdc.gov/example">cdc.gov</a>
+</body></html>"""
+
+_DEFAULT_PAGE = """<html><head><title>Benchmark stub page</title></head>
+<body><article><p>Officials confirmed the figures in a statement on Tuesday.</p>
+<p>The report was published by the national statistics office.</p></article></body></html>"""
+
+
+def _stub_body(service: str, request: requests.PreparedRequest) -> Tuple[str, object]:
+    """(content type, body) of the canned response for a request"""
+    params = {key: values[0] for key, values in parse_qs(urlparse(request.url).query).items()}
+
+    if service == 'groq':
+        return 'application/json', {
+            'id': 'benchmark', 'object': 'chat.completion',
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': _GROQ_REPLY}}]
+        }
+    if service == 'google':
+        return 'application/json', {'items': [
+            {'title': f"Fact check result {i}", 'link': f"https://www.factcheck.org/benchmark/{i}",
+             'snippet': 'Fact-checkers rated this claim false.'} for i in range(1, 6)
+        ]}
+    if service == 'duckduckgo':
+        return 'text/html', _DDG_PAGE
+    if service == 'wikipedia':
+        if params.get('action') == 'opensearch':
+            term = params.get('search', 'Example')
+            return 'application/json', [term, [term.title()], [''], [f"https://en.wikipedia.org/wiki/{term.title()}"]]
+        titles = params.get('titles', 'Example')
+        return 'application/json', {'query': {'pages': {
+            str(i): {'pageid': i, 'title': title, 'extract': f"{title} is described in this benchmark extract."}
+            for i, title in enumerate(titles.split('|'), 1)
+        }}}
+    if service == 'wikidata':
+        term = params.get('search', 'Example')
+        return 'application/json', {'search': [{'id': 'Q1', 'label': term, 'description': 'benchmark entity'}]}
+    if service == 'pubmed':
+        if 'esearch' in request.url:
+            return 'application/json', {'esearchresult': {'idlist': ['100001', '100002']}}
+        return 'application/json', {'result': {'uids': ['100001'], '100001': {'title': 'Benchmark study'}}}
+    if service == 'arxiv':
+        return 'application/atom+xml', _ARXIV_FEED
+    return 'text/html', _DEFAULT_PAGE
+
+
+class StubAdapter(BaseAdapter):
+    """
+    Transport adapter answering every request locally after a fixed latency
+    """
+
+    def __init__(self, latency: Dict[str, float]):
+        super().__init__()
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        service = _service(urlparse(request.url).hostname or '')
+        with self._lock:
+            self.calls[service] = self.calls.get(service, 0) + 1
+
+        delay = self.latency.get(service, self.latency.get('default', 0))
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            raise requests.exceptions.ReadTimeout(f"stub {service}: {delay}s exceeds read timeout {read_timeout}s",
+                                                  request=request)
+        time.sleep(delay)
+
+        content_type, body = _stub_body(service, request)
+        content = (body if isinstance(body, str) else json.dumps(body)).encode('utf-8')
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict({'Content-Type': f"{content_type}; charset=utf-8",
+                                                'Content-Length': str(len(content))})
+        response._content = content
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def install_stubs(latency: Dict[str, float]) -> StubAdapter:
+    """Route all outbound HTTP of the shared session to the stubs"""
+    from http_client import get_http_session
+
+    adapter = StubAdapter(latency)
+    session = get_http_session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+# ========================================
+# WORKLOADS
+# ========================================
+
+def load_samples(long_articles: int, seed: int = BENCHMARK_SEED) -> List[Dict]:
+    """HARD_TEST_SAMPLES plus seeded synthetic long articles"""
+    from accuracy_test_real import HARD_TEST_SAMPLES
+
+    samples = []
+    sentences = []
+    for sample in HARD_TEST_SAMPLES:
+        content = ' '.join(sample['content'].split())
+        samples.append({'name': f"hard-{sample['id']}", 'title': sample.get('description', ''),
+                        'paragraphs': [content]})
+        sentences.extend(s.strip() + '.' for s in content.split('.') if len(s.strip()) > 20)
+
+    rng = random.Random(seed)
+    for i in range(long_articles):
+        paragraphs = [' '.join(rng.choice(sentences) for _ in range(rng.randint(3, 6)))
+                      for _ in range(LONG_ARTICLE_PARAGRAPHS)]
+        samples.append({'name': f"long-{i + 1}", 'title': f"Synthetic long article {i + 1}",
+                        'paragraphs': paragraphs})
+    return samples
+
+
+def _payload(sample: Dict) -> Dict:
+    return {'paragraphs': sample['paragraphs'], 'title': sample['title'],
+            'url': f"https://news.example.com/{sample['name']}"}
+
+
+def _phases(server) -> List[Tuple[str, Callable[[Dict, Dict], object]]]:
+    """The analyze-chunks stages as (name, fn(sample, state)) in pipeline order"""
+    def content(sample):
+        return '\n\n'.join(sample['paragraphs'])
+
+    def claims(sample, state):
+        state['claims'] = server.verify_text_claims(content(sample), _payload(sample)['url'])
+        return state['claims']
+
+    def network(sample, state):
+        found = state.get('claims') or {}
+        return server.verify_claims_network([r['claim'] for r in found.get('detailed_results', []) if r.get('claim')])
+
+    return [
+        ('Pre-trained models', lambda s, st: server.analyze_with_pretrained_models(content(s))),
+        ('Research agent', lambda s, st: st.setdefault('research', server.groq_ai.research_agent(s['title'], content(s)))),
+        ('Analysis agent', lambda s, st: server.groq_ai.analysis_agent(content(s), st.get('research', {}))),
+        ('Phase 1.1 - Linguistic', lambda s, st: server.analyze_text_fingerprint(content(s))),
+        ('Phase 1.2 - Claims', claims),
+        ('Phase 1.3 - Sources', lambda s, st: server.analyze_text_sources(content(s))),
+        ('Phase 2.1 - Entities', lambda s, st: server.verify_text_entities(content(s))),
+        ('Phase 2.2 - Propaganda', lambda s, st: server.detect_text_propaganda(content(s))),
+        ('Phase 2.3 - Network Verification', network),
+        ('Phase 3.1 - Contradictions', lambda s, st: server.detect_text_contradictions(content(s))),
+        ('Phase 3.2 - Network Analysis', lambda s, st: server.analyze_network_patterns(content(s))),
+    ]
+
+
+# ========================================
+# MEASUREMENT
+# ========================================
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0-100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float], errors: int = 0) -> Dict:
+    """Latency statistics in milliseconds"""
+    return {
+        'count': len(latencies),
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 1),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+        'max_ms': round(max(latencies) * 1000, 1) if latencies else 0.0
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process (None if unavailable)"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)  # bytes on macOS, KB elsewhere
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)  # Windows
+    except (ImportError, AttributeError):
+        return None
+
+
+def reset_caches(server):
+    """Clear the in-process caches so every measured call does the full work"""
+    with server._ml_prediction_lock:
+        server._ml_prediction_cache.clear()
+    try:
+        from claim_verifier import get_claim_verifier
+        get_claim_verifier().claim_cache.clear()
+    except ImportError:
+        pass
+    try:
+        import google_search
+        with google_search._search_cache._lock:
+            google_search._search_cache._entries.clear()
+    except ImportError:
+        pass
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool):
+    """Silence the pipeline's console output and log while measuring"""
+    if not enabled:
+        yield
+        return
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        root.setLevel(level)
+
+
+class Benchmark:
+    """
+    Runs the workloads against an imported combined_server
+    """
+
+    def __init__(self, server, samples: List[Dict], iterations: int, warm_caches: bool,
+                 deadline: float, verbose: bool):
+        self.server = server
+        self.samples = samples
+        self.iterations = iterations
+        self.warm_caches = warm_caches
+        self.headers = {'X-Request-Deadline': str(deadline)}
+        self.verbose = verbose
+
+    def _timed(self, fn: Callable[[], object]) -> Tuple[float, bool]:
+        if not self.warm_caches:
+            reset_caches(self.server)
+        start = time.perf_counter()
+        try:
+            fn()
+            ok = True
+        except Exception as e:
+            ok = False
+            print(f"⚠️ [BENCH] {type(e).__name__}: {e}", file=sys.stderr)
+        return time.perf_counter() - start, ok
+
+    def run_phases(self) -> Dict[str, Dict]:
+        phases = _phases(self.server)
+        latencies: Dict[str, List[float]] = {name: [] for name, _ in phases}
+        errors = {name: 0 for name, _ in phases}
+        for _ in range(self.iterations):
+            for sample in self.samples:
+                state: Dict = {}
+                for name, fn in phases:
+                    with quiet(not self.verbose):
+                        elapsed, ok = self._timed(lambda: fn(sample, state))
+                    latencies[name].append(elapsed)
+                    errors[name] += 0 if ok else 1
+        return {name: summarize(latencies[name], errors[name]) for name, _ in phases}
+
+    def _post(self, client, path: str, body: Dict):
+        response = client.post(path, json=body, headers=self.headers)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} returned HTTP {response.status_code}")
+
+    def run_endpoint(self, path: str, body_for: Callable[[Dict], Dict]) -> Dict:
+        client = self.server.app.test_client()
+        latencies, errors = [], 0
+        for _ in range(self.iterations):
+            for sample in self.samples:
+                with quiet(not self.verbose):
+                    elapsed, ok = self._timed(lambda: self._post(client, path, body_for(sample)))
+                latencies.append(elapsed)
+                errors += 0 if ok else 1
+        return summarize(latencies, errors)
+
+    def run_throughput(self, clients: int) -> Dict:
+        """
+        analyze-chunks requests from N concurrent clients (each sample once per iteration)
+
+        Caches are cleared before the run, not per request - clearing them
+        under concurrent clients would race with their lookups.
+        """
+        work = [sample for _ in range(self.iterations) for sample in self.samples]
+        latencies = []
+        counts = {'errors': 0, 'rejected': 0, 'degraded': 0}  # Admission outcomes would skew req/s
+        lock = threading.Lock()
+        local = threading.local()
+
+        def one(sample):
+            if not hasattr(local, 'client'):
+                local.client = self.server.app.test_client()
+            start = time.perf_counter()
+            outcome = None
+            try:
+                response = local.client.post('/api/v1/analyze-chunks', json=_payload(sample), headers=self.headers)
+                if response.status_code in (429, 503):
+                    outcome = 'rejected'
+                elif response.status_code != 200:
+                    raise RuntimeError(f"/api/v1/analyze-chunks returned HTTP {response.status_code}")
+                elif ((response.get_json(silent=True) or {}).get('deadline') or {}).get('degraded'):
+                    outcome = 'degraded'
+            except Exception as e:
+                outcome = 'errors'
+                print(f"⚠️ [BENCH] {e}", file=sys.stderr)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                if outcome:
+                    counts[outcome] += 1
+
+        if not self.warm_caches:
+            reset_caches(self.server)
+        with quiet(not self.verbose):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=clients) as executor:
+                list(executor.map(one, work))
+            wall = time.perf_counter() - start
+
+        return dict(summarize(latencies, counts['errors']), clients=clients, seconds=round(wall, 2),
+                    requests_per_second=round(len(work) / wall, 3) if wall > 0 else 0.0,
+                    rejected=counts['rejected'], degraded=counts['degraded'])
+
+
+# ========================================
+# REPORTING
+# ========================================
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              timeout=5, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def print_report(results: Dict):
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK  {results['timestamp']}  (commit {results['environment']['git_commit']})")
+    print("=" * 70)
+    print(f"{'Stage':<40}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+    for section in ('phases', 'endpoints'):
+        for name, stats in results[section].items():
+            print(f"{name:<40}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['errors']:>8}")
+    print("-" * 70)
+    print("Throughput (caches shared across the run):")
+    for entry in results['throughput']:
+        print(f"{entry['clients']:>3} clients: {entry['requests_per_second']:.2f} req/s, "
+              f"p50 {entry['p50_ms']:.0f} ms, p95 {entry['p95_ms']:.0f} ms"
+              + (f", {entry.get('rejected', 0)} rejected, {entry.get('degraded', 0)} degraded"
+                 if entry.get('rejected') or entry.get('degraded') else ''))
+    print(f"Peak RSS: {results['peak_rss_mb']} MB")
+    print(f"Stub calls: {json.dumps(results['stub_calls'])}")
+    print("=" * 70)
+
+
+def print_comparison(results: Dict, baseline: Dict):
+    """p95 and throughput change against an earlier results file"""
+    print(f"\nCompared with {baseline['timestamp']} (commit {baseline['environment'].get('git_commit')}):")
+    for section in ('phases', 'endpoints'):
+        for name, stats in results[section].items():
+            before = baseline.get(section, {}).get(name)
+            if not before or not before['p95_ms']:
+                continue
+            change = (stats['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+            print(f"   {name:<40} p95 {before['p95_ms']:>9.1f} -> {stats['p95_ms']:>9.1f} ms ({change:+.1f}%)")
+    previous = {entry['clients']: entry for entry in baseline.get('throughput', [])}
+    for entry in results['throughput']:
+        before = previous.get(entry['clients'])
+        if before and before['requests_per_second']:
+            change = (entry['requests_per_second'] - before['requests_per_second']) / before['requests_per_second'] * 100
+            print(f"   {entry['clients']:>3} clients: {before['requests_per_second']:.2f} -> "
+                  f"{entry['requests_per_second']:.2f} req/s ({change:+.1f}%)")
+    if baseline.get('peak_rss_mb') and results.get('peak_rss_mb'):
+        print(f"   Peak RSS: {baseline['peak_rss_mb']} -> {results['peak_rss_mb']} MB")
+
+
+# ========================================
+# COMMAND LINE
+# ========================================
+
+def _parse_latency(values: List[str]) -> Dict[str, float]:
+    latency = dict(STUB_LATENCY)
+    for value in values:
+        service, _, seconds = value.partition('=')
+        if service not in latency or not seconds:
+            raise SystemExit(f"--latency expects SERVICE=SECONDS with SERVICE in {', '.join(latency)}")
+        latency[service] = float(seconds)
+    return latency
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='LinkScout end-to-end benchmark (offline service stubs)')
+    parser.add_argument('--iterations', type=int, default=3, help='Passes over the samples per workload')
+    parser.add_argument('--long-articles', type=int, default=3, help=f"Synthetic {LONG_ARTICLE_PARAGRAPHS}-paragraph articles")
+    parser.add_argument('--concurrency', default='1,4,8', help='Client counts for the throughput runs')
+    parser.add_argument('--latency', action='append', default=[], metavar='SERVICE=SECONDS',
+                        help='Stub latency override (groq, google, duckduckgo, wikipedia, wikidata, pubmed, arxiv, default)')
+    parser.add_argument('--deadline', type=float, default=300, help='Request deadline sent with each analysis')
+    parser.add_argument('--warm-caches', action='store_true', help='Keep in-process caches between measured calls')
+    parser.add_argument('--skip', default='', help='Workloads to skip: phases, endpoints, throughput')
+    parser.add_argument('-o', '--output', help=f"Results file (default {BENCHMARK_RESULTS_DIR}/<timestamp>.json)")
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    parser.add_argument('--verbose', action='store_true', help='Show the pipeline log')
+    args = parser.parse_args(argv)
+
+    latency = _parse_latency(args.latency)
+    concurrency = [int(n) for n in args.concurrency.split(',') if n.strip()]
+    skip = {s.strip() for s in args.skip.split(',') if s.strip()}
+
+    # Deterministic, self-contained configuration (set before the server module is imported)
+    scratch = tempfile.mkdtemp(prefix='linkscout-bench-')
+    os.environ.setdefault('GROQ_API_KEY', 'benchmark')
+    os.environ.setdefault('GOOGLE_API_KEY', 'benchmark')
+    os.environ.setdefault('GOOGLE_CSE_ID', 'benchmark')
+    os.environ['VERIFICATION_LIVE_FALLBACK'] = 'true'  # Exercise the (stubbed) database APIs
+    os.environ['PAGE_CACHE_DIR'] = os.path.join(scratch, 'pages')
+    os.environ['JOB_STORE'] = 'memory'
+    # Admission control: every client gets a slot at full quality, so
+    # req/s measures the pipeline, not shed or degraded requests
+    os.environ['ADMISSION_MAX_CONCURRENT'] = str(max(concurrency + [1]))
+    os.environ['ADMISSION_MAX_QUEUE'] = str(max(concurrency + [1]))
+    os.environ['ADMISSION_DEGRADE_QUEUE'] = '0'
+    os.environ['ADMISSION_MAX_PER_CLIENT'] = '0'
+
+    stubs = install_stubs(latency)
+    print("⏱️ [BENCH] Loading server and models...")
+    load_start = time.perf_counter()
+    with quiet(not args.verbose):
+        import combined_server as server
+    load_seconds = time.perf_counter() - load_start
+
+    samples = load_samples(args.long_articles)
+    print(f"⏱️ [BENCH] {len(samples)} samples x {args.iterations} iterations, stub latency {latency}")
+    bench = Benchmark(server, samples, args.iterations, args.warm_caches, args.deadline, args.verbose)
+
+    results = {
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'environment': {'git_commit': _git_commit(), 'python': platform.python_version(),
+                        'platform': platform.platform(), 'cpus': os.cpu_count()},
+        'config': {'iterations': args.iterations, 'samples': len(samples), 'long_articles': args.long_articles,
+                   'concurrency': concurrency, 'stub_latency': latency, 'warm_caches': args.warm_caches,
+                   'deadline': args.deadline, 'seed': BENCHMARK_SEED},
+        'startup_seconds': round(load_seconds, 2),
+        'phases': {},
+        'endpoints': {},
+        'throughput': []
+    }
+
+    if 'phases' not in skip:
+        print("⏱️ [BENCH] Phase functions...")
+        results['phases'] = bench.run_phases()
+    if 'endpoints' not in skip:
+        print("⏱️ [BENCH] /api/v1/analyze-chunks...")
+        results['endpoints']['/api/v1/analyze-chunks'] = bench.run_endpoint('/api/v1/analyze-chunks', _payload)
+        print("⏱️ [BENCH] /quick-test...")
+        results['endpoints']['/quick-test'] = bench.run_endpoint(
+            '/quick-test', lambda s: {'content': '\n\n'.join(s['paragraphs'])})
+    if 'throughput' not in skip:
+        for clients in concurrency:
+            print(f"⏱️ [BENCH] Throughput with {clients} concurrent clients...")
+            results['throughput'].append(bench.run_throughput(clients))
+
+    results['peak_rss_mb'] = peak_rss_mb()
+    results['stub_calls'] = dict(stubs.calls)
+
+    output = args.output or os.path.join(BENCHMARK_RESULTS_DIR, results['timestamp'].replace(':', '-') + '.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    print_report(results)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print_comparison(results, json.load(f))
+    print(f"💾 [BENCH] Results saved to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,12 +12,24 @@ Author: AI Misinformation Detector
 """
 
 import re
-import requests
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import spacy
 from urllib.parse import quote_plus
-import time
+
+from http_client import get_http_session, http_timeout
+from request_context import component_enabled, current_context, deadline_expired, deadline_sleep, degraded_mode
+from tracing import annotate, span
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Explanation of a claim that was extracted but not looked up, by reason
+UNCHECKED_EXPLANATIONS = {
+    'deadline': "Not checked: the request deadline was reached.",
+    'degraded': "Not checked: web search is skipped while the server is under heavy load.",
+    'mode': "Not checked: web search only runs in the deep analysis mode.",
+}
 
 
 @dataclass
@@ -51,21 +63,22 @@ class ClaimVerifier:
     
     def __init__(self):
         """Initialize the claim verifier"""
-        print("🔍 [CLAIM] Initializing claim verifier...")
+        logger.info("🔍 [CLAIM] Initializing claim verifier...")
         
         # Load spaCy model for NLP
         try:
             self.nlp = spacy.load("en_core_web_sm")
-            print("✅ [CLAIM] spaCy model loaded")
+            logger.info("✅ [CLAIM] spaCy model loaded")
         except OSError:
-            print("⚠️ [CLAIM] spaCy model not found, downloading...")
+            logger.warning("⚠️ [CLAIM] spaCy model not found, downloading...")
             import subprocess
             subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
             self.nlp = spacy.load("en_core_web_sm")
-            print("✅ [CLAIM] spaCy model downloaded and loaded")
+            logger.info("✅ [CLAIM] spaCy model downloaded and loaded")
         
         # Cache for verified claims (avoid redundant checks)
         self.claim_cache = {}
+        self.cache_stats = {'hits': 0, 'misses': 0}
     
     def extract_and_verify(self, text: str, url: str = "") -> ClaimVerificationResult:
         """
@@ -81,33 +94,61 @@ class ClaimVerifier:
         if not text or len(text) < 50:
             return self._create_empty_result()
         
-        print(f"🔍 [CLAIM] Extracting claims from text ({len(text)} chars)...")
+        logger.debug("🔍 [CLAIM] Extracting claims from text (%s chars)...", len(text))
         
         # Step 1: Extract factual claims
         claims = self.extract_factual_claims(text)
-        print(f"📋 [CLAIM] Found {len(claims)} claims to verify")
+        logger.debug("📋 [CLAIM] Found %s claims to verify", len(claims))
         
         if len(claims) == 0:
             return self._create_empty_result()
         
-        # Step 2: Verify each claim
+        # Step 2: Verify each claim (claims left when the request deadline
+        # passes, or all uncached claims when the server runs degraded or the
+        # analysis mode has no web search, are reported as unverifiable and
+        # not cached)
         verified_claims = []
+        unchecked = 0
+        cache_hits = 0
+        degraded = degraded_mode()
+        if not component_enabled('claim_web_search'):
+            skip_reason = 'mode'
+        else:
+            skip_reason = 'degraded' if degraded else None
         for i, claim in enumerate(claims, 1):
-            print(f"🔍 [CLAIM] Verifying claim {i}/{len(claims)}: {claim[:60]}...")
-            
             # Check cache first
             cache_key = self._get_cache_key(claim)
             if cache_key in self.claim_cache:
-                print(f"💾 [CLAIM] Using cached result")
-                result = self.claim_cache[cache_key]
-            else:
+                logger.debug("💾 [CLAIM] Using cached result for claim %s/%s", i, len(claims))
+                verified_claims.append(self.claim_cache[cache_key])
+                cache_hits += 1
+                self.cache_stats['hits'] += 1
+                continue
+            
+            if skip_reason or deadline_expired():
+                verified_claims.append(self._create_unchecked_result(claim, skip_reason or 'deadline'))
+                unchecked += 1
+                continue
+            
+            logger.debug("🔍 [CLAIM] Verifying claim %s/%s: %s...", i, len(claims), claim[:60])
+            self.cache_stats['misses'] += 1
+            with span('Verify claim', 'internal', input_chars=len(claim), cache='miss'):
                 result = self.verify_single_claim(claim)
+            if not deadline_expired():
                 self.claim_cache[cache_key] = result
             
             verified_claims.append(result)
             
             # Rate limiting (be nice to fact-checking sites)
-            time.sleep(0.5)
+            deadline_sleep(0.5)
+        
+        annotate(claims=len(claims), cache_hits=cache_hits, cache_misses=len(claims) - cache_hits - unchecked)
+        
+        if unchecked:
+            logger.debug("⏱️ [CLAIM] %s claims not checked (%s)", unchecked, skip_reason or 'deadline')
+            context = current_context()
+            if context is not None and skip_reason != 'mode':
+                context.skip('Claim web search (degraded)' if skip_reason else 'Claim verification (partial)')
         
         # Step 3: Calculate statistics
         true_count = sum(1 for c in verified_claims if c.verdict == "TRUE")
@@ -120,7 +161,7 @@ class ClaimVerifier:
         # Step 4: Generate summary
         summary = self._generate_summary(true_count, false_count, partial_count, unverifiable_count, len(claims))
         
-        print(f"✅ [CLAIM] Verification complete: {true_count} true, {false_count} false, {partial_count} partial, {unverifiable_count} unverifiable")
+        logger.debug("✅ [CLAIM] Verification complete: %s true, %s false, %s partial, %s unverifiable", true_count, false_count, partial_count, unverifiable_count)
         
         return ClaimVerificationResult(
             total_claims=len(claims),
@@ -258,6 +299,8 @@ class ClaimVerifier:
         ]
         
         for domain in fact_check_domains:
+            if deadline_expired():
+                break
             try:
                 # Use DuckDuckGo search (no API key needed)
                 search_url = f"https://duckduckgo.com/html/?q={quote_plus(query + ' site:' + domain)}"
@@ -266,7 +309,7 @@ class ClaimVerifier:
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 
-                response = requests.get(search_url, headers=headers, timeout=5)
+                response = get_http_session().get(search_url, headers=headers, timeout=http_timeout(5))
                 
                 # Simple check if domain appears in results
                 if domain in response.text:
@@ -275,10 +318,10 @@ class ClaimVerifier:
                         'found': True,
                         'method': 'fact_check_search'
                     })
-                    print(f"✅ [CLAIM] Found on {domain}")
+                    logger.debug("✅ [CLAIM] Found on %s", domain)
                 
             except Exception as e:
-                print(f"⚠️ [CLAIM] Could not search {domain}: {e}")
+                logger.warning("⚠️ [CLAIM] Could not search %s: %s", domain, e)
                 continue
         
         return results
@@ -299,7 +342,7 @@ class ClaimVerifier:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(search_url, headers=headers, timeout=5)
+            response = get_http_session().get(search_url, headers=headers, timeout=http_timeout(5))
             
             # Check for credible sources in results
             credible_sources = ['wikipedia.org', 'gov', 'edu', 'who.int', 'cdc.gov', 'nih.gov']
@@ -313,7 +356,7 @@ class ClaimVerifier:
                     })
             
         except Exception as e:
-            print(f"⚠️ [CLAIM] Web search failed: {e}")
+            logger.warning("⚠️ [CLAIM] Web search failed: %s", e)
         
         return results
     
@@ -394,6 +437,17 @@ class ClaimVerifier:
         
         return summary
     
+    def _create_unchecked_result(self, claim: str, reason: str = 'deadline') -> ClaimResult:
+        """Result for a claim skipped because of the deadline, server load ('degraded') or the analysis mode"""
+        return ClaimResult(
+            claim=claim,
+            verdict="UNVERIFIABLE",
+            confidence=0,
+            sources_checked=[],
+            evidence=[],
+            explanation=UNCHECKED_EXPLANATIONS.get(reason, UNCHECKED_EXPLANATIONS['deadline'])
+        )
+    
     def _create_empty_result(self) -> ClaimVerificationResult:
         """Create empty result for invalid input"""
         return ClaimVerificationResult(
@@ -420,6 +474,13 @@ def get_claim_verifier() -> ClaimVerifier:
     return _claim_verifier
 
 
+def get_claim_cache_stats() -> Optional[Dict]:
+    """Claim cache hit/miss counters (None until the verifier is created)"""
+    if _claim_verifier is None:
+        return None
+    return {**_claim_verifier.cache_stats, 'entries': len(_claim_verifier.claim_cache)}
+
+
 def verify_text_claims(text: str, url: str = "") -> Dict:
     """
     Convenience function to verify claims in text
@@ -30,17 +30,37 @@ os.environ['HUGGINGFACE_HUB_CACHE'] = r'D:\huggingface_cache'
 os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
 os.environ['SAFETENSORS_FAST_GPU'] = '1'
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, make_response, stream_with_context
 from flask_cors import CORS
 import requests
 from bs4 import BeautifulSoup
+import hashlib
 import json
 import re
+import threading
+import time
 import torch
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass
+from http_client import get_http_metrics, get_http_session, http_timeout
+from request_context import ComponentDisabled, DeadlineExceeded, RequestContext, activate, component_enabled, current_context, deactivate, deadline_sleep, request_budget, watch_disconnect
+from job_queue import FINISHED_STATES, SUCCEEDED, QueueFullError, get_job_queue
+from admission import Overloaded, client_address, get_admission_controller
+from analysis_modes import (FIRST_PASS_KEY, PROGRESSIVE_FIRST_PASS, PROGRESSIVE_REFINEMENT, describe_modes, first_pass_results,
+                            get_mode, progressive_requested, requested_mode)
+from single_flight import SingleFlight
+from metrics import ANALYSIS_SECONDS, CONTENT_TYPE, MODEL_BATCH_SIZE, MODEL_SECONDS, install_flask_metrics, metrics_authorized, registry as metrics_registry, timed_model
+from logging_setup import SAMPLED, get_logger, get_logging_stats
+from tracing import annotate, current_trace, finish_trace, get_trace_stats, span, start_span, start_trace, timings_requested, traced, tracing_enabled
+from image_cache import get_image_cache_stats
+from keyword_matcher import register_keywords, scan_keywords
+from page_cache import get_page_cache_stats
+from profiler import PROFILING_ENABLED, ProfilerBusy, allocation_diff, clamp_interval, clamp_seconds, sample_stacks
+
+logger = get_logger(__name__)
 
 # Import transformers for pre-trained models
 from transformers import (
@@ -74,10 +94,11 @@ except:
         return {'fingerprint_score': 0, 'verdict': 'UNKNOWN', 'patterns': [], 'confidence': 0}
 
 try:
-    from claim_verifier import verify_text_claims
+    from claim_verifier import verify_text_claims, get_claim_cache_stats
 except:
     def verify_text_claims(*args, **kwargs) -> Dict: 
         return {'total_claims': 0, 'false_claims': 0, 'false_percentage': 0, 'detailed_results': []}
+    def get_claim_cache_stats() -> Optional[Dict]: return None
 
 try:
     from source_credibility import analyze_text_sources
@@ -130,29 +151,44 @@ except:
     def check_known_false_claim(*args, **kwargs) -> Optional[Dict]: return None
     def get_source_credibility_override(*args, **kwargs) -> Optional[float]: return None
 
+# Import dataset store (versioned, hot-reloadable reference data)
+try:
+    from dataset_store import get_dataset_store, reload_datasets
+except Exception as e:
+    logger.warning("⚠️ Dataset store import failed: %s", e)
+    get_dataset_store = None
+    def reload_datasets(*args, **kwargs) -> Dict: 
+        return {'reloaded': False, 'error': 'Dataset store not available'}
+
 # Import Google Search
 try:
-    from google_search import google_web_search
-    print("✅ Google Search imported successfully")
+    from google_search import google_web_search, get_search_stats
+    logger.info("✅ Google Search imported successfully")
 except Exception as e:
-    print(f"⚠️ Google Search import failed: {e}")
+    logger.warning("⚠️ Google Search import failed: %s", e)
     def google_web_search(*args, **kwargs) -> List: 
-        print("⚠️ Using fallback google_web_search (returns empty list)")
+        logger.warning("⚠️ Using fallback google_web_search (returns empty list)")
         return []
+    def get_search_stats() -> Dict:
+        return {'available': False}
 
 # Groq API Configuration
 GROQ_API_KEY = os.environ.get('GROQ_API_KEY', '')
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_MODEL = "llama-3.3-70b-versatile"
 
+# Admin endpoints are disabled unless ADMIN_TOKEN is set (sent as X-Admin-Token)
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
 app = Flask(__name__)
 CORS(app)
+install_flask_metrics(app)
 
 # Initialize device
 device = "cuda" if torch.cuda.is_available() else "cpu"
-print(f"📱 Using device: {device}")
+logger.info("📱 Using device: %s", device)
 
-print("🚀 Loading AI models...")
+logger.info("🚀 Loading AI models...")
 
 # Determine cache directory and loading mode
 import os
@@ -160,14 +196,14 @@ IS_PRODUCTION = os.environ.get('RENDER') or os.environ.get('RAILWAY_ENVIRONMENT'
 if IS_PRODUCTION:
     CACHE_DIR = './models_cache'
     LOCAL_ONLY = False
-    print("📦 Production mode: Will download models from HuggingFace")
+    logger.info("📦 Production mode: Will download models from HuggingFace")
 else:
     CACHE_DIR = r'D:\huggingface_cache'
     LOCAL_ONLY = True
-    print("💻 Local mode: Using cached models")
+    logger.info("💻 Local mode: Using cached models")
 
 # RoBERTa for fake news detection
-print("Loading RoBERTa fake news detector...")
+logger.info("Loading RoBERTa fake news detector...")
 try:
     roberta_tokenizer = AutoTokenizer.from_pretrained(
         "hamzab/roberta-fake-news-classification",
@@ -180,13 +216,13 @@ try:
         local_files_only=LOCAL_ONLY
     ).to(device)
     roberta_model.eval()  # Set to evaluation mode
-    print("✅ RoBERTa loaded")
+    logger.info("✅ RoBERTa loaded")
 except Exception as e:
-    print(f"❌ RoBERTa loading failed: {e}")
+    logger.error("❌ RoBERTa loading failed: %s", e)
     raise
 
 # Emotion classifier
-print("Loading emotion classifier...")
+logger.info("Loading emotion classifier...")
 emotion_tokenizer = AutoTokenizer.from_pretrained(
     "j-hartmann/emotion-english-distilroberta-base",
     cache_dir=CACHE_DIR,
@@ -197,30 +233,30 @@ emotion_model = AutoModelForSequenceClassification.from_pretrained(
     cache_dir=CACHE_DIR,
     local_files_only=LOCAL_ONLY
 ).to(device)
-print("✅ Emotion model loaded")
+logger.info("✅ Emotion model loaded")
 
 # NER for entity extraction
-print("⏳ NER model: lazy loading (loads on first use)")
+logger.info("⏳ NER model: lazy loading (loads on first use)")
 ner_tokenizer = None
 ner_model = None
 
 # Hate Speech Detector
-print("⏳ Hate Speech detector: lazy loading (loads on first use)")
+logger.info("⏳ Hate Speech detector: lazy loading (loads on first use)")
 hate_speech_tokenizer = None
 hate_speech_model = None
 
 # Clickbait Detector
-print("⏳ Clickbait detector: lazy loading (loads on first use)")
+logger.info("⏳ Clickbait detector: lazy loading (loads on first use)")
 clickbait_tokenizer = None
 clickbait_model = None
 
 # Bias Detector
-print("⏳ Bias detector: lazy loading (loads on first use)")
+logger.info("⏳ Bias detector: lazy loading (loads on first use)")
 bias_tokenizer = None
 bias_model = None
 
 # === ADDITIONAL FAKE NEWS MODELS FOR ENSEMBLE VOTING ===
-print("⏳ Additional fake news models: lazy loading (loads on first use)")
+logger.info("⏳ Additional fake news models: lazy loading (loads on first use)")
 
 # Fake News BERT #2
 fake_news_bert_tokenizer = None
@@ -231,14 +267,14 @@ fake_news_pulk_tokenizer = None
 fake_news_pulk_model = None
 
 # Custom trained model (deferred loading)
-print("Custom model: deferred loading on first use...")
+logger.info("Custom model: deferred loading on first use...")
 custom_model_path = r'D:\mis\misinformation_model\final'
 custom_tokenizer = None
 custom_model = None
 _custom_model_disabled = False
 
-print("✅ Core models loaded (RoBERTa, Emotion, NER, Hate, Clickbait, Bias)")
-print("✅ Ensemble models ready (3 fake news detectors + custom model)")
+logger.info("✅ Core models loaded (RoBERTa, Emotion, NER, Hate, Clickbait, Bias)")
+logger.info("✅ Ensemble models ready (3 fake news detectors + custom model)")
 
 # ========================================
 # NEWS CATEGORIES (from server_chunk_analysis.py)
@@ -263,10 +299,10 @@ NEWS_CATEGORIES = {
 
 def detect_categories(text):
     """Detect news categories based on keywords"""
-    text_lower = text.lower()
+    scan = scan_keywords(text)
     category_scores = {}
     for category, keywords in NEWS_CATEGORIES.items():
-        score = sum(1 for keyword in keywords if keyword in text_lower)
+        score = sum(1 for keyword in keywords if scan.contains(keyword))
         if score > 0:
             category_scores[category] = score
     
@@ -280,6 +316,55 @@ def detect_categories(text):
     result = [cat for cat, score in sorted_cats if score >= min_threshold and cat != 'Other / General / Info']
     return result if result else ['Other / General / Info']
 
+# ========================================
+# QUICK TEST KEYWORDS (/quick-test endpoint)
+# ========================================
+# Common misinformation topics
+QUICK_TEST_MISINFORMATION_KEYWORDS = {
+    'covid_conspiracy': ['microchip', 'bill gates vaccine', 'vaccine tracking', 'vaccine surveillance', 
+                        'vaccine magnetism', 'vaccine 5g', 'mrna change dna', 'vaccine gene therapy',
+                        'vaccine emergency use', 'vaccine experimental', 'vaccine untested',
+                        'natural immunity better', 'natural immunity is'],
+    'election_fraud': ['dominion', 'voting machine', 'voting machines', 'machine hack', 'switch votes',
+                      'bamboo ballot', 'sharpie', 'dead people voted', 'dead voter', 
+                      'ballot dump', 'election stolen', 'election rigged', 'election theft',
+                      'voter fraud', 'fraudulent vote', 'fake ballot', 'hacked by venezuela',
+                      'invalidate ballot', 'biggest election theft'],
+    'health_conspiracy': ['chemtrail', 'fluoride mind control', 'fluoride lower iq', 
+                         'big pharma suppress', 'vitamin c cure', 'alkaline water prevent',
+                         'natural immunity better', 'cancer cure suppressed', 'cure suppressed',
+                         'sugar feeds cancer'],
+    'tech_conspiracy': ['5g coronavirus', '5g cause', '5g radiation', '5g depopulation', '5g towers cause',
+                       'phone radiation brain', 'wifi cancer', 'microwave oven cancer', 
+                       '5g to depopulate', 'weakens your immune system'],
+    'climate_denial': ['climate hoax', 'ice age coming', 'sun cause warming', 'climate scientist disagree',
+                      'antarctica ice growing'],
+    'manipulation': ['poison our children', 'government planes spray', 'nasa documents prove',
+                    'geoengineering', 'they are installing', 'depopulate the planet']
+}
+
+# Linguistic patterns
+QUICK_TEST_SUSPICIOUS_WORDS = {
+    'conspiracy': ['exposed', 'shocking', 'they dont want you to know', 'wake up', 'sheeple',
+                  'hidden truth', 'conspiracy', 'cover up', 'coverup', 'mainstream media lies', 
+                  'msm lies', 'fake news media'],
+    'manipulation': ['big pharma', 'globalist', 'deep state', 'new world order', 'illuminati',
+                   'shadow government', 'puppet master', 'controlled opposition'],
+    'urgency': ['must share', 'share before deleted', 'censored', 'banned', 'silenced',
+               'they are hiding', 'breaking', 'urgent', 'alert'],
+    'distrust': ['dont trust', 'never trust', 'lie to you', 'lying to us', 'propaganda',
+                'brainwash', 'indoctrination', 'mind control', 'sheep'],
+    'absolutism': ['never', 'always', 'everyone knows', 'nobody believes', 'all scientists',
+                  'every doctor', '100% proof', 'undeniable', 'fact'],
+    'fearmongering': ['deadly', 'killing', 'poison', 'toxic', 'dangerous truth',
+                     'devastating', 'apocalypse', 'extinction', 'genocide']
+}
+
+# Register keyword lists with the shared keyword automaton
+register_keywords('server.news_categories', [kw for keywords in NEWS_CATEGORIES.values() for kw in keywords])
+register_keywords('server.quick_test.misinformation', [kw for keywords in QUICK_TEST_MISINFORMATION_KEYWORDS.values() for kw in keywords])
+register_keywords('server.quick_test.suspicious', [word for words in QUICK_TEST_SUSPICIOUS_WORDS.values() for word in words])
+
 # ========================================
 # LAZY LOADING FUNCTIONS (Memory Optimization)
 # ========================================
@@ -288,7 +373,7 @@ def load_ner_model():
     """Load NER model on first use"""
     global ner_tokenizer, ner_model
     if ner_tokenizer is None:
-        print("🔄 Loading NER model...")
+        logger.info("🔄 Loading NER model...")
         ner_tokenizer = AutoTokenizer.from_pretrained(
             "dslim/bert-base-NER",
             cache_dir=CACHE_DIR,
@@ -299,13 +384,13 @@ def load_ner_model():
             cache_dir=CACHE_DIR,
             local_files_only=LOCAL_ONLY
         ).to(device)
-        print("✅ NER model loaded")
+        logger.info("✅ NER model loaded")
 
 def load_hate_speech_model():
     """Load Hate Speech model on first use"""
     global hate_speech_tokenizer, hate_speech_model
     if hate_speech_tokenizer is None:
-        print("🔄 Loading Hate Speech detector...")
+        logger.info("🔄 Loading Hate Speech detector...")
         hate_speech_tokenizer = AutoTokenizer.from_pretrained(
             "facebook/roberta-hate-speech-dynabench-r4-target",
             cache_dir=CACHE_DIR,
@@ -316,13 +401,13 @@ def load_hate_speech_model():
             cache_dir=CACHE_DIR,
             local_files_only=LOCAL_ONLY
         ).to(device)
-        print("✅ Hate Speech detector loaded")
+        logger.info("✅ Hate Speech detector loaded")
 
 def load_clickbait_model():
     """Load Clickbait model on first use"""
     global clickbait_tokenizer, clickbait_model
     if clickbait_tokenizer is None:
-        print("🔄 Loading Clickbait detector...")
+        logger.info("🔄 Loading Clickbait detector...")
         clickbait_tokenizer = AutoTokenizer.from_pretrained(
             "elozano/bert-base-cased-clickbait-news",
             cache_dir=CACHE_DIR,
@@ -333,13 +418,13 @@ def load_clickbait_model():
             cache_dir=CACHE_DIR,
             local_files_only=LOCAL_ONLY
         ).to(device)
-        print("✅ Clickbait detector loaded")
+        logger.info("✅ Clickbait detector loaded")
 
 def load_bias_model():
     """Load Bias model on first use"""
     global bias_tokenizer, bias_model
     if bias_tokenizer is None:
-        print("🔄 Loading Bias detector...")
+        logger.info("🔄 Loading Bias detector...")
         bias_tokenizer = AutoTokenizer.from_pretrained(
             "valurank/distilroberta-bias",
             cache_dir=CACHE_DIR,
@@ -350,14 +435,14 @@ def load_bias_model():
             cache_dir=CACHE_DIR,
             local_files_only=LOCAL_ONLY
         ).to(device)
-        print("✅ Bias detector loaded")
+        logger.info("✅ Bias detector loaded")
 
 def load_fake_news_bert_model():
     """Load Fake News BERT #2 model on first use"""
     global fake_news_bert_tokenizer, fake_news_bert_model
     if fake_news_bert_tokenizer is None:
         try:
-            print("🔄 Loading Fake News BERT #2...")
+            logger.info("🔄 Loading Fake News BERT #2...")
             fake_news_bert_tokenizer = AutoTokenizer.from_pretrained(
                 "jy46604790/Fake-News-Bert-Detect",
                 cache_dir=CACHE_DIR,
@@ -369,16 +454,16 @@ def load_fake_news_bert_model():
                 local_files_only=LOCAL_ONLY
             ).to(device)
             fake_news_bert_model.eval()
-            print("✅ Fake News BERT #2 loaded")
+            logger.info("✅ Fake News BERT #2 loaded")
         except Exception as e:
-            print(f"⚠️ Fake News BERT #2 not available: {e}")
+            logger.warning("⚠️ Fake News BERT #2 not available: %s", e)
 
 def load_fake_news_pulk_model():
     """Load Fake News Pulk17 model on first use"""
     global fake_news_pulk_tokenizer, fake_news_pulk_model
     if fake_news_pulk_tokenizer is None:
         try:
-            print("🔄 Loading Fake News Pulk17...")
+            logger.info("🔄 Loading Fake News Pulk17...")
             fake_news_pulk_tokenizer = AutoTokenizer.from_pretrained(
                 "Pulk17/Fake-News-Detection",
                 cache_dir=CACHE_DIR,
@@ -390,9 +475,9 @@ def load_fake_news_pulk_model():
                 local_files_only=LOCAL_ONLY
             ).to(device)
             fake_news_pulk_model.eval()
-            print("✅ Fake News Pulk17 loaded")
+            logger.info("✅ Fake News Pulk17 loaded")
         except Exception as e:
-            print(f"⚠️ Fake News Pulk17 not available: {e}")
+            logger.warning("⚠️ Fake News Pulk17 not available: %s", e)
 
 def load_custom_model():
     """Load your custom trained model on first use"""
@@ -401,7 +486,7 @@ def load_custom_model():
         return False
     if custom_tokenizer is None:
         try:
-            print("🔄 Loading custom trained model...")
+            logger.info("🔄 Loading custom trained model...")
             custom_tokenizer = AutoTokenizer.from_pretrained(
                 custom_model_path,
                 cache_dir=CACHE_DIR,
@@ -413,10 +498,10 @@ def load_custom_model():
                 local_files_only=LOCAL_ONLY
             ).to(device)
             custom_model.eval()
-            print("✅ Custom model loaded")
+            logger.info("✅ Custom model loaded")
             return True
         except Exception as e:
-            print(f"⚠️ Custom model not available: {e}")
+            logger.warning("⚠️ Custom model not available: %s", e)
             _custom_model_disabled = True
             return False
     return True
@@ -425,6 +510,8 @@ def load_custom_model():
 # HELPER FUNCTIONS FOR PRE-TRAINED MODELS
 # ========================================
 
+@traced(kind='model')
+@timed_model('emotion')
 def get_emotion(text):
     """Get emotion from text"""
     try:
@@ -442,7 +529,7 @@ def get_emotion(text):
 def get_entities(text):
     """✅ REGEX-BASED: Extract entities using simple pattern matching (no ML model needed!)"""
     try:
-        print(f"   🔍 [ENTITIES] Starting regex-based entity extraction from text ({len(text)} chars)...")
+        logger.debug("🔍 [ENTITIES] Starting regex-based entity extraction from text (%s chars)...", len(text))
         
         import re
         
@@ -472,7 +559,7 @@ def get_entities(text):
         the_entities = re.findall(the_pattern, text)
         entities.extend(the_entities)
         
-        print(f"   🔍 [ENTITIES] Found {len(entities)} raw entities")
+        logger.debug("🔍 [ENTITIES] Found %s raw entities", len(entities))
         
         # Clean and filter entities
         cleaned_entities = []
@@ -510,15 +597,15 @@ def get_entities(text):
         # Limit to 10 most relevant entities
         final_entities = unique_entities[:10]
         
-        print(f"   ✅ [ENTITIES] Extracted {len(final_entities)} unique entities: {final_entities}")
+        logger.debug("✅ [ENTITIES] Extracted %s unique entities: %s", len(final_entities), final_entities)
         return final_entities
         
     except Exception as e:
-        print(f"⚠️ [ENTITIES] Entity extraction error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("⚠️ [ENTITIES] Entity extraction error: %s", e, exc_info=True)
         return []
 
+@traced(kind='model')
+@timed_model('hate_speech')
 def detect_hate_speech(text):
     """Detect hate speech"""
     try:
@@ -532,6 +619,8 @@ def detect_hate_speech(text):
     except:
         return 0.0
 
+@traced(kind='model')
+@timed_model('clickbait')
 def detect_clickbait(text):
     """Detect clickbait"""
     try:
@@ -545,6 +634,8 @@ def detect_clickbait(text):
     except:
         return 0.0
 
+@traced(kind='model')
+@timed_model('bias')
 def detect_bias(text):
     """Detect bias"""
     try:
@@ -559,6 +650,8 @@ def detect_bias(text):
     except:
         return 'neutral', 0.5
 
+@traced(kind='model')
+@timed_model('custom')
 def analyze_with_custom_model(text):
     """Analyze using custom trained model"""
     global custom_tokenizer, custom_model, _custom_model_disabled
@@ -568,12 +661,12 @@ def analyze_with_custom_model(text):
     
     if custom_tokenizer is None or custom_model is None:
         try:
-            print(f"Loading custom model from {custom_model_path}...")
+            logger.info("Loading custom model from %s...", custom_model_path)
             custom_tokenizer = AutoTokenizer.from_pretrained(custom_model_path, local_files_only=LOCAL_ONLY)
             custom_model = AutoModelForSequenceClassification.from_pretrained(custom_model_path, local_files_only=LOCAL_ONLY).to(device)
-            print("✅ Custom model loaded")
+            logger.debug("✅ Custom model loaded")
         except Exception as e:
-            print(f"⚠️ Custom model not available: {e}")
+            logger.warning("⚠️ Custom model not available: %s", e)
             _custom_model_disabled = True
             return {'misinformation_probability': 0, 'reliable_probability': 1}
     
@@ -589,6 +682,27 @@ def analyze_with_custom_model(text):
     except:
         return {'misinformation_probability': 0, 'reliable_probability': 1}
 
+# Ensemble scores by text sample, shared by single and batched predictions
+ML_PREDICTION_CACHE_SIZE = 4096
+_ml_prediction_cache: 'OrderedDict[str, float]' = OrderedDict()
+_ml_prediction_lock = threading.Lock()
+_ml_prediction_stats = {'hits': 0, 'misses': 0}
+
+def _cached_ml_prediction(text_sample: str) -> Optional[float]:
+    with _ml_prediction_lock:
+        score = _ml_prediction_cache.get(text_sample)
+        if score is not None:
+            _ml_prediction_cache.move_to_end(text_sample)
+        return score
+
+def _remember_ml_prediction(text_sample: str, score: float):
+    with _ml_prediction_lock:
+        _ml_prediction_cache[text_sample] = score
+        _ml_prediction_cache.move_to_end(text_sample)
+        while len(_ml_prediction_cache) > ML_PREDICTION_CACHE_SIZE:
+            _ml_prediction_cache.popitem(last=False)
+
+@traced(kind='model')
 def get_ml_misinformation_prediction(text: str) -> float:
     """
     🎯 ENSEMBLE VOTING: Get ML model prediction using ALL 4 fake news models
@@ -604,6 +718,9 @@ def get_ml_misinformation_prediction(text: str) -> float:
     - Final score = weighted average of all available models
     - Minimum 1 model (RoBERTa), Maximum 4 models
     
+    In fast mode (no 'ensemble' component) only RoBERTa votes; its scores
+    are cached apart from the ensemble scores.
+    
     Returns:
         float: Misinformation probability as percentage (0-100)
     """
@@ -612,24 +729,48 @@ def get_ml_misinformation_prediction(text: str) -> float:
             return 0.0
             
         text_sample = text[:512]
+        use_ensemble = component_enabled('ensemble')
+        cache_key = text_sample if use_ensemble else 'roberta:' + text_sample
+        cached_score = _cached_ml_prediction(cache_key)
+        annotate(cache='hit' if cached_score is not None else 'miss')
+        with _ml_prediction_lock:
+            _ml_prediction_stats['hits' if cached_score is not None else 'misses'] += 1
+        if cached_score is not None:
+            return cached_score
+        started = time.perf_counter()
+        
         model_predictions = []
         model_names = []
         
         # === MODEL 1: RoBERTa (ALWAYS AVAILABLE) ===
+        # Its vote is also cached on its own, so a fast-mode score (e.g. the
+        # first pass of a progressive analysis) is reused by a later ensemble
+        roberta_key = 'roberta:' + text_sample
+        roberta_score = _cached_ml_prediction(roberta_key)
         try:
-            inputs = roberta_tokenizer(text_sample, return_tensors="pt", truncation=True, padding=True, max_length=512)
-            input_ids = inputs['input_ids'].to(device)
-            attention_mask = inputs['attention_mask'].to(device)
-            
-            with torch.no_grad():
-                outputs = roberta_model(input_ids=input_ids, attention_mask=attention_mask)
-                probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                fake_prob = float(probs[0][1].cpu().item())  # Index 1 = FAKE
+            if roberta_score is None:
+                inputs = roberta_tokenizer(text_sample, return_tensors="pt", truncation=True, padding=True, max_length=512)
+                input_ids = inputs['input_ids'].to(device)
+                attention_mask = inputs['attention_mask'].to(device)
+                
+                with torch.no_grad():
+                    outputs = roberta_model(input_ids=input_ids, attention_mask=attention_mask)
+                    probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
+                    fake_prob = float(probs[0][1].cpu().item())  # Index 1 = FAKE
                 
-            model_predictions.append(fake_prob * 100)
-            model_names.append(f"RoBERTa:{fake_prob*100:.1f}%")
+                roberta_score = fake_prob * 100
+                _remember_ml_prediction(roberta_key, roberta_score)
+            model_predictions.append(roberta_score)
+            model_names.append(f"RoBERTa:{roberta_score:.1f}%")
         except Exception as e:
-            print(f"⚠️ RoBERTa prediction error: {e}")
+            logger.warning("⚠️ RoBERTa prediction error: %s", e)
+        
+        if not use_ensemble:
+            if not model_predictions:
+                return 0.0
+            MODEL_SECONDS.observe(time.perf_counter() - started, model='RoBERTa')
+            MODEL_BATCH_SIZE.observe(1, model='RoBERTa')
+            return model_predictions[0]
         
         # === MODEL 2: Fake News BERT #2 (LAZY LOAD) ===
         try:
@@ -648,7 +789,7 @@ def get_ml_misinformation_prediction(text: str) -> float:
                 model_predictions.append(fake_prob * 100)
                 model_names.append(f"BERT2:{fake_prob*100:.1f}%")
         except Exception as e:
-            print(f"⚠️ BERT #2 prediction error: {e}")
+            logger.warning("⚠️ BERT #2 prediction error: %s", e)
         
         # === MODEL 3: Pulk17 Fake News Detection (LAZY LOAD) ===
         try:
@@ -667,7 +808,7 @@ def get_ml_misinformation_prediction(text: str) -> float:
                 model_predictions.append(fake_prob * 100)
                 model_names.append(f"Pulk17:{fake_prob*100:.1f}%")
         except Exception as e:
-            print(f"⚠️ Pulk17 prediction error: {e}")
+            logger.warning("⚠️ Pulk17 prediction error: %s", e)
         
         # === MODEL 4: Your Custom Trained Model (LAZY LOAD) ===
         try:
@@ -685,44 +826,128 @@ def get_ml_misinformation_prediction(text: str) -> float:
                 model_predictions.append(fake_prob * 100)
                 model_names.append(f"Custom:{fake_prob*100:.1f}%")
         except Exception as e:
-            print(f"⚠️ Custom model prediction error: {e}")
+            logger.warning("⚠️ Custom model prediction error: %s", e)
         
         # === ENSEMBLE VOTING: Calculate weighted average ===
         if len(model_predictions) == 0:
-            print(f"⚠️ No models available for prediction!")
+            logger.warning("⚠️ No models available for prediction!")
             return 0.0
         
         # Simple average (all models have equal weight)
         ensemble_score = sum(model_predictions) / len(model_predictions)
         
-        print(f"   🎯 ENSEMBLE ({len(model_predictions)} models): {ensemble_score:.1f}% fake")
-        print(f"      Models: {' | '.join(model_names)}")
+        logger.debug("🎯 ENSEMBLE (%s models): %.1f%% fake [%s]", len(model_predictions), ensemble_score, ' | '.join(model_names))
         
+        MODEL_SECONDS.observe(time.perf_counter() - started, model='ensemble')
+        MODEL_BATCH_SIZE.observe(1, model='ensemble')
+        _remember_ml_prediction(text_sample, ensemble_score)
         return ensemble_score
         
     except Exception as e:
-        print(f"⚠️ ML ensemble prediction error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("⚠️ ML ensemble prediction error: %s", e, exc_info=True)
         return 0.0
 
+def _ensemble_models() -> List[Tuple[str, Any, Any]]:
+    """(name, tokenizer, model) for every available ensemble model"""
+    load_fake_news_bert_model()
+    load_fake_news_pulk_model()
+    models = [('RoBERTa', roberta_tokenizer, roberta_model)]
+    if fake_news_bert_tokenizer is not None:
+        models.append(('BERT2', fake_news_bert_tokenizer, fake_news_bert_model))
+    if fake_news_pulk_tokenizer is not None:
+        models.append(('Pulk17', fake_news_pulk_tokenizer, fake_news_pulk_model))
+    if load_custom_model():
+        models.append(('Custom', custom_tokenizer, custom_model))
+    return models
+
+@traced(kind='model')
+def predict_misinformation_batch(texts: List[str], batch_size: int = 16) -> List[float]:
+    """
+    Ensemble scores for many texts, running each model on padded batches
+    
+    Gives the same scores as get_ml_misinformation_prediction() and stores
+    them in its cache, so the per-paragraph loop of a later analysis finds
+    them there. The batch CLI uses this to score the paragraphs of several
+    documents in one pass per model.
+    
+    Returns:
+        Misinformation probability (0-100) per text, in input order
+    """
+    samples = list(dict.fromkeys(t[:512] for t in texts if t and len(t.strip()) >= 10))
+    todo = [sample for sample in samples if _cached_ml_prediction(sample) is None]
+    annotate(cache_hits=len(samples) - len(todo), cache_misses=len(todo))
+    
+    if todo:
+        totals = [0.0] * len(todo)
+        votes = [0] * len(todo)
+        for name, tokenizer, model in _ensemble_models():
+            try:
+                for start in range(0, len(todo), batch_size):
+                    batch = todo[start:start + batch_size]
+                    MODEL_BATCH_SIZE.observe(len(batch), model=name)
+                    with MODEL_SECONDS.time(model=name), torch.no_grad():
+                        inputs = tokenizer(batch, return_tensors="pt", truncation=True, padding=True, max_length=512)
+                        outputs = model(input_ids=inputs['input_ids'].to(device),
+                                        attention_mask=inputs['attention_mask'].to(device))
+                        fake_probs = torch.nn.functional.softmax(outputs.logits, dim=-1)[:, 1].cpu().tolist()
+                    for offset, fake_prob in enumerate(fake_probs):
+                        totals[start + offset] += fake_prob * 100
+                        votes[start + offset] += 1
+            except Exception as e:
+                logger.warning("⚠️ %s batch prediction error: %s", name, e)
+        
+        for sample, total, count in zip(todo, totals, votes):
+            if count:
+                _remember_ml_prediction(sample, total / count)
+        logger.debug("🎯 ENSEMBLE batch: %s texts scored", len(todo))
+    
+    scores = []
+    for text in texts:
+        if not text or len(text.strip()) < 10:
+            scores.append(0.0)
+        else:
+            score = _cached_ml_prediction(text[:512])
+            scores.append(score if score is not None else 0.0)
+    return scores
+
 def analyze_with_pretrained_models(text: str) -> Dict:
     """🎯 ENHANCED: Comprehensive analysis with ALL models + ENSEMBLE VOTING"""
     try:
-        print(f"🔍 [DEBUG] analyze_with_pretrained_models() called with text length: {len(text)} chars")
+        logger.debug("🔍 [DEBUG] analyze_with_pretrained_models() called with text length: %s chars", len(text))
         
         # 1. ENSEMBLE FAKE NEWS DETECTION (4 models voting together)
         ensemble_fake_score = get_ml_misinformation_prediction(text)  # 0-100 scale
         fake_prob = ensemble_fake_score / 100.0  # Convert to 0-1
         real_prob = 1.0 - fake_prob
         
+        # Fast mode: the fake news score alone (classifiers are lazy-loaded and slow)
+        if not component_enabled('classifiers'):
+            categories = detect_categories(text)
+            return {
+                'fake_probability': fake_prob,
+                'real_probability': real_prob,
+                'ensemble_fake_score': ensemble_fake_score,
+                'ensemble_models_used': 4 if component_enabled('ensemble') else 1,
+                'emotion': 'neutral',
+                'emotion_score': 0,
+                'named_entities': [],
+                'hate_probability': 0,
+                'clickbait_probability': 0,
+                'bias_label': 'neutral',
+                'bias_score': 0,
+                'custom_model_misinformation': 0,
+                'custom_model_reliable': 1,
+                'categories': categories,
+                'labels': categories
+            }
+        
         # 2. Emotion analysis
         emotion, emotion_score = get_emotion(text)
         
         # 3. Named entities
-        print(f"🔍 [DEBUG] About to call get_entities()...")
+        logger.debug("🔍 [DEBUG] About to call get_entities()...")
         named_entities = get_entities(text)
-        print(f"🔍 [DEBUG] get_entities() returned: {named_entities}")
+        logger.debug("🔍 [DEBUG] get_entities() returned: %s", named_entities)
         
         # 4. Hate speech
         hate_prob = detect_hate_speech(text)
@@ -743,7 +968,7 @@ def analyze_with_pretrained_models(text: str) -> Dict:
             'fake_probability': fake_prob,
             'real_probability': real_prob,
             'ensemble_fake_score': ensemble_fake_score,  # NEW: 0-100 scale
-            'ensemble_models_used': 4,  # NEW: Number of models in ensemble
+            'ensemble_models_used': 4 if component_enabled('ensemble') else 1,  # NEW: Number of models in ensemble
             'emotion': emotion,
             'emotion_score': emotion_score,
             'named_entities': named_entities,
@@ -757,7 +982,7 @@ def analyze_with_pretrained_models(text: str) -> Dict:
             'labels': categories  # Alias for frontend
         }
     except Exception as e:
-        print(f"Pre-trained models error: {e}")
+        logger.warning("⚠️ Pre-trained models error: %s", e)
         return {
             'fake_probability': 0,
             'real_probability': 1,
@@ -781,9 +1006,7 @@ class GroqAI:
         self.api_key = api_key
         
     def call_groq_api(self, messages: List[Dict], temperature: float = 0.7, max_tokens: int = 1500) -> str:
-        """Call Groq API with exponential backoff for rate limits"""
-        import time
-        
+        """Call Groq API with exponential backoff for rate limits (within the request deadline)"""
         max_retries = 3
         base_delay = 2  # Start with 2 seconds
         
@@ -803,67 +1026,68 @@ class GroqAI:
                     "stream": False
                 }
                 
-                print(f"   🔄 Calling Groq API (attempt {attempt + 1}/{max_retries})...")
-                response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=45)
+                logger.debug("🔄 Calling Groq API (attempt %s/%s)...", attempt + 1, max_retries)
+                response = get_http_session().post(GROQ_API_URL, headers=headers, json=payload, timeout=http_timeout(45))
                 
-                print(f"   📡 Groq API response status: {response.status_code}")
+                logger.debug("📡 Groq API response status: %s", response.status_code)
                 response.raise_for_status()
                 
                 result = response.json()
                 if 'choices' in result and len(result['choices']) > 0:
                     content = result['choices'][0]['message']['content']
-                    print(f"   ✅ Groq API success - {len(content)} chars returned")
+                    logger.debug("✅ Groq API success - %s chars returned", len(content))
                     return content
                 else:
-                    print(f"   ⚠️ Groq API returned unexpected format: {result}")
+                    logger.warning("⚠️ Groq API returned unexpected format: %s", result)
                     return "Analysis unavailable - unexpected API response format."
             
+            except DeadlineExceeded:
+                logger.debug("⏱️ Groq API call skipped - request deadline reached")
+                return "⚠️ AI analysis skipped (time limit reached). Analysis based on ML models."
+            
             except requests.exceptions.Timeout:
-                print(f"   ⏱️ Groq API timeout (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(base_delay * (2 ** attempt))
+                logger.warning("⏱️ Groq API timeout (attempt %s/%s)", attempt + 1, max_retries)
+                if attempt < max_retries - 1 and deadline_sleep(base_delay * (2 ** attempt)):
                     continue
                 return "⚠️ AI analysis temporarily unavailable (timeout). Analysis based on ML models."
             
             except requests.exceptions.ConnectionError as e:
-                print(f"   🔌 Groq API connection error: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(base_delay)
+                logger.warning("🔌 Groq API connection error: %s", e)
+                if attempt < max_retries - 1 and deadline_sleep(base_delay):
                     continue
                 return "⚠️ AI analysis temporarily unavailable (connection error). Analysis based on ML models."
             
             except requests.exceptions.HTTPError as e:
-                print(f"   ⚠️ Groq API HTTP error: {e.response.status_code}")
+                logger.warning("⚠️ Groq API HTTP error: %s", e.response.status_code)
                 if hasattr(e, 'response') and e.response is not None:
                     try:
                         error_detail = e.response.json()
-                        print(f"   Error details: {error_detail}")
+                        logger.debug("Error details: %s", error_detail)
                     except:
-                        print(f"   Error text: {e.response.text[:200]}")
+                        logger.debug("Error text: %s", e.response.text[:200])
                 
                 if hasattr(e, 'response') and e.response.status_code == 429:  # Rate limit
                     if attempt < max_retries - 1:
                         delay = base_delay * (2 ** attempt)  # Exponential backoff: 2s, 4s, 8s
-                        print(f"   ⏳ Groq API rate limit - waiting {delay}s before retry...")
-                        time.sleep(delay)
-                        continue
+                        logger.debug("⏳ Groq API rate limit - waiting %ss before retry...", delay)
+                        if deadline_sleep(delay):
+                            continue
+                        logger.debug("⏱️ Not enough time left to retry")
+                        return "⚠️ AI analysis temporarily unavailable (rate limit). Analysis based on ML models."
                     else:
-                        print(f"   ❌ Groq API rate limit exceeded after {max_retries} retries")
+                        logger.error("❌ Groq API rate limit exceeded after %s retries", max_retries)
                         return "⚠️ AI analysis temporarily unavailable (rate limit). Analysis based on ML models."
                 else:
-                    print(f"   ❌ Groq API HTTP error: {e}")
+                    logger.error("❌ Groq API HTTP error: %s", e)
                     return "⚠️ AI analysis temporarily unavailable. Analysis based on ML models."
             
             except KeyError as e:
-                print(f"   ⚠️ Groq API response parsing error: {e}")
+                logger.warning("⚠️ Groq API response parsing error: %s", e)
                 return "⚠️ AI analysis temporarily unavailable (parsing error). Analysis based on ML models."
             
             except Exception as e:
-                print(f"   ❌ Unexpected Groq API error: {type(e).__name__}: {e}")
-                import traceback
-                traceback.print_exc()
-                if attempt < max_retries - 1:
-                    time.sleep(base_delay)
+                logger.error("❌ Unexpected Groq API error: %s: %s", type(e).__name__, e, exc_info=True)
+                if attempt < max_retries - 1 and deadline_sleep(base_delay):
                     continue
                 return "⚠️ AI analysis temporarily unavailable. Analysis based on ML models."
         
@@ -871,7 +1095,7 @@ class GroqAI:
     
     def research_agent(self, topic: str, content: str) -> Dict:
         """Agent 1: Research internet for facts and cross-references"""
-        print(f"🔍 [AGENT 1] Research Agent analyzing: {topic[:50]}...")
+        logger.debug("🔍 [AGENT 1] Research Agent analyzing: %s...", topic[:50])
         
         # Google search for fact-checking
         search_results = google_web_search(topic, count=5)
@@ -879,7 +1103,7 @@ class GroqAI:
         
         # If no sources found, provide fallback reference sources
         if not sources:
-            print("   ⚠️ No Google search results - adding fallback fact-checking sources")
+            logger.warning("⚠️ No Google search results - adding fallback fact-checking sources")
             sources = [
                 {
                     'title': 'Snopes - Fact Checking',
@@ -926,7 +1150,7 @@ Based on these sources, provide a 3-4 sentence research summary of what credible
         
         summary = self.call_groq_api(messages, temperature=0.3, max_tokens=500)
         
-        print(f"   ✅ Research Agent: {len(sources)} sources found")
+        logger.debug("✅ Research Agent: %s sources found", len(sources))
         
         return {
             "search_results": search_results,
@@ -936,7 +1160,7 @@ Based on these sources, provide a 3-4 sentence research summary of what credible
     
     def analysis_agent(self, content: str, research_data: Dict) -> Dict:
         """Agent 2: Detailed misinformation pattern analysis"""
-        print(f"🔬 [AGENT 2] Analysis Agent detecting patterns...")
+        logger.debug("🔬 [AGENT 2] Analysis Agent detecting patterns...")
         
         prompt = f"""You are a misinformation detection expert. Analyze this content for suspicious patterns:
 
@@ -966,7 +1190,7 @@ Provide a detailed 4-5 sentence analysis."""
     
     def conclusion_agent(self, topic: str, content: str, research_data: Dict, analysis_data: Dict) -> Dict:
         """Agent 3: Form expert conclusion with verdict and recommendations"""
-        print(f"✅ [AGENT 3] Conclusion Agent forming verdict...")
+        logger.debug("✅ [AGENT 3] Conclusion Agent forming verdict...")
         
         prompt = f"""You are an expert fact-checker providing final conclusions. Based on:
 
@@ -1034,7 +1258,7 @@ Provide a structured conclusion with these exact sections:
                 start = conclusion.find("WHY THIS MATTERS")
                 why_matters = conclusion[start:].strip()
         except Exception as e:
-            print(f"Section extraction error: {e}")
+            logger.debug("Section extraction error: %s", e)
         
         return {
             "full_conclusion": conclusion,
@@ -1052,35 +1276,244 @@ groq_ai = GroqAI(GROQ_API_KEY)
 # MAIN ANALYSIS ENDPOINT
 # ========================================
 
+# Identical analyses running at the same time (viral URLs) are computed once
+analysis_flights = SingleFlight()
+
+
+def analysis_key(data: Dict, args: Mapping) -> str:
+    """
+    Content hash of an analysis request and its options
+    
+    The deadline is left out so requests with different budgets still
+    coalesce; a result the leader's budget cut short is not shared (see
+    shareable_result()).
+    """
+    body = {k: v for k, v in data.items() if k != 'deadline'}
+    canonical = json.dumps([body, sorted(args.items())], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def shareable_result(result) -> bool:
+    """
+    True if a leader's response is valid for identical concurrent requests
+    
+    Responses that depend on the leader itself are not: an abandoned run
+    (499), the leader's admission rejection (429/503) and results its
+    deadline made partial.
+    """
+    if result.status_code in (429, 499, 503):
+        return False
+    body = result.get_json(silent=True) or {}
+    deadline = body.get('deadline') if isinstance(body, dict) else None
+    return not (isinstance(deadline, dict) and deadline.get('skipped'))
+
+
+def queue_refinement(data: Dict, first_pass: Dict) -> Dict:
+    """
+    Queue the deep pass of a progressive analysis
+    
+    The job runs the original request in the refinement mode and takes the
+    first-pass results along, so those phases are not run again. Its job
+    id is the analysis id.
+    """
+    payload = {k: v for k, v in data.items() if k not in ('progressive', 'mode', 'deadline', FIRST_PASS_KEY)}
+    payload['mode'] = PROGRESSIVE_REFINEMENT
+    payload[FIRST_PASS_KEY] = json.loads(json.dumps(first_pass, default=str))
+    try:
+        job = get_job_queue().submit(payload, priority='high')
+    except QueueFullError as e:
+        logger.warning("⚠️ Refinement not queued: %s", e)
+        return {'analysis_id': None, 'status': 'unavailable', 'error': str(e)}
+    
+    logger.debug("🗃️ Refinement queued as job %s (%s first-pass results)", job.job_id, len(first_pass))
+    return {
+        'analysis_id': job.job_id,
+        'status': job.status,
+        'mode': PROGRESSIVE_REFINEMENT,
+        'status_url': f"/api/v1/analyses/{job.job_id}",
+        'events_url': f"/api/v1/analyses/{job.job_id}/events"
+    }
+
+
+def log_stage_failure(stage: str, e: Exception):
+    """Log a stage that fell back to its default result (mode skips only at debug)"""
+    if isinstance(e, ComponentDisabled):
+        logger.debug("⏭️ %s", e)
+    else:
+        logger.warning("⚠️ %s failed: %s: %s", stage, type(e).__name__, e, exc_info=not isinstance(e, DeadlineExceeded))
+
+
 @app.route('/api/v1/analyze-chunks', methods=['POST', 'OPTIONS'])
 def analyze_chunks():
-    """Unified analysis endpoint - combines ALL features from both servers"""
+    """
+    Unified analysis endpoint - combines ALL features from both servers
+    
+    Optional "mode" (body field or ?mode=): fast | standard | deep, see
+    analysis_modes. The response schema is the same in every mode.
+    With "progressive": true the fast result comes back at once, with an
+    'analysis_id' whose deep refinement can be polled or streamed (SSE).
+    
+    Concurrent identical requests share one run: the first computes, the
+    others wait (within their own deadline) and get a copy of its response
+    with X-Analysis-Shared: true. If that response is specific to the
+    leader (partial, rejected or abandoned), the waiting requests go back
+    through the flight: one of them runs it again and the rest share that.
+    Queued jobs and the batch CLI call analyze() directly.
+    """
+    if request.method == 'OPTIONS':
+        return run_analyze_chunks()
+    
+    data = request.get_json(silent=True) or {}
+    key = analysis_key(data, request.args)
+    deadline = time.monotonic() + request_budget(request.headers, data)
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining <= 0:
+                raise TimeoutError("Timed out waiting for an identical request")
+            result, shared = analysis_flights.do(key, lambda: make_response(run_analyze_chunks()), timeout=remaining)
+        except TimeoutError as e:
+            response = jsonify({'success': False, 'error': str(e)})
+            response.headers['Retry-After'] = '30'
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response, 503
+        if not shared:
+            return result
+        if shareable_result(result):
+            break
+        # Abandoned, rejected or cut short by the leader's own budget: one of us runs it again
+        logger.debug("🛫 Identical in-flight analysis not shareable (HTTP %s) - retrying", result.status_code)
+    
+    logger.debug("🛫 Shared result of an identical in-flight analysis")
+    response = app.response_class(result.get_data(), status=result.status_code, headers=dict(result.headers))
+    response.headers['X-Analysis-Shared'] = 'true'
+    return response
+
+
+def run_analyze_chunks():
+    """Serve one analyze-chunks request: admission, deadline and the HTTP response around analyze()"""
+    ctx = None
+    ctx_token = None
+    ticket = None
     try:
-        print("\n" + "=" * 80)
-        print(f"🚨 ENDPOINT HIT: {request.method} /api/v1/analyze-chunks")
-        print("=" * 80)
+        logger.debug("🚨 ENDPOINT HIT: %s /api/v1/analyze-chunks", request.method)
         
         if request.method == 'OPTIONS':
-            print("✅ OPTIONS request - returning CORS headers")
+            logger.debug("✅ OPTIONS request - returning CORS headers")
             response = jsonify({'status': 'ok'})
             response.headers.add('Access-Control-Allow-Origin', '*')
             response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
             response.headers.add('Access-Control-Allow-Methods', 'POST, OPTIONS')
             return response
         
-        print("� POST request received - extracting data...")
-        data = request.json or {}
-        paragraphs = data.get('paragraphs', [])
-        title = data.get('title', '')
-        url = data.get('url', '')
-        print(f"✅ Data extracted: {len(paragraphs)} paragraphs, title='{title[:50]}...'")
-        
-        print("=" * 70)
-        print(f"📊 LINKSCOUT ANALYSIS STARTED")
-        print(f"📍 URL: {url}")
-        print(f"📄 Title: {title}")
-        print(f"📝 Paragraphs: {len(paragraphs)}")
-        print("=" * 70)
+        data = request.get_json(silent=True) or {}
+        try:
+            mode = get_mode(PROGRESSIVE_FIRST_PASS) if progressive_requested(request.args, data) else requested_mode(request.args, data)
+        except ValueError as e:
+            response = jsonify({'success': False, 'error': str(e)})
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response, 400
+        
+        # Request deadline: phases check it, outbound calls are capped by it,
+        # and a client disconnect cancels the remaining work
+        ctx = RequestContext(request_budget(request.headers, data, default=mode.budget))
+        
+        # Admission control: wait (within the budget) for an analysis
+        # slot, or shed the request; under load optional stages are skipped
+        try:
+            ticket = get_admission_controller().admit(client_address(request.headers, request.remote_addr),
+                                                      timeout=ctx.remaining())
+        except Overloaded as e:
+            logger.warning("🚦 Analysis rejected (%s): %s", e.status, e)
+            response = jsonify({'success': False, 'error': str(e), 'retry_after': e.retry_after})
+            response.headers['Retry-After'] = str(e.retry_after)
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response, e.status
+        ctx.degraded = ticket.degraded
+        if ticket.degraded:
+            logger.info("🚦 Admitted in degraded mode after %.1fs in queue", ticket.waited)
+        
+        ctx_token = activate(ctx)
+        watch_disconnect(ctx, request.environ)
+        
+        response = jsonify(analyze(data, request.args, ctx))
+        response.headers.add('Access-Control-Allow-Origin', '*')
+        logger.debug("✅ Response prepared successfully - returning to client")
+        return response
+        
+    except Exception as e:
+        if ctx is not None and ctx.cancelled:
+            # Nobody is waiting for the result any more
+            return jsonify({'success': False, 'error': ctx.cancel_reason}), 499
+        
+        logger.exception("❌ CRITICAL ERROR IN ANALYZE-CHUNKS: %s: %s", type(e).__name__, e)
+        import traceback
+        
+        error_response = jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': type(e).__name__,
+            'traceback': traceback.format_exc()
+        })
+        error_response.headers.add('Access-Control-Allow-Origin', '*')
+        return error_response, 500
+    
+    finally:
+        if ctx_token is not None:
+            ctx.finish()
+            deactivate(ctx_token)
+        if ticket is not None:
+            ticket.release()
+
+
+def analyze(payload: Dict, args: Optional[Mapping] = None, ctx: Optional[RequestContext] = None) -> Dict:
+    """
+    Run the analysis pipeline on an analyze-chunks payload
+    
+    Shared by the HTTP endpoint, job workers and the batch CLI. args are
+    the query parameters (mode, progressive, timings) if there are any.
+    ctx sets the time budget; without one the current context is used, or
+    a new one with the payload's deadline (else the mode's default budget).
+    A progressive request queues its deep refinement before returning.
+    
+    Args:
+        payload: {'paragraphs', 'title', 'url', 'html', 'mode', ...}
+        args: Query parameters
+        ctx: RequestContext to run under
+    
+    Returns:
+        Response dictionary ('success': True)
+    
+    Raises:
+        ValueError: Unknown analysis mode
+        DeadlineExceeded: The analysis was cancelled before it finished
+    """
+    args = args if args is not None else {}
+    data = payload
+    paragraphs = data.get('paragraphs', [])
+    title = data.get('title', '')
+    url = data.get('url', '')
+    logger.debug("✅ Data extracted: %s paragraphs, title='%s...'", len(paragraphs), title[:50])
+    
+    # Analysis tier (fast / standard / deep): which components run and the default budget.
+    # A progressive request answers with a fast first pass and queues the refinement.
+    progressive = progressive_requested(args, data)
+    mode = get_mode(PROGRESSIVE_FIRST_PASS) if progressive else requested_mode(args, data)
+    
+    owned = ctx is None and current_context() is None
+    if ctx is None:
+        ctx = current_context() or RequestContext(request_budget({}, data, default=mode.budget))
+    ctx_token = activate(ctx) if current_context() is not ctx else None
+    trace = None
+    try:
+        ctx.set_mode(mode.name, mode.components)
+        
+        # Timing spans: returned as 'timings' on request, exported if configured
+        want_timings = timings_requested(args, data)
+        if (want_timings or tracing_enabled()) and current_trace() is None:
+            trace = start_trace('analyze_chunks', paragraphs=len(paragraphs), url=url)
+        
+        logger.info("📊 Analysis started: %s paragraphs, %s mode, budget %.0fs, url=%s", len(paragraphs), mode.name, ctx.budget, url)
         
         # Combine paragraphs into full content
         if paragraphs and isinstance(paragraphs[0], dict):
@@ -1088,19 +1521,25 @@ def analyze_chunks():
         else:
             content = '\n\n'.join([str(p) for p in paragraphs if p])
         
+        # Refinement of a progressive analysis: the first pass's RoBERTa score
+        # is the ensemble's RoBERTa vote (its phase results are reused below)
+        if 'fake_news_model' in ctx.prior_results:
+            _remember_ml_prediction('roberta:' + content[:512], float(ctx.prior_results['fake_news_model']))
+            ctx.reused.append('fake_news_model')
+        
         # ========================================
         # STEP 1: PRE-TRAINED MODELS (8 models)
         # ========================================
-        print("\n🤖 [STEP 1/4] Running pre-trained models...")
+        logger.debug("🤖 [STEP 1/4] Running pre-trained models...")
         try:
-            pretrained_result = analyze_with_pretrained_models(content)
-            print(f"   ✅ Fake probability: {pretrained_result.get('fake_probability', 0)*100:.1f}%")
-            print(f"   ✅ Emotion: {pretrained_result.get('emotion', 'unknown')}")
-            print(f"   ✅ Categories: {', '.join(pretrained_result.get('categories', []))}")
+            ctx.check_component('fake_news_model', 'Pre-trained models')
+            with span('Pre-trained models', 'phase', input_chars=len(content)):
+                pretrained_result = analyze_with_pretrained_models(content)
+            logger.debug("✅ Fake probability: %.1f%%, emotion: %s, categories: %s",
+                         pretrained_result.get('fake_probability', 0) * 100, pretrained_result.get('emotion', 'unknown'),
+                         ', '.join(pretrained_result.get('categories', [])))
         except Exception as e:
-            print(f"   ⚠️ Pre-trained models failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log_stage_failure('Pre-trained models', e)
             pretrained_result = {
                 'fake_probability': 0.5,
                 'real_probability': 0.5,
@@ -1111,45 +1550,46 @@ def analyze_chunks():
                 'bias': 'neutral',
                 'entities': []
             }
+        ctx.report('pretrained_models', pretrained_result)
         
         # ========================================
         # STEP 2: GROQ AI AGENTS (3 agents)
         # ========================================
-        print("\n🤖 [STEP 2/4] Running Groq AI agents...")
+        logger.debug("🤖 [STEP 2/4] Running Groq AI agents...")
         try:
-            print("   Starting research agent...")
-            research_data = groq_ai.research_agent(title or "Article", content)
-            print(f"   ✅ Research: {len(research_data.get('sources_found', []))} sources found")
+            logger.debug("Starting research agent...")
+            ctx.check_component('groq_agents', 'Research agent', optional=True)
+            with span('Research agent', 'agent', input_chars=len(content)):
+                research_data = groq_ai.research_agent(title or "Article", content)
+            logger.debug("✅ Research: %s sources found", len(research_data.get('sources_found', [])))
         except KeyboardInterrupt:
             raise  # Re-raise keyboard interrupt to allow server shutdown
         except Exception as e:
-            print(f"   ⚠️ Research agent failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            log_stage_failure('Research agent', e)
             research_data = {'research_summary': 'Analysis unavailable', 'sources_found': [], 'search_results': []}
         
         try:
-            print("   Starting analysis agent...")
-            analysis_data = groq_ai.analysis_agent(content, research_data)
-            print(f"   ✅ Analysis: Complete")
+            logger.debug("Starting analysis agent...")
+            ctx.check_component('groq_agents', 'Analysis agent', optional=True)
+            with span('Analysis agent', 'agent', input_chars=len(content)):
+                analysis_data = groq_ai.analysis_agent(content, research_data)
+            logger.debug("✅ Analysis: Complete")
         except KeyboardInterrupt:
             raise  # Re-raise keyboard interrupt to allow server shutdown
         except Exception as e:
-            print(f"   ⚠️ Analysis agent failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            log_stage_failure('Analysis agent', e)
             analysis_data = {'detailed_analysis': 'Analysis unavailable'}
         
         try:
-            print("   Starting conclusion agent...")
-            conclusion_data = groq_ai.conclusion_agent(title or "Article", content, research_data, analysis_data)
-            print(f"   ✅ Conclusion: Complete")
+            logger.debug("Starting conclusion agent...")
+            ctx.check_component('groq_agents', 'Conclusion agent', optional=True)
+            with span('Conclusion agent', 'agent', input_chars=len(content)):
+                conclusion_data = groq_ai.conclusion_agent(title or "Article", content, research_data, analysis_data)
+            logger.debug("✅ Conclusion: Complete")
         except KeyboardInterrupt:
             raise  # Re-raise keyboard interrupt to allow server shutdown
         except Exception as e:
-            print(f"   ⚠️ Conclusion agent failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            log_stage_failure('Conclusion agent', e)
             conclusion_data = {
                 'full_conclusion': 'Analysis unavailable',
                 'what_is_right': 'See conclusion',
@@ -1158,90 +1598,117 @@ def analyze_chunks():
                 'recommendation': 'Verify with credible sources',
                 'why_matters': 'Critical thinking is essential'
             }
+        ctx.report('research_summary', research_data.get('research_summary', ''))
+        ctx.report('sources_found', research_data.get('sources_found', []))
+        ctx.report('detailed_analysis', analysis_data.get('detailed_analysis', ''))
+        ctx.report('full_conclusion', conclusion_data.get('full_conclusion', ''))
         
         # ========================================
         # STEP 3: REVOLUTIONARY DETECTION (8 Phases)
         # ========================================
-        print("\n🔥 [STEP 3/4] Running Revolutionary Detection (8 Phases)...")
+        logger.debug("🔥 [STEP 3/4] Running Revolutionary Detection (8 Phases)...")
         
         # Phase 1.1 - Linguistic Fingerprint
         try:
-            linguistic_result = analyze_text_fingerprint(content)
-            print(f"   ✅ Phase 1.1 - Linguistic: {linguistic_result.get('fingerprint_score', 0)}/100")
+            ctx.check_component('linguistic', 'Phase 1.1 - Linguistic')
+            with span('Phase 1.1 - Linguistic', 'phase', input_chars=len(content)):
+                linguistic_result = ctx.reuse_or_run('linguistic_fingerprint', analyze_text_fingerprint, content)
+            logger.debug("✅ Phase 1.1 - Linguistic: %s/100", linguistic_result.get('fingerprint_score', 0))
         except Exception as e:
-            print(f"   ⚠️ Phase 1.1 failed: {e}")
+            log_stage_failure('Phase 1.1 - Linguistic', e)
             linguistic_result = {'fingerprint_score': 50, 'emotional_language': 50, 'complexity': 50}
         
         # Phase 1.2 - Claim Verification
         try:
-            claim_result = verify_text_claims(content, url)
-            print(f"   ✅ Phase 1.2 - Claims: {claim_result.get('total_claims', 0)} found, {claim_result.get('false_claims', 0)} false")
+            ctx.check_component('claims', 'Phase 1.2 - Claims')
+            with span('Phase 1.2 - Claims', 'phase', input_chars=len(content)):
+                claim_result = verify_text_claims(content, url)
+            logger.debug("✅ Phase 1.2 - Claims: %s found, %s false", claim_result.get('total_claims', 0), claim_result.get('false_claims', 0))
         except Exception as e:
-            print(f"   ⚠️ Phase 1.2 failed: {e}")
+            log_stage_failure('Phase 1.2 - Claims', e)
             claim_result = {'total_claims': 0, 'false_claims': 0, 'verification_score': 50}
         
         # Phase 1.3 - Source Credibility
         try:
-            if url:
-                source_result = analyze_text_sources(f"{url}\n{content}")
-            else:
-                source_result = analyze_text_sources(content)
-            print(f"   ✅ Phase 1.3 - Sources: {source_result.get('average_credibility', 0):.1f}/100 credibility")
+            ctx.check_component('sources', 'Phase 1.3 - Sources')
+            with span('Phase 1.3 - Sources', 'phase', input_chars=len(content)):
+                source_result = ctx.reuse_or_run('source_credibility', analyze_text_sources,
+                                                 f"{url}\n{content}" if url else content)
+            logger.debug("✅ Phase 1.3 - Sources: %.1f/100 credibility", source_result.get('average_credibility', 0))
         except Exception as e:
-            print(f"   ⚠️ Phase 1.3 failed: {e}")
+            log_stage_failure('Phase 1.3 - Sources', e)
             source_result = {'average_credibility': 50, 'sources': []}
         
         # Phase 2.1 - Entity Verification
         try:
-            entity_result = verify_text_entities(content)
-            print(f"   ✅ Phase 2.1 - Entities: {entity_result.get('verified_entities', 0)}/{entity_result.get('total_entities', 0)} verified")
+            ctx.check_component('entities', 'Phase 2.1 - Entities')
+            with span('Phase 2.1 - Entities', 'phase', input_chars=len(content)):
+                entity_result = ctx.reuse_or_run('entity_verification', verify_text_entities, content)
+            logger.debug("✅ Phase 2.1 - Entities: %s/%s verified", entity_result.get('verified_entities', 0), entity_result.get('total_entities', 0))
         except Exception as e:
-            print(f"   ⚠️ Phase 2.1 failed: {e}")
+            log_stage_failure('Phase 2.1 - Entities', e)
             entity_result = {'total_entities': 0, 'verified_entities': 0}
         
         # Phase 2.2 - Propaganda Detection
         try:
-            propaganda_result = detect_text_propaganda(content)
+            ctx.check_component('propaganda', 'Phase 2.2 - Propaganda')
+            with span('Phase 2.2 - Propaganda', 'phase', input_chars=len(content)):
+                propaganda_result = ctx.reuse_or_run('propaganda_analysis', detect_text_propaganda, content)
             # ✅ FIX: Use 'technique_list' (array) instead of 'techniques' (dict)
             propaganda_result['techniques'] = propaganda_result.get('technique_list', [])
-            print(f"   ✅ Phase 2.2 - Propaganda: {propaganda_result.get('propaganda_score', 0)}/100")
+            logger.debug("✅ Phase 2.2 - Propaganda: %s/100", propaganda_result.get('propaganda_score', 0))
             if propaganda_result.get('technique_list'):
-                print(f"      Techniques: {', '.join(propaganda_result['technique_list'])}")
+                logger.debug("Techniques: %s", ', '.join(propaganda_result['technique_list']))
         except Exception as e:
-            print(f"   ⚠️ Phase 2.2 failed: {e}")
+            log_stage_failure('Phase 2.2 - Propaganda', e)
             propaganda_result = {'propaganda_score': 0, 'techniques': [], 'technique_list': []}
         
-        # Phase 2.3 - Network Verification
+        # Phase 2.3 - Network Verification (claims extracted in Phase 1.2)
         try:
-            network_verification_result = verify_claims_network([])
-            print(f"   ✅ Phase 2.3 - Network Verification: Complete")
+            ctx.check_component('verification_network', 'Phase 2.3 - Network Verification')
+            extracted_claims = [r['claim'] for r in claim_result.get('detailed_results', []) if r.get('claim')]
+            with span('Phase 2.3 - Network Verification', 'phase', input_items=len(extracted_claims)):
+                network_verification_result = verify_claims_network(extracted_claims)
+            logger.debug("✅ Phase 2.3 - Network Verification: %s/%s claims verified", network_verification_result.get('verified_claims', 0), len(extracted_claims))
         except Exception as e:
-            print(f"   ⚠️ Phase 2.3 failed: {e}")
+            log_stage_failure('Phase 2.3 - Network Verification', e)
             network_verification_result = {'verification_status': 'unknown'}
         
         # Phase 3.1 - Contradiction Detection
         try:
-            contradiction_result = detect_text_contradictions(content)
-            print(f"   ✅ Phase 3.1 - Contradictions: {contradiction_result.get('total_contradictions', 0)} found")
+            ctx.check_component('contradictions', 'Phase 3.1 - Contradictions')
+            with span('Phase 3.1 - Contradictions', 'phase', input_chars=len(content)):
+                contradiction_result = detect_text_contradictions(content)
+            logger.debug("✅ Phase 3.1 - Contradictions: %s found", contradiction_result.get('total_contradictions', 0))
         except Exception as e:
-            print(f"   ⚠️ Phase 3.1 failed: {e}")
+            log_stage_failure('Phase 3.1 - Contradictions', e)
             contradiction_result = {'total_contradictions': 0}
         
         # Phase 3.2 - Network Analysis
         try:
-            network_analysis_result = analyze_network_patterns(content)
-            print(f"   ✅ Phase 3.2 - Network Analysis: {network_analysis_result.get('bot_score', 0):.1f}/100 bot score")
+            ctx.check_component('network_analysis', 'Phase 3.2 - Network Analysis')
+            with span('Phase 3.2 - Network Analysis', 'phase', input_chars=len(content)):
+                network_analysis_result = ctx.reuse_or_run('network_analysis', analyze_network_patterns, content)
+            logger.debug("✅ Phase 3.2 - Network Analysis: %.1f/100 bot score", network_analysis_result.get('bot_score', 0))
         except Exception as e:
-            print(f"   ⚠️ Phase 3.2 failed: {e}")
+            log_stage_failure('Phase 3.2 - Network Analysis', e)
             network_analysis_result = {'bot_score': 0}
         
+        for key, phase_result in (('linguistic_fingerprint', linguistic_result), ('claim_verification', claim_result),
+                                  ('source_credibility', source_result), ('entity_verification', entity_result),
+                                  ('propaganda_analysis', propaganda_result), ('verification_network', network_verification_result),
+                                  ('contradiction_detection', contradiction_result), ('network_analysis', network_analysis_result)):
+            ctx.report(key, phase_result)
+        
         # ========================================
         # GENERATE AI EXPLANATIONS FOR 8 PHASES
         # ========================================
-        print("\n🤖 Generating AI explanations for detection phases...")
+        logger.debug("🤖 Generating AI explanations for detection phases...")
         phase_explanations = {}
         
         try:
+            ctx.check_component('ai_explanations', 'AI phase explanations', optional=True)
+            
             # Prepare phase data summary for AI
             phases_summary = f"""
 PHASE 1 - LINGUISTIC FINGERPRINT: Score {linguistic_result.get('fingerprint_score', 0)}/100
@@ -1302,7 +1769,8 @@ Provide 8 separate explanations in this EXACT format:
                 {"role": "user", "content": explanation_prompt}
             ]
             
-            explanations_text = groq_ai.call_groq_api(messages, temperature=0.7, max_tokens=2000)
+            with span('Phase explanations agent', 'agent', input_chars=len(explanation_prompt)):
+                explanations_text = groq_ai.call_groq_api(messages, temperature=0.7, max_tokens=2000)
             
             # Parse explanations
             if explanations_text and "PHASE 1" in explanations_text:
@@ -1329,12 +1797,12 @@ Provide 8 separate explanations in this EXACT format:
                 if "PHASE 8" in explanations_text:
                     phase_explanations['network_prop'] = explanations_text.split("**PHASE 8 - NETWORK PROPAGATION:**")[1].strip()
                 
-                print(f"   ✅ Generated AI explanations for {len(phase_explanations)} phases")
+                logger.debug("✅ Generated AI explanations for %s phases", len(phase_explanations))
             else:
-                print(f"   ⚠️ AI explanation parsing failed")
+                logger.warning("⚠️ AI explanation parsing failed")
         
         except Exception as e:
-            print(f"   ⚠️ AI explanation generation failed: {e}")
+            log_stage_failure('AI explanation generation', e)
             # Provide basic fallback explanations
             phase_explanations = {
                 'linguistic': 'Analyzes writing patterns to detect manipulation.',
@@ -1360,7 +1828,7 @@ Provide 8 separate explanations in this EXACT format:
         # ========================================
         # GENERATE COMBINED OVERALL SUMMARY
         # ========================================
-        print("\n🎯 Generating combined credibility summary...")
+        logger.debug("🎯 Generating combined credibility summary...")
         
         # Calculate overall credibility score (0-100, lower = more credible)
         overall_score = (
@@ -1421,27 +1889,36 @@ Write like you're talking to a friend who wants to know if this article is trust
         ]
         
         try:
-            combined_ai_summary = groq_ai.call_groq_api(combined_messages, temperature=0.7, max_tokens=400)
+            ctx.check_component('ai_summary', 'AI summary', optional=True)
+            with span('Summary agent', 'agent', input_chars=len(combined_summary_prompt)):
+                combined_ai_summary = groq_ai.call_groq_api(combined_messages, temperature=0.7, max_tokens=400)
             # ✅ FIX: Remove ALL leading/trailing whitespace and normalize internal spacing
             # Remove leading spaces from each line
             lines = combined_ai_summary.split('\n')
             cleaned_lines = [line.strip() for line in lines if line.strip()]
             combined_ai_summary = '\n\n'.join(cleaned_lines)  # Join with double newline for paragraphs
-            print(f"✅ Generated combined AI summary ({len(combined_ai_summary)} chars)")
+            logger.debug("✅ Generated combined AI summary (%s chars)", len(combined_ai_summary))
         except Exception as e:
-            print(f"⚠️ Failed to generate combined summary: {e}")
+            log_stage_failure('Combined summary', e)
             combined_ai_summary = f"This article received an overall credibility score of {overall_score:.1f}/100. Based on the analysis, it appears to be {overall_verdict.lower()}."
         
         # ========================================
         # STEP 4: PER-PARAGRAPH ANALYSIS (Chunks)
         # ========================================
-        print("\n📋 [STEP 4/4] Analyzing individual paragraphs...")
+        logger.debug("📋 [STEP 4/4] Analyzing individual paragraphs...")
         
         chunks = []
         fake_count = 0
         suspicious_count = 0
-        
-        for i, para in enumerate(paragraphs):
+        paragraph_span = start_span('Paragraph analysis', 'phase', input_items=len(paragraphs))
+        
+        # Fast mode returns no chunks: per-paragraph scoring needs the classifiers
+        for i, para in enumerate(paragraphs if ctx.use('paragraphs') else []):
+            if ctx.expired():
+                logger.debug("⏱️ Deadline reached - stopping at paragraph %s", i)
+                ctx.skip('Paragraph analysis (partial)')
+                break
+            
             para_text = para.get('text', str(para)) if isinstance(para, dict) else str(para)
             
             # ✅ Skip very short paragraphs
@@ -1461,7 +1938,7 @@ Write like you're talking to a friend who wants to know if this article is trust
             
             para_lower = para_text.lower()
             if any(pattern in para_lower for pattern in skip_patterns):
-                print(f"   ⏭️  Skipping paragraph {i} (navigation/metadata element)")
+                logger.debug("⏭️  Skipping paragraph %s (navigation/metadata element)", i, extra=SAMPLED)
                 continue
             
             # ✅ Skip if too short after removing punctuation (likely a headline fragment)
@@ -1480,7 +1957,7 @@ Write like you're talking to a friend who wants to know if this article is trust
                 
                 # DEBUG: Print on first few paragraphs
                 if i < 3:
-                    print(f"   🔍 Para {i}: Ensemble fake news score = {para_ensemble_score:.1f}/100")
+                    logger.debug("🔍 Para %s: Ensemble fake news score = %.1f/100", i, para_ensemble_score, extra=SAMPLED)
                 
                 # Use ensemble score to flag suspicious paragraphs
                 # Enhanced scoring: higher points for higher fake news probability
@@ -1498,7 +1975,7 @@ Write like you're talking to a friend who wants to know if this article is trust
                     why_flagged.append(f"⚠️ Some fake news indicators: {int(para_ensemble_score)}%")
             except Exception as e:
                 if i < 3:
-                    print(f"   ⚠️ Ensemble prediction error for para {i}: {e}")
+                    logger.warning("⚠️ Ensemble prediction error for para %s: %s", i, e)
                 para_ensemble_score = 0
             
             # Emotion analysis for THIS paragraph - BALANCED THRESHOLDS
@@ -1507,7 +1984,7 @@ Write like you're talking to a friend who wants to know if this article is trust
                 
                 # DEBUG: Print emotion on first few paragraphs
                 if i < 3:
-                    print(f"   🔍 Emotion: {para_emotion} ({para_emotion_score:.3f})")
+                    logger.debug("🔍 Emotion: %s (%.3f)", para_emotion, para_emotion_score, extra=SAMPLED)
                 
                 # ✅ BALANCED: Flag high emotion (but not too strict)
                 # 95%+ = clear manipulation, 85%+ = strong emotional tone
@@ -1597,6 +2074,8 @@ Write like you're talking to a friend who wants to know if this article is trust
                     'why_flagged': ' • '.join(why_flagged) if why_flagged else None,
                     'severity': 'high' if para_score >= 70 else 'medium'
                 })
+        paragraph_span.set(flagged=len(chunks))
+        paragraph_span.end()
         
         # ========================================
         # FINAL COUNTS
@@ -1605,16 +2084,14 @@ Write like you're talking to a friend who wants to know if this article is trust
         suspicious_count = len([c for c in chunks if 60 <= c['suspicious_score'] < 70])
         safe_count = len(paragraphs) - len(chunks)  # Count all non-suspicious paragraphs
         
-        print(f"   ✅ Analyzed {len(paragraphs)} total paragraphs")
-        print(f"   🚨 High risk (>=70): {fake_count}")
-        print(f"   ⚠️  Medium risk (60-69): {suspicious_count}")
-        print(f"   ✅ Low risk (<60): {safe_count}")
-        print(f"   📍 Flagged {len(chunks)} suspicious paragraphs for highlighting")
+        logger.debug("✅ Analyzed %s paragraphs: %s high risk (>=70), %s medium risk (60-69), %s low risk; %s flagged",
+                     len(paragraphs), fake_count, suspicious_count, safe_count, len(chunks))
+        ctx.report('chunks', chunks)
         
         # ========================================
         # CALCULATE OVERALL MISINFORMATION %
         # ========================================
-        print("\n📊 Calculating overall misinformation percentage...")
+        logger.debug("📊 Calculating overall misinformation percentage...")
         
         suspicious_score = 0
         
@@ -1623,7 +2100,7 @@ Write like you're talking to a friend who wants to know if this article is trust
         ml_prediction = get_ml_misinformation_prediction(content)
         ml_contribution = ml_prediction * 0.35
         suspicious_score += ml_contribution
-        print(f"   📊 ML Model contribution: {ml_contribution:.1f} points (35% weight)")
+        logger.debug("📊 ML Model contribution: %.1f points (35%% weight)", ml_contribution)
         
         # Pre-trained models weight (15% - reduced from 40% to make room for ML)
         if pretrained_result.get('fake_probability', 0) > 0.7:
@@ -1659,15 +2136,15 @@ Write like you're talking to a friend who wants to know if this article is trust
         if source_credibility >= 70:  # Highly credible source (like NDTV, BBC, Reuters)
             credibility_bonus = -30  # Reduce suspicious score by 30 points
             suspicious_score += credibility_bonus
-            print(f"   ✅ Credible source bonus: {credibility_bonus} points (credibility: {source_credibility}/100)")
+            logger.debug("✅ Credible source bonus: %s points (credibility: %s/100)", credibility_bonus, source_credibility)
         elif source_credibility >= 50:  # Moderately credible
             credibility_bonus = -15
             suspicious_score += credibility_bonus
-            print(f"   ✅ Source credibility bonus: {credibility_bonus} points (credibility: {source_credibility}/100)")
+            logger.debug("✅ Source credibility bonus: %s points (credibility: %s/100)", credibility_bonus, source_credibility)
         elif source_credibility < 30:  # Low credibility source
             credibility_penalty = 20
             suspicious_score += credibility_penalty
-            print(f"   ⚠️ Low credibility source penalty: +{credibility_penalty} points (credibility: {source_credibility}/100)")
+            logger.debug("⚠️ Low credibility source penalty: +%s points (credibility: %s/100)", credibility_penalty, source_credibility)
         
         # Ensure score stays in valid range (0-100)
         suspicious_score = max(0, min(suspicious_score, 100))
@@ -1680,13 +2157,8 @@ Write like you're talking to a friend who wants to know if this article is trust
         else:
             verdict = "APPEARS CREDIBLE"
         
-        print(f"\n✅ Analysis complete!")
-        print(f"   Verdict: {verdict}")
-        print(f"   Misinformation: {suspicious_score}%")
-        print(f"   Chunks analyzed: {len(chunks)}")
-        print(f"   Fake paragraphs: {fake_count}")
-        print(f"   Suspicious paragraphs: {suspicious_count}")
-        print("=" * 70)
+        logger.info("✅ Analysis complete: %s (%s%% misinformation), %s chunks flagged (%s fake, %s suspicious) in %.1fs",
+                    verdict, suspicious_score, len(chunks), fake_count, suspicious_count, ctx.elapsed())
         
         # ========================================
         # SANITIZE DATA - ENSURE ARRAYS ARE ARRAYS
@@ -1717,7 +2189,8 @@ Write like you're talking to a friend who wants to know if this article is trust
                       'rate limit' in str(conclusion_data.get('what_is_right', '')).lower())
         
         if groq_failed:
-            print("⚠️ Groq API failed - generating fallback analysis from ML models...")
+            if ctx.allows('groq_agents'):
+                logger.warning("⚠️ Groq API failed - generating fallback analysis from ML models...")
             
             # Generate What's Correct from ML analysis
             fake_prob = pretrained_result.get('fake_probability', 0) * 100
@@ -1787,30 +2260,38 @@ This {', '.join(categories[:2])} story affects public understanding. In an era o
             conclusion_data['recommendation'] = recommendation
             conclusion_data['why_matters'] = why_matters
             
-            print("✅ Fallback analysis generated from ML models")
+            logger.debug("✅ Fallback analysis generated from ML models")
         
         # ========================================
         # STEP 5: IMAGE ANALYSIS (NEW!)
         # ========================================
-        print("\n🖼️ [STEP 5/5] Analyzing images...")
+        logger.debug("🖼️ [STEP 5/5] Analyzing images...")
         image_analysis_result = {'total_images': 0, 'analyzed_images': 0, 'ai_generated_count': 0, 'summary': 'No images analyzed'}
         
         try:
             html_content = data.get('html', '')
             if html_content and url:
-                print(f"   📄 HTML content received: {len(html_content)} chars")
+                ctx.check_component('images', 'Image analysis', optional=True)
+                logger.debug("📄 HTML content received: %s chars", len(html_content))
                 image_analysis_result = analyze_webpage_images(html_content, url)
-                print(f"   ✅ Image Analysis: {image_analysis_result.get('analyzed_images', 0)} images analyzed")
+                logger.debug("✅ Image Analysis: %s images analyzed", image_analysis_result.get('analyzed_images', 0))
                 if image_analysis_result.get('ai_generated_count', 0) > 0:
-                    print(f"   ⚠️  AI-Generated: {image_analysis_result['ai_generated_count']} suspicious images found")
+                    logger.debug("⚠️  AI-Generated: %s suspicious images found", image_analysis_result['ai_generated_count'])
             else:
-                print(f"   ⚠️  Image analysis skipped (no HTML content)")
+                logger.debug("⚠️  Image analysis skipped (no HTML content)")
         except KeyboardInterrupt:
             raise
         except Exception as e:
-            print(f"   ⚠️  Image analysis failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            log_stage_failure('Image analysis', e)
+        
+        # Nobody is waiting for the result any more
+        if ctx.cancelled:
+            logger.info("🛑 Analysis abandoned (%s) after %.1fs", ctx.cancel_reason, ctx.elapsed())
+            raise DeadlineExceeded(f"Analysis abandoned: {ctx.cancel_reason}")
+        
+        if ctx.skipped:
+            logger.info("⏱️ Partial result - skipped: %s", ', '.join(ctx.skipped))
+        ANALYSIS_SECONDS.observe(ctx.elapsed(), mode=mode.name)
         
         # ========================================
         # BUILD COMPREHENSIVE RESPONSE
@@ -1879,33 +2360,160 @@ This {', '.join(categories[:2])} story affects public understanding. In an era o
             },
             
             # Image Analysis (NEW!)
-            'image_analysis': image_analysis_result
+            'image_analysis': image_analysis_result,
+            
+            # Analysis tier and the components that ran in it
+            'analysis_mode': mode.name,
+            'components': ctx.components_summary(),
+            
+            # Time budget usage (partial results list the skipped stages)
+            'deadline': ctx.summary()
         }
+        if want_timings and trace is not None:
+            response_data['timings'] = trace.timings()
         
-        response = jsonify(response_data)
-        response.headers.add('Access-Control-Allow-Origin', '*')
-        print("✅ Response prepared successfully - returning to client")
-        return response
-        
-    except Exception as e:
-        print("\n" + "=" * 80)
-        print("❌❌❌ CRITICAL ERROR IN ANALYZE-CHUNKS ❌❌❌")
-        print("=" * 80)
-        print(f"Error type: {type(e).__name__}")
-        print(f"Error message: {str(e)}")
-        print("\n📋 FULL TRACEBACK:")
-        import traceback
-        traceback.print_exc()
-        print("=" * 80)
+        # Progressive analysis: this fast result now, the deep refinement in the background
+        if progressive:
+            first_pass = first_pass_results(ctx.completed, _cached_ml_prediction('roberta:' + content[:512]))
+            response_data['refinement'] = queue_refinement(data, first_pass)
+            response_data['analysis_id'] = response_data['refinement']['analysis_id']
         
-        error_response = jsonify({
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__,
-            'traceback': traceback.format_exc()
-        })
-        error_response.headers.add('Access-Control-Allow-Origin', '*')
-        return error_response, 500
+        return response_data
+    
+    finally:
+        if trace is not None:
+            finish_trace(trace)
+        if owned:
+            ctx.finish()
+        if ctx_token is not None:
+            deactivate(ctx_token)
+
+
+# ========================================
+# ASYNC JOBS
+# ========================================
+
+def run_analysis(payload: Dict) -> Dict:
+    """
+    Job runner: analyze() a queued payload in the worker's RequestContext
+    
+    The first-pass results of a progressive analysis are handed to that
+    context for reuse; a queued job never fans out into another refinement.
+    """
+    payload = {k: v for k, v in payload.items() if k != 'progressive'}
+    first_pass = payload.pop(FIRST_PASS_KEY, None)
+    ctx = current_context()
+    if first_pass and ctx is not None:
+        ctx.prior_results = first_pass
+    return analyze(payload, ctx=ctx)
+
+
+get_job_queue().set_runner(run_analysis)
+
+
+@app.route('/api/v1/jobs', methods=['POST'])
+def submit_job():
+    """
+    Queue an analysis and return its job id immediately
+    
+    Expected JSON: the /api/v1/analyze-chunks body, plus optional
+    "priority" ("high" | "normal" | "low"), "webhook_url" (receives the
+    finished job as a POST) and "deadline" (seconds).
+    """
+    data = request.json or {}
+    payload = {k: v for k, v in data.items() if k not in ('priority', 'webhook_url', FIRST_PASS_KEY)}
+    try:
+        job = get_job_queue().submit(payload, priority=data.get('priority', 'normal'),
+                                     webhook_url=data.get('webhook_url', ''))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except QueueFullError as e:
+        response = jsonify({'success': False, 'error': str(e)})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+    
+    logger.debug("🗃️ [JOBS] Queued job %s (%s, %s paragraphs)", job.job_id, job.priority, len(payload.get('paragraphs', [])))
+    return jsonify({
+        'success': True,
+        'job_id': job.job_id,
+        'status': job.status,
+        'status_url': f"/api/v1/jobs/{job.job_id}"
+    }), 202
+
+
+@app.route('/api/v1/jobs/<job_id>', methods=['GET'])
+@app.route('/api/v1/analyses/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Job status; partial results while running, the full analysis when succeeded"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, **job.to_dict()})
+
+
+# Event streams end after this long even if the job has not finished
+EVENTS_MAX_SECONDS = 600
+EVENTS_KEEPALIVE_SECONDS = 15
+
+
+def sse_event(event: str, data: Any) -> str:
+    """One Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+@app.route('/api/v1/jobs/<job_id>/events', methods=['GET'])
+@app.route('/api/v1/analyses/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """
+    Server-Sent Events stream of a job (e.g. a progressive refinement)
+    
+    A 'partial' event ({stage, result}) is pushed as each stage finishes;
+    the stream ends with one event named after the final status
+    (succeeded / failed / cancelled) that carries the job and its result.
+    """
+    job_queue = get_job_queue()
+    if job_queue.get(job_id) is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    def stream():
+        sent = set()
+        version = job_queue.version
+        give_up = time.monotonic() + EVENTS_MAX_SECONDS
+        while True:
+            job = job_queue.get(job_id)
+            if job is None:
+                yield sse_event('failed', {'success': False, 'job_id': job_id, 'error': 'Job not found'})
+                return
+            for stage, result in job.partial_results.items():
+                if stage not in sent:
+                    sent.add(stage)
+                    yield sse_event('partial', {'stage': stage, 'result': result})
+            if job.status in FINISHED_STATES:
+                yield sse_event(job.status, {'success': job.status == SUCCEEDED, **job.to_dict()})
+                return
+            if time.monotonic() >= give_up:
+                yield sse_event('timeout', {'success': False, 'job_id': job_id, 'status': job.status})
+                return
+            seen = version
+            version = job_queue.wait_for_update(seen, EVENTS_KEEPALIVE_SECONDS)
+            if version == seen:
+                yield ': keep-alive\n\n'
+    
+    response = Response(stream_with_context(stream()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Don't let a proxy buffer the stream
+    response.headers.add('Access-Control-Allow-Origin', '*')
+    return response
+
+
+@app.route('/api/v1/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancel a queued or running job"""
+    job = get_job_queue().cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job_id': job.job_id, 'status': job.status})
+
 
 # Legacy endpoints for backward compatibility
 @app.route('/analyze', methods=['POST', 'OPTIONS'])
@@ -1913,7 +2521,7 @@ This {', '.join(categories[:2])} story affects public understanding. In an era o
 @app.route('/api/v1/analyze', methods=['POST', 'OPTIONS'])
 def analyze_legacy():
     """Legacy endpoint - redirects to main endpoint"""
-    print(f"📍 Legacy endpoint called: {request.path} -> redirecting to analyze-chunks")
+    logger.debug("📍 Legacy endpoint called: %s -> redirecting to analyze-chunks", request.path)
     return analyze_chunks()
 
 @app.route('/quick-test', methods=['POST'])
@@ -1937,7 +2545,7 @@ def quick_test():
                 'risk_score': 0
             }), 400
         
-        print(f"\n🧪 Quick Test - Content length: {len(content)} chars")
+        logger.debug("🧪 Quick Test - Content length: %s chars", len(content))
         
         # Run only essential models for testing
         suspicious_score = 0
@@ -1964,56 +2572,33 @@ def quick_test():
             # BOOST: If ML is very confident (>95%), add bonus
             if fake_prob > 0.95:
                 ml_contribution += 10  # Increased bonus for high confidence
-                print(f"   🤖 ML Model (RoBERTa): {fake_prob*100:.1f}% fake → {ml_contribution:.1f} points (40% weight + HIGH CONFIDENCE BOOST)")
+                logger.debug("🤖 ML Model (RoBERTa): %.1f%% fake → %.1f points (40%% weight + HIGH CONFIDENCE BOOST)", fake_prob * 100, ml_contribution)
             else:
-                print(f"   🤖 ML Model (RoBERTa): {fake_prob*100:.1f}% fake → {ml_contribution:.1f} points (40% weight)")
+                logger.debug("🤖 ML Model (RoBERTa): %.1f%% fake → %.1f points (40%% weight)", fake_prob * 100, ml_contribution)
             
             suspicious_score += ml_contribution
         except Exception as e:
-            print(f"   ⚠️ ML Model error: {e}")
+            logger.warning("⚠️ ML Model error: %s", e)
         
         # 2. False Claims Database + Keyword Detection (45% weight = 45 points max, increased from 35%)
         try:
             from known_false_claims import KNOWN_FALSE_CLAIMS
-            content_lower = content.lower()
+            scan = scan_keywords(content)
             matches = 0
             matched_claims = []
             
             # Check against database claims
             for claim in KNOWN_FALSE_CLAIMS.keys():
-                if claim.lower() in content_lower:
+                if scan.contains(claim):
                     matches += 1
                     matched_claims.append(claim[:50])
             
             # Enhanced keyword detection for common misinformation topics
-            misinformation_keywords = {
-                'covid_conspiracy': ['microchip', 'bill gates vaccine', 'vaccine tracking', 'vaccine surveillance', 
-                                    'vaccine magnetism', 'vaccine 5g', 'mrna change dna', 'vaccine gene therapy',
-                                    'vaccine emergency use', 'vaccine experimental', 'vaccine untested',
-                                    'natural immunity better', 'natural immunity is'],
-                'election_fraud': ['dominion', 'voting machine', 'voting machines', 'machine hack', 'switch votes',
-                                  'bamboo ballot', 'sharpie', 'dead people voted', 'dead voter', 
-                                  'ballot dump', 'election stolen', 'election rigged', 'election theft',
-                                  'voter fraud', 'fraudulent vote', 'fake ballot', 'hacked by venezuela',
-                                  'invalidate ballot', 'biggest election theft'],
-                'health_conspiracy': ['chemtrail', 'fluoride mind control', 'fluoride lower iq', 
-                                     'big pharma suppress', 'vitamin c cure', 'alkaline water prevent',
-                                     'natural immunity better', 'cancer cure suppressed', 'cure suppressed',
-                                     'sugar feeds cancer'],
-                'tech_conspiracy': ['5g coronavirus', '5g cause', '5g radiation', '5g depopulation', '5g towers cause',
-                                   'phone radiation brain', 'wifi cancer', 'microwave oven cancer', 
-                                   '5g to depopulate', 'weakens your immune system'],
-                'climate_denial': ['climate hoax', 'ice age coming', 'sun cause warming', 'climate scientist disagree',
-                                  'antarctica ice growing'],
-                'manipulation': ['poison our children', 'government planes spray', 'nasa documents prove',
-                                'geoengineering', 'they are installing', 'depopulate the planet']
-            }
-            
             keyword_score = 0
             keyword_matches = []
-            for category, keywords in misinformation_keywords.items():
+            for category, keywords in QUICK_TEST_MISINFORMATION_KEYWORDS.items():
                 for keyword in keywords:
-                    if keyword in content_lower:
+                    if scan.contains(keyword):
                         keyword_score += 5  # Increased from 4 to 5
                         keyword_matches.append(f"{keyword[:30]}")
             
@@ -2026,39 +2611,22 @@ def quick_test():
             
             if matches > 0 or keyword_score > 0:
                 total_matches = matches + len(keyword_matches)
-                print(f"   📚 Database + Keywords: {matches} claims + {len(keyword_matches)} keywords → {total_score:.1f} points (45% weight)")
+                logger.debug("📚 Database + Keywords: %s claims + %s keywords → %.1f points (45%% weight)", matches, len(keyword_matches), total_score)
                 if matched_claims or keyword_matches:
                     examples = (matched_claims + keyword_matches)[:3]
-                    print(f"      Examples: {', '.join(examples)}")
+                    logger.debug("Examples: %s", ', '.join(examples))
             else:
-                print(f"   📚 Database + Keywords: No matches found → 0 points")
+                logger.debug("📚 Database + Keywords: No matches found → 0 points")
         except Exception as e:
-            print(f"   ⚠️ Database error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("⚠️ Database error: %s", e, exc_info=True)
         
         # 3. Linguistic Patterns (15% weight = 15 points max)
-        suspicious_words = {
-            'conspiracy': ['exposed', 'shocking', 'they dont want you to know', 'wake up', 'sheeple',
-                          'hidden truth', 'conspiracy', 'cover up', 'coverup', 'mainstream media lies', 
-                          'msm lies', 'fake news media'],
-            'manipulation': ['big pharma', 'globalist', 'deep state', 'new world order', 'illuminati',
-                           'shadow government', 'puppet master', 'controlled opposition'],
-            'urgency': ['must share', 'share before deleted', 'censored', 'banned', 'silenced',
-                       'they are hiding', 'breaking', 'urgent', 'alert'],
-            'distrust': ['dont trust', 'never trust', 'lie to you', 'lying to us', 'propaganda',
-                        'brainwash', 'indoctrination', 'mind control', 'sheep'],
-            'absolutism': ['never', 'always', 'everyone knows', 'nobody believes', 'all scientists',
-                          'every doctor', '100% proof', 'undeniable', 'fact'],
-            'fearmongering': ['deadly', 'killing', 'poison', 'toxic', 'dangerous truth',
-                             'devastating', 'apocalypse', 'extinction', 'genocide']
-        }
-        
+        scan = scan_keywords(content)
         word_count = 0
         categories_found = set()
-        for category, words in suspicious_words.items():
+        for category, words in QUICK_TEST_SUSPICIOUS_WORDS.items():
             for word in words:
-                if word in content_lower:
+                if scan.contains(word):
                     word_count += 1
                     categories_found.add(category)
         
@@ -2077,9 +2645,9 @@ def quick_test():
         suspicious_score += ling_contribution
         
         if categories_found:
-            print(f"   🔤 Linguistic: {word_count} phrases in {len(categories_found)} categories → {ling_contribution:.1f} points (15% weight)")
+            logger.debug("🔤 Linguistic: %s phrases in %s categories → %.1f points (15%% weight)", word_count, len(categories_found), ling_contribution)
         else:
-            print(f"   🔤 Linguistic: No suspicious patterns → 0 points")
+            logger.debug("🔤 Linguistic: No suspicious patterns → 0 points")
         
         suspicious_score = min(suspicious_score, 100)
         
@@ -2091,7 +2659,7 @@ def quick_test():
         else:
             verdict = "APPEARS CREDIBLE"
         
-        print(f"   Final Score: {suspicious_score:.1f}% - {verdict}\n")
+        logger.debug("Final Score: %.1f%% - %s", suspicious_score, verdict)
         
         return jsonify({
             'success': True,
@@ -2102,9 +2670,7 @@ def quick_test():
         })
         
     except Exception as e:
-        print(f"❌ Quick test error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("❌ Quick test error: %s", e, exc_info=True)
         return jsonify({
             'success': False,
             'error': str(e),
@@ -2128,11 +2694,90 @@ def health():
             'revolutionary_detection': 8,
             'reinforcement_learning': rl_stats
         },
+        'datasets': get_dataset_store().get_status() if get_dataset_store else 'not available',
+        'http': get_http_metrics(),
+        'google_search': get_search_stats(),
+        'jobs': get_job_queue().get_stats(),
+        'tracing': get_trace_stats(),
+        'admission': get_admission_controller().get_stats(),
+        'analysis_dedup': analysis_flights.get_stats(),
+        'analysis_modes': describe_modes(),
+        'logging': get_logging_stats(),
         'device': device,
         'timestamp': datetime.now().isoformat()
     })
 
 
+def collect_component_metrics():
+    """Cache, queue and export figures for /metrics (read from component stats)"""
+    with _ml_prediction_lock:
+        lookups = [({'cache': 'ml_prediction', 'result': 'hit'}, _ml_prediction_stats['hits']),
+                   ({'cache': 'ml_prediction', 'result': 'miss'}, _ml_prediction_stats['misses'])]
+        entries = [({'cache': 'ml_prediction'}, len(_ml_prediction_cache))]
+    
+    search = get_search_stats()
+    if 'api_calls' in search:
+        lookups += [({'cache': 'google_search', 'result': 'hit'}, search['cache_hits']),
+                    ({'cache': 'google_search', 'result': 'coalesced'}, search['coalesced']),
+                    ({'cache': 'google_search', 'result': 'miss'}, search['api_calls'])]
+        entries.append(({'cache': 'google_search'}, search['cached_queries']))
+    claims = get_claim_cache_stats()
+    if claims:
+        lookups += [({'cache': 'claims', 'result': 'hit'}, claims['hits']),
+                    ({'cache': 'claims', 'result': 'miss'}, claims['misses'])]
+        entries.append(({'cache': 'claims'}, claims['entries']))
+    pages = get_page_cache_stats()
+    if pages:
+        lookups += [({'cache': 'pages', 'result': 'hit'}, pages['hits']),
+                    ({'cache': 'pages', 'result': 'miss'}, pages['fetches'])]
+        entries.append(({'cache': 'pages'}, pages['cached_pages']))
+    images = get_image_cache_stats()
+    if images:
+        lookups += [({'cache': 'images', 'result': 'hit'}, images['url_hits'] + images['hash_hits']),
+                    ({'cache': 'images', 'result': 'miss'}, images['misses'])]
+        entries.append(({'cache': 'images'}, images['entries']))
+    yield 'linkscout_cache_lookups_total', 'counter', 'Cache lookups by result', lookups
+    yield 'linkscout_cache_entries', 'gauge', 'Entries held per cache', entries
+    
+    jobs = get_job_queue().get_stats()
+    yield 'linkscout_job_queue_depth', 'gauge', 'Jobs waiting for a worker', [({}, jobs['queued'])]
+    yield 'linkscout_jobs_running', 'gauge', 'Jobs being analyzed', [({}, jobs['running'])]
+    yield 'linkscout_jobs_total', 'counter', 'Jobs by outcome', [
+        ({'outcome': outcome}, jobs[outcome]) for outcome in ('submitted', 'succeeded', 'failed', 'cancelled', 'rejected')]
+    
+    traces = get_trace_stats()
+    if 'queued' in traces:
+        yield 'linkscout_trace_export_queue_depth', 'gauge', 'Traces waiting for export', [({}, traces['queued'])]
+    
+    admission = get_admission_controller().get_stats()
+    yield 'linkscout_admission_active', 'gauge', 'Analyses holding an admission slot', [({}, admission['active'])]
+    yield 'linkscout_admission_waiting', 'gauge', 'Analyses waiting for an admission slot', [({}, admission['waiting'])]
+    yield 'linkscout_admission_total', 'counter', 'Admission decisions by outcome', [
+        ({'outcome': outcome}, admission[outcome])
+        for outcome in ('admitted', 'degraded', 'rejected_queue_full', 'rejected_timeout', 'rejected_client_limit')]
+    
+    flights = analysis_flights.get_stats()
+    yield 'linkscout_analysis_in_flight', 'gauge', 'Distinct analyses running', [({}, flights['in_flight'])]
+    yield 'linkscout_analysis_dedup_total', 'counter', 'Analysis requests by single-flight role', [
+        ({'role': 'leader'}, flights['leaders']), ({'role': 'shared'}, flights['shared']),
+        ({'role': 'timeout'}, flights['timeouts'])]
+    
+    logs = get_logging_stats()
+    yield 'linkscout_log_queue_depth', 'gauge', 'Log records waiting to be written', [({}, logs['queued'])]
+    yield 'linkscout_log_records_dropped_total', 'counter', 'Log records dropped because the queue was full', [({}, logs['dropped'])]
+
+
+metrics_registry.add_collector(collect_component_metrics)
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics (text exposition format)"""
+    if not metrics_authorized(request.headers):
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 401
+    return metrics_registry.render(), 200, {'Content-Type': CONTENT_TYPE}
+
+
 @app.route('/feedback', methods=['POST'])
 def submit_feedback():
     """
@@ -2154,7 +2799,7 @@ def submit_feedback():
         analysis_data = data.get('analysis_data', {})
         user_feedback = data.get('feedback', {})
         
-        print(f"📝 [RL] Received feedback: {user_feedback.get('feedback_type', 'unknown')}")
+        logger.debug("📝 [RL] Received feedback: %s", user_feedback.get('feedback_type', 'unknown'))
         
         # Get RL agent
         rl_agent = get_rl_agent()
@@ -2179,7 +2824,7 @@ def submit_feedback():
         })
         
     except Exception as e:
-        print(f"❌ [RL] Feedback error: {e}")
+        logger.error("❌ [RL] Feedback error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2219,7 +2864,7 @@ def get_rl_suggestion():
         })
         
     except Exception as e:
-        print(f"❌ [RL] Suggestion error: {e}")
+        logger.error("❌ [RL] Suggestion error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2247,13 +2892,111 @@ def get_rl_statistics():
         })
         
     except Exception as e:
-        print(f"❌ [RL] Stats error: {e}")
+        logger.error("❌ [RL] Stats error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+def is_admin_request() -> bool:
+    """Check the X-Admin-Token header against ADMIN_TOKEN"""
+    import hmac
+    token = request.headers.get('X-Admin-Token', '')
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token, ADMIN_TOKEN)
+
+
+@app.route('/admin/reload-data', methods=['POST'])
+def admin_reload_data():
+    """Hot-reload the false claims and source credibility data files"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Forbidden'
+        }), 403
+    
+    result = reload_datasets(force=True)
+    success = 'error' not in result
+    
+    return jsonify({
+        'success': success,
+        **result,
+        'timestamp': datetime.now().isoformat()
+    }), 200 if success else 500
+
+
+def profiling_forbidden():
+    """Error response unless this is an admin request and profiling is enabled"""
+    if not is_admin_request():
+        return jsonify({'success': False, 'error': 'Forbidden'}), 403
+    if not PROFILING_ENABLED:
+        return jsonify({'success': False, 'error': 'Profiling is disabled (set PROFILING_ENABLED=true)'}), 404
+    return None
+
+
+@app.route('/admin/profile', methods=['GET'])
+def admin_profile():
+    """
+    Sample the stacks of all threads and return them as collapsed stacks
+    
+    Query: seconds (default 10), interval (seconds between samples, default
+    0.01), idle=1 to include waiting threads. Feed the result to
+    flamegraph.pl or speedscope.
+    """
+    forbidden = profiling_forbidden()
+    if forbidden:
+        return forbidden
+    
+    seconds = clamp_seconds(request.args.get('seconds'))
+    try:
+        interval = clamp_interval(request.args.get('interval'), seconds)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': f"Invalid interval: {e}"}), 400
+    include_idle = request.args.get('idle', '').lower() in ('1', 'true', 'yes')
+    
+    logger.info("🔬 [PROFILE] Sampling stacks for %.1fs", seconds)
+    try:
+        profile = sample_stacks(seconds, interval, include_idle=include_idle)
+    except ProfilerBusy as e:
+        return jsonify({'success': False, 'error': str(e)}), 409
+    
+    filename = f"linkscout-{datetime.now().strftime('%Y%m%d-%H%M%S')}.collapsed"
+    return profile.to_collapsed(), 200, {
+        'Content-Type': 'text/plain; charset=utf-8',
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'X-Profile-Samples': str(profile.samples),
+    }
+
+
+@app.route('/admin/allocations', methods=['GET'])
+def admin_allocations():
+    """
+    Trace allocations for a window and return the top growing sites
+    
+    Query: seconds (default 10), top (default 25), group_by (lineno,
+    filename or traceback).
+    """
+    forbidden = profiling_forbidden()
+    if forbidden:
+        return forbidden
+    
+    seconds = clamp_seconds(request.args.get('seconds'))
+    top = request.args.get('top', 25, type=int)
+    group_by = request.args.get('group_by', 'lineno')
+    
+    logger.info("🔬 [PROFILE] Tracing allocations for %.1fs", seconds)
+    try:
+        result = allocation_diff(seconds, top=top, group_by=group_by)
+    except ProfilerBusy as e:
+        return jsonify({'success': False, 'error': str(e)}), 409
+    
+    return jsonify({
+        'success': True,
+        **result,
+        'timestamp': datetime.now().isoformat()
+    })
+
+
 @app.route('/download-extension', methods=['GET'])
 def download_extension():
     """
@@ -2276,7 +3019,7 @@ def download_extension():
             zip_path = tmp_file.name
         
         # Create ZIP archive
-        print(f"📦 Creating extension ZIP from {extension_dir}...")
+        logger.debug("📦 Creating extension ZIP from %s...", extension_dir)
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Walk through the extension directory
             for root, dirs, files in os.walk(extension_dir):
@@ -2291,9 +3034,9 @@ def download_extension():
                     file_path = os.path.join(root, file)
                     arcname = os.path.relpath(file_path, os.path.dirname(extension_dir))
                     zipf.write(file_path, arcname)
-                    print(f"   ✅ Added: {arcname}")
+                    logger.debug("✅ Added: %s", arcname)
         
-        print(f"✅ Extension ZIP created successfully")
+        logger.debug("✅ Extension ZIP created successfully")
         
         # Read the ZIP file
         with open(zip_path, 'rb') as f:
@@ -2314,9 +3057,7 @@ def download_extension():
         )
         
     except Exception as e:
-        print(f"❌ Extension download error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("❌ Extension download error: %s", e, exc_info=True)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2330,13 +3071,8 @@ def download_extension():
 @app.errorhandler(Exception)
 def handle_exception(e):
     """Catch all unhandled exceptions"""
-    print(f"\n{'='*70}")
-    print(f"❌ UNHANDLED EXCEPTION: {type(e).__name__}")
-    print(f"Message: {str(e)}")
-    print(f"{'='*70}")
+    logger.exception("❌ UNHANDLED EXCEPTION: %s: %s", type(e).__name__, e)
     import traceback
-    traceback.print_exc()
-    print(f"{'='*70}\n")
     
     return jsonify({
         'success': False,
@@ -2355,7 +3091,7 @@ def not_found(e):
 @app.errorhandler(500)
 def internal_error(e):
     """Handle 500 errors"""
-    print(f"❌ Internal Server Error: {e}")
+    logger.error("❌ Internal Server Error: %s", e)
     return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -2394,6 +3130,10 @@ if __name__ == '__main__':
     except Exception as e:
         print(f"  RL Agent: Not available ({e})")
     
+    # Watch data files for changes (hot reload without restart)
+    if get_dataset_store:
+        get_dataset_store().start_watcher()
+    
     print("\n  Server starting...\n")
     
     try:
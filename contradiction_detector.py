@@ -16,6 +16,9 @@ import spacy
 from typing import Dict, List, Tuple, Set
 from dataclasses import dataclass
 from collections import defaultdict
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
 
 @dataclass
 class Contradiction:
@@ -46,13 +49,13 @@ class ContradictionDetector:
         # Load spaCy model
         try:
             self.nlp = spacy.load("en_core_web_sm")
-            print("🧠 [CONTRADICTION] spaCy model loaded")
+            logger.info("🧠 [CONTRADICTION] spaCy model loaded")
         except OSError:
-            print("🔍 [CONTRADICTION] Downloading spaCy model...")
+            logger.info("🔍 [CONTRADICTION] Downloading spaCy model...")
             import subprocess
             subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
             self.nlp = spacy.load("en_core_web_sm")
-            print("✅ [CONTRADICTION] spaCy model loaded")
+            logger.info("✅ [CONTRADICTION] spaCy model loaded")
         
         # Negation words
         self.negations = {'not', 'no', 'never', 'neither', 'nor', 'none', 'nobody', 
@@ -78,17 +81,17 @@ class ContradictionDetector:
             r'(?:it|this)\s+works\s+because\s+(?:it|this)\s+works'
         ]
         
-        print("🧠 [CONTRADICTION] Contradiction Detector initialized")
+        logger.info("🧠 [CONTRADICTION] Contradiction Detector initialized")
     
     def detect_contradictions(self, text: str) -> ContradictionResult:
         """Detect all types of contradictions in text"""
-        print(f"\n🧠 [CONTRADICTION] Analyzing text for contradictions ({len(text)} chars)...")
+        logger.debug("🧠 [CONTRADICTION] Analyzing text for contradictions (%s chars)...", len(text))
         
         # Split into sentences
         doc = self.nlp(text)
         sentences = [sent.text.strip() for sent in doc.sents]
         
-        print(f"   Found {len(sentences)} sentences to analyze")
+        logger.debug("🧠 [CONTRADICTION] Found %s sentences to analyze", len(sentences))
         
         all_contradictions = []
         
@@ -129,8 +132,8 @@ class ContradictionDetector:
         # Generate summary
         summary = f"{total} contradictions found: {high_severity} high, {medium_severity} medium, {low_severity} low severity"
         
-        print(f"   ✅ Found {total} contradictions ({high_severity} high severity)")
-        print(f"   Score: {contradiction_score}/100 ({verdict})")
+        logger.debug("✅ Found %s contradictions (%s high severity)", total, high_severity)
+        logger.debug("🧠 [CONTRADICTION] Score: %s/100 (%s)", contradiction_score, verdict)
         
         return ContradictionResult(
             total_contradictions=total,
@@ -0,0 +1,273 @@
+"""
+📦 DATASET STORE MODULE
+Versioned, hot-reloadable reference datasets
+
+The false claims database, misinformation patterns and source credibility
+lists live in versioned JSON files under data/ instead of Python literals:
+
+- data/known_false_claims.json: claims + FALSE_CLAIM_PATTERNS
+- data/source_credibility.json: credibility tiers + source score overrides
+
+Files are loaded into an immutable DatasetSnapshot. A reload (file change
+detected by the watcher thread, or an explicit reload_datasets() call from
+the admin endpoint) parses the files and builds every derived index off the
+request path, then swaps the snapshot reference in one assignment. Requests
+in flight keep reading the snapshot they started with; nothing blocks.
+
+Author: AI Misinformation Detector
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Data directory (override with LINKSCOUT_DATA_DIR)
+DATA_DIR = os.getenv('LINKSCOUT_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+FALSE_CLAIMS_FILE = 'known_false_claims.json'
+SOURCE_CREDIBILITY_FILE = 'source_credibility.json'
+
+# Seconds between file change checks (0 disables the watcher)
+DATA_RELOAD_INTERVAL = int(os.getenv('DATA_RELOAD_INTERVAL', '30'))
+
+# Data file schema understood by this version of the loader
+SUPPORTED_SCHEMA = 1
+
+CLAIM_FIELDS = ('verdict', 'source', 'explanation')
+TIERS = ('tier1', 'tier2', 'tier3', 'tier4')
+
+
+@dataclass(frozen=True)
+class DatasetSnapshot:
+    """One consistent, read-only version of all reference datasets"""
+    false_claims: Dict[str, Dict]  # claim key -> verdict/source/explanation
+    false_claim_patterns: List[str]
+    tier_sources: Dict[str, Dict[str, Dict]]  # tier1..tier4 -> domain -> info
+    unreliable_sources: Dict[str, int]  # domain -> score override
+    credible_sources: Dict[str, int]  # domain -> score override
+    versions: Dict[str, str]  # file name -> dataset version
+    mtimes: Dict[str, float] = field(default_factory=dict)
+    loaded_at: str = ''
+
+
+class DatasetStore:
+    """
+    Holds the current DatasetSnapshot and swaps it atomically on reload
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR):
+        self.data_dir = data_dir
+        self._reload_lock = threading.Lock()  # Serializes reloads, never taken by readers
+        self._listeners: List[Callable[[DatasetSnapshot], Callable[[], None]]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+
+        self.snapshot = self._load_snapshot()
+        logger.info("📦 [DATA] Datasets loaded: %s", self._describe(self.snapshot))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.data_dir, name)
+
+    def _read_json(self, name: str) -> Dict:
+        """Read and validate one data file"""
+        with open(self._path(name), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get('schema') != SUPPORTED_SCHEMA:
+            schema = data.get('schema') if isinstance(data, dict) else None
+            raise ValueError(f"{name}: unsupported schema {schema!r} (expected {SUPPORTED_SCHEMA})")
+        if name == FALSE_CLAIMS_FILE:
+            self._check_claims(name, data)
+        elif name == SOURCE_CREDIBILITY_FILE:
+            self._check_credibility(name, data)
+        return data
+
+    def _check_claims(self, name: str, data: Dict):
+        """Every claim needs verdict, source and explanation; patterns are strings"""
+        claims = data.get('claims', {})
+        if not isinstance(claims, dict):
+            raise ValueError(f"{name}: 'claims' must be an object")
+        for key, claim in claims.items():
+            if not isinstance(claim, dict):
+                raise ValueError(f"{name}: claim {key!r} must be an object")
+            missing = [field_name for field_name in CLAIM_FIELDS if not isinstance(claim.get(field_name), str)]
+            if missing:
+                raise ValueError(f"{name}: claim {key!r} is missing {', '.join(missing)}")
+        patterns = data.get('patterns', [])
+        if not isinstance(patterns, list) or not all(isinstance(pattern, str) for pattern in patterns):
+            raise ValueError(f"{name}: 'patterns' must be a list of strings")
+
+    def _check_credibility(self, name: str, data: Dict):
+        """Tiers map domains to info objects; overrides map domains to scores"""
+        tiers = data.get('tiers', {})
+        if not isinstance(tiers, dict):
+            raise ValueError(f"{name}: 'tiers' must be an object")
+        for tier in TIERS:
+            sources = tiers.get(tier, {})
+            if not isinstance(sources, dict):
+                raise ValueError(f"{name}: tier {tier!r} must be an object")
+            for domain, info in sources.items():
+                if not isinstance(info, dict) or not isinstance(info.get('score'), (int, float)):
+                    raise ValueError(f"{name}: {tier} source {domain!r} must be an object with a numeric score")
+        for key in ('unreliable_sources', 'credible_sources'):
+            overrides = data.get(key, {})
+            if not isinstance(overrides, dict) or not all(isinstance(score, (int, float)) for score in overrides.values()):
+                raise ValueError(f"{name}: {key!r} must map domains to numeric scores")
+
+    def _load_snapshot(self) -> DatasetSnapshot:
+        """Parse all data files into a new snapshot"""
+        mtimes = self._current_mtimes()
+        claims_data = self._read_json(FALSE_CLAIMS_FILE)
+        credibility_data = self._read_json(SOURCE_CREDIBILITY_FILE)
+
+        tiers = credibility_data.get('tiers', {})
+        return DatasetSnapshot(
+            false_claims=claims_data.get('claims', {}),
+            false_claim_patterns=list(claims_data.get('patterns', [])),
+            tier_sources={tier: tiers.get(tier, {}) for tier in TIERS},
+            unreliable_sources=credibility_data.get('unreliable_sources', {}),
+            credible_sources=credibility_data.get('credible_sources', {}),
+            versions={
+                FALSE_CLAIMS_FILE: str(claims_data.get('version', 'unknown')),
+                SOURCE_CREDIBILITY_FILE: str(credibility_data.get('version', 'unknown'))
+            },
+            mtimes=mtimes,
+            loaded_at=datetime.now().isoformat()
+        )
+
+    def _current_mtimes(self) -> Dict[str, float]:
+        mtimes = {}
+        for name in (FALSE_CLAIMS_FILE, SOURCE_CREDIBILITY_FILE):
+            try:
+                mtimes[name] = os.path.getmtime(self._path(name))
+            except OSError:
+                mtimes[name] = 0.0
+        return mtimes
+
+    def _describe(self, snapshot: DatasetSnapshot) -> str:
+        tier_count = sum(len(sources) for sources in snapshot.tier_sources.values())
+        versions = ', '.join(f"{name}@{version}" for name, version in snapshot.versions.items())
+        return (f"{len(snapshot.false_claims)} claims, {len(snapshot.false_claim_patterns)} patterns, "
+                f"{tier_count} tiered sources ({versions})")
+
+    def add_listener(self, listener: Callable[[DatasetSnapshot], Callable[[], None]]):
+        """
+        Register a callback that rebuilds derived indexes from a new snapshot
+
+        Listeners run in the reloading thread before the snapshot is swapped,
+        so request threads never build indexes themselves. A listener only
+        builds; it returns a commit callable that swaps its indexes in. The
+        commits run once every listener has built successfully, so a failed
+        build leaves all indexes on the old data.
+        """
+        self._listeners.append(listener)
+
+    def changed(self) -> bool:
+        """Whether any data file changed since the current snapshot was loaded"""
+        return self._current_mtimes() != self.snapshot.mtimes
+
+    def reload(self, force: bool = True) -> Dict:
+        """
+        Reload the data files and swap in a new snapshot
+
+        Args:
+            force: Reload even if no file modification was detected
+
+        Returns:
+            Status dictionary (reloaded flag, versions, error if any)
+        """
+        with self._reload_lock:
+            if not force and not self.changed():
+                return {'reloaded': False, 'versions': self.snapshot.versions}
+
+            try:
+                snapshot = self._load_snapshot()
+                # Build derived indexes before the swap; a failure keeps the old data
+                commits = [listener(snapshot) for listener in self._listeners]
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.warning("⚠️ [DATA] Reload failed, keeping version %s: %s", self.snapshot.versions, self.last_error)
+                return {'reloaded': False, 'versions': self.snapshot.versions, 'error': self.last_error}
+
+            for commit in commits:
+                commit()
+            self.snapshot = snapshot  # Atomic reference swap
+            self.reload_count += 1
+            self.last_error = None
+            logger.info("📦 [DATA] Datasets reloaded: %s", self._describe(snapshot))
+            return {'reloaded': True, 'versions': snapshot.versions, 'loaded_at': snapshot.loaded_at}
+
+    def start_watcher(self, interval: int = DATA_RELOAD_INTERVAL):
+        """Start a daemon thread that reloads the datasets when a file changes"""
+        if interval <= 0 or self._watcher is not None:
+            return
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.reload(force=False)
+                except Exception as e:
+                    logger.warning("⚠️ [DATA] Watcher error: %s", e)
+
+        self._watcher = threading.Thread(target=watch, name='dataset-watcher', daemon=True)
+        self._watcher.start()
+        logger.info("📦 [DATA] Watching %s for changes every %ss", self.data_dir, interval)
+
+    def get_status(self) -> Dict:
+        """Versions and reload statistics"""
+        snapshot = self.snapshot
+        return {
+            'data_dir': self.data_dir,
+            'versions': snapshot.versions,
+            'loaded_at': snapshot.loaded_at,
+            'reload_count': self.reload_count,
+            'watching': self._watcher is not None,
+            'last_error': self.last_error
+        }
+
+
+# Singleton instance
+_dataset_store = None
+_store_lock = threading.Lock()
+
+
+def get_dataset_store() -> DatasetStore:
+    """Get or create the dataset store singleton"""
+    global _dataset_store
+    if _dataset_store is None:
+        with _store_lock:
+            if _dataset_store is None:
+                _dataset_store = DatasetStore()
+    return _dataset_store
+
+
+def get_datasets() -> DatasetSnapshot:
+    """Current dataset snapshot (read once per request for a consistent view)"""
+    return get_dataset_store().snapshot
+
+
+def reload_datasets(force: bool = True) -> Dict:
+    """Reload the data files (used by the admin endpoint)"""
+    return get_dataset_store().reload(force=force)
+
+
+# Test function
+if __name__ == "__main__":
+    store = get_dataset_store()
+
+    print("\n" + "=" * 60)
+    print("DATASET STORE TEST")
+    print("=" * 60)
+    print(json.dumps(store.get_status(), indent=2))
+    print(f"Changed since load: {store.changed()}")
+    print(f"Forced reload: {reload_datasets()}")
+    print("=" * 60)
@@ -12,6 +12,10 @@ Uses pattern matching and basic heuristics for verification.
 import re
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from keyword_matcher import register_keywords, scan_keywords
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
 
 @dataclass
 class Entity:
@@ -38,6 +42,38 @@ class EntityVerificationResult:
 class EntityVerifier:
     """Verify entities mentioned in text"""
     
+    # Keyword lists - word-boundary matches read from the shared keyword automaton
+    
+    # Known prestigious institutions (partial list)
+    PRESTIGIOUS_INSTITUTIONS = {
+        'harvard', 'stanford', 'mit', 'oxford', 'cambridge',
+        'yale', 'princeton', 'caltech', 'columbia', 'chicago',
+        'who', 'cdc', 'nasa', 'fda', 'nih', 'nhs',
+        'reuters', 'associated press', 'bbc', 'nature', 'science'
+    }
+    
+    # Suspicious organization keywords
+    SUSPICIOUS_ORG_KEYWORDS = [
+        'anonymous', 'secret', 'underground', 'shadow',
+        'independent researcher', 'citizen journalist',
+        'alternative media', 'truth seeker'
+    ]
+    
+    # Countries (simplified list)
+    COUNTRIES = [
+        'United States', 'USA', 'America', 'China', 'Russia', 'India', 'Japan',
+        'Germany', 'France', 'United Kingdom', 'UK', 'Britain', 'Canada',
+        'Australia', 'Brazil', 'Mexico', 'Italy', 'Spain', 'South Korea',
+        'Indonesia', 'Turkey', 'Saudi Arabia', 'Argentina', 'Poland'
+    ]
+    
+    # Major cities (simplified list)
+    CITIES = [
+        'New York', 'Los Angeles', 'London', 'Paris', 'Tokyo', 'Beijing',
+        'Moscow', 'Delhi', 'Shanghai', 'Mumbai', 'Seoul', 'Berlin',
+        'Madrid', 'Rome', 'Toronto', 'Sydney', 'Washington', 'Chicago'
+    ]
+    
     def __init__(self):
         # Known fake expert patterns
         self.fake_expert_patterns = [
@@ -71,26 +107,11 @@ class EntityVerifier:
             'Agency', 'Department', 'Ministry', 'Bureau'
         ]
         
-        # Known prestigious institutions (partial list)
-        self.prestigious_institutions = {
-            'harvard', 'stanford', 'mit', 'oxford', 'cambridge',
-            'yale', 'princeton', 'caltech', 'columbia', 'chicago',
-            'who', 'cdc', 'nasa', 'fda', 'nih', 'nhs',
-            'reuters', 'associated press', 'bbc', 'nature', 'science'
-        }
-        
-        # Suspicious organization keywords
-        self.suspicious_org_keywords = [
-            'anonymous', 'secret', 'underground', 'shadow',
-            'independent researcher', 'citizen journalist',
-            'alternative media', 'truth seeker'
-        ]
-        
-        print("👤 [ENTITY] Entity Verification System initialized")
+        logger.info("👤 [ENTITY] Entity Verification System initialized")
     
     def verify_entities(self, text: str) -> EntityVerificationResult:
         """Verify all entities in text"""
-        print(f"\n👤 [ENTITY] Analyzing entities in text ({len(text)} chars)...")
+        logger.debug("👤 [ENTITY] Analyzing entities in text (%s chars)...", len(text))
         
         # Extract entities
         people = self._extract_people(text)
@@ -99,7 +120,7 @@ class EntityVerifier:
         
         all_entities = people + organizations + locations
         
-        print(f"   Found: {len(people)} people, {len(organizations)} orgs, {len(locations)} locations")
+        logger.debug("👤 [ENTITY] Found: %s people, %s orgs, %s locations", len(people), len(organizations), len(locations))
         
         # Verify each entity
         verified_count = 0
@@ -134,9 +155,9 @@ class EntityVerifier:
         else:
             verdict = "VERIFIED"
         
-        print(f"   ✅ Verification: {verified_count}/{total_entities} verified, {suspicious_count} suspicious")
+        logger.debug("✅ Verification: %s/%s verified, %s suspicious", verified_count, total_entities, suspicious_count)
         if fake_expert_detected:
-            print(f"   ⚠️ FAKE EXPERT DETECTED!")
+            logger.debug("⚠️ FAKE EXPERT DETECTED!")
         
         return EntityVerificationResult(
             total_entities=total_entities,
@@ -218,15 +239,15 @@ class EntityVerifier:
     def _extract_organizations(self, text: str) -> List[Entity]:
         """Extract and verify organization names"""
         organizations = []
+        scan = scan_keywords(text)
         
         # Pattern 1: Known prestigious institutions
-        for institution in self.prestigious_institutions:
-            pattern = re.compile(r'\b' + re.escape(institution) + r'\b', re.IGNORECASE)
-            for match in re.finditer(pattern, text):
-                context = text[max(0, match.start()-50):min(len(text), match.end()+50)]
+        for institution in self.PRESTIGIOUS_INSTITUTIONS:
+            for match in scan.occurrences(institution, bounded=True):
+                context = text[max(0, match.start-50):min(len(text), match.end+50)]
                 
                 organizations.append(Entity(
-                    text=match.group(0),
+                    text=scan.matched_text(match),
                     type="ORGANIZATION",
                     context=context,
                     verified=True,
@@ -251,7 +272,7 @@ class EntityVerifier:
                 confidence = 60
                 
                 # Check for suspicious keywords
-                if any(keyword in org_name.lower() for keyword in self.suspicious_org_keywords):
+                if any(keyword in org_name.lower() for keyword in self.SUSPICIOUS_ORG_KEYWORDS):
                     issues.append('suspicious_name')
                     verified = False
                     confidence = 30
@@ -266,13 +287,12 @@ class EntityVerifier:
                 ))
         
         # Pattern 3: Suspicious organizations
-        for keyword in self.suspicious_org_keywords:
-            pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-            for match in re.finditer(pattern, text):
-                context = text[max(0, match.start()-50):min(len(text), match.end()+50)]
+        for keyword in self.SUSPICIOUS_ORG_KEYWORDS:
+            for match in scan.occurrences(keyword, bounded=True):
+                context = text[max(0, match.start-50):min(len(text), match.end+50)]
                 
                 organizations.append(Entity(
-                    text=match.group(0),
+                    text=scan.matched_text(match),
                     type="ORGANIZATION",
                     context=context,
                     verified=False,
@@ -285,22 +305,15 @@ class EntityVerifier:
     def _extract_locations(self, text: str) -> List[Entity]:
         """Extract and verify location names"""
         locations = []
+        scan = scan_keywords(text)
         
-        # Pattern 1: Countries (simplified list)
-        countries = [
-            'United States', 'USA', 'America', 'China', 'Russia', 'India', 'Japan',
-            'Germany', 'France', 'United Kingdom', 'UK', 'Britain', 'Canada',
-            'Australia', 'Brazil', 'Mexico', 'Italy', 'Spain', 'South Korea',
-            'Indonesia', 'Turkey', 'Saudi Arabia', 'Argentina', 'Poland'
-        ]
-        
-        for country in countries:
-            pattern = re.compile(r'\b' + re.escape(country) + r'\b', re.IGNORECASE)
-            for match in re.finditer(pattern, text):
-                context = text[max(0, match.start()-50):min(len(text), match.end()+50)]
+        # Pattern 1: Countries
+        for country in self.COUNTRIES:
+            for match in scan.occurrences(country, bounded=True):
+                context = text[max(0, match.start-50):min(len(text), match.end+50)]
                 
                 locations.append(Entity(
-                    text=match.group(0),
+                    text=scan.matched_text(match),
                     type="LOCATION",
                     context=context,
                     verified=True,
@@ -308,24 +321,17 @@ class EntityVerifier:
                     issues=[]
                 ))
         
-        # Pattern 2: Major cities (simplified list)
-        cities = [
-            'New York', 'Los Angeles', 'London', 'Paris', 'Tokyo', 'Beijing',
-            'Moscow', 'Delhi', 'Shanghai', 'Mumbai', 'Seoul', 'Berlin',
-            'Madrid', 'Rome', 'Toronto', 'Sydney', 'Washington', 'Chicago'
-        ]
-        
-        for city in cities:
-            pattern = re.compile(r'\b' + re.escape(city) + r'\b', re.IGNORECASE)
-            for match in re.finditer(pattern, text):
-                context = text[max(0, match.start()-50):min(len(text), match.end()+50)]
+        # Pattern 2: Major cities
+        for city in self.CITIES:
+            for match in scan.occurrences(city, bounded=True):
+                context = text[max(0, match.start-50):min(len(text), match.end+50)]
                 
                 # Check if already found
                 if any(city.lower() in e.text.lower() for e in locations):
                     continue
                 
                 locations.append(Entity(
-                    text=match.group(0),
+                    text=scan.matched_text(match),
                     type="LOCATION",
                     context=context,
                     verified=True,
@@ -346,6 +352,12 @@ class EntityVerifier:
             'context': entity.context[:100]  # Truncate context
         }
 
+# Register keyword lists with the shared keyword automaton
+register_keywords('entity.institutions', EntityVerifier.PRESTIGIOUS_INSTITUTIONS)
+register_keywords('entity.suspicious_orgs', EntityVerifier.SUSPICIOUS_ORG_KEYWORDS)
+register_keywords('entity.countries', EntityVerifier.COUNTRIES)
+register_keywords('entity.cities', EntityVerifier.CITIES)
+
 # Singleton instance
 _entity_verifier = None
 
@@ -1,6 +1,13 @@
-import requests
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
+
+from http_client import get_http_session, http_timeout
+from request_context import DeadlineExceeded, check_deadline, current_context, deadline_expired
+from single_flight import SingleFlight
+from tracing import annotate, span
 
 # Load Google API key and CSE ID from environment variables or config file
 def load_google_config():
@@ -23,14 +30,115 @@ def load_google_config():
 GOOGLE_API_KEY, GOOGLE_CSE_ID = load_google_config()
 GOOGLE_SEARCH_URL = 'https://www.googleapis.com/customsearch/v1'
 
-def google_web_search(query, count=5):
+# Result cache: the query is usually the article title, so repeat and
+# concurrent analyses of the same story share one API call
+GOOGLE_SEARCH_TIMEOUT = float(os.environ.get('GOOGLE_SEARCH_TIMEOUT', '5'))  # Read timeout (seconds)
+GOOGLE_SEARCH_CACHE_TTL = int(os.environ.get('GOOGLE_SEARCH_CACHE_TTL', '21600'))  # Seconds (0 = no cache)
+GOOGLE_SEARCH_CACHE_SIZE = 1000  # Cached queries (LRU)
+
+
+def normalize_query(query):
+    """Cache key form of a query: lower-cased, whitespace collapsed"""
+    return ' '.join(str(query).lower().split())
+
+
+class SearchResultCache:
+    """
+    TTL + LRU cache of search results; concurrent misses share one API call
+    """
+
+    def __init__(self, ttl=GOOGLE_SEARCH_CACHE_TTL, max_entries=GOOGLE_SEARCH_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, results)
+        self._flights = SingleFlight()
+        self.stats = {'api_calls': 0, 'api_errors': 0, 'cache_hits': 0, 'coalesced': 0}
+
+    def _cached(self, key):
+        """Unexpired cached results for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.stats['cache_hits'] += 1
+                return list(entry[1])
+            del self._entries[key]
+            return None
+
+    def _fetch(self, key, fetch):
+        """Call the API (leader only) and cache the results"""
+        with self._lock:
+            self.stats['api_calls'] += 1
+        try:
+            results = fetch()
+        except Exception:
+            with self._lock:
+                self.stats['api_errors'] += 1
+            raise
+        with self._lock:
+            if self.ttl > 0:
+                self._entries[key] = (time.time() + self.ttl, results)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return results
+
+    def get_or_fetch(self, key, fetch):
+        """
+        Cached results for key, or fetch() them exactly once
+
+        Concurrent callers with the same key wait (within their own budget)
+        for the first caller's fetch instead of issuing their own. Errors
+        are not cached. If that fetch ran out of the first caller's time
+        budget, a waiting caller with budget left fetches again itself.
+        """
+        while True:
+            results = self._cached(key)
+            if results is not None:
+                annotate(cache='hit')
+                return results
+
+            context = current_context()
+            try:
+                results, shared = self._flights.do(key, lambda: self._fetch(key, fetch),
+                                                   timeout=context.remaining() if context is not None else None)
+            except TimeoutError as e:
+                raise DeadlineExceeded(f"Google search skipped: {e}") from e
+            except DeadlineExceeded:
+                if deadline_expired():
+                    raise
+                continue  # The leader's budget ran out, not ours: try again
+
+            if shared:
+                with self._lock:
+                    self.stats['coalesced'] += 1
+            annotate(cache='coalesced' if shared else 'miss')
+            return list(results)
+
+    def get_stats(self):
+        """Quota used (API calls) and saved (cache hits + coalesced calls)"""
+        with self._lock:
+            return {
+                **self.stats,
+                'quota_saved': self.stats['cache_hits'] + self.stats['coalesced'],
+                'cached_queries': len(self._entries)
+            }
+
+
+_search_cache = SearchResultCache()
+
+
+def _fetch_results(query, count):
     params = {
         'key': GOOGLE_API_KEY,
         'cx': GOOGLE_CSE_ID,
         'q': query,
         'num': count
     }
-    response = requests.get(GOOGLE_SEARCH_URL, params=params)
+    response = get_http_session().get(GOOGLE_SEARCH_URL, params=params, timeout=http_timeout(GOOGLE_SEARCH_TIMEOUT))
     response.raise_for_status()
     data = response.json()
     results = []
@@ -41,3 +149,15 @@ def google_web_search(query, count=5):
             'snippet': item.get('snippet', '')
         })
     return results
+
+
+def google_web_search(query, count=5):
+    check_deadline('Google search')
+    key = (normalize_query(query), count)
+    with span('Google search', 'internal', input_chars=len(str(query))):
+        return _search_cache.get_or_fetch(key, lambda: _fetch_results(query, count))
+
+
+def get_search_stats():
+    """Google search quota metrics"""
+    return _search_cache.get_stats()
@@ -0,0 +1,263 @@
+"""
+🔌 SHARED HTTP CLIENT
+One pooled, keep-alive HTTP session for all outbound requests
+
+Google search, claim verification, the verification network, official
+source pages, image downloads and the Groq API all go through the session
+returned by get_http_session():
+
+- Per-host connection pools (urllib3 PoolManager), reused across requests
+  and threads, so repeat calls skip the TCP + TLS handshake
+- Consistent default (connect, read) timeouts; a call may still pass its
+  own timeout. Within an analysis request, timeouts never exceed the
+  request's remaining deadline (request_context)
+- Retries with exponential backoff and jitter for idempotent requests
+  (connection errors, 429 and 5xx; Retry-After is honoured)
+- Metrics per host: requests sent, connections opened, connections reused
+- Every call is a span of the current trace (tracing), if one is active,
+  and is counted in the outbound metrics of its service (metrics)
+
+Author: AI Misinformation Detector
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from request_context import DeadlineExceeded, current_context, deadline_expired
+from metrics import OUTBOUND_REQUESTS, OUTBOUND_SECONDS
+from tracing import span
+
+# Configuration
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3.05'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '10'))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+HTTP_BACKOFF_FACTOR = 0.3  # Seconds; doubled per retry, then jittered
+HTTP_POOL_HOSTS = 32  # Host pools kept open
+HTTP_POOL_MAXSIZE = 16  # Keep-alive connections per host
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Metrics label per host suffix; other hosts are grouped as 'other'
+SERVICE_HOSTS = (
+    ('groq.com', 'groq'),
+    ('googleapis.com', 'google'),
+    ('google.com', 'google'),
+    ('duckduckgo.com', 'duckduckgo'),
+    ('wikipedia.org', 'wikipedia'),
+    ('wikidata.org', 'wikidata'),
+    ('ncbi.nlm.nih.gov', 'pubmed'),
+    ('arxiv.org', 'arxiv')
+)
+
+
+def service_name(host: str) -> str:
+    """Service label of a host for outbound metrics"""
+    for suffix, service in SERVICE_HOSTS:
+        if host == suffix or host.endswith('.' + suffix):
+            return service
+    return 'other'
+
+
+def http_timeout(read: Optional[float] = None, connect: Optional[float] = None) -> Tuple[float, float]:
+    """(connect, read) timeout tuple using the shared defaults"""
+    return (connect or HTTP_CONNECT_TIMEOUT, read or HTTP_READ_TIMEOUT)
+
+
+class JitterRetry(Retry):
+    """
+    Exponential backoff with +/-50% jitter so clients don't retry in lockstep
+
+    No retry is attempted once the current request's deadline has passed.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff * random.uniform(0.5, 1.5) if backoff > 0 else 0
+
+    def is_exhausted(self) -> bool:
+        return super().is_exhausted() or deadline_expired()
+
+
+def _build_retry() -> Retry:
+    options = dict(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=1,
+        status=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+        respect_retry_after_header=True
+    )
+    try:
+        return JitterRetry(allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']), **options)
+    except TypeError:
+        # urllib3 < 1.26
+        return JitterRetry(method_whitelist=frozenset(['GET', 'HEAD', 'OPTIONS']), **options)
+
+
+class HTTPClient(requests.Session):
+    """
+    requests.Session with pooled adapters, default timeouts and metrics
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.headers['User-Agent'] = DEFAULT_USER_AGENT
+
+        self.adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_HOSTS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=_build_retry()
+        )
+        self.mount('http://', self.adapter)
+        self.mount('https://', self.adapter)
+
+        self._metrics_lock = threading.Lock()
+        self._host_stats: Dict[str, Dict[str, int]] = {}
+
+    def request(self, method, url, timeout: Union[None, float, Tuple[float, float]] = None, **kwargs):
+        """
+        Send a request; default (connect, read) timeouts when none given
+
+        Inside an analysis request the timeout is capped at the remaining
+        budget, and no request is started once the deadline has passed
+        (raises DeadlineExceeded).
+        """
+        if timeout is None:
+            timeout = http_timeout()
+        host = urlparse(url).hostname or ''
+        context = current_context()
+        if context is not None:
+            if context.expired():
+                raise DeadlineExceeded(f"{method} {host} not sent: request deadline reached")
+            timeout = context.cap_timeout(timeout, HTTP_READ_TIMEOUT)
+        service = service_name(host)
+        started = time.perf_counter()
+        with span(f"{method} {host}", 'http', **{'http.method': method, 'http.host': host}) as http_span:
+            try:
+                response = super().request(method, url, timeout=timeout, **kwargs)
+            except requests.RequestException as e:
+                self._count(host, 'errors')
+                OUTBOUND_SECONDS.observe(time.perf_counter() - started, service=service)
+                OUTBOUND_REQUESTS.inc(service=service, status='timeout' if isinstance(e, requests.Timeout) else 'error')
+                raise
+            OUTBOUND_SECONDS.observe(time.perf_counter() - started, service=service)
+            OUTBOUND_REQUESTS.inc(service=service, status=str(response.status_code))
+            http_span.set(**{'http.status_code': response.status_code,
+                             'response_bytes': int(response.headers.get('Content-Length') or 0)})
+        self._count(host, 'responses')
+        return response
+
+    def _count(self, host: str, field: str):
+        with self._metrics_lock:
+            stats = self._host_stats.setdefault(host, {'responses': 0, 'errors': 0})
+            stats[field] += 1
+
+    def get_metrics(self) -> Dict:
+        """
+        Connection reuse per host
+
+        'requests' counts every attempt (retries included) and 'connections'
+        every new TCP/TLS connection; the difference was served by keep-alive.
+        """
+        hosts: Dict[str, Dict] = {}
+        with self._metrics_lock:
+            for host, stats in self._host_stats.items():
+                hosts[host] = dict(stats, requests=0, connections=0)
+
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            try:
+                pool = pools[key]
+            except KeyError:
+                continue  # Evicted meanwhile
+            entry = hosts.setdefault(pool.host, {'responses': 0, 'errors': 0, 'requests': 0, 'connections': 0})
+            entry['requests'] += pool.num_requests
+            entry['connections'] += pool.num_connections
+
+        total_requests = sum(h['requests'] for h in hosts.values())
+        total_connections = sum(h['connections'] for h in hosts.values())
+        for entry in hosts.values():
+            entry['reused'] = max(0, entry['requests'] - entry['connections'])
+
+        return {
+            'requests': total_requests,
+            'connections': total_connections,
+            'reuse_rate': round(1 - total_connections / total_requests, 3) if total_requests else 0.0,
+            'hosts': hosts
+        }
+
+
+# Singleton instance
+_http_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_session() -> HTTPClient:
+    """Shared pooled session for all outbound HTTP"""
+    global _http_client
+    if _http_client is None:
+        with _client_lock:
+            if _http_client is None:
+                _http_client = HTTPClient()
+    return _http_client
+
+
+def get_http_metrics() -> Dict:
+    """Connection reuse metrics of the shared session"""
+    return get_http_session().get_metrics()
+
+
+# Test function
+if __name__ == "__main__":
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    failures = {'count': 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep-alive
+
+        def do_GET(self):
+            if self.path == '/flaky' and failures['count'] < 1:
+                failures['count'] += 1
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            body = b'ok'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    session = get_http_session()
+    start = time.time()
+    for _ in range(20):
+        session.get(f"{base}/page")
+    flaky = session.get(f"{base}/flaky")
+
+    print("\n" + "=" * 60)
+    print("HTTP CLIENT TEST")
+    print("=" * 60)
+    print(f"21 requests in {(time.time() - start) * 1000:.0f} ms, flaky endpoint -> {flaky.status_code} after retry")
+    print(json.dumps(get_http_metrics(), indent=2))
+    print("=" * 60)
+    server.shutdown()
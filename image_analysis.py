@@ -4,31 +4,32 @@ Detects AI-generated/fake images and performs reverse image search verification
 """
 
 import os
-import requests
 from PIL import Image
 from io import BytesIO
 import torch
 from transformers import AutoFeatureExtractor, AutoModelForImageClassification
 import hashlib
-from urllib.parse import urlparse, urljoin
-import base64
-import re
-import tempfile
-import time
-import shutil
-from pathlib import Path
-import shutil
-from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import get_http_session, http_timeout
+from image_cache import dhash, get_image_verdict_cache
+from image_extractor import extract_image_candidates, is_content_image_url
+from request_context import submit
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
 
 # Configuration
 MODELS_CACHE_DIR = os.path.join(os.path.dirname(__file__), 'models_cache')
 AI_IMAGE_DETECTOR_MODEL = "umm-maybe/AI-image-detector"
 MAX_IMAGES_PER_PAGE = 10
 IMAGE_SIZE_LIMIT_MB = 10
-TEMP_IMAGE_DIR = os.path.join(tempfile.gettempdir(), 'ai_detector_images')
-
-# Ensure temp directory exists
-os.makedirs(TEMP_IMAGE_DIR, exist_ok=True)
+IMAGE_DOWNLOAD_WORKERS = 6  # Concurrent downloads (over the shared connection pool)
+IMAGE_DOWNLOAD_TIMEOUT = 10  # Seconds (read timeout) per request
+IMAGE_CHUNK_SIZE = 64 * 1024  # Streaming read size
+# Decoded images are downscaled to about this size (the detector works on 224px inputs)
+IMAGE_DECODE_MAX_SIZE = 512
 
 class ImageAnalyzer:
     """
@@ -42,49 +43,21 @@ class ImageAnalyzer:
         self.model = None
         self.feature_extractor = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.temp_images = []  # Track downloaded images for cleanup
-        print(f"🖼️ [IMAGE] Image Analyzer initializing (Device: {self.device})...")
+        logger.info("🖼️ [IMAGE] Image Analyzer initializing (Device: %s)...", self.device)
         
-        # Clean old images from previous runs
-        self._cleanup_old_images()
+        # Shared pooled session (keep-alive per image host) used by the download workers
+        self.session = get_http_session()
+        
+        # Verdicts of images already classified (by URL and perceptual hash)
+        self.verdict_cache = get_image_verdict_cache(AI_IMAGE_DETECTOR_MODEL)
         
         # Load AI image detection model
         self._load_model()
     
-    def _cleanup_old_images(self):
-        """Clean up old temporary images from previous runs"""
-        try:
-            if os.path.exists(TEMP_IMAGE_DIR):
-                for file in os.listdir(TEMP_IMAGE_DIR):
-                    file_path = os.path.join(TEMP_IMAGE_DIR, file)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.unlink(file_path)
-                    except Exception as e:
-                        print(f"⚠️ [IMAGE] Could not delete {file_path}: {e}")
-                print(f"🧹 [IMAGE] Cleaned up old temporary images")
-        except Exception as e:
-            print(f"⚠️ [IMAGE] Cleanup warning: {e}")
-    
-    def _cleanup_downloaded_images(self):
-        """Delete all downloaded images after analysis"""
-        try:
-            for img_path in self.temp_images:
-                try:
-                    if os.path.exists(img_path):
-                        os.unlink(img_path)
-                except Exception as e:
-                    print(f"⚠️ [IMAGE] Could not delete {img_path}: {e}")
-            
-            self.temp_images.clear()
-            print(f"🧹 [IMAGE] Cleaned up {len(self.temp_images)} downloaded images")
-        except Exception as e:
-            print(f"⚠️ [IMAGE] Cleanup error: {e}")
-    
     def _load_model(self):
         """Load the AI-generated image detection model"""
         try:
-            print(f"🤖 [IMAGE] Loading AI image detector: {AI_IMAGE_DETECTOR_MODEL}")
+            logger.info("🤖 [IMAGE] Loading AI image detector: %s", AI_IMAGE_DETECTOR_MODEL)
             
             cache_dir = os.path.join(MODELS_CACHE_DIR, AI_IMAGE_DETECTOR_MODEL.replace('/', '_'))
             
@@ -101,11 +74,11 @@ class ImageAnalyzer:
             self.model.to(self.device)
             self.model.eval()
             
-            print(f"✅ [IMAGE] AI image detector loaded successfully")
+            logger.info("✅ [IMAGE] AI image detector loaded successfully")
             
         except Exception as e:
-            print(f"⚠️ [IMAGE] Could not load AI detector model: {e}")
-            print(f"💡 [IMAGE] Will use fallback basic analysis")
+            logger.warning("⚠️ [IMAGE] Could not load AI detector model: %s", e)
+            logger.info("💡 [IMAGE] Will use fallback basic analysis")
     
     def extract_images_from_html(self, html_content, base_url):
         """
@@ -116,115 +89,110 @@ class ImageAnalyzer:
             base_url: Base URL for resolving relative paths
             
         Returns:
-            List of absolute image URLs
+            List of absolute image URLs, best candidates first
         """
-        print(f"🔍 [IMAGE] Extracting images from HTML...")
-        
-        image_urls = []
-        
-        # Find all img tags with src
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\']'
-        matches = re.findall(img_pattern, html_content, re.IGNORECASE)
-        
-        for img_url in matches:
-            # Convert relative URLs to absolute
-            if img_url.startswith('//'):
-                img_url = 'https:' + img_url
-            elif img_url.startswith('/'):
-                img_url = urljoin(base_url, img_url)
-            elif not img_url.startswith('http'):
-                img_url = urljoin(base_url, img_url)
-            
-            # Filter out small icons, logos, tracking pixels
-            if self._is_valid_image_url(img_url):
-                image_urls.append(img_url)
+        logger.debug("🔍 [IMAGE] Extracting images from HTML...")
         
-        # Remove duplicates while preserving order
-        image_urls = list(dict.fromkeys(image_urls))
+        # Streaming parse: srcset/lazy-load/<picture>/og:image, tiny images
+        # dropped from declared sizes, ranked by DOM position
+        candidates = extract_image_candidates(html_content, base_url)
         
         # Limit to MAX_IMAGES_PER_PAGE
-        image_urls = image_urls[:MAX_IMAGES_PER_PAGE]
+        image_urls = [candidate.url for candidate in candidates[:MAX_IMAGES_PER_PAGE]]
         
-        print(f"✅ [IMAGE] Found {len(image_urls)} valid images to analyze")
+        logger.debug("✅ [IMAGE] Found %s valid images to analyze (%s candidates)", len(image_urls), len(candidates))
         
         return image_urls
     
     def _is_valid_image_url(self, url):
         """Check if URL is likely a valid content image (not icon/logo/navigation)"""
-        url_lower = url.lower()
-        
-        # ✅ Skip common non-content images (expanded list)
-        skip_patterns = [
-            'logo', 'icon', 'favicon', 'sprite', 'avatar',
-            'placeholder', 'loading', 'spinner', 'blank',
-            'pixel', 'tracking', 'analytics', '1x1',
-            'data:image', 'base64',
-            'arrow', 'button', 'badge', 'bullet',  # Navigation elements
-            'banner', 'header', 'footer', 'sidebar',  # Layout elements
-            'social', 'share', 'follow', 'subscribe',  # Social buttons
-            'ad', 'advertisement', 'promo', 'sponsor',  # Ads
-            'thumbnail-small', 'thumb-', '-thumb',  # Small thumbnails
-            'widget', 'module', 'component'  # UI components
-        ]
-        
-        for pattern in skip_patterns:
-            if pattern in url_lower:
-                return False
-        
-        # Must be image file
-        image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp']
-        has_extension = any(ext in url_lower for ext in image_extensions)
-        
-        # Or from known image CDNs
-        image_cdns = ['images', 'img', 'media', 'photo', 'picture', 'cdn']
-        has_cdn = any(cdn in url_lower for cdn in image_cdns)
-        
-        return has_extension or has_cdn
+        return is_content_image_url(url)
     
     def download_image(self, image_url):
         """
-        Download image from URL and save to temp directory
+        Download and decode an image in memory
+        
+        The body is streamed and the download aborted as soon as it exceeds
+        IMAGE_SIZE_LIMIT_MB, whether or not the server sent Content-Length.
         
         Args:
             image_url: URL of the image
             
         Returns:
-            tuple of (PIL Image object, temp_file_path) or (None, None)
+            tuple of (PIL Image object, (original width, original height)) or (None, None)
         """
+        max_bytes = IMAGE_SIZE_LIMIT_MB * 1024 * 1024
+        
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(image_url, headers=headers, timeout=10, stream=True)
-            
-            # Check file size
-            content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > IMAGE_SIZE_LIMIT_MB * 1024 * 1024:
-                print(f"⚠️ [IMAGE] Skipping large image: {image_url}")
-                return None, None
-            
-            response.raise_for_status()
-            
-            # Load image
-            image = Image.open(BytesIO(response.content))
-            
-            # Convert to RGB if needed
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Save to temp directory
-            temp_filename = f"img_{len(self.temp_images)}_{int(time.time())}.jpg"
-            temp_path = os.path.join(TEMP_IMAGE_DIR, temp_filename)
-            image.save(temp_path, 'JPEG')
-            self.temp_images.append(temp_path)
+            with self.session.get(image_url, timeout=http_timeout(IMAGE_DOWNLOAD_TIMEOUT), stream=True) as response:
+                # Check file size
+                content_length = response.headers.get('content-length')
+                if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+                    logger.warning("⚠️ [IMAGE] Skipping large image: %s", image_url)
+                    return None, None
+                
+                response.raise_for_status()
+                
+                # Stream with a hard byte cap
+                buffer = BytesIO()
+                for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_SIZE):
+                    buffer.write(chunk)
+                    if buffer.tell() > max_bytes:
+                        logger.warning("⚠️ [IMAGE] Skipping large image (over %sMB): %s", IMAGE_SIZE_LIMIT_MB, image_url)
+                        return None, None
             
-            return image, temp_path
+            buffer.seek(0)
+            return self._decode_image(buffer)
             
         except Exception as e:
-            print(f"⚠️ [IMAGE] Could not download {image_url}: {e}")
+            logger.warning("⚠️ [IMAGE] Could not download %s: %s", image_url, e)
             return None, None
     
+    def _decode_image(self, buffer):
+        """
+        Decode image bytes into a downscaled RGB image
+        
+        JPEGs are decoded directly at reduced scale with draft(); other formats
+        are decoded and then shrunk with thumbnail().
+        
+        Returns:
+            tuple of (PIL Image object, (original width, original height))
+        """
+        image = Image.open(buffer)
+        original_size = image.size
+        
+        # Let the JPEG decoder skip detail we don't need (DCT scaling)
+        image.draft('RGB', (IMAGE_DECODE_MAX_SIZE, IMAGE_DECODE_MAX_SIZE))
+        
+        # Convert to RGB if needed (forces the decode)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        else:
+            image.load()
+        
+        if max(image.size) > IMAGE_DECODE_MAX_SIZE:
+            image.thumbnail((IMAGE_DECODE_MAX_SIZE, IMAGE_DECODE_MAX_SIZE))
+        
+        return image, original_size
+    
+    def download_images(self, image_urls):
+        """
+        Download several images concurrently over the pooled session
+        
+        Downloads run under the caller's request context, so they stop at
+        the request deadline.
+        
+        Returns:
+            List of (PIL Image object, original size) or (None, None), in input order
+        """
+        if not image_urls:
+            return []
+        
+        workers = min(IMAGE_DOWNLOAD_WORKERS, len(image_urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-download') as executor:
+            futures = [submit(executor, self.download_image, url) for url in image_urls]
+            return [future.result() for future in futures]
+    
     def detect_ai_generated(self, image):
         """
         Detect if image is AI-generated using the model
@@ -235,13 +203,28 @@ class ImageAnalyzer:
         Returns:
             dict with 'is_ai_generated' (bool), 'confidence' (float), 'label' (str)
         """
+        return self.detect_ai_generated_batch([image])[0]
+    
+    def detect_ai_generated_batch(self, images):
+        """
+        Detect AI-generated images with one batched forward pass
+        
+        Args:
+            images: List of PIL Image objects
+            
+        Returns:
+            List of detection dicts (same format as detect_ai_generated), in input order
+        """
+        if not images:
+            return []
+        
         if self.model is None or self.feature_extractor is None:
-            print(f"⚠️ [IMAGE] Model not loaded, using fallback")
-            return self._fallback_ai_detection(image)
+            logger.warning("⚠️ [IMAGE] Model not loaded, using fallback")
+            return [self._fallback_ai_detection(image) for image in images]
         
         try:
-            # Preprocess image
-            inputs = self.feature_extractor(images=image, return_tensors="pt")
+            # Preprocess all images into one batch
+            inputs = self.feature_extractor(images=images, return_tensors="pt")
             inputs = {k: v.to(self.device) for k, v in inputs.items()}
             
             # Run inference
@@ -251,10 +234,7 @@ class ImageAnalyzer:
             
             # Get predictions
             probabilities = torch.nn.functional.softmax(logits, dim=-1)
-            predicted_class_idx = logits.argmax(-1).item()
-            
-            # Model labels: typically 'artificial' vs 'real'
-            label = self.model.config.id2label[predicted_class_idx]
+            predicted_class_indices = logits.argmax(-1).tolist()
             
             # Find which class index corresponds to AI/artificial
             ai_class_idx = None
@@ -263,32 +243,38 @@ class ImageAnalyzer:
                     ai_class_idx = idx
                     break
             
-            # Confidence should ALWAYS be for AI-generated class (not the predicted class)
-            if ai_class_idx is not None:
-                confidence_ai = probabilities[0][ai_class_idx].item() * 100
-            else:
-                # Fallback: use predicted class confidence
-                confidence_ai = probabilities[0][predicted_class_idx].item() * 100
-            
-            # ✅ STRICTER THRESHOLD for more accurate detection
-            # Use 65% threshold to reduce false positives
-            is_ai_generated = confidence_ai > 65  # Higher threshold = more accurate
-            
-            result = {
-                'is_ai_generated': is_ai_generated,
-                'confidence': confidence_ai,  # Always confidence that it's AI-generated
-                'label': label,
-                'predicted_label': label,  # Original model prediction
-                'verdict': 'AI-Generated' if is_ai_generated else 'Real Photo'
-            }
-            
-            print(f"✅ [IMAGE] AI Detection: {result['verdict']} ({result['confidence']:.1f}% AI confidence, model predicted: {label})")
+            results = []
+            for row, predicted_class_idx in enumerate(predicted_class_indices):
+                # Model labels: typically 'artificial' vs 'real'
+                label = self.model.config.id2label[predicted_class_idx]
+                
+                # Confidence should ALWAYS be for AI-generated class (not the predicted class)
+                if ai_class_idx is not None:
+                    confidence_ai = probabilities[row][ai_class_idx].item() * 100
+                else:
+                    # Fallback: use predicted class confidence
+                    confidence_ai = probabilities[row][predicted_class_idx].item() * 100
+                
+                # ✅ STRICTER THRESHOLD for more accurate detection
+                # Use 65% threshold to reduce false positives
+                is_ai_generated = confidence_ai > 65  # Higher threshold = more accurate
+                
+                result = {
+                    'is_ai_generated': is_ai_generated,
+                    'confidence': confidence_ai,  # Always confidence that it's AI-generated
+                    'label': label,
+                    'predicted_label': label,  # Original model prediction
+                    'verdict': 'AI-Generated' if is_ai_generated else 'Real Photo'
+                }
+                
+                logger.debug("✅ [IMAGE] AI Detection: %s (%.1f%% AI confidence, model predicted: %s)", result['verdict'], result['confidence'], label)
+                results.append(result)
             
-            return result
+            return results
             
         except Exception as e:
-            print(f"⚠️ [IMAGE] AI detection failed: {e}")
-            return self._fallback_ai_detection(image)
+            logger.warning("⚠️ [IMAGE] AI detection failed: %s", e)
+            return [self._fallback_ai_detection(image) for image in images]
     
     def _fallback_ai_detection(self, image):
         """Fallback basic analysis when model fails"""
@@ -309,7 +295,7 @@ class ImageAnalyzer:
         Returns:
             dict with search results and context
         """
-        print(f"🔍 [IMAGE] Performing reverse image search for: {image_url}")
+        logger.debug("🔍 [IMAGE] Performing reverse image search for: %s", image_url)
         
         # Generate search URLs for major search engines
         search_urls = {
@@ -330,7 +316,7 @@ class ImageAnalyzer:
         # Note: Actual reverse search requires API keys or web scraping
         # For now, we provide search links for manual verification
         
-        print(f"✅ [IMAGE] Reverse search links generated")
+        logger.debug("✅ [IMAGE] Reverse search links generated")
         
         return result
     
@@ -345,7 +331,7 @@ class ImageAnalyzer:
         Returns:
             dict with analysis results
         """
-        print(f"🖼️ [IMAGE] Analyzing {len(image_urls)} images from {page_url}")
+        logger.debug("🖼️ [IMAGE] Analyzing %s images from %s", len(image_urls), page_url)
         
         results = {
             'total_images': len(image_urls),
@@ -356,56 +342,84 @@ class ImageAnalyzer:
             'all_results': []
         }
         
-        try:
-            for idx, img_url in enumerate(image_urls, 1):
-                print(f"🖼️ [IMAGE] Processing image {idx}/{len(image_urls)}: {img_url[:60]}...")
+        # image index -> (url, width, height, ai_detection, cache hit kind)
+        analyzed = {}
+        
+        # Stage 0: images already classified under this URL skip the download
+        pending = []
+        for idx, img_url in enumerate(image_urls, 1):
+            cached = self.verdict_cache.get_by_url(img_url)
+            if cached is not None:
+                analyzed[idx] = (img_url, cached['width'], cached['height'], dict(cached['detection']), 'url')
+            else:
+                pending.append((idx, img_url))
+        
+        # Stage 1: concurrent streaming downloads + in-memory decode
+        downloads = self.download_images([img_url for _, img_url in pending])
+        to_detect = []
+        for (idx, img_url), (image, original_size) in zip(pending, downloads):
+            if image is None:
+                continue
+            # Re-encoded/resized copies of a known image reuse its verdict
+            image_hash = dhash(image)
+            cached = self.verdict_cache.get_by_hash(image_hash, img_url)
+            if cached is not None:
+                analyzed[idx] = (img_url, original_size[0], original_size[1], dict(cached['detection']), 'phash')
+            else:
+                to_detect.append((idx, img_url, image, original_size, image_hash))
+        
+        failed = sum(1 for image, _ in downloads if image is None)
+        logger.debug("🖼️ [IMAGE] %s cached verdicts, %s images to classify, %s failed downloads", len(analyzed), len(to_detect), failed)
+        
+        # Stage 2: one batched forward pass for the remaining images
+        detections = self.detect_ai_generated_batch([image for _, _, image, _, _ in to_detect])
+        
+        for (idx, img_url, image, original_size, image_hash), ai_detection in zip(to_detect, detections):
+            analyzed[idx] = (img_url, original_size[0], original_size[1], ai_detection, None)
+            # Only real model verdicts are cached (not the fallback)
+            if self.model is not None and 'predicted_label' in ai_detection:
+                self.verdict_cache.put(img_url, image_hash, original_size[0], original_size[1], ai_detection)
+        
+        self.verdict_cache.save()
+        results['cache_hits'] = sum(1 for entry in analyzed.values() if entry[4])
+        
+        for idx in sorted(analyzed):
+            img_url, width, height, ai_detection, cache_hit = analyzed[idx]
+            try:
+                # Reverse search
+                reverse_search = self.reverse_image_search(img_url)
+                
+                # Combine results
+                image_result = {
+                    'url': img_url,
+                    'index': idx,
+                    'width': width,
+                    'height': height,
+                    'ai_detection': ai_detection,
+                    'reverse_search': reverse_search,
+                    'is_suspicious': ai_detection['is_ai_generated'] and ai_detection['confidence'] > 70,
+                    'cache_hit': cache_hit  # 'url', 'phash' or None (classified now)
+                }
+                
+                results['all_results'].append(image_result)
+                results['analyzed_images'] += 1
+                
+                if ai_detection['is_ai_generated']:
+                    results['ai_generated_count'] += 1
+                    if ai_detection['confidence'] > 70:
+                        results['suspicious_images'].append(image_result)
+                else:
+                    results['real_images_count'] += 1
                 
-                try:
-                    # Download image (returns tuple: image, temp_path)
-                    image, temp_path = self.download_image(img_url)
-                    if image is None:
-                        continue
-                    
-                    # Detect AI-generated
-                    ai_detection = self.detect_ai_generated(image)
-                    
-                    # Reverse search
-                    reverse_search = self.reverse_image_search(img_url)
-                    
-                    # Combine results
-                    image_result = {
-                        'url': img_url,
-                        'index': idx,
-                        'width': image.width,
-                        'height': image.height,
-                        'ai_detection': ai_detection,
-                        'reverse_search': reverse_search,
-                        'is_suspicious': ai_detection['is_ai_generated'] and ai_detection['confidence'] > 70
-                    }
-                    
-                    results['all_results'].append(image_result)
-                    results['analyzed_images'] += 1
-                    
-                    if ai_detection['is_ai_generated']:
-                        results['ai_generated_count'] += 1
-                        if ai_detection['confidence'] > 70:
-                            results['suspicious_images'].append(image_result)
-                    else:
-                        results['real_images_count'] += 1
-                    
-                except Exception as e:
-                    print(f"⚠️ [IMAGE] Error analyzing image {img_url}: {e}")
-                    continue
-        
-        finally:
-            # Always cleanup downloaded images
-            self._cleanup_downloaded_images()
+            except Exception as e:
+                logger.warning("⚠️ [IMAGE] Error analyzing image %s: %s", img_url, e)
+                continue
         
         # Generate summary
         results['summary'] = self._generate_summary(results)
         
-        print(f"✅ [IMAGE] Analysis complete: {results['analyzed_images']} images analyzed")
-        print(f"   AI-Generated: {results['ai_generated_count']}, Real: {results['real_images_count']}")
+        logger.debug("✅ [IMAGE] Analysis complete: %s images analyzed (AI-generated: %s, real: %s)",
+                     results['analyzed_images'], results['ai_generated_count'], results['real_images_count'])
         
         return results
     
@@ -0,0 +1,317 @@
+"""
+🗂️ IMAGE VERDICT CACHE
+Remembers AI-detection verdicts for images already classified
+
+News sites reuse the same hero and stock images across many articles.
+Verdicts are cached under two keys:
+
+- Image URL: a repeat URL is answered before anything is downloaded
+- Perceptual hash (64-bit dHash) of the decoded image: a re-encoded,
+  resized or re-hosted copy lands within a small Hamming distance of the
+  original and reuses its verdict without running the detector model
+
+Hamming lookups use multi-index hashing: the 64-bit hash is split into
+8 bands of 8 bits, and any hash within distance <= 7 shares at least one
+band exactly with the query, so only those buckets are compared.
+
+The cache is bounded (LRU) and persisted as JSON under models_cache/.
+
+Author: AI Misinformation Detector
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration
+IMAGE_CACHE_FILE = os.getenv(
+    'IMAGE_CACHE_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models_cache', 'image_verdict_cache.json')
+)
+IMAGE_CACHE_MAX_ENTRIES = int(os.getenv('IMAGE_CACHE_MAX_ENTRIES', '5000'))
+IMAGE_CACHE_SAVE_INTERVAL = 60  # Seconds between writes of a changed cache
+IMAGE_HASH_MAX_DISTANCE = 6  # Hamming distance (of 64 bits) still treated as the same image
+MAX_URLS_PER_IMAGE = 20  # URLs remembered per cached image
+
+HASH_BITS = 64
+BAND_BITS = 8
+BAND_COUNT = HASH_BITS // BAND_BITS  # Pigeonhole: exact for distances < BAND_COUNT
+BAND_MASK = (1 << BAND_BITS) - 1
+
+CACHE_SCHEMA = 1
+
+
+def dhash(image, hash_size: int = 8) -> int:
+    """
+    64-bit difference hash of a PIL image
+
+    Compares horizontally adjacent pixels of a (hash_size+1) x hash_size
+    grayscale thumbnail; robust to scaling, re-encoding and small edits.
+    """
+    small = image.convert('L').resize((hash_size + 1, hash_size))
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] < pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count('1')
+
+
+def _bands(image_hash: int) -> List[Tuple[int, int]]:
+    return [(band, (image_hash >> (band * BAND_BITS)) & BAND_MASK) for band in range(BAND_COUNT)]
+
+
+class ImageVerdictCache:
+    """
+    Bounded URL + perceptual hash cache of detector verdicts
+    """
+
+    def __init__(self, path: str = IMAGE_CACHE_FILE, max_entries: int = IMAGE_CACHE_MAX_ENTRIES,
+                 max_distance: int = IMAGE_HASH_MAX_DISTANCE, model_name: str = ''):
+        if max_distance >= BAND_COUNT:
+            raise ValueError(f"max_distance must be below {BAND_COUNT} for exact band lookup")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self.model_name = model_name
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[int, Dict]' = OrderedDict()  # hash -> entry (LRU order)
+        self._urls: Dict[str, int] = {}  # image URL -> hash
+        self._buckets: Dict[Tuple[int, int], set] = defaultdict(set)  # (band, value) -> hashes
+        self._dirty = False
+        self._last_save = 0.0
+
+        self.stats = {'url_hits': 0, 'hash_hits': 0, 'misses': 0}
+
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Index maintenance (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _index(self, image_hash: int):
+        for key in _bands(image_hash):
+            self._buckets[key].add(image_hash)
+
+    def _unindex(self, image_hash: int):
+        for key in _bands(image_hash):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(image_hash)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _add_url(self, entry: Dict, url: str, image_hash: int):
+        self._urls[url] = image_hash
+        entry['urls'].append(url)
+        while len(entry['urls']) > MAX_URLS_PER_IMAGE:
+            oldest = entry['urls'].pop(0)
+            if self._urls.get(oldest) == image_hash:
+                del self._urls[oldest]
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            image_hash, entry = self._entries.popitem(last=False)
+            self._unindex(image_hash)
+            for url in entry.get('urls', ()):
+                if self._urls.get(url) == image_hash:
+                    del self._urls[url]
+
+    def _nearest(self, image_hash: int) -> Optional[int]:
+        if image_hash in self._entries:
+            return image_hash
+        best, best_distance = None, self.max_distance + 1
+        candidates = set()
+        for key in _bands(image_hash):
+            candidates.update(self._buckets.get(key, ()))
+        for candidate in candidates:
+            distance = hamming_distance(image_hash, candidate)
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_by_url(self, url: str) -> Optional[Dict]:
+        """
+        Cached entry for an image URL (no download needed)
+
+        Returns:
+            {'detection': ..., 'width': ..., 'height': ...} or None
+        """
+        with self._lock:
+            image_hash = self._urls.get(url)
+            if image_hash is None or image_hash not in self._entries:
+                return None
+            self._entries.move_to_end(image_hash)
+            self.stats['url_hits'] += 1
+            return self._entries[image_hash]
+
+    def get_by_hash(self, image_hash: int, url: Optional[str] = None) -> Optional[Dict]:
+        """
+        Cached entry for the nearest perceptual hash within max_distance
+
+        A hit also remembers the URL so the next request skips the download.
+        """
+        with self._lock:
+            match = self._nearest(image_hash)
+            if match is None:
+                self.stats['misses'] += 1
+                return None
+            entry = self._entries[match]
+            self._entries.move_to_end(match)
+            if url and url not in self._urls:
+                self._add_url(entry, url, match)
+                self._dirty = True
+            self.stats['hash_hits'] += 1
+            return entry
+
+    def put(self, url: str, image_hash: int, width: int, height: int, detection: Dict):
+        """Store a fresh verdict"""
+        with self._lock:
+            entry = self._entries.get(image_hash)
+            if entry is None:
+                entry = {'urls': [], 'width': width, 'height': height}
+                self._entries[image_hash] = entry
+                self._index(image_hash)
+            entry['detection'] = detection
+            entry['cached_at'] = time.time()
+            self._entries.move_to_end(image_hash)
+            if url and self._urls.get(url) != image_hash:
+                self._add_url(entry, url, image_hash)
+            self._dirty = True
+            self._evict()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Load the cache file (ignored if missing, corrupt or for another model)"""
+        try:
+            if not os.path.exists(self.path):
+                return
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('schema') != CACHE_SCHEMA or data.get('model') != self.model_name:
+                logger.info("🗂️ [IMAGE CACHE] Ignoring cache for another schema/model: %s", self.path)
+                return
+
+            with self._lock:
+                for hex_hash, entry in data.get('entries', {}).items():
+                    image_hash = int(hex_hash, 16)
+                    entry['urls'] = list(entry.get('urls', []))
+                    self._entries[image_hash] = entry
+                    self._index(image_hash)
+                    for url in entry['urls']:
+                        self._urls[url] = image_hash
+                self._evict()
+            logger.info("📂 [IMAGE CACHE] Loaded %s cached verdicts", len(self._entries))
+
+        except Exception as e:
+            logger.warning("⚠️ [IMAGE CACHE] Could not load cache: %s", e)
+
+    def save(self, force: bool = False):
+        """Write the cache if it changed (at most every IMAGE_CACHE_SAVE_INTERVAL seconds)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            if not force and time.time() - self._last_save < IMAGE_CACHE_SAVE_INTERVAL:
+                return
+            data = {
+                'schema': CACHE_SCHEMA,
+                'model': self.model_name,
+                'entries': {f"{image_hash:016x}": {**entry, 'urls': list(entry['urls'])}
+                            for image_hash, entry in self._entries.items()}
+            }
+            self._dirty = False
+            self._last_save = time.time()
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)  # Atomic on the same filesystem
+        except Exception as e:
+            self._dirty = True
+            logger.warning("⚠️ [IMAGE CACHE] Could not save cache: %s", e)
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters and size"""
+        with self._lock:
+            return {**self.stats, 'entries': len(self._entries), 'urls': len(self._urls)}
+
+
+# Singleton instance
+_image_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_image_verdict_cache(model_name: str = '') -> ImageVerdictCache:
+    """Get or create the image verdict cache (saved on exit)"""
+    global _image_cache
+    if _image_cache is None:
+        with _cache_lock:
+            if _image_cache is None:
+                _image_cache = ImageVerdictCache(model_name=model_name)
+                atexit.register(_image_cache.save, True)
+    return _image_cache
+
+
+def get_image_cache_stats() -> Optional[Dict]:
+    """Image verdict cache counters (None until the cache is created)"""
+    return _image_cache.get_stats() if _image_cache is not None else None
+
+
+# Test function
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'cache.json')
+    cache = ImageVerdictCache(path=path, max_entries=3, model_name='test-model')
+
+    rng = random.Random(7)
+    hashes = [rng.getrandbits(64) for _ in range(4)]
+    verdict = {'is_ai_generated': False, 'confidence': 12.0, 'verdict': 'Real Photo'}
+
+    cache.put('https://cdn.example.com/hero.jpg', hashes[0], 1200, 800, verdict)
+    near = hashes[0] ^ 0b10110  # 3 bits flipped (re-encoded copy)
+    far = hashes[0] ^ ((1 << 40) - 1)  # 40 bits flipped
+
+    print("\n" + "=" * 60)
+    print("IMAGE VERDICT CACHE TEST")
+    print("=" * 60)
+    print(f"URL hit: {cache.get_by_url('https://cdn.example.com/hero.jpg') is not None}")
+    print(f"Near-duplicate hit: {cache.get_by_hash(near, 'https://mirror.example.net/hero-small.jpg') is not None}")
+    print(f"Mirror URL now cached: {cache.get_by_url('https://mirror.example.net/hero-small.jpg') is not None}")
+    print(f"Unrelated image miss: {cache.get_by_hash(far) is None}")
+
+    for i, image_hash in enumerate(hashes[1:], 1):
+        cache.put(f"https://cdn.example.com/{i}.jpg", image_hash, 640, 480, verdict)
+    print(f"Evicted oldest (bounded to 3): {cache.get_by_url('https://cdn.example.com/hero.jpg') is None}")
+
+    cache.save(force=True)
+    reloaded = ImageVerdictCache(path=path, max_entries=3, model_name='test-model')
+    print(f"Persisted: {reloaded.get_by_url('https://cdn.example.com/3.jpg') is not None}")
+    print(f"Stats: {cache.get_stats()}")
+    print("=" * 60)
@@ -0,0 +1,362 @@
+"""
+🧭 IMAGE CANDIDATE EXTRACTOR
+Streaming HTML parser that picks the content images worth analyzing
+
+Replaces the `<img src=...>` regex over raw HTML:
+- Parses the page incrementally (lxml pull parser, stdlib html.parser
+  fallback) and stops once enough candidates are collected
+- Reads srcset / data-srcset (best resolution wins), lazy-load attributes
+  (data-src, data-lazy-src, data-original), <picture><source> sets and
+  og:image / twitter:image meta tags
+- Drops tiny images (tracking pixels, icons) from their width/height
+  attributes or srcset widths before anything is downloaded
+- Scores candidates by DOM position: inside <article>/<main>/<figure> is
+  good, inside <header>/<nav>/<footer>/<aside> is bad, earlier is better
+
+Author: AI Misinformation Detector
+"""
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from logging_setup import get_logger
+
+try:
+    from lxml import etree  # Optional fast C parser
+except ImportError:
+    etree = None
+
+logger = get_logger(__name__)
+
+# Configuration
+MIN_IMAGE_DIMENSION = 100  # Pixels; smaller declared images are never downloaded
+MAX_IMAGE_CANDIDATES = 50  # Parsing stops after this many candidates
+HTML_CHUNK_SIZE = 64 * 1024  # Characters fed to the parser at a time
+
+# Score adjustments for enclosing elements (summed over all ancestors)
+CONTEXT_SCORES = {
+    'article': 3, 'main': 2, 'figure': 2,
+    'header': -3, 'nav': -4, 'footer': -4, 'aside': -2
+}
+META_IMAGE_SCORE = 5  # og:image / twitter:image: the page's own hero image
+
+META_IMAGE_PROPERTIES = {'og:image', 'og:image:url', 'og:image:secure_url', 'twitter:image', 'twitter:image:src'}
+LAZY_SRC_ATTRIBUTES = ('data-src', 'data-lazy-src', 'data-original', 'data-url', 'src')
+SRCSET_ATTRIBUTES = ('srcset', 'data-srcset', 'data-lazy-srcset')
+UNSUPPORTED_SOURCE_TYPES = {'image/avif', 'image/svg+xml', 'image/jxl'}
+
+# Non-content images, matched as whole words anywhere in the URL
+SKIP_URL_PATTERN = re.compile(
+    r'(?<![a-z])(?:'
+    r'logos?|icons?|favicons?|sprites?|avatars?|'
+    r'placeholders?|loading|spinners?|blank|'
+    r'pixels?|tracking|analytics|1x1|'
+    r'arrows?|buttons?|badges?|bullets?|'
+    r'banners?|header|footer|sidebar|'
+    r'social|share|follow|subscribe|'
+    r'ads?|advertisement|promo|sponsor(?:ed)?|'
+    r'thumbnail-small|thumbs?|'
+    r'widgets?|module|component'
+    r')(?![a-z])'
+    r'|^data:|base64|\.svg(?:$|[?#])'
+)
+IMAGE_URL_PATTERN = re.compile(r'\.(?:jpe?g|png|webp|gif|bmp)(?![a-z])|images|img|media|photo|picture|cdn')
+
+
+@dataclass
+class ImageCandidate:
+    """An image URL found in the page, with its ranking score"""
+    url: str
+    score: float
+    position: int  # Document order
+    width: Optional[int] = None  # Declared/srcset width, if known
+    height: Optional[int] = None
+    origin: str = 'img'  # img, picture or meta
+
+
+def is_content_image_url(url: str) -> bool:
+    """Check if URL is likely a valid content image (not icon/logo/navigation)"""
+    url_lower = url.lower()
+    if SKIP_URL_PATTERN.search(url_lower):
+        return False
+    return IMAGE_URL_PATTERN.search(url_lower) is not None
+
+
+def parse_dimension(value: Optional[str]) -> Optional[int]:
+    """Integer pixel size from a width/height attribute ('300', '300px'); None if unknown"""
+    if not value:
+        return None
+    match = re.match(r'\s*(\d+)(?:\.\d+)?\s*(?:px)?\s*$', value)
+    return int(match.group(1)) if match else None
+
+
+def parse_srcset(srcset: str) -> List[Tuple[str, Optional[int], float]]:
+    """
+    Parse a srcset attribute
+
+    Returns:
+        [(url, width descriptor or None, density descriptor)] in attribute order
+    """
+    candidates = []
+    position, length = 0, len(srcset)
+    while position < length:
+        # Skip separators
+        while position < length and (srcset[position].isspace() or srcset[position] == ','):
+            position += 1
+        start = position
+        while position < length and not srcset[position].isspace():
+            position += 1
+        url = srcset[start:position]
+        if not url:
+            break
+
+        descriptor = ''
+        if url.endswith(','):
+            url = url.rstrip(',')
+        else:
+            start = position
+            while position < length and srcset[position] != ',':
+                position += 1
+            descriptor = srcset[start:position].strip().lower()
+
+        width, density = None, 1.0
+        for token in descriptor.split():
+            try:
+                if token.endswith('w'):
+                    width = int(float(token[:-1]))
+                elif token.endswith('x'):
+                    density = float(token[:-1])
+            except ValueError:
+                continue
+        if url:
+            candidates.append((url, width, density))
+    return candidates
+
+
+def best_srcset_candidate(srcset: str) -> Tuple[Optional[str], Optional[int]]:
+    """Highest-resolution entry of a srcset: (url, width or None)"""
+    best = None
+    for url, width, density in parse_srcset(srcset):
+        key = (width or 0, density)
+        if best is None or key > best[0]:
+            best = (key, url, width)
+    if best is None:
+        return None, None
+    return best[1], best[2]
+
+
+# ========================================
+# PARSER BACKENDS
+# ========================================
+
+class _StdlibEventParser(HTMLParser):
+    """html.parser backend producing (event, tag, attrs) tuples like the lxml one"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events: List[Tuple[str, str, Dict[str, str]]] = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(('start', tag, {name: value or '' for name, value in attrs}))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.events.append(('end', tag, {}))
+
+    def handle_endtag(self, tag):
+        self.events.append(('end', tag, {}))
+
+
+def _iter_events(html_content: str) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+    """Parse incrementally, yielding (event, tag, attrs) as chunks are fed"""
+    if etree is not None:
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+
+        def drain():
+            for event, element in parser.read_events():
+                tag = element.tag.lower() if isinstance(element.tag, str) else ''
+                if event == 'start':
+                    yield 'start', tag, dict(element.attrib)
+                else:
+                    yield 'end', tag, {}
+                    element.clear()  # Keep memory flat on large pages
+
+        for offset in range(0, len(html_content), HTML_CHUNK_SIZE):
+            parser.feed(html_content[offset:offset + HTML_CHUNK_SIZE])
+            yield from drain()
+        parser.close()
+        yield from drain()
+        return
+
+    parser = _StdlibEventParser()
+    for offset in range(0, len(html_content), HTML_CHUNK_SIZE):
+        parser.feed(html_content[offset:offset + HTML_CHUNK_SIZE])
+        events, parser.events = parser.events, []
+        yield from events
+    parser.close()
+    yield from parser.events
+
+
+# ========================================
+# EXTRACTION
+# ========================================
+
+def extract_image_candidates(html_content: str, base_url: str,
+                             max_candidates: int = MAX_IMAGE_CANDIDATES) -> List[ImageCandidate]:
+    """
+    Collect and rank content image candidates from a page
+
+    Args:
+        html_content: Raw HTML string
+        base_url: Base URL for resolving relative paths
+        max_candidates: Stop parsing after this many accepted candidates
+
+    Returns:
+        Candidates sorted best first (unique URLs); images that only appear
+        in page chrome (negative score) are left out
+    """
+    open_context: Dict[str, int] = {tag: 0 for tag in CONTEXT_SCORES}
+    picture_sources: Optional[List[Tuple[str, Optional[int]]]] = None
+    candidates: Dict[str, ImageCandidate] = {}
+    position = 0
+
+    def context_score() -> float:
+        return sum(CONTEXT_SCORES[tag] for tag, depth in open_context.items() if depth)
+
+    def add(url: Optional[str], width: Optional[int], height: Optional[int], score: float, origin: str):
+        nonlocal position
+        if not url:
+            return
+        url = url.strip()
+        if url.startswith('//'):
+            url = 'https:' + url
+        else:
+            url = urljoin(base_url, url)
+        position += 1
+
+        # Declared tiny images (tracking pixels, icons) are never downloaded
+        if (width is not None and width < MIN_IMAGE_DIMENSION) or \
+                (height is not None and height < MIN_IMAGE_DIMENSION):
+            return
+        if not url.startswith('http') or not is_content_image_url(url):
+            return
+
+        # Larger declared images rank higher (up to +2)
+        if width and height:
+            score += min(width * height / 250000, 2.0)
+
+        existing = candidates.get(url)
+        if existing is None:
+            candidates[url] = ImageCandidate(url, score, position, width, height, origin)
+        elif score > existing.score:
+            existing.score = score
+
+    try:
+        for event, tag, attrs in _iter_events(html_content):
+            if event == 'end':
+                if tag in open_context and open_context[tag]:
+                    open_context[tag] -= 1
+                elif tag == 'picture':
+                    picture_sources = None
+                continue
+
+            if tag in open_context:
+                open_context[tag] += 1
+
+            elif tag == 'base' and attrs.get('href'):
+                base_url = urljoin(base_url, attrs['href'])
+
+            elif tag == 'meta':
+                name = (attrs.get('property') or attrs.get('name') or '').lower()
+                if name in META_IMAGE_PROPERTIES:
+                    add(attrs.get('content'), None, None, META_IMAGE_SCORE, 'meta')
+
+            elif tag == 'picture':
+                picture_sources = []
+
+            elif tag == 'source' and picture_sources is not None:
+                if attrs.get('type', '').lower() in UNSUPPORTED_SOURCE_TYPES:
+                    continue
+                for name in SRCSET_ATTRIBUTES:
+                    if attrs.get(name):
+                        picture_sources.append(best_srcset_candidate(attrs[name]))
+                        break
+
+            elif tag == 'img':
+                width = parse_dimension(attrs.get('width'))
+                height = parse_dimension(attrs.get('height'))
+
+                # Best resolution: srcset, then lazy-load attributes, then src
+                url, srcset_width = None, None
+                for name in SRCSET_ATTRIBUTES:
+                    if attrs.get(name):
+                        url, srcset_width = best_srcset_candidate(attrs[name])
+                        break
+                if not url:
+                    for name in LAZY_SRC_ATTRIBUTES:
+                        value = attrs.get(name, '').strip()
+                        if value and not value.startswith('data:'):
+                            url = value
+                            break
+
+                origin = 'img'
+                if picture_sources:
+                    # <picture>: widest usable <source> beats the fallback <img>
+                    source_url, source_width = max(picture_sources, key=lambda s: s[1] or 0)
+                    if source_url and (source_width or 0) >= (srcset_width or 0):
+                        url, srcset_width, origin = source_url, source_width, 'picture'
+
+                if srcset_width and width and srcset_width >= width:
+                    # Declared layout size, resolution from srcset; keep aspect ratio
+                    height = height * srcset_width // width if height else None
+                    width = srcset_width
+                elif srcset_width and not width:
+                    width = srcset_width
+
+                add(url, width, height, context_score(), origin)
+
+            if len(candidates) >= max_candidates:
+                break
+
+    except Exception as e:
+        logger.warning("⚠️ [IMAGE] HTML parsing stopped early: %s", e)
+
+    ranked = [c for c in candidates.values() if c.score >= 0]
+    return sorted(ranked, key=lambda c: (-c.score, c.position))
+
+
+# Test function
+if __name__ == "__main__":
+    sample_html = """
+    <html><head>
+      <meta property="og:image" content="https://cdn.example.com/images/hero-1200.jpg">
+    </head><body>
+      <header><img src="/static/site-logo.png" width="120" height="40"></header>
+      <nav><img src="/images/menu-photo.jpg" width="300" height="200"></nav>
+      <img src="https://track.example.com/p.gif" width="1" height="1">
+      <article>
+        <figure>
+          <picture>
+            <source type="image/avif" srcset="/media/story.avif 1600w">
+            <source srcset="/media/story-800.webp 800w, /media/story-1600.webp 1600w">
+            <img src="/media/story-400.jpg" width="400" height="300">
+          </picture>
+        </figure>
+        <img class="lazy" src="data:image/gif;base64,R0lGOD" data-src="/uploads/2024/chart.png" width="640" height="480">
+        <img srcset="https://img.example.com/w_300,h_200/a.jpg 300w, https://img.example.com/w_900,h_600/a.jpg 900w">
+      </article>
+      <aside><img src="/images/related.jpg" width="200" height="150"></aside>
+      <footer><img src="/images/footer-photo.jpg"></footer>
+    </body></html>
+    """
+
+    print("\n" + "=" * 60)
+    print("IMAGE CANDIDATE EXTRACTOR TEST")
+    print("=" * 60)
+    print(f"Parser: {'lxml' if etree is not None else 'html.parser'}")
+    for candidate in extract_image_candidates(sample_html, "https://news.example.com/2024/story.html"):
+        print(f"  {candidate.score:5.2f}  {candidate.origin:8} {candidate.width}x{candidate.height}  {candidate.url}")
+    print("=" * 60)
@@ -3,10 +3,15 @@
 # INCLUDES: Official government agencies (health departments, disaster management, etc.)
 # EXCLUDES: News channels, media outlets (biased/unreliable)
 
-import requests
-from bs4 import BeautifulSoup
+import threading
 import urllib.parse
 
+from http_client import get_http_session, http_timeout
+from page_cache import get_page_cache
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
 # ============= OFFICIAL SOURCES =============
 TIER_1_SOURCES = {
     'WHO': {
@@ -218,6 +223,24 @@ TIER_3_SOURCES = {
 }
 
 
+_official_pages = None
+_official_pages_lock = threading.Lock()
+
+
+def _official_page_cache():
+    """Page cache with every official source's landing page kept warm in the background"""
+    global _official_pages
+    if _official_pages is None:
+        with _official_pages_lock:
+            if _official_pages is None:
+                cache = get_page_cache()
+                cache.register(info['search_url'] for sources in (TIER_1_SOURCES, TIER_2_SOURCES)
+                               for info in sources.values() if info.get('search_url'))
+                cache.start_refresher()
+                _official_pages = cache
+    return _official_pages
+
+
 def search_official_source_online(query: str, source_name: str, source_info: dict) -> dict:
     """
     AI searches official source websites in real-time to verify claims
@@ -236,13 +259,13 @@ def search_official_source_online(query: str, source_name: str, source_info: dic
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        print(f"🔍 AI searching {source_name} at {search_url}...")
+        logger.debug("🔍 AI searching %s at %s...", source_name, search_url)
         
         # Some sites have search APIs
         if source_name == 'USGS' and 'earthquake' in query.lower():
             # Check USGS earthquake data
             api_url = 'https://earthquake.usgs.gov/fdsnws/event/1/query?format=geojson&limit=10'
-            response = requests.get(api_url, headers=headers, timeout=5)
+            response = get_http_session().get(api_url, headers=headers, timeout=http_timeout(5))
             if response.status_code == 200:
                 data = response.json()
                 if data.get('features'):
@@ -253,13 +276,10 @@ def search_official_source_online(query: str, source_name: str, source_info: dic
                         "details": f"Found {len(data['features'])} recent earthquake events"
                     }
         
-        # General web search on the official site
-        response = requests.get(search_url, headers=headers, timeout=5)
+        # General web search on the official site (cached, lower-cased page text)
+        text_content = _official_page_cache().get_text(search_url)
         
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            text_content = soup.get_text().lower()
-            
+        if text_content is not None:
             # Check if query terms appear on their main page/news
             query_words = query.lower().split()
             matches = sum(1 for word in query_words if len(word) > 3 and word in text_content)
@@ -275,7 +295,7 @@ def search_official_source_online(query: str, source_name: str, source_info: dic
         return {"found": False, "reason": f"No matches on {source_name}"}
         
     except Exception as e:
-        print(f"⚠️ Error searching {source_name}: {str(e)}")
+        logger.warning("⚠️ Error searching %s: %s", source_name, str(e))
         return {"found": False, "reason": str(e)}
 
 
@@ -307,7 +327,7 @@ def verify_with_official_sources_enhanced(content: str, title: str, url: str) ->
         "recommendation": ""
     }
     
-    print("🌐 AI starting real-time verification with international organizations...")
+    logger.debug("🌐 AI starting real-time verification with international organizations...")
     
     # Check Tier 1: International Organizations (Score: 10 each)
     for org_name, org_info in TIER_1_SOURCES.items():
@@ -385,7 +405,7 @@ def verify_with_official_sources_enhanced(content: str, title: str, url: str) ->
         verification_results['trust_level'] = "LOW"
         verification_results['recommendation'] = "🚫 NOT verified by WHO/UN/UNESCO - Search these organizations' websites before believing"
     
-    print(f"✅ Verification complete: {verification_results['verdict']} (Score: {score})")
+    logger.debug("✅ Verification complete: %s (Score: %s)", verification_results['verdict'], score)
     
     return verification_results
 
@@ -395,7 +415,7 @@ def ensemble_classification(content: str, fake_news_classifier_1, fake_news_clas
     Multiple AI models vote on classification
     Returns consensus from 3+ models
     """
-    print("🤖 Running ensemble AI classification with multiple models...")
+    logger.debug("🤖 Running ensemble AI classification with multiple models...")
     
     votes = []
     
@@ -409,9 +429,9 @@ def ensemble_classification(content: str, fake_news_classifier_1, fake_news_clas
                 "classification": classification1,
                 "confidence": result1['score']
             })
-            print(f"  Model 1 (RoBERTa): {classification1} ({result1['score']:.2f})")
+            logger.debug("Model 1 (RoBERTa): %s (%.2f)", classification1, result1['score'])
     except Exception as e:
-        print(f"⚠️ Model 1 error: {e}")
+        logger.warning("⚠️ Model 1 error: %s", e)
     
     try:
         # Model 2: BERT Fake News Detector
@@ -423,9 +443,9 @@ def ensemble_classification(content: str, fake_news_classifier_1, fake_news_clas
                 "classification": classification2,
                 "confidence": result2['score']
             })
-            print(f"  Model 2 (BERT): {classification2} ({result2['score']:.2f})")
+            logger.debug("Model 2 (BERT): %s (%.2f)", classification2, result2['score'])
     except Exception as e:
-        print(f"⚠️ Model 2 error: {e}")
+        logger.warning("⚠️ Model 2 error: %s", e)
     
     try:
         # Model 3: Financial/General News Sentiment
@@ -438,9 +458,9 @@ def ensemble_classification(content: str, fake_news_classifier_1, fake_news_clas
                 "classification": classification3,
                 "confidence": result3['score']
             })
-            print(f"  Model 3 (Sentiment): {classification3} ({result3['score']:.2f})")
+            logger.debug("Model 3 (Sentiment): %s (%.2f)", classification3, result3['score'])
     except Exception as e:
-        print(f"⚠️ Model 3 error: {e}")
+        logger.warning("⚠️ Model 3 error: %s", e)
     
     # Calculate consensus
     if not votes:
@@ -461,7 +481,7 @@ def ensemble_classification(content: str, fake_news_classifier_1, fake_news_clas
     else:
         final_classification = "questionable"
     
-    print(f"📊 Ensemble result: {final_classification} ({false_votes}F/{questionable_votes}Q/{verified_votes}V)")
+    logger.debug("📊 Ensemble result: %s (%sF/%sQ/%sV)", final_classification, false_votes, questionable_votes, verified_votes)
     
     return {
         "classification": final_classification,
@@ -0,0 +1,557 @@
+"""
+🗃️ ASYNC JOB QUEUE
+Queued analyses with polling and webhook delivery
+
+Long analyses (whole-site crawls) no longer hold an HTTP worker for
+30-90 s: POST /api/v1/jobs queues the analysis and returns a job id at
+once. A bounded pool of worker threads runs jobs by priority; clients
+poll GET /api/v1/jobs/<id> (status plus partial results as phases
+finish), follow them on an event stream (wait_for_update()) or receive
+the final result on a webhook.
+
+The job store is pluggable:
+
+- memory: jobs live in the process (default)
+- sqlite: jobs survive restarts; unfinished jobs are queued again
+
+Author: AI Misinformation Detector
+"""
+
+import ipaddress
+import itertools
+import json
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from dataset_store import DATA_DIR
+from http_client import get_http_session, http_timeout
+from logging_setup import get_logger
+from request_context import RequestContext, activate, deactivate, request_budget
+
+logger = get_logger(__name__)
+
+# Configuration
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+JOB_QUEUE_MAX = int(os.getenv('JOB_QUEUE_MAX', '100'))  # Queued jobs before new ones are rejected
+JOB_STORE = os.getenv('JOB_STORE', 'memory')  # memory | sqlite
+JOB_STORE_PATH = os.getenv('JOB_STORE_PATH', os.path.join(DATA_DIR, 'jobs.db'))
+JOB_DEADLINE = float(os.getenv('JOB_DEADLINE', '300'))  # Default time budget per job (seconds)
+JOB_RETENTION = int(os.getenv('JOB_RETENTION', '86400'))  # Seconds finished jobs are kept
+WEBHOOK_ALLOWED_HOSTS = {host.strip().lower() for host in os.getenv('WEBHOOK_ALLOWED_HOSTS', '').split(',') if host.strip()}
+WEBHOOK_TIMEOUT = 10  # Seconds per delivery attempt
+WEBHOOK_ATTEMPTS = 3
+WEBHOOK_WORKERS = 2  # Threads delivering webhooks (job workers never wait for them)
+
+PRIORITIES = {'high': 0, 'normal': 1, 'low': 2}
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class QueueFullError(Exception):
+    """The job queue is at JOB_QUEUE_MAX"""
+
+
+@dataclass
+class Job:
+    """One queued analysis"""
+    job_id: str
+    payload: Dict
+    priority: str = 'normal'
+    status: str = QUEUED
+    webhook_url: str = ''
+    created_at: float = field(default_factory=time.time)
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    partial_results: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict] = None
+    error: str = ''
+    webhook_status: str = ''
+
+    def to_dict(self, include_payload: bool = False) -> Dict:
+        """API view of the job"""
+        data = asdict(self)
+        if not include_payload:
+            del data['payload']
+        return data
+
+
+def parse_priority(value) -> str:
+    """Normalize a priority name ('high', 'normal', 'low')"""
+    value = str(value or 'normal').lower()
+    if value not in PRIORITIES:
+        raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+    return value
+
+
+def validate_webhook_url(url: str) -> str:
+    """
+    Webhook URLs must be absolute http(s) URLs of an allowed host
+
+    With WEBHOOK_ALLOWED_HOSTS set, only those hosts are accepted. Otherwise
+    every address the host resolves to must be public: loopback, private,
+    link-local, multicast and reserved addresses are rejected, so a job
+    cannot make the server call internal services.
+
+    Raises:
+        ValueError: Not an http(s) URL, or the host is not allowed
+    """
+    if not url:
+        return ''
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        raise ValueError('webhook_url must be an http(s) URL')
+    host = parsed.hostname.lower()
+    if WEBHOOK_ALLOWED_HOSTS:
+        if host not in WEBHOOK_ALLOWED_HOSTS:
+            raise ValueError(f"webhook_url host '{host}' is not in WEBHOOK_ALLOWED_HOSTS")
+        return url
+
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parsed.port, proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError) as e:
+        raise ValueError(f"webhook_url host '{host}' does not resolve") from e
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split('%')[0])
+        if ip.version == 6 and ip.ipv4_mapped:
+            ip = ip.ipv4_mapped
+        if not ip.is_global or ip.is_multicast:
+            raise ValueError(f"webhook_url host '{host}' resolves to a non-public address ({ip})")
+    return url
+
+
+# ========================================
+# JOB STORES
+# ========================================
+
+class JobStore(ABC):
+    """
+    Job persistence interface
+    """
+
+    @abstractmethod
+    def save(self, job: Job):
+        """Insert or replace a job"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """Job by id, or None"""
+
+    @abstractmethod
+    def unfinished(self) -> List[Job]:
+        """Queued or running jobs (to resume after a restart)"""
+
+    @abstractmethod
+    def purge(self, older_than: float) -> int:
+        """Delete finished jobs that ended before the given time"""
+
+
+class MemoryJobStore(JobStore):
+    """Jobs kept in process memory"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def save(self, job: Job):
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def unfinished(self) -> List[Job]:
+        with self._lock:
+            return [job for job in self._jobs.values() if job.status not in FINISHED_STATES]
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.status in FINISHED_STATES and job.finished_at < older_than]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+
+class SQLiteJobStore(JobStore):
+    """Jobs stored as JSON rows in a SQLite database"""
+
+    def __init__(self, path: str = JOB_STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                finished_at REAL NOT NULL DEFAULT 0,
+                data TEXT NOT NULL
+            )
+        """)
+        self._connection.commit()
+
+    def save(self, job: Job):
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO jobs (job_id, status, finished_at, data) VALUES (?, ?, ?, ?)',
+                (job.job_id, job.status, job.finished_at, json.dumps(asdict(job), default=str))
+            )
+            self._connection.commit()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._connection.execute('SELECT data FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return Job(**json.loads(row[0])) if row else None
+
+    def unfinished(self) -> List[Job]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT data FROM jobs WHERE status IN (?, ?)', (QUEUED, RUNNING)
+            ).fetchall()
+        return [Job(**json.loads(row[0])) for row in rows]
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"DELETE FROM jobs WHERE status IN ({','.join('?' * len(FINISHED_STATES))}) AND finished_at < ?",
+                (*FINISHED_STATES, older_than)
+            )
+            self._connection.commit()
+            return cursor.rowcount
+
+
+def create_job_store(kind: str = JOB_STORE) -> JobStore:
+    """Job store by name ('memory' or 'sqlite')"""
+    if kind == 'sqlite':
+        return SQLiteJobStore(JOB_STORE_PATH)
+    if kind != 'memory':
+        logger.warning("⚠️ [JOBS] Unknown JOB_STORE '%s', using memory", kind)
+    return MemoryJobStore()
+
+
+# ========================================
+# QUEUE AND WORKERS
+# ========================================
+
+class JobQueue:
+    """
+    Bounded priority queue served by a fixed pool of worker threads
+
+    The runner is called as runner(payload) on a worker thread, under a
+    RequestContext whose progress reports become the job's partial results.
+    It returns the result dict or raises.
+    """
+
+    def __init__(self, store: Optional[JobStore] = None, workers: int = JOB_WORKERS,
+                 max_queued: int = JOB_QUEUE_MAX):
+        self.store = store or create_job_store()
+        self.workers = workers
+        self.max_queued = max_queued
+        self.runner: Optional[Callable[[Dict], Dict]] = None
+
+        self._queue: 'queue.PriorityQueue' = queue.PriorityQueue()
+        self._sequence = itertools.count()  # FIFO within a priority
+        self._contexts: Dict[str, RequestContext] = {}  # Running job -> context
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._updates = threading.Condition()
+        self._webhooks = ThreadPoolExecutor(max_workers=WEBHOOK_WORKERS, thread_name_prefix='job-webhook')
+        self.version = 0  # Bumped on every progress report and finished job
+
+        self.stats = {'submitted': 0, 'succeeded': 0, 'failed': 0, 'cancelled': 0, 'rejected': 0}
+
+    def set_runner(self, runner: Callable[[Dict], Dict]):
+        self.runner = runner
+
+    def start(self):
+        """Start the workers and resume jobs left unfinished by a previous run"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f'job-worker-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+        resumed = 0
+        for job in self.store.unfinished():
+            job.status = QUEUED
+            self.store.save(job)
+            self._enqueue(job)
+            resumed += 1
+        logger.info("🗃️ [JOBS] %s workers started (%s)%s", self.workers, type(self.store).__name__,
+                    f", {resumed} jobs resumed" if resumed else '')
+
+    def _changed(self):
+        with self._updates:
+            self.version += 1
+            self._updates.notify_all()
+
+    def wait_for_update(self, seen: int, timeout: float) -> int:
+        """
+        Block until some job reported progress or finished after version `seen`
+
+        Returns:
+            The current version (equal to `seen` if the timeout passed first)
+        """
+        with self._updates:
+            self._updates.wait_for(lambda: self.version != seen, timeout)
+            return self.version
+
+    def _enqueue(self, job: Job):
+        self._queue.put((PRIORITIES[job.priority], next(self._sequence), job.job_id))
+
+    def submit(self, payload: Dict, priority: str = 'normal', webhook_url: str = '') -> Job:
+        """
+        Queue an analysis
+
+        Raises:
+            ValueError: Invalid priority or webhook URL
+            QueueFullError: JOB_QUEUE_MAX jobs already waiting
+        """
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            payload=payload,
+            priority=parse_priority(priority),
+            webhook_url=validate_webhook_url(webhook_url)
+        )
+        if self._queue.qsize() >= self.max_queued:
+            self.stats['rejected'] += 1
+            raise QueueFullError(f"Job queue is full ({self.max_queued} jobs waiting)")
+
+        self.start()
+        self.store.save(job)
+        self._enqueue(job)
+        self.stats['submitted'] += 1
+
+        # Finished jobs are only kept for JOB_RETENTION seconds
+        if self.stats['submitted'] % 50 == 0:
+            self.store.purge(time.time() - JOB_RETENTION)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a queued job, or stop a running one at its next deadline check"""
+        with self._lock:
+            job = self.store.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return job
+            context = self._contexts.get(job_id)
+            if context is None:
+                # Still queued: the worker skips it when it comes up
+                self._finish(job, CANCELLED, error='job cancelled', notify=False)
+            else:
+                context.cancel('job cancelled')
+                return job
+        self._notify(job)
+        return job
+
+    def _work(self):
+        while True:
+            _, _, job_id = self._queue.get()
+            try:
+                context = None
+                with self._lock:
+                    # Claim the job atomically with respect to cancel()
+                    job = self.store.get(job_id)
+                    if job is not None and job.status == QUEUED:
+                        context = self._claim(job)
+                if context is not None:
+                    self._run(job, context)
+            except Exception as e:
+                logger.exception("⚠️ [JOBS] Worker error on %s: %s: %s", job_id, type(e).__name__, e)
+            finally:
+                self._queue.task_done()
+
+    def _claim(self, job: Job) -> RequestContext:
+        """Mark a job running and create its context (caller holds the lock)"""
+        # Same validation and REQUEST_DEADLINE_MAX clamp as synchronous requests
+        context = RequestContext(request_budget({}, job.payload, default=JOB_DEADLINE))
+        self._contexts[job.job_id] = context
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        self.store.save(job)
+        return context
+
+    def _run(self, job: Job, context: RequestContext):
+        def on_progress(stage: str, result: Any):
+            # JSON snapshot: the pipeline keeps mutating its result dicts
+            snapshot = json.loads(json.dumps(result, default=str))
+            job.partial_results = {**job.partial_results, stage: snapshot}
+            self.store.save(job)
+            self._changed()
+
+        context.add_listener(on_progress)
+        logger.debug("🗃️ [JOBS] Running job %s (%s)", job.job_id, job.priority)
+
+        token = activate(context)
+        try:
+            if self.runner is None:
+                raise RuntimeError('No job runner configured')
+            result = self.runner(job.payload)
+            if context.cancelled:
+                self._finish(job, CANCELLED, error=context.cancel_reason)
+            else:
+                self._finish(job, SUCCEEDED, result=result)
+        except Exception as e:
+            self._finish(job, CANCELLED if context.cancelled else FAILED,
+                         error=context.cancel_reason or f"{type(e).__name__}: {e}")
+        finally:
+            deactivate(token)
+            context.finish()
+            with self._lock:
+                self._contexts.pop(job.job_id, None)
+
+    def _finish(self, job: Job, status: str, result: Optional[Dict] = None, error: str = '',
+                notify: bool = True):
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        if status == SUCCEEDED:
+            job.partial_results = {}  # Superseded by the full result
+        self.stats[status] += 1
+        self.store.save(job)
+        self._changed()
+        logger.info("🗃️ [JOBS] Job %s %s%s", job.job_id, status,
+                    f" in {job.finished_at - job.started_at:.1f}s" if job.started_at else '')
+        if notify:
+            self._notify(job)
+
+    def _notify(self, job: Job):
+        """Deliver a finished job to its webhook, if any, off the worker thread"""
+        if job.webhook_url:
+            job.webhook_status = 'pending'
+            self.store.save(job)
+            self._webhooks.submit(self._deliver, job)
+
+    def _deliver(self, job: Job):
+        try:
+            job.webhook_status = deliver_webhook(job)
+        except Exception as e:
+            job.webhook_status = f"failed: {type(e).__name__}: {e}"
+        self.store.save(job)
+        self._changed()
+
+    def get_stats(self) -> Dict:
+        """Queue depth, running jobs and outcome counters"""
+        with self._lock:
+            running = len(self._contexts)
+        return {
+            **self.stats,
+            'queued': self._queue.qsize(),
+            'running': running,
+            'workers': self.workers,
+            'store': type(self.store).__name__
+        }
+
+
+def deliver_webhook(job: Job) -> str:
+    """
+    POST the finished job to its webhook URL (a few attempts with backoff)
+
+    The URL is checked again first (its host may resolve differently by
+    now) and redirects are not followed.
+
+    Returns:
+        Delivery status, e.g. 'delivered (200)', 'rejected: ...' or 'failed: ...'
+    """
+    try:
+        validate_webhook_url(job.webhook_url)
+    except ValueError as e:
+        logger.warning("⚠️ [JOBS] Webhook for %s rejected: %s", job.job_id, e)
+        return f"rejected: {e}"
+
+    body = {'job_id': job.job_id, 'status': job.status, 'result': job.result, 'error': job.error or None}
+    last_error = ''
+    for attempt in range(WEBHOOK_ATTEMPTS):
+        try:
+            response = get_http_session().post(job.webhook_url, json=body, timeout=http_timeout(WEBHOOK_TIMEOUT),
+                                              allow_redirects=False)
+            if response.status_code < 500:
+                return f"delivered ({response.status_code})"
+            last_error = f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            last_error = f"{type(e).__name__}: {e}"
+        if attempt < WEBHOOK_ATTEMPTS - 1:
+            time.sleep(2 ** attempt)
+    logger.warning("⚠️ [JOBS] Webhook for %s failed: %s", job.job_id, last_error)
+    return f"failed: {last_error}"
+
+
+# Singleton instance
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the job queue singleton (workers start with the first job)"""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue()
+    return _job_queue
+
+
+# Test function
+if __name__ == "__main__":
+    import tempfile
+
+    from request_context import current_context
+
+    def fake_runner(payload: Dict) -> Dict:
+        context = current_context()
+        for phase in ('pretrained_models', 'linguistic_fingerprint'):
+            time.sleep(0.05)
+            context.report(phase, {'done': True})
+        return {'verdict': 'APPEARS CREDIBLE', 'title': payload.get('title')}
+
+    print("\n" + "=" * 60)
+    print("JOB QUEUE TEST")
+    print("=" * 60)
+    for store in (MemoryJobStore(), SQLiteJobStore(os.path.join(tempfile.mkdtemp(), 'jobs.db'))):
+        job_queue = JobQueue(store=store, workers=1)
+        job_queue.set_runner(fake_runner)
+        blocker = job_queue.submit({'title': 'first'})
+        low = job_queue.submit({'title': 'low'}, priority='low')
+        high = job_queue.submit({'title': 'high'}, priority='high')
+        cancelled = job_queue.submit({'title': 'cancelled'}, priority='low')
+        job_queue.cancel(cancelled.job_id)
+        job_queue._queue.join()
+
+        order = sorted((job_queue.get(j.job_id) for j in (blocker, low, high)), key=lambda j: j.started_at)
+        print(f"{type(store).__name__}: run order {[j.payload['title'] for j in order]}, "
+              f"cancelled={job_queue.get(cancelled.job_id).status}")
+        print(f"  Result: {job_queue.get(high.job_id).result}")
+        print(f"  Stats: {job_queue.get_stats()}")
+        print(f"  Updates seen by event streams: {job_queue.wait_for_update(0, 0.1)}")
+    for url in ('http://127.0.0.1:8080/hook', 'http://169.254.169.254/latest', 'ftp://example.com/'):
+        try:
+            validate_webhook_url(url)
+            print(f"Webhook {url}: accepted")
+        except ValueError as e:
+            print(f"Webhook {url}: {e}")
+    print("=" * 60)
@@ -0,0 +1,344 @@
+"""
+🔤 SHARED KEYWORD AUTOMATON
+Single-pass multi-keyword matcher for the keyword-driven detectors
+
+Every keyword list used by the detection phases (linguistic fingerprint,
+propaganda, network analysis, entity verification, false claims database,
+/quick-test) is registered here under a category tag. All lists are compiled
+into ONE Aho-Corasick automaton, so a document is scanned once and every
+detector reads its hits from the same scan instead of running its own
+`if kw in text_lower` / `re.compile(r'\\b' + word + r'\\b')` loops.
+
+Each hit carries:
+- keyword (lower-cased, as registered)
+- start/end offsets into the original text
+- bounded: True if both ends sit on regex-style \\b word boundaries
+
+Uses the `pyahocorasick` C extension when installed, otherwise a pure
+Python automaton with the same output.
+
+Author: AI Misinformation Detector
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from logging_setup import get_logger
+
+try:
+    import ahocorasick  # Optional C implementation
+except ImportError:
+    ahocorasick = None
+
+logger = get_logger(__name__)
+
+# Number of recently scanned documents kept so that all detectors
+# analysing the same content share one pass
+SCAN_CACHE_SIZE = 16
+
+
+@dataclass
+class KeywordHit:
+    """A single keyword occurrence in a document"""
+    keyword: str  # Lower-cased keyword as registered
+    start: int
+    end: int
+    bounded: bool  # Both ends on \b word boundaries
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the re module's \\w"""
+    return ch.isalnum() or ch == '_'
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """Lower-case text without changing its length (offsets stay valid)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') expand when lower-cased
+    return ''.join(ch.lower()[:1] or ch for ch in text)
+
+
+class _PythonAutomaton:
+    """Pure Python Aho-Corasick automaton (fallback when pyahocorasick is missing)"""
+
+    def __init__(self, keywords: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for keyword_id, keyword in enumerate(keywords):
+            state = 0
+            for ch in keyword:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword_id)
+
+        # Breadth-first construction of failure links
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                outputs[next_state].extend(outputs[self.fail[next_state]])
+
+        self.output = [tuple(ids) for ids in outputs]
+
+    def iter(self, text: str):
+        """Yield (end_index, keyword_id) for every occurrence, overlaps included"""
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        state = 0
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for keyword_id in output[state]:
+                    yield index, keyword_id
+
+
+class KeywordAutomaton:
+    """
+    Compiled multi-pattern matcher over tagged keyword lists
+    """
+
+    def __init__(self, registry: Dict[str, List[str]]):
+        """
+        Args:
+            registry: Mapping of category tag -> keyword list
+        """
+        self.keywords: List[str] = []
+        self.keyword_ids: Dict[str, int] = {}
+        self.tag_keywords: Dict[str, Set[str]] = {}
+
+        for tag, keywords in registry.items():
+            lowered = set()
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                lowered.add(keyword)
+                if keyword not in self.keyword_ids:
+                    self.keyword_ids[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+            self.tag_keywords[tag] = lowered
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword_id, keyword in enumerate(self.keywords):
+                self._automaton.add_word(keyword, keyword_id)
+            if self.keywords:
+                self._automaton.make_automaton()
+            else:
+                self._automaton = None
+        else:
+            self._automaton = _PythonAutomaton(self.keywords)
+
+    def scan(self, text: str) -> 'KeywordScan':
+        """Scan a document once and collect every keyword occurrence"""
+        lowered = _lower_preserving_offsets(text)
+        occurrences: Dict[str, List[KeywordHit]] = defaultdict(list)
+
+        if self._automaton is not None and lowered:
+            keywords = self.keywords
+            length = len(lowered)
+            for end_index, keyword_id in self._automaton.iter(lowered):
+                keyword = keywords[keyword_id]
+                end = end_index + 1
+                start = end - len(keyword)
+
+                # Regex-style \b check on both ends
+                before = start > 0 and _is_word_char(lowered[start - 1])
+                after = end < length and _is_word_char(lowered[end])
+                bounded = (before != _is_word_char(lowered[start]) and
+                           after != _is_word_char(lowered[end - 1]))
+
+                occurrences[keyword].append(KeywordHit(keyword, start, end, bounded))
+
+        # pyahocorasick reports hits by end offset; keep them in start order
+        for hits in occurrences.values():
+            hits.sort(key=lambda h: h.start)
+
+        return KeywordScan(text, lowered, occurrences, self.tag_keywords)
+
+
+class KeywordScan:
+    """
+    Result of scanning one document; queried by each detector with its tag
+    """
+
+    def __init__(self, text: str, lowered: str, occurrences: Dict[str, List[KeywordHit]],
+                 tag_keywords: Dict[str, Set[str]]):
+        self.text = text
+        self.lowered = lowered
+        self._occurrences = occurrences
+        self._tag_keywords = tag_keywords
+
+    def found(self, tag: str, bounded: bool = False) -> Set[str]:
+        """Keywords of a category present in the document"""
+        tag_keywords = self._tag_keywords.get(tag, set())
+        # Walk whichever side is smaller (large databases, short documents)
+        if len(self._occurrences) < len(tag_keywords):
+            candidates = (k for k in self._occurrences if k in tag_keywords)
+        else:
+            candidates = tag_keywords
+        present = set()
+        for keyword in candidates:
+            hits = self._occurrences.get(keyword)
+            if not hits:
+                continue
+            if not bounded or any(h.bounded for h in hits):
+                present.add(keyword)
+        return present
+
+    def contains(self, keyword: str, bounded: bool = False) -> bool:
+        """Whether a single (registered) keyword appears in the document"""
+        hits = self._occurrences.get(keyword.lower())
+        if not hits:
+            return False
+        return not bounded or any(h.bounded for h in hits)
+
+    def occurrences(self, keyword: str, bounded: bool = False) -> List[KeywordHit]:
+        """All occurrences of a registered keyword, in text order"""
+        hits = self._occurrences.get(keyword.lower(), [])
+        if bounded:
+            return [h for h in hits if h.bounded]
+        return list(hits)
+
+    def hits(self, tag: str, bounded: bool = False) -> List[KeywordHit]:
+        """All occurrences of a category's keywords, in text order"""
+        result = []
+        for keyword in self._tag_keywords.get(tag, ()):
+            result.extend(self.occurrences(keyword, bounded))
+        result.sort(key=lambda h: (h.start, -h.end))
+        return result
+
+    def matched_text(self, hit: KeywordHit) -> str:
+        """Original-case text of a hit"""
+        return self.text[hit.start:hit.end]
+
+
+# ========================================
+# SHARED REGISTRY
+# ========================================
+
+_registry: Dict[str, List[str]] = {}
+_automaton: Optional[KeywordAutomaton] = None
+_scan_cache: 'OrderedDict[str, KeywordScan]' = OrderedDict()
+_lock = threading.Lock()
+
+
+def register_keywords(tag: str, keywords: Iterable[str]):
+    """
+    Register a detector's keyword list under a category tag
+
+    Called at import time by each detector module; the shared automaton is
+    (re)compiled once on the next scan.
+    """
+    global _automaton
+    with _lock:
+        _registry[tag] = list(keywords)
+        _automaton = None
+        _scan_cache.clear()
+
+
+def prepare_keyword_update(updates: Dict[str, Iterable[str]]) -> Callable[[], None]:
+    """
+    Compile the automaton for replaced categories; returns the call that swaps it in
+
+    Compiling happens here, outside the lock, so concurrent scans keep using
+    the previous automaton; nothing changes until the returned commit runs.
+    """
+    updates = {tag: list(keywords) for tag, keywords in updates.items()}
+    with _lock:
+        registry = dict(_registry)
+    registry.update(updates)
+    automaton = KeywordAutomaton(registry)
+
+    def commit():
+        global _automaton
+        with _lock:
+            _registry.update(updates)
+            # Another category registered meanwhile: fall back to a lazy rebuild
+            _automaton = automaton if _registry == registry else None
+            _scan_cache.clear()
+        logger.info("🔤 [KEYWORDS] Automaton updated: %s keywords, %s categories", len(automaton.keywords), len(registry))
+
+    return commit
+
+
+def update_keywords(updates: Dict[str, Iterable[str]]):
+    """Replace several categories at once (hot reload of a dataset)"""
+    prepare_keyword_update(updates)()
+
+
+def get_keyword_automaton() -> KeywordAutomaton:
+    """Get the shared automaton, compiling it if the registry changed"""
+    global _automaton
+    with _lock:
+        if _automaton is None:
+            _automaton = KeywordAutomaton(_registry)
+            logger.info("🔤 [KEYWORDS] Automaton compiled: %s keywords, %s categories", len(_automaton.keywords), len(_registry))
+        return _automaton
+
+
+def scan_keywords(text: str) -> KeywordScan:
+    """
+    Scan text with the shared automaton
+
+    Recent results are cached by content, so every detector that analyses
+    the same document reuses a single pass.
+    """
+    automaton = get_keyword_automaton()
+    with _lock:
+        cached = _scan_cache.get(text)
+        if cached is not None:
+            _scan_cache.move_to_end(text)
+            return cached
+
+    result = automaton.scan(text)
+
+    with _lock:
+        if _automaton is automaton:
+            _scan_cache[text] = result
+            while len(_scan_cache) > SCAN_CACHE_SIZE:
+                _scan_cache.popitem(last=False)
+    return result
+
+
+# Test function
+if __name__ == "__main__":
+    register_keywords('test.fear', ['deadly', 'threat', 'kill'])
+    register_keywords('test.phrases', ['wake up', 'big pharma', 'vaccine', 'vaccine tracking'])
+
+    test_text = "WAKE UP! Big Pharma hides the deadly threat. Vaccine tracking is a killer myth."
+    scan = scan_keywords(test_text)
+
+    print("\n" + "=" * 60)
+    print("KEYWORD AUTOMATON TEST")
+    print("=" * 60)
+    print(f"Engine: {'pyahocorasick' if ahocorasick else 'pure Python'}")
+    for tag in ('test.fear', 'test.phrases'):
+        print(f"\n{tag}:")
+        for hit in scan.hits(tag):
+            print(f"  {scan.matched_text(hit)!r} @ {hit.start}-{hit.end} bounded={hit.bounded}")
+    print("=" * 60)
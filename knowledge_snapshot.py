@@ -0,0 +1,300 @@
+"""
+📚 LOCAL KNOWLEDGE SNAPSHOT
+Offline SQLite FTS5 index of Wikipedia abstracts and Wikidata labels
+
+The verification network looks claims up here first, so claims are
+verified at local-index speed (a few milliseconds) without any network
+round trip. The live Wikipedia/Wikidata/PubMed/arXiv APIs are only used
+when explicitly enabled (VERIFICATION_LIVE_FALLBACK).
+
+The snapshot is optional: without a database file the verification
+network simply has no local source.
+
+Build one from public dumps:
+
+    python knowledge_snapshot.py build \\
+        --wikipedia enwiki-latest-abstract.xml.gz \\
+        --wikidata wikidata_labels.jsonl
+
+- Wikipedia: the abstract dump (<doc><title>/<url>/<abstract>), plain or
+  gzipped, or JSON lines with title/abstract/url
+- Wikidata: JSON lines with id/label/description, or a TSV with the same
+  three columns
+
+Author: AI Misinformation Detector
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dataset_store import DATA_DIR
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Snapshot database location (override with KNOWLEDGE_SNAPSHOT_PATH)
+KNOWLEDGE_SNAPSHOT_PATH = os.getenv('KNOWLEDGE_SNAPSHOT_PATH', os.path.join(DATA_DIR, 'knowledge_snapshot.db'))
+
+SNAPSHOT_SCHEMA = 1
+INSERT_BATCH_SIZE = 10000
+
+# Column weights for bm25 ranking: a title/label match counts more than body text
+WIKIPEDIA_RANK = 'bm25(wikipedia, 5.0, 1.0)'
+WIKIDATA_RANK = 'bm25(wikidata, 0.0, 5.0, 1.0)'  # entity_id, label, description
+
+
+def _open(path: str):
+    """Open a plain or gzipped file for reading"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def _fts_phrase(keyword: str) -> str:
+    """Quote a keyword as an FTS5 string (no operator injection)"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class KnowledgeSnapshot:
+    """
+    Read-only access to a snapshot database (one connection per thread)
+    """
+
+    def __init__(self, path: str = KNOWLEDGE_SNAPSHOT_PATH):
+        self.path = path
+        self._local = threading.local()
+        self.meta = dict(self._connection().execute('SELECT key, value FROM meta').fetchall())
+        if int(self.meta.get('schema', 0)) != SNAPSHOT_SCHEMA:
+            raise ValueError(f"{path}: unsupported snapshot schema {self.meta.get('schema')!r}")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            self._local.connection = connection
+        return connection
+
+    def _search(self, table: str, rank: str, columns: str, query: str):
+        """Best-ranked row for an FTS5 query, or None"""
+        return self._connection().execute(
+            f"SELECT {columns} FROM {table} WHERE {table} MATCH ? ORDER BY {rank} LIMIT 1", (query,)
+        ).fetchone()
+
+    def search_wikipedia(self, keywords: List[str]) -> Optional[Tuple[str, str, str]]:
+        """
+        Best Wikipedia article for claim keywords: (title, abstract, url) or None
+
+        Articles must contain at least two of the claim's top 5 keywords.
+        """
+        terms = [_fts_phrase(k) for k in dict.fromkeys(keywords[:5])]
+        if not terms:
+            return None
+        if len(terms) == 1:
+            query = terms[0]
+        else:
+            query = ' OR '.join(f"({a} AND {b})" for a, b in combinations(terms, 2))
+        return self._search('wikipedia', WIKIPEDIA_RANK, 'title, abstract, url', query)
+
+    def search_wikidata(self, keywords: List[str]) -> Optional[Tuple[str, str, str]]:
+        """
+        Best Wikidata entity for claim keywords: (entity id, label, description) or None
+
+        The entity label must contain one of the claim's top 3 keywords.
+        """
+        terms = [_fts_phrase(k) for k in dict.fromkeys(keywords[:3])]
+        if not terms:
+            return None
+        query = 'label : (' + ' OR '.join(terms) + ')'
+        return self._search('wikidata', WIKIDATA_RANK, 'entity_id, label, description', query)
+
+    def get_status(self) -> Dict:
+        """Snapshot metadata (build time, row counts)"""
+        return {'path': self.path, **self.meta}
+
+
+# ========================================
+# BUILDING
+# ========================================
+
+def iter_wikipedia_abstracts(path: str) -> Iterator[Tuple[str, str, str]]:
+    """(title, abstract, url) from an abstract XML dump or JSON lines"""
+    if path.endswith(('.jsonl', '.jsonl.gz', '.json', '.json.gz')):
+        with _open(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record.get('title', ''), record.get('abstract', ''), record.get('url', '')
+        return
+
+    with _open(path) as f:
+        for _, element in ET.iterparse(f, events=('end',)):
+            if element.tag != 'doc':
+                continue
+            title = element.findtext('title') or ''
+            if title.startswith('Wikipedia: '):
+                title = title[len('Wikipedia: '):]
+            yield title, element.findtext('abstract') or '', element.findtext('url') or ''
+            element.clear()
+
+
+def iter_wikidata_labels(path: str) -> Iterator[Tuple[str, str, str]]:
+    """(entity id, label, description) from JSON lines or a TSV"""
+    with _open(path) as f:
+        for line in f:
+            line = line.decode('utf-8').rstrip('\n')
+            if not line.strip():
+                continue
+            if line.lstrip().startswith('{'):
+                record = json.loads(line)
+                yield record.get('id', ''), record.get('label', ''), record.get('description', '')
+            else:
+                entity_id, label, description = (line.split('\t') + ['', '', ''])[:3]
+                yield entity_id, label, description
+
+
+def _insert(connection: sqlite3.Connection, sql: str, rows: Iterable[Tuple]) -> int:
+    count = 0
+    batch = []
+    for row in rows:
+        if not row[0] or not row[1]:
+            continue
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            connection.executemany(sql, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        connection.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def build_snapshot(path: str = KNOWLEDGE_SNAPSHOT_PATH,
+                   wikipedia: Optional[Iterable[Tuple[str, str, str]]] = None,
+                   wikidata: Optional[Iterable[Tuple[str, str, str]]] = None) -> Dict:
+    """
+    Build a snapshot database (written to a temp file, then swapped in)
+
+    Args:
+        path: Target database path
+        wikipedia: (title, abstract, url) rows
+        wikidata: (entity id, label, description) rows
+
+    Returns:
+        Snapshot metadata
+    """
+    temp_path = f"{path}.building"
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE VIRTUAL TABLE wikipedia USING fts5(title, abstract, url UNINDEXED, tokenize='porter unicode61');
+            CREATE VIRTUAL TABLE wikidata USING fts5(entity_id UNINDEXED, label, description, tokenize='porter unicode61');
+        """)
+        wikipedia_count = _insert(connection, 'INSERT INTO wikipedia VALUES (?, ?, ?)', wikipedia or ())
+        wikidata_count = _insert(connection, 'INSERT INTO wikidata VALUES (?, ?, ?)', wikidata or ())
+        logger.info("📚 [SNAPSHOT] Indexed %s Wikipedia abstracts, %s Wikidata labels", wikipedia_count, wikidata_count)
+
+        # Merge FTS segments for faster queries
+        connection.execute("INSERT INTO wikipedia(wikipedia) VALUES ('optimize')")
+        connection.execute("INSERT INTO wikidata(wikidata) VALUES ('optimize')")
+
+        meta = {
+            'schema': str(SNAPSHOT_SCHEMA),
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'wikipedia_articles': str(wikipedia_count),
+            'wikidata_entities': str(wikidata_count)
+        }
+        connection.executemany('INSERT INTO meta VALUES (?, ?)', meta.items())
+        connection.commit()
+    finally:
+        connection.close()
+
+    os.replace(temp_path, path)
+    return meta
+
+
+# Singleton instance
+_knowledge_snapshot = None
+_snapshot_checked = False
+_snapshot_lock = threading.Lock()
+
+
+def get_knowledge_snapshot() -> Optional[KnowledgeSnapshot]:
+    """Get the local snapshot, or None if no snapshot database is installed"""
+    global _knowledge_snapshot, _snapshot_checked
+    if not _snapshot_checked:
+        with _snapshot_lock:
+            if not _snapshot_checked:
+                if os.path.exists(KNOWLEDGE_SNAPSHOT_PATH):
+                    try:
+                        _knowledge_snapshot = KnowledgeSnapshot(KNOWLEDGE_SNAPSHOT_PATH)
+                        logger.info("📚 [SNAPSHOT] Loaded %s (%s articles, %s entities)", KNOWLEDGE_SNAPSHOT_PATH,
+                                    _knowledge_snapshot.meta.get('wikipedia_articles', 0),
+                                    _knowledge_snapshot.meta.get('wikidata_entities', 0))
+                    except Exception as e:
+                        logger.warning("⚠️ [SNAPSHOT] Could not open %s: %s", KNOWLEDGE_SNAPSHOT_PATH, e)
+                else:
+                    logger.info("💡 [SNAPSHOT] No local knowledge snapshot at %s", KNOWLEDGE_SNAPSHOT_PATH)
+                _snapshot_checked = True
+    return _knowledge_snapshot
+
+
+# Build command / test function
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'build':
+        import argparse
+
+        parser = argparse.ArgumentParser(description='Build the local knowledge snapshot')
+        parser.add_argument('command', choices=['build'])
+        parser.add_argument('--wikipedia', help='Wikipedia abstract dump (.xml[.gz]) or JSON lines')
+        parser.add_argument('--wikidata', help='Wikidata labels (JSON lines or TSV)')
+        parser.add_argument('--output', default=KNOWLEDGE_SNAPSHOT_PATH, help='Snapshot database path')
+        args = parser.parse_args()
+
+        meta = build_snapshot(
+            args.output,
+            wikipedia=iter_wikipedia_abstracts(args.wikipedia) if args.wikipedia else None,
+            wikidata=iter_wikidata_labels(args.wikidata) if args.wikidata else None
+        )
+        print(json.dumps(meta, indent=2))
+        sys.exit(0)
+
+    import tempfile
+
+    test_path = os.path.join(tempfile.mkdtemp(), 'snapshot.db')
+    build_snapshot(
+        test_path,
+        wikipedia=[
+            ('Age of Earth', 'The age of Earth is estimated to be 4.54 billion years.', 'https://en.wikipedia.org/wiki/Age_of_Earth'),
+            ('Boiling point', 'Water boils at 100 degrees Celsius at sea level.', 'https://en.wikipedia.org/wiki/Boiling_point'),
+        ],
+        wikidata=[
+            ('Q2', 'Earth', 'third planet from the Sun in the Solar System'),
+            ('Q283', 'water', 'chemical compound; main constituent of the fluids of most living organisms'),
+        ]
+    )
+    snapshot = KnowledgeSnapshot(test_path)
+
+    print("\n" + "=" * 60)
+    print("KNOWLEDGE SNAPSHOT TEST")
+    print("=" * 60)
+    for keywords in (['earth', 'approximately', 'billion', 'years', 'old'], ['water', 'boils', 'degrees', 'celsius'],
+                     ['chocolate', 'cures', 'diseases']):
+        print(f"{' '.join(keywords)}:")
+        print(f"  Wikipedia: {snapshot.search_wikipedia(keywords)}")
+        print(f"  Wikidata:  {snapshot.search_wikidata(keywords)}")
+    print(f"Status: {snapshot.get_status()}")
+    print("=" * 60)
@@ -4,705 +4,244 @@ Offline database of common misinformation to avoid network dependency
 Updated regularly from fact-checking sites
 """
 
-# Common false claims with verification sources (EXPANDED to 100+)
-KNOWN_FALSE_CLAIMS = {
-    # Health/Medical Misinformation - COVID-19 (30+)
-    "bill gates microchip": {
-        "verdict": "FALSE",
-        "source": "Snopes, Reuters, FactCheck.org",
-        "explanation": "No evidence Bill Gates is implanting microchips through vaccines"
-    },
-    "vaccines cause autism": {
-        "verdict": "FALSE",
-        "source": "CDC, WHO, Lancet retraction",
-        "explanation": "Numerous studies debunk vaccine-autism link; original study was fraudulent"
-    },
-    "5g causes coronavirus": {
-        "verdict": "FALSE",
-        "source": "WHO, BBC, FullFact",
-        "explanation": "No scientific link between 5G and COVID-19; virus spread in areas without 5G"
-    },
-    "covid vaccine changes dna": {
-        "verdict": "FALSE",
-        "source": "CDC, Nature",
-        "explanation": "mRNA vaccines don't alter DNA; they work in cytoplasm, not nucleus"
-    },
-    "drinking bleach cure": {
-        "verdict": "FALSE",
-        "source": "FDA, CDC",
-        "explanation": "Bleach is toxic and can cause severe harm or death"
-    },
-    "ivermectin cures covid": {
-        "verdict": "UNPROVEN",
-        "source": "FDA, WHO",
-        "explanation": "No conclusive evidence; FDA warns against using animal ivermectin"
-    },
-    "masks cause hypoxia": {
-        "verdict": "FALSE",
-        "source": "Mayo Clinic, WHO",
-        "explanation": "Masks do not reduce oxygen levels; safe for most people"
-    },
-    "covid created in lab": {
-        "verdict": "UNPROVEN",
-        "source": "WHO, Scientific studies",
-        "explanation": "No conclusive evidence; most scientists believe natural origin"
-    },
-    "covid vaccine magnetize": {
-        "verdict": "FALSE",
-        "source": "CDC, Reuters",
-        "explanation": "Vaccines contain no magnetic materials"
-    },
-    "covid vaccine infertility": {
-        "verdict": "FALSE",
-        "source": "ACOG, CDC, Studies",
-        "explanation": "No evidence vaccines affect fertility"
-    },
-    "hydroxychloroquine cure covid": {
-        "verdict": "FALSE",
-        "source": "FDA, WHO studies",
-        "explanation": "Studies show no benefit; can cause heart problems"
-    },
-    "covid just flu": {
-        "verdict": "FALSE",
-        "source": "WHO, CDC data",
-        "explanation": "COVID-19 more contagious and deadly than flu"
-    },
-    "vaccinated shed virus": {
-        "verdict": "FALSE",
-        "source": "CDC, Medical consensus",
-        "explanation": "mRNA vaccines don't contain live virus; can't shed"
-    },
-    "covid vaccine mark beast": {
-        "verdict": "FALSE",
-        "source": "Religious scholars, FactCheck",
-        "explanation": "No religious or medical basis for this claim"
-    },
-    "plandemic conspiracy": {
-        "verdict": "FALSE",
-        "source": "WHO, Medical experts",
-        "explanation": "Natural pandemic; no evidence of planned conspiracy"
-    },
-    "covid vaccine kill more": {
-        "verdict": "FALSE",
-        "source": "CDC data, Studies",
-        "explanation": "Vaccines far safer than COVID; save millions of lives"
-    },
-    "graphene oxide vaccine": {
-        "verdict": "FALSE",
-        "source": "Fact-checkers, Vaccine composition",
-        "explanation": "Vaccines don't contain graphene oxide"
-    },
-    "vaccine makes sick magnetic": {
-        "verdict": "FALSE",
-        "source": "Physics, Medical facts",
-        "explanation": "Human body not magnetic; vaccines don't change this"
-    },
-    "covid test implant tracker": {
-        "verdict": "FALSE",
-        "source": "Medical procedure facts",
-        "explanation": "Nasal swabs don't implant anything"
-    },
-    "vitamin d prevents covid": {
-        "verdict": "UNPROVEN",
-        "source": "WHO, Studies ongoing",
-        "explanation": "May help but not a cure or prevention guarantee"
-    },
-    
-    # Health - General (20+)
-    "fluoride mind control": {
-        "verdict": "FALSE",
-        "source": "CDC, Dental associations",
-        "explanation": "Fluoride prevents cavities; no mind control properties"
-    },
-    "chemtrails poison": {
-        "verdict": "FALSE",
-        "source": "Scientists, EPA",
-        "explanation": "Contrails are water vapor; no chemical spraying program"
-    },
-    "sugar causes hyperactivity": {
-        "verdict": "FALSE",
-        "source": "Multiple studies",
-        "explanation": "No scientific evidence linking sugar to hyperactivity"
-    },
-    "cracking knuckles arthritis": {
-        "verdict": "FALSE",
-        "source": "Medical studies",
-        "explanation": "No link between knuckle cracking and arthritis"
-    },
-    "copper bracelets arthritis": {
-        "verdict": "FALSE",
-        "source": "Studies, Mayo Clinic",
-        "explanation": "No evidence copper bracelets help arthritis"
-    },
-    "detox foot pads": {
-        "verdict": "FALSE",
-        "source": "FTC, Scientific analysis",
-        "explanation": "Pads don't remove toxins; discoloration from sweat/chemicals"
-    },
-    "ear candles remove wax": {
-        "verdict": "FALSE",
-        "source": "FDA, Medical studies",
-        "explanation": "Ineffective and dangerous; can cause injury"
-    },
-    "activated charcoal detox": {
-        "verdict": "MISLEADING",
-        "source": "Medical experts",
-        "explanation": "Limited medical uses; doesn't 'detox' body as claimed"
-    },
-    "himalayan salt lamp": {
-        "verdict": "UNPROVEN",
-        "source": "Studies lacking",
-        "explanation": "No scientific evidence of health benefits"
-    },
-    "essential oils cure": {
-        "verdict": "MISLEADING",
-        "source": "FDA, Medical consensus",
-        "explanation": "May have minor benefits but don't cure diseases"
-    },
-    
-    # Political Misinformation - Elections (20+)
-    "2020 election stolen": {
-        "verdict": "FALSE",
-        "source": "AP, Reuters, Court rulings",
-        "explanation": "No evidence of widespread fraud; 60+ court cases dismissed"
-    },
-    "dominion voting machines rigged": {
-        "verdict": "FALSE",
-        "source": "Audits, Court rulings",
-        "explanation": "No evidence; multiple audits confirmed accuracy"
-    },
-    "dead people voted": {
-        "verdict": "FALSE",
-        "source": "Election officials, Fact-checks",
-        "explanation": "Isolated errors, not widespread fraud"
-    },
-    "mail ballot fraud massive": {
-        "verdict": "FALSE",
-        "source": "Election data, Studies",
-        "explanation": "Mail voting secure; fraud extremely rare"
-    },
-    "watermark ballots secret": {
-        "verdict": "FALSE",
-        "source": "Election officials",
-        "explanation": "No secret watermarks; conspiracy theory"
-    },
-    "obama not born america": {
-        "verdict": "FALSE",
-        "source": "Birth certificate, PolitiFact",
-        "explanation": "Birth certificate verified; born in Hawaii in 1961"
-    },
-    "pizzagate": {
-        "verdict": "FALSE",
-        "source": "Snopes, NYTimes investigation",
-        "explanation": "Debunked conspiracy theory; no evidence of criminal activity"
-    },
-    "qanon": {
-        "verdict": "FALSE",
-        "source": "FBI, Multiple fact-checkers",
-        "explanation": "Baseless conspiracy theory; no evidence for claims"
-    },
-    "deep state coup": {
-        "verdict": "FALSE",
-        "source": "Political analysts",
-        "explanation": "Conspiracy theory; no evidence"
-    },
-    "soros funds everything": {
-        "verdict": "FALSE",
-        "source": "Fact-checkers",
-        "explanation": "Antisemitic conspiracy theory; exaggerates influence"
-    },
-    
-    # Climate/Environment (15+)
-    "climate change hoax": {
-        "verdict": "FALSE",
-        "source": "NASA, NOAA, IPCC",
-        "explanation": "97% of climate scientists agree human activity causes climate change"
-    },
-    "global cooling 1970s": {
-        "verdict": "MISLEADING",
-        "source": "Scientific record",
-        "explanation": "Minority view; most predicted warming even then"
-    },
-    "co2 plant food good": {
-        "verdict": "MISLEADING",
-        "source": "Climate scientists",
-        "explanation": "Oversimplifies; excess CO2 causes harmful warming"
-    },
-    "climate changed before": {
-        "verdict": "MISLEADING",
-        "source": "IPCC, NASA",
-        "explanation": "Current change unprecedented in speed and human-caused"
-    },
-    "volcanoes emit more co2": {
-        "verdict": "FALSE",
-        "source": "USGS, Scientists",
-        "explanation": "Humans emit 100x more CO2 than volcanoes"
-    },
-    "polar bears increasing": {
-        "verdict": "MISLEADING",
-        "source": "IUCN, Studies",
-        "explanation": "Some populations stable but overall at risk"
-    },
-    "renewable energy impossible": {
-        "verdict": "FALSE",
-        "source": "Energy studies",
-        "explanation": "100% renewable feasible; many countries progressing"
-    },
-    
-    # Science - Space/Physics (10+)
-    "earth flat": {
-        "verdict": "FALSE",
-        "source": "NASA, Centuries of scientific evidence",
-        "explanation": "Earth is spherical; proven by satellite imagery, physics, circumnavigation"
-    },
-    "moon landing fake": {
-        "verdict": "FALSE",
-        "source": "NASA, Independent verification",
-        "explanation": "Moon landing verified by independent sources, samples, retroreflectors"
-    },
-    "nibiru planet x": {
-        "verdict": "FALSE",
-        "source": "NASA, Astronomers",
-        "explanation": "No such planet; doomsday predictions repeatedly fail"
-    },
-    "mars face artificial": {
-        "verdict": "FALSE",
-        "source": "NASA higher-res images",
-        "explanation": "Natural rock formation; pareidolia effect"
-    },
-    "stars close earth": {
-        "verdict": "FALSE",
-        "source": "Astronomy, Physics",
-        "explanation": "Nearest star 4+ light years away"
-    },
-    
-    # Historical Events (10+)
-    "holocaust denial": {
-        "verdict": "FALSE",
-        "source": "Historical records, survivor testimony",
-        "explanation": "Holocaust extensively documented; denying it is rejected by historians"
-    },
-    "911 inside job": {
-        "verdict": "FALSE",
-        "source": "9/11 Commission, NIST reports",
-        "explanation": "No credible evidence; conspiracy theories debunked by investigations"
-    },
-    "pearl harbor let happen": {
-        "verdict": "FALSE",
-        "source": "Historical consensus",
-        "explanation": "No evidence FDR knew; intelligence failures documented"
-    },
-    "jfk shot multiple shooters": {
-        "verdict": "DISPUTED",
-        "source": "Warren Commission vs theories",
-        "explanation": "Official: Oswald alone; some evidence disputed"
-    },
-    "moon landings faked kubrick": {
-        "verdict": "FALSE",
-        "source": "Film analysis, Historical record",
-        "explanation": "Technology didn't exist to fake; moon rocks verified"
-    },
-    
-    # Additional COVID-19 Claims (10 more)
-    "covid vaccine sterilize": {
-        "verdict": "FALSE",
-        "source": "WHO, Medical studies",
-        "explanation": "No evidence vaccines cause sterilization"
-    },
-    "covid vaccine gene therapy": {
-        "verdict": "MISLEADING",
-        "source": "CDC, Medical definition",
-        "explanation": "mRNA vaccines are not gene therapy; don't alter DNA"
-    },
-    "covid vaccine fetus cells": {
-        "verdict": "MISLEADING",
-        "source": "Fact-checkers, Vaccine info",
-        "explanation": "Some use cell lines from 1960s-80s; no fetal tissue in final product"
-    },
-    "covid vaccine untested": {
-        "verdict": "FALSE",
-        "source": "Clinical trials, FDA",
-        "explanation": "Vaccines underwent extensive testing with tens of thousands of participants"
-    },
-    "natural immunity better vaccine": {
-        "verdict": "MISLEADING",
-        "source": "CDC, Medical studies",
-        "explanation": "Vaccination provides more consistent protection; getting COVID has risks"
-    },
-    "covid vaccine emergency only": {
-        "verdict": "OUTDATED",
-        "source": "FDA full approval",
-        "explanation": "Major vaccines received full FDA approval, not just EUA"
-    },
-    "covid vaccine tracks location": {
-        "verdict": "FALSE",
-        "source": "Technology facts",
-        "explanation": "No GPS or tracking devices in vaccines; impossible with injection"
-    },
-    "covid vaccine luciferin": {
-        "verdict": "FALSE",
-        "source": "Ingredient lists",
-        "explanation": "No such ingredient; confusion with luciferase (enzyme)"
-    },
-    "covid survival rate 99%": {
-        "verdict": "MISLEADING",
-        "source": "WHO data, Context",
-        "explanation": "Oversimplifies; millions died; long COVID and complications matter"
-    },
-    "covid no worse flu": {
-        "verdict": "FALSE",
-        "source": "Comparative mortality data",
-        "explanation": "COVID-19 killed far more than typical flu seasons"
-    },
-    
-    # More Election Claims (5 more)
-    "venezuelan machines hacked": {
-        "verdict": "FALSE",
-        "source": "Election officials, Audits",
-        "explanation": "No evidence; claims debunked by multiple audits"
-    },
-    "bamboo ballots china": {
-        "verdict": "FALSE",
-        "source": "Arizona audit findings",
-        "explanation": "Baseless claim; no bamboo fibers found"
-    },
-    "sharpie invalidate ballots": {
-        "verdict": "FALSE",
-        "source": "Election officials",
-        "explanation": "Sharpies work fine; claim used to suppress votes"
-    },
-    "midnight ballot dumps": {
-        "verdict": "MISLEADING",
-        "source": "Election procedures",
-        "explanation": "Normal counting of mail ballots; explained by process"
-    },
-    "more votes than registered": {
-        "verdict": "FALSE",
-        "source": "Official vote counts",
-        "explanation": "False claim; actual counts showed normal turnout"
-    },
-    
-    # More Health/Medical Claims (10 more)
-    "fluoride lowers iq": {
-        "verdict": "DISPUTED",
-        "source": "Studies, Context",
-        "explanation": "Some studies suggest high levels may affect IQ; optimal levels safe"
-    },
-    "chemtrails poison population": {
-        "verdict": "FALSE",
-        "source": "Atmospheric scientists",
-        "explanation": "Contrails are water vapor; no evidence of chemical spraying"
-    },
-    "microwave ovens cause cancer": {
-        "verdict": "FALSE",
-        "source": "FDA, Cancer research",
-        "explanation": "No evidence properly working microwaves cause cancer"
-    },
-    "antiperspirants cause breast cancer": {
-        "verdict": "FALSE",
-        "source": "Cancer societies, Studies",
-        "explanation": "No conclusive evidence linking antiperspirants to cancer"
-    },
-    "vitamin c cures cancer": {
-        "verdict": "FALSE",
-        "source": "Cancer research",
-        "explanation": "No evidence vitamin C alone cures cancer"
-    },
-    "sugar feeds cancer": {
-        "verdict": "MISLEADING",
-        "source": "Cancer research",
-        "explanation": "Oversimplifies; all cells use sugar; not a valid treatment strategy"
-    },
-    "alkaline water prevents disease": {
-        "verdict": "FALSE",
-        "source": "Medical consensus",
-        "explanation": "Body regulates pH; drinking alkaline water doesn't change blood pH"
-    },
-    "detox cleanses remove toxins": {
-        "verdict": "FALSE",
-        "source": "Medical experts",
-        "explanation": "Liver and kidneys naturally detox; cleanses unnecessary and potentially harmful"
-    },
-    "gmo food dangerous": {
-        "verdict": "FALSE",
-        "source": "Scientific consensus, WHO",
-        "explanation": "GMOs safe to eat; no evidence of harm"
-    },
-    "wifi causes cancer": {
-        "verdict": "FALSE",
-        "source": "Cancer research, WHO",
-        "explanation": "No evidence non-ionizing radiation from WiFi causes cancer"
-    },
-    
-    # More Climate Claims (5 more)
-    "ice age coming soon": {
-        "verdict": "FALSE",
-        "source": "Climate scientists",
-        "explanation": "Earth warming; no ice age predicted"
-    },
-    "sun causing warming": {
-        "verdict": "FALSE",
-        "source": "Solar data, Climate science",
-        "explanation": "Solar activity declining while temps rise; human activity responsible"
-    },
-    "climate scientists disagree": {
-        "verdict": "FALSE",
-        "source": "Surveys, Consensus studies",
-        "explanation": "97%+ of climate scientists agree humans cause warming"
-    },
-    "antarctica ice growing": {
-        "verdict": "MISLEADING",
-        "source": "NASA data",
-        "explanation": "Sea ice varies; land ice melting; overall net loss"
-    },
-    "climate models always wrong": {
-        "verdict": "FALSE",
-        "source": "Model validation studies",
-        "explanation": "Models accurately predicted warming; constantly improving"
-    },
+import re
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from dataset_store import DatasetSnapshot, get_dataset_store, get_datasets
+from keyword_matcher import prepare_keyword_update, register_keywords, scan_keywords
+from source_index import get_source_index
+
+# Datasets are versioned JSON files under data/ (known_false_claims.json,
+# source_credibility.json) loaded by the dataset store. These names are
+# rebound to the new snapshot whenever the files are hot-reloaded.
+_datasets = get_datasets()
+
+# Common false claims with verification sources
+KNOWN_FALSE_CLAIMS = _datasets.false_claims
+
+# Common patterns that indicate false claims
+FALSE_CLAIM_PATTERNS = _datasets.false_claim_patterns
+
+# Low credibility sources (should be scored 0-30/100)
+KNOWN_UNRELIABLE_SOURCES = _datasets.unreliable_sources
+
+# Highly credible sources (should be scored 80-100/100)
+KNOWN_CREDIBLE_SOURCES = _datasets.credible_sources
+
+# Maximum gap (in characters, same line) between consecutive terms of a
+# FALSE_CLAIM_PATTERNS entry - replaces the unbounded `.*` of the regexes
+PATTERN_TERM_WINDOW = 200
+
+
+def _split_top_level(pattern: str, separator: str) -> List[str]:
+    """Split a regex on a separator that is not inside a group or class"""
+    parts = []
+    depth = 0
+    in_class = False
+    current = ''
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            current += pattern[i:i + 2]
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != ']'
+        elif ch == '[':
+            in_class = True
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif depth == 0 and pattern.startswith(separator, i):
+            parts.append(current)
+            current = ''
+            i += len(separator)
+            continue
+        current += ch
+        i += 1
+    parts.append(current)
+    return parts
+
+
+def _literal_anchors(term: str) -> List[str]:
+    """
+    Literal strings one of which must occur wherever the term regex matches
     
-    # Technology/5G Claims (5 more)
-    "5g causes cancer": {
-        "verdict": "FALSE",
-        "source": "WHO, Medical research",
-        "explanation": "No evidence 5G radio waves cause cancer"
-    },
-    "5g depopulation plan": {
-        "verdict": "FALSE",
-        "source": "No credible evidence",
-        "explanation": "Conspiracy theory; 5G is standard telecommunications technology"
-    },
-    "phone radiation brain tumors": {
-        "verdict": "UNPROVEN",
-        "source": "Long-term studies inconclusive",
-        "explanation": "No conclusive link found in major studies"
-    },
-    "alexa always listening recording": {
-        "verdict": "PARTIALLY TRUE",
-        "source": "Company policies, Reviews",
-        "explanation": "Listens for wake word; recordings can be reviewed by humans (opt-out available)"
-    },
-    "social media listening mic": {
-        "verdict": "DISPUTED",
-        "source": "Tech analysis, Denials",
-        "explanation": "Companies deny; targeted ads use other data; no proof of mic listening"
-    },
+    Handles the forms used in FALSE_CLAIM_PATTERNS: a leading literal run
+    (`bill\\s+gates` -> 'bill', `vaccines?` -> 'vaccine') or a leading
+    group of literal alternatives (`(?:coronavirus|covid)`). Returns [] if
+    no anchor can be derived, in which case the term is always evaluated.
+    """
+    group = re.match(r'\(\?:([\w\s|]+)\)(?![?*{])', term)
+    if group:
+        return [alt.lower() for alt in group.group(1).split('|') if alt]
+    
+    literal = re.match(r'[\w\- ]+', term)
+    if not literal:
+        return []
+    anchor = literal.group(0)
+    if term[len(anchor):len(anchor) + 1] in ('?', '*', '{'):
+        anchor = anchor[:-1]  # Last character is optional
+    return [anchor.lower()] if anchor else []
+
+
+class FalseClaimIndex:
+    """
+    Indexed matcher for the false claims database
+    
+    - Claims: inverted index word -> claims. Only claims whose words all
+      appear in the text (one shared keyword automaton scan) are checked,
+      so lookup cost depends on the text, not on the database size.
+    - Patterns: each FALSE_CLAIM_PATTERNS regex is split on top-level `|`
+      into alternatives and on `.*` into ordered terms. Terms are compiled
+      once and only run when one of their literal anchors is in the keyword
+      scan; a pattern matches when its terms co-occur in order with at most
+      PATTERN_TERM_WINDOW characters (and no line break) between them.
+    """
     
-    # Food/Nutrition Myths (5 more)
-    "msg dangerous neurotoxin": {
-        "verdict": "FALSE",
-        "source": "FDA, Studies",
-        "explanation": "MSG safe for most people; 'Chinese restaurant syndrome' largely psychosomatic"
-    },
-    "eat every 3 hours metabolism": {
-        "verdict": "FALSE",
-        "source": "Nutrition research",
-        "explanation": "Meal frequency doesn't significantly affect metabolism"
-    },
-    "carbs make fat": {
-        "verdict": "MISLEADING",
-        "source": "Nutrition science",
-        "explanation": "Excess calories cause weight gain; carbs not inherently fattening"
-    },
-    "gluten bad everyone": {
-        "verdict": "FALSE",
-        "source": "Medical consensus",
-        "explanation": "Gluten problematic only for celiac disease and sensitivity; safe for most"
-    },
-    "breakfast most important meal": {
-        "verdict": "MISLEADING",
-        "source": "Nutrition research",
-        "explanation": "Marketing slogan; meal timing matters less than overall nutrition"
+    def __init__(self, claims: Dict[str, Dict], patterns: List[str],
+                 window: int = PATTERN_TERM_WINDOW):
+        self.claims = claims
+        self.window = window
+        
+        # Inverted index: word -> [(claim order, claim key)]
+        self.claim_words: Dict[str, set] = {}
+        self.word_index: Dict[str, List[Tuple[int, str]]] = {}
+        for order, claim_key in enumerate(claims):
+            words = set(claim_key.split())
+            self.claim_words[claim_key] = words
+            for word in words:
+                self.word_index.setdefault(word, []).append((order, claim_key))
+        
+        # Patterns: [(pattern, [[term ids of alternative]])]
+        self.term_regexes: List[re.Pattern] = []
+        self.term_anchors: List[List[str]] = []
+        term_ids: Dict[str, int] = {}
+        self.patterns: List[Tuple[str, List[List[int]]]] = []
+        for pattern in patterns:
+            alternatives = []
+            for alternative in _split_top_level(pattern, '|'):
+                terms = []
+                for term in _split_top_level(alternative, '.*'):
+                    if not term:
+                        continue
+                    if term not in term_ids:
+                        term_ids[term] = len(self.term_regexes)
+                        self.term_regexes.append(re.compile(term, re.IGNORECASE))
+                        self.term_anchors.append(_literal_anchors(term))
+                    terms.append(term_ids[term])
+                if terms:
+                    alternatives.append(terms)
+            self.patterns.append((pattern, alternatives))
+    
+    def match_claims(self, text: str) -> List[Tuple[str, int]]:
+        """Claims found in text as (claim key, confidence), in database order"""
+        scan = scan_keywords(text)
+        
+        # Count matched words per candidate claim
+        hits: Dict[Tuple[int, str], int] = {}
+        for word in scan.found('false_claims.words'):
+            for candidate in self.word_index.get(word, ()):
+                hits[candidate] = hits.get(candidate, 0) + 1
+        
+        matched = []
+        for order, claim_key in sorted(hits):
+            if hits[(order, claim_key)] < len(self.claim_words[claim_key]):
+                continue
+            # Whole claim as a substring, otherwise all keywords present
+            confidence = 95 if scan.contains(claim_key) else 85
+            matched.append((claim_key, confidence))
+        return matched
+    
+    def match_patterns(self, text: str) -> List[str]:
+        """FALSE_CLAIM_PATTERNS entries whose terms co-occur in text"""
+        scan = scan_keywords(text)
+        occurrences: Dict[int, Tuple[List[int], List[int]]] = {}
+        
+        def term_spans(term_id: int) -> Tuple[List[int], List[int]]:
+            if term_id not in occurrences:
+                starts, ends = [], []
+                anchors = self.term_anchors[term_id]
+                # Skip the regex entirely when none of its anchors occur
+                if not anchors or any(scan.contains(anchor) for anchor in anchors):
+                    for match in self.term_regexes[term_id].finditer(text):
+                        starts.append(match.start())
+                        ends.append(match.end())
+                occurrences[term_id] = (starts, ends)
+            return occurrences[term_id]
+        
+        matched = []
+        for pattern, alternatives in self.patterns:
+            if any(self._terms_cooccur(text, terms, term_spans) for terms in alternatives):
+                matched.append(pattern)
+        return matched
+    
+    def _terms_cooccur(self, text: str, terms: List[int], term_spans) -> bool:
+        """Whether the terms appear in order within the window of each other"""
+        first_starts, first_ends = term_spans(terms[0])
+        for position in first_ends:
+            for term_id in terms[1:]:
+                starts, ends = term_spans(term_id)
+                i = bisect_left(starts, position)
+                if (i == len(starts) or starts[i] - position > self.window or
+                        text.find('\n', position, starts[i]) != -1):
+                    break
+                position = ends[i]
+            else:
+                return True
+        return False
+
+
+def _keyword_lists(claims: Dict[str, Dict], patterns: List[str]) -> Dict[str, set]:
+    """Claim keys, their individual words and pattern anchors for the keyword automaton"""
+    return {
+        'false_claims.keys': set(claims),
+        'false_claims.words': {word for claim_key in claims for word in claim_key.split()},
+        'false_claims.pattern_anchors': {
+            anchor
+            for pattern in patterns
+            for alternative in _split_top_level(pattern, '|')
+            for term in _split_top_level(alternative, '.*')
+            for anchor in _literal_anchors(term)
+        }
     }
-}
 
-# Common patterns that indicate false claims (EXPANDED)
-FALSE_CLAIM_PATTERNS = [
-    # COVID-19
-    r"bill\s+gates.*microchip",
-    r"vaccines?.*autism",
-    r"5g.*(?:coronavirus|covid)",
-    r"covid.*vaccine.*dna",
-    r"bleach.*cure",
-    r"ivermectin.*cure.*covid",
-    r"masks?.*hypoxia|oxygen",
-    r"covid.*created.*lab",
-    r"vaccine.*magnet",
-    r"vaccine.*infertil",
-    r"hydroxychloroquine.*cure",
-    r"vaccinated.*shed",
-    r"plandemic",
-    r"graphene.*oxide.*vaccine",
-    
-    # Elections
-    r"election.*stolen|fraud",
-    r"dominion.*rigg",
-    r"dead\s+people.*vot",
-    r"mail.*ballot.*fraud",
-    
-    # Climate
-    r"climate.*hoax",
-    r"global\s+cooling.*1970",
-    
-    # Space/Science
-    r"earth.*flat",
-    r"moon.*landing.*fake|hoax",
-    r"chemtrails",
-    
-    # Conspiracy
-    r"pizzagate",
-    r"qanon",
-    r"deep\s+state",
-    r"new\s+world\s+order",
-    r"illuminati.*control",
-    
-    # Health
-    r"fluoride.*mind\s+control",
-    r"big\s+pharma.*hiding.*cure"
-]
 
-# Low credibility sources (should be scored 0-30/100) - EXPANDED
-KNOWN_UNRELIABLE_SOURCES = {
-    # Conspiracy/Fake News
-    "infowars.com": 0,
-    "naturalnews.com": 5,
-    "beforeitsnews.com": 10,
-    "yournewswire.com": 0,
-    "neonnettle.com": 5,
-    "worldnewsdailyreport.com": 0,
-    "realfarmacy.com": 10,
-    "wakingtimes.com": 15,
-    "collective-evolution.com": 20,
-    "activistpost.com": 20,
-    "zerohedge.com": 25,
-    "veteranstoday.com": 15,
-    "thedailysheeple.com": 10,
-    "intellihub.com": 15,
-    
-    # Satire (often mistaken as real)
-    "theonion.com": 0,
-    "clickhole.com": 0,
-    "beaverton.com": 0,
-    "babylonbee.com": 0,
-    
-    # Highly Partisan/Unreliable
-    "breitbart.com": 30,
-    "newsmax.com": 35,
-    "oann.com": 30,
-    "gateway pundit": 20,
-    "dailywire.com": 35,
-    "truthsocial.com": 25,
-    "gettr.com": 25,
-    
-    # State-Controlled Media
-    "rt.com": 25,
-    "sputniknews.com": 20,
-    "presstv.com": 25,
-    "cgtn.com": 30,
-    "xinhuanet.com": 30,
-    
-    # Clickbait/Low Quality
-    "buzzfeed.com": 40,
-    "dailymail.co.uk": 45,
-    "nypost.com": 50,
-    "thesun.co.uk": 40,
-    "mirror.co.uk": 40,
-    
-    # Health Misinformation
-    "mercola.com": 20,
-    "greenmedinfo.com": 20,
-    "articles.mercola.com": 20,
-    
-    # Additional Low-Quality
-    "epoch times": 35,
-    "newsbusters.org": 35,
-    "project veritas": 25,
-    "westernjournal.com": 30,
-    "conservativetribune.com": 25,
-    "100percentfedup.com": 15,
-    "palmerreport.com": 30
-}
+# Register with the shared keyword automaton
+for _tag, _keywords in _keyword_lists(KNOWN_FALSE_CLAIMS, FALSE_CLAIM_PATTERNS).items():
+    register_keywords(_tag, _keywords)
 
-# Highly credible sources (should be scored 80-100/100) - EXPANDED
-KNOWN_CREDIBLE_SOURCES = {
-    # Wire Services
-    "reuters.com": 95,
-    "apnews.com": 95,
-    "afp.com": 90,
-    "upi.com": 85,
-    
-    # Traditional Media - High Quality
-    "bbc.com": 90,
-    "bbc.co.uk": 90,
-    "npr.org": 90,
-    "pbs.org": 90,
-    "nytimes.com": 85,
-    "washingtonpost.com": 85,
-    "theguardian.com": 85,
-    "wsj.com": 85,
-    "ft.com": 90,
-    "economist.com": 90,
-    "theatlantic.com": 85,
-    "newyorker.com": 85,
-    "propublica.org": 95,
-    
-    # Traditional Media - Good Quality
-    "cnn.com": 75,
-    "msnbc.com": 70,
-    "nbcnews.com": 80,
-    "abcnews.go.com": 80,
-    "cbsnews.com": 80,
-    "usatoday.com": 75,
-    "latimes.com": 80,
-    "chicagotribune.com": 80,
-    
-    # Fact-Checking
-    "factcheck.org": 100,
-    "snopes.com": 100,
-    "politifact.com": 100,
-    "fullfact.org": 100,
-    "factcheckni.org": 95,
-    "checkyourfact.com": 90,
-    "truthorfiction.com": 90,
-    
-    # Government/Official
-    "who.int": 95,
-    "cdc.gov": 95,
-    "nih.gov": 95,
-    "fda.gov": 95,
-    "nasa.gov": 95,
-    "noaa.gov": 95,
-    "usgs.gov": 95,
-    "epa.gov": 90,
-    "gov.uk": 90,
-    
-    # Academic/Scientific
-    "nature.com": 95,
-    "science.org": 95,
-    "sciencemag.org": 95,
-    "thelancet.com": 95,
-    "nejm.org": 95,
-    "cell.com": 95,
-    "pnas.org": 95,
-    "bmj.com": 95,
-    "jamanetwork.com": 95,
-    "plos.org": 90,
-    "sciencedirect.com": 90,
-    "scholar.google.com": 90,
-    
-    # Technology News
-    "arstechnica.com": 85,
-    "wired.com": 85,
-    "techcrunch.com": 80,
-    "theverge.com": 80,
-    
-    # International Quality News
-    "aljazeera.com": 80,
-    "dw.com": 85,
-    "france24.com": 85,
-    "thelocal.com": 75,
-    "swissinfo.ch": 85
-}
+# Singleton instance
+_false_claim_index = None
+
+def get_false_claim_index() -> FalseClaimIndex:
+    """Get or create the false claims index singleton"""
+    global _false_claim_index
+    if _false_claim_index is None:
+        _false_claim_index = FalseClaimIndex(KNOWN_FALSE_CLAIMS, FALSE_CLAIM_PATTERNS)
+    return _false_claim_index
+
+def _on_datasets_reloaded(snapshot: DatasetSnapshot):
+    """Build the index and keyword automaton for a new dataset snapshot; returns the swap"""
+    index = FalseClaimIndex(snapshot.false_claims, snapshot.false_claim_patterns)
+    commit_keywords = prepare_keyword_update(_keyword_lists(snapshot.false_claims, snapshot.false_claim_patterns))
+    
+    def commit():
+        global _false_claim_index, KNOWN_FALSE_CLAIMS, FALSE_CLAIM_PATTERNS
+        global KNOWN_UNRELIABLE_SOURCES, KNOWN_CREDIBLE_SOURCES
+        commit_keywords()
+        _false_claim_index = index
+        KNOWN_FALSE_CLAIMS = snapshot.false_claims
+        FALSE_CLAIM_PATTERNS = snapshot.false_claim_patterns
+        KNOWN_UNRELIABLE_SOURCES = snapshot.unreliable_sources
+        KNOWN_CREDIBLE_SOURCES = snapshot.credible_sources
+    
+    return commit
+
+get_dataset_store().add_listener(_on_datasets_reloaded)
 
 def check_known_false_claim(text: str) -> dict:
     """
@@ -711,46 +250,30 @@ def check_known_false_claim(text: str) -> dict:
     Returns:
         dict with verdict, matched_claims, confidence
     """
-    import re
-    
-    text_lower = text.lower()
+    index = get_false_claim_index()
     matched_claims = []
     
-    # Check against known false claims database (flexible keyword matching)
-    for claim_key, claim_info in KNOWN_FALSE_CLAIMS.items():
-        # Simple substring match first
-        if claim_key in text_lower:
-            matched_claims.append({
-                'claim': claim_key,
-                'verdict': claim_info['verdict'],
-                'source': claim_info['source'],
-                'explanation': claim_info['explanation'],
-                'confidence': 95
-            })
-            continue
-        
-        # Keyword-based matching (all keywords must appear)
-        keywords = claim_key.split()
-        if all(kw in text_lower for kw in keywords):
-            matched_claims.append({
-                'claim': claim_key,
-                'verdict': claim_info['verdict'],
-                'source': claim_info['source'],
-                'explanation': claim_info['explanation'],
-                'confidence': 85  # Slightly lower for keyword match
-            })
-    
-    # Check against patterns
-    for pattern in FALSE_CLAIM_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            pattern_readable = pattern.replace(r'\s+', ' ').replace('.*', ' ')
-            matched_claims.append({
-                'claim': f"Pattern match: {pattern_readable}",
-                'verdict': 'LIKELY_FALSE',
-                'source': 'Pattern matching',
-                'explanation': 'Matches known misinformation pattern',
-                'confidence': 70
-            })
+    # Check against known false claims database (inverted keyword index)
+    for claim_key, confidence in index.match_claims(text):
+        claim_info = index.claims[claim_key]
+        matched_claims.append({
+            'claim': claim_key,
+            'verdict': claim_info['verdict'],
+            'source': claim_info['source'],
+            'explanation': claim_info['explanation'],
+            'confidence': confidence  # 95 substring match, 85 keyword match
+        })
+    
+    # Check against patterns (bounded-window term co-occurrence)
+    for pattern in index.match_patterns(text):
+        pattern_readable = pattern.replace(r'\s+', ' ').replace('.*', ' ')
+        matched_claims.append({
+            'claim': f"Pattern match: {pattern_readable}",
+            'verdict': 'LIKELY_FALSE',
+            'source': 'Pattern matching',
+            'explanation': 'Matches known misinformation pattern',
+            'confidence': 70
+        })
     
     # Deduplicate
     seen = set()
@@ -772,20 +295,15 @@ def get_source_credibility_override(domain: str) -> int:
     """
     Get credibility score override for known sources
     
+    Matches the domain or any parent domain (shared source domain index),
+    unreliable sources taking precedence over credible ones.
+    
     Returns:
         Credibility score (0-100) or 0 if unknown
     """
-    domain_lower = domain.lower()
-    
-    # Check unreliable sources
-    for source, score in KNOWN_UNRELIABLE_SOURCES.items():
-        if source in domain_lower:
-            return score
-    
-    # Check credible sources
-    for source, score in KNOWN_CREDIBLE_SOURCES.items():
-        if source in domain_lower:
-            return score
+    _, _, record = get_source_index().lookup(domain)
+    if record is not None:
+        return record.override
     
     return 0  # Return 0 for unknown sources instead of None
 
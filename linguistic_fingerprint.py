@@ -16,6 +16,11 @@ import re
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from keyword_matcher import register_keywords, scan_keywords
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class FingerprintResult:
@@ -63,7 +68,7 @@ class LinguisticFingerprint:
         'without a doubt', 'no question', 'obviously', 'clearly'
     ]
     
-    # Pattern 3: Source Evasion
+    # Pattern 3: Source Evasion (plain phrases, matched by the shared automaton)
     SOURCE_EVASION_PATTERNS = [
         r'studies show',
         r'research shows',
@@ -107,7 +112,7 @@ class LinguisticFingerprint:
     
     def __init__(self):
         """Initialize the fingerprint analyzer"""
-        print("🔍 [FINGERPRINT] Linguistic Pattern Analyzer initialized")
+        logger.info("🔍 [FINGERPRINT] Linguistic Pattern Analyzer initialized")
     
     def analyze(self, text: str) -> FingerprintResult:
         """
@@ -146,7 +151,7 @@ class LinguisticFingerprint:
         else:
             verdict = "NORMAL"
         
-        print(f"🔍 [FINGERPRINT] Score: {fingerprint_score:.1f} ({verdict})")
+        logger.debug("🔍 [FINGERPRINT] Score: %.1f (%s)", fingerprint_score, verdict)
         
         return FingerprintResult(
             fingerprint_score=round(fingerprint_score, 2),
@@ -184,9 +189,10 @@ class LinguisticFingerprint:
             examples.extend([f"ALL CAPS: {w}" for w in caps_words[:3]])
         
         # Check for emotional keywords
-        text_lower = text.lower()
+        scan = scan_keywords(text)
         for category, keywords in self.EMOTIONAL_KEYWORDS.items():
-            found = [kw for kw in keywords if kw.lower() in text_lower]
+            present = scan.found(f'linguistic.emotional.{category}')
+            found = [kw for kw in keywords if kw.lower() in present]
             if found:
                 score += min(20, len(found) * 4)
                 examples.extend([f"{category}: {kw}" for kw in found[:2]])
@@ -198,17 +204,18 @@ class LinguisticFingerprint:
         examples = []
         score = 0
         
-        text_lower = text.lower()
+        scan = scan_keywords(text)
         
         for marker in self.CERTAINTY_MARKERS:
-            if marker.lower() in text_lower:
+            occurrences = scan.occurrences(marker)
+            if occurrences:
                 score += 8
                 # Find the sentence containing this marker
-                sentences = text.split('.')
-                for sent in sentences:
-                    if marker.lower() in sent.lower():
-                        examples.append(f"Certainty marker: '{marker}' in '{sent.strip()[:100]}...'")
-                        break
+                first = occurrences[0]
+                sent_start = text.rfind('.', 0, first.start) + 1
+                sent_end = text.find('.', first.end)
+                sent = text[sent_start:sent_end if sent_end != -1 else len(text)]
+                examples.append(f"Certainty marker: '{marker}' in '{sent.strip()[:100]}...'")
         
         return min(100, score), examples
     
@@ -217,15 +224,14 @@ class LinguisticFingerprint:
         examples = []
         score = 0
         
-        text_lower = text.lower()
+        scan = scan_keywords(text)
         
         for pattern in self.SOURCE_EVASION_PATTERNS:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
+            for match in scan.occurrences(pattern):
                 score += 15
                 # Get context around the match
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
+                start = max(0, match.start - 50)
+                end = min(len(text), match.end + 50)
                 context = text[start:end].strip()
                 examples.append(f"Vague source: '{context}'")
         
@@ -236,10 +242,10 @@ class LinguisticFingerprint:
         examples = []
         score = 0
         
-        text_lower = text.lower()
+        present = scan_keywords(text).found('linguistic.conspiracy')
         
         for phrase in self.CONSPIRACY_PHRASES:
-            if phrase.lower() in text_lower:
+            if phrase.lower() in present:
                 score += 20
                 examples.append(f"Conspiracy phrase: '{phrase}'")
         
@@ -293,6 +299,14 @@ class LinguisticFingerprint:
         )
 
 
+# Register keyword lists with the shared automaton
+for _category, _keywords in LinguisticFingerprint.EMOTIONAL_KEYWORDS.items():
+    register_keywords(f'linguistic.emotional.{_category}', _keywords)
+register_keywords('linguistic.certainty', LinguisticFingerprint.CERTAINTY_MARKERS)
+register_keywords('linguistic.source_evasion', LinguisticFingerprint.SOURCE_EVASION_PATTERNS)
+register_keywords('linguistic.conspiracy', LinguisticFingerprint.CONSPIRACY_PHRASES)
+
+
 # Singleton instance
 _fingerprint_analyzer = None
 
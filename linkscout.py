@@ -0,0 +1,328 @@
+"""
+🧰 LINKSCOUT COMMAND LINE
+Offline bulk analysis without the HTTP server
+
+    python linkscout.py batch articles.jsonl -o results.jsonl --workers 2
+
+Articles are read as a stream from JSON lines, CSV or Parquet files and
+run through the same pipeline as /api/v1/analyze-chunks, in a pool of
+worker processes:
+
+- Each worker imports the server module once, so models load once per
+  worker, not once per article
+- Articles go to workers in chunks; the paragraphs of a whole chunk are
+  scored by the ensemble models in padded batches before the chunk's
+  articles are analyzed
+- Results are appended to the output as JSON lines as they finish; a
+  restarted run skips articles already analyzed in the output and tries
+  the failed ones again (the last line for an id is the current one)
+
+Input records use the analyze-chunks fields: 'paragraphs' (list of
+strings or {'text': ...}) or 'content'/'text' (split on blank lines),
+plus optional 'id', 'title', 'url' and 'html'. Records without 'id' are
+identified by a hash of url, title and text.
+
+Author: AI Misinformation Detector
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set
+
+BATCH_CHUNK_SIZE = 8  # Articles per worker task
+BATCH_DEADLINE = 120.0  # Seconds per article
+MODEL_BATCH_SIZE = 16  # Paragraphs per forward pass
+
+
+# ========================================
+# INPUT
+# ========================================
+
+def _detect_format(path: str) -> str:
+    name = path.lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    for extension, kind in (('.jsonl', 'jsonl'), ('.ndjson', 'jsonl'), ('.json', 'jsonl'),
+                            ('.csv', 'csv'), ('.parquet', 'parquet')):
+        if name.endswith(extension):
+            return kind
+    raise ValueError(f"{path}: unknown input format (use .jsonl, .csv or .parquet, or --format)")
+
+
+def _open_text(path: str):
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8', newline='')
+
+
+def read_records(path: str, kind: str = 'auto') -> Iterator[Dict]:
+    """Stream article records from a JSON lines, CSV or Parquet file"""
+    kind = _detect_format(path) if kind == 'auto' else kind
+
+    if kind == 'jsonl':
+        with _open_text(path) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"⚠️ [BATCH] {path}:{line_number}: invalid JSON ({e})", file=sys.stderr)
+
+    elif kind == 'csv':
+        csv.field_size_limit(sys.maxsize if sys.maxsize < 2 ** 31 else 2 ** 31 - 1)
+        with _open_text(path) as f:
+            yield from csv.DictReader(f)
+
+    elif kind == 'parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Reading Parquet needs pyarrow (pip install pyarrow)")
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=256):
+            yield from batch.to_pylist()
+
+    else:
+        raise ValueError(f"Unknown input format: {kind}")
+
+
+def record_id(record: Dict) -> str:
+    """Stable id of an input record (its 'id' field, else a content hash)"""
+    if record.get('id') not in (None, ''):
+        return str(record['id'])
+    digest = hashlib.sha1()
+    for key in ('url', 'title', 'content', 'text'):
+        digest.update(str(record.get(key) or '').encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(json.dumps(record.get('paragraphs') or [], sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def to_payload(record: Dict) -> Dict:
+    """analyze-chunks request body for an input record"""
+    paragraphs = record.get('paragraphs')
+    if isinstance(paragraphs, str):
+        try:
+            paragraphs = json.loads(paragraphs)  # CSV/Parquet columns holding a JSON list
+        except json.JSONDecodeError:
+            paragraphs = None
+    if not paragraphs:
+        text = str(record.get('content') or record.get('text') or '')
+        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+
+    payload = {
+        'paragraphs': paragraphs,
+        'title': str(record.get('title') or ''),
+        'url': str(record.get('url') or '')
+    }
+    if record.get('html'):
+        payload['html'] = record['html']
+    return payload
+
+
+def _paragraph_texts(payload: Dict) -> List[str]:
+    return [p.get('text', str(p)) if isinstance(p, dict) else str(p) for p in payload['paragraphs'] if p]
+
+
+# ========================================
+# OUTPUT / RESUME
+# ========================================
+
+def completed_ids(output_path: str) -> Set[str]:
+    """
+    Ids already analyzed successfully in an output file
+
+    Error records (deadline hit, model or HTTP failure) do not count, so a
+    resumed run tries those articles again. A partial last line (from an
+    interrupted run) is cut off so new results start on a clean line.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, 'rb+') as f:
+        data = f.read()
+        if data and not data.endswith(b'\n'):
+            f.truncate(data.rfind(b'\n') + 1)
+            data = data[:data.rfind(b'\n') + 1]
+
+    for line in data.splitlines():
+        try:
+            record = json.loads(line)
+            if 'result' in record:
+                done.add(record['id'])
+        except (ValueError, KeyError, TypeError):
+            continue
+    return done
+
+
+# ========================================
+# WORKERS
+# ========================================
+
+_worker_server = None
+_worker_options: Dict = {}
+
+
+def _init_worker(options: Dict):
+    """Process pool initializer: load the pipeline (and its models) once"""
+    global _worker_server, _worker_options
+    _worker_options = options
+    if not options.get('verbose'):
+        # The pipeline logs every step; workers only show warnings and errors
+        from logging_setup import configure_logging
+        configure_logging()
+        logging.getLogger().setLevel(logging.WARNING)
+    import combined_server
+    _worker_server = combined_server
+
+
+def _analyze_chunk(items: List[Dict]) -> List[Dict]:
+    """Analyze a chunk of (id, payload) items in a worker process"""
+    from request_context import RequestContext, activate, deactivate
+
+    server = _worker_server
+    deadline = _worker_options.get('deadline', BATCH_DEADLINE)
+
+    # Score the paragraphs of all articles in the chunk together
+    texts = []
+    for item in items:
+        texts.extend(_paragraph_texts(item['payload']))
+        texts.append('\n\n'.join(_paragraph_texts(item['payload'])))
+    try:
+        server.predict_misinformation_batch(texts, batch_size=_worker_options.get('model_batch_size', MODEL_BATCH_SIZE))
+    except Exception as e:
+        print(f"⚠️ [BATCH] Batched scoring failed, scoring per paragraph: {e}", file=sys.stderr)
+
+    results = []
+    for item in items:
+        started = time.time()
+        context = RequestContext(deadline)
+        token = activate(context)
+        try:
+            analysis = server.analyze(item['payload'], ctx=context)
+            results.append({'id': item['id'], 'url': item['payload']['url'], 'title': item['payload']['title'],
+                            'elapsed': round(time.time() - started, 2), 'result': analysis})
+        except Exception as e:
+            results.append({'id': item['id'], 'url': item['payload']['url'], 'title': item['payload']['title'],
+                            'elapsed': round(time.time() - started, 2), 'error': f"{type(e).__name__}: {e}"})
+        finally:
+            deactivate(token)
+            context.finish()
+    return results
+
+
+def _chunks(records: Iterator[Dict], skip: Set[str], size: int, stats: Dict) -> Iterator[List[Dict]]:
+    chunk = []
+    for record in records:
+        item_id = record_id(record)
+        if item_id in skip:
+            stats['skipped'] += 1
+            continue
+        skip.add(item_id)  # Duplicates within the input run once
+        payload = to_payload(record)
+        if not payload['paragraphs']:
+            stats['empty'] += 1
+            continue
+        chunk.append({'id': item_id, 'payload': payload})
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(inputs: List[str], output_path: str, workers: int = 2, chunk_size: int = BATCH_CHUNK_SIZE,
+              input_format: str = 'auto', deadline: float = BATCH_DEADLINE,
+              model_batch_size: int = MODEL_BATCH_SIZE, verbose: bool = False) -> Dict:
+    """
+    Analyze every input article, appending results to output_path
+
+    Returns:
+        Run statistics
+    """
+    done = completed_ids(output_path)
+    stats = {'analyzed': 0, 'errors': 0, 'skipped': 0, 'empty': 0}
+    if done:
+        print(f"♻️ [BATCH] Resuming: {len(done)} articles already analyzed in {output_path}")
+
+    records = (record for path in inputs for record in read_records(path, input_format))
+    chunks = _chunks(records, done, chunk_size, stats)
+
+    options = {'deadline': deadline, 'model_batch_size': model_batch_size, 'verbose': verbose}
+    started = time.time()
+    # 'spawn': workers must not inherit CUDA or thread state from the parent
+    context = multiprocessing.get_context('spawn')
+
+    with open(output_path, 'a', encoding='utf-8') as output, \
+            ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                initializer=_init_worker, initargs=(options,)) as executor:
+        pending = set()
+        exhausted = False
+        while True:
+            # Keep a bounded number of chunks in flight (input is streamed)
+            while not exhausted and len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(_analyze_chunk, chunk))
+            if not pending:
+                break
+
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                for result in future.result():
+                    output.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+                    stats['errors' if 'error' in result else 'analyzed'] += 1
+                output.flush()
+
+            total = stats['analyzed'] + stats['errors']
+            rate = total / max(time.time() - started, 1e-9)
+            print(f"📊 [BATCH] {total} articles ({stats['errors']} errors), {rate:.2f}/s")
+
+    stats['seconds'] = round(time.time() - started, 1)
+    return stats
+
+
+# ========================================
+# COMMAND LINE
+# ========================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='linkscout', description='LinkScout command line tools')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser('batch', help='Analyze a corpus of articles offline')
+    batch.add_argument('inputs', nargs='+', help='Input files (.jsonl, .csv, .parquet; .gz allowed for text formats)')
+    batch.add_argument('-o', '--output', required=True, help='Output JSON lines file (appended, resumable)')
+    batch.add_argument('--format', default='auto', choices=['auto', 'jsonl', 'csv', 'parquet'], help='Input format')
+    batch.add_argument('--workers', type=int, default=2, help='Worker processes (each loads the models)')
+    batch.add_argument('--chunk-size', type=int, default=BATCH_CHUNK_SIZE, help='Articles per worker task')
+    batch.add_argument('--model-batch-size', type=int, default=MODEL_BATCH_SIZE, help='Paragraphs per model forward pass')
+    batch.add_argument('--deadline', type=float, default=BATCH_DEADLINE, help='Time budget per article (seconds)')
+    batch.add_argument('--verbose', action='store_true', help='Show the pipeline log of the workers')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'batch':
+        stats = run_batch(args.inputs, args.output, workers=max(1, args.workers),
+                          chunk_size=max(1, args.chunk_size), input_format=args.format,
+                          deadline=args.deadline, model_batch_size=max(1, args.model_batch_size),
+                          verbose=args.verbose)
+        print(f"✅ [BATCH] Done: {json.dumps(stats)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
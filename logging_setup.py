@@ -0,0 +1,254 @@
+"""
+📝 LOGGING MODULE
+Leveled, asynchronous, structured logging for the server and phase modules
+
+Every module gets its own logger (get_logger(__name__)); records go through
+a bounded in-memory queue to one background thread that writes them, so a
+request thread never blocks on the stdout lock and debug lines cost only a
+level check when disabled.
+
+- LOG_LEVEL sets the level (DEBUG, INFO, WARNING, ...); LOG_LEVELS
+  overrides it per module ("claim_verifier=DEBUG,verification_network=WARNING")
+- LOG_FORMAT=json writes one JSON object per line (ts, level, logger, msg,
+  trace_id, exc, extra fields); text keeps the readable console format
+- Per-paragraph lines are logged with extra=SAMPLED and only a
+  LOG_SAMPLE_RATE fraction of them is kept
+- If the queue is full, records are dropped and counted instead of
+  stalling the request
+
+Author: AI Misinformation Detector
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+# Configuration
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')  # Per-module overrides: "name=LEVEL,name=LEVEL"
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()  # 'text' or 'json'
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', '0.1'))  # Fraction of sampled (per-paragraph) records kept
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+# Pass as extra= on high-volume lines (per paragraph, per claim, ...)
+SAMPLED = {'sampled': True}
+
+# LogRecord attributes that are not user-supplied extra fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'sampled', 'trace_id', 'taskName'}
+
+
+# ========================================
+# FILTERS & FORMATTERS
+# ========================================
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a fraction of the records marked with extra=SAMPLED"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, 'sampled', False) and self.rate < 1.0:
+            return random.random() < self.rate
+        return True
+
+
+class ContextFilter(logging.Filter):
+    """Stamps the active trace id on the record (runs in the calling thread)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'trace_id'):
+            record.trace_id = None
+            try:
+                from tracing import current_trace
+                trace = current_trace()
+                if trace is not None:
+                    record.trace_id = trace.trace_id
+            except ImportError:
+                pass
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        if getattr(record, 'trace_id', None):
+            entry['trace_id'] = record.trace_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Interpolate in the caller (args may not be thread-safe) but keep the
+        # traceback apart from the message so JSON output has an 'exc' field
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# ========================================
+# SETUP
+# ========================================
+
+_configured = False
+_configure_lock = threading.Lock()
+_queue_handler: Optional[_BoundedQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _parse_level(value: str, default: int = logging.INFO) -> int:
+    level = logging.getLevelName(value.strip().upper())
+    return level if isinstance(level, int) else default
+
+
+def _installed_queue_handler() -> Optional[_BoundedQueueHandler]:
+    """
+    Queue handler already on the root logger, if any
+
+    Matched by attribute rather than class: when this file runs as a script,
+    the ContextFilter import of tracing loads a second copy of the module
+    whose classes differ from __main__'s.
+    """
+    for handler in logging.getLogger().handlers:
+        if getattr(handler, 'log_listener', None) is not None:
+            return handler
+    return None
+
+
+def configure_logging():
+    """Install the queue handler on the root logger (once per process)"""
+    global _configured, _queue_handler, _listener
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+
+        installed = _installed_queue_handler()
+        if installed is not None:
+            # Another copy of this module already set up the root logger
+            _queue_handler = installed
+            _listener = installed.log_listener
+            _configured = True
+            return
+
+        if LOG_FORMAT == 'json':
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s %(levelname)-7s [%(name)s] %(message)s', '%H:%M:%S')
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        log_queue: queue.Queue = queue.Queue(maxsize=max(1, LOG_QUEUE_SIZE))
+        _queue_handler = _BoundedQueueHandler(log_queue)
+        _queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+        _queue_handler.addFilter(ContextFilter())
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        _queue_handler.log_listener = _listener
+
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(_parse_level(LOG_LEVEL))
+        for override in LOG_LEVELS.split(','):
+            if '=' in override:
+                name, level = override.split('=', 1)
+                logging.getLogger(name.strip()).setLevel(_parse_level(level))
+
+        # Chatty third-party loggers stay at WARNING unless asked for explicitly
+        for name in ('urllib3', 'werkzeug', 'transformers', 'filelock'):
+            if name not in LOG_LEVELS:
+                logging.getLogger(name).setLevel(max(logging.WARNING, root.level))
+
+        _configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module, configuring logging on first use"""
+    configure_logging()
+    if name == '__main__':
+        # Same logger name whether a module is imported or run as a script
+        name = os.path.splitext(os.path.basename(sys.argv[0] or 'main'))[0]
+    return logging.getLogger(name)
+
+
+def get_logging_stats() -> Dict:
+    """Queue depth and dropped records of the async handler"""
+    if _queue_handler is None:
+        return {'level': LOG_LEVEL, 'format': LOG_FORMAT, 'queued': 0, 'dropped': 0}
+    return {
+        'level': LOG_LEVEL,
+        'format': LOG_FORMAT,
+        'queued': _queue_handler.queue.qsize(),
+        'dropped': _queue_handler.dropped,
+    }
+
+
+def flush_logs():
+    """Write out everything queued so far (stops and restarts the listener)"""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+        _listener.start()
+
+
+# Test function
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("LOGGING TEST")
+    print("=" * 60)
+
+    log = get_logger('logging_setup')
+    log.info("✅ Info line")
+    log.debug("🔍 Debug line (hidden at INFO)")
+    for i in range(50):
+        log.info("📄 Paragraph %d", i, extra=SAMPLED)
+    log.warning("⚠️ Warning with fields", extra={'claim_count': 3})
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        log.error("❌ Failed", exc_info=True)
+    flush_logs()
+    print(get_logging_stats())
+    print("=" * 60)
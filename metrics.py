@@ -0,0 +1,353 @@
+"""
+📈 METRICS MODULE
+Prometheus metrics for load, latency and bottlenecks
+
+GET /metrics serves the Prometheus text format (version 0.0.4):
+
+- Requests per route, method and status; latency histograms per route;
+  requests in flight
+- Model inference time and batch size per model
+- Outbound call latency per service (groq, google, duckduckgo, ...) and
+  responses per status, so 429s and errors can be alerted on
+- Cache lookups by result (hit ratios), job queue depth, process memory
+
+Request, model and outbound metrics are recorded as they happen. Cache,
+queue and process figures are read from the components' existing stats
+when /metrics is scraped (collectors).
+
+Author: AI Misinformation Detector
+"""
+
+import functools
+import hmac
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')  # If set, scrapes must send 'Authorization: Bearer <token>'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# (labels, value) pairs of one metric family
+Samples = List[Tuple[Dict[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base for labelled metrics (values keyed by label tuple)"""
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(self._labels(key), value))
+        return lines
+
+    def _render_sample(self, labels: Dict[str, str], value) -> List[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['buckets'][i] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def time(self, **labels):
+        """Context manager observing the duration of a block (seconds)"""
+        return _Timer(self, labels)
+
+    def _render_sample(self, labels: Dict[str, str], state) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state['buckets']):
+            cumulative += count
+            lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {cumulative}")
+        lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {state['count']}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {state['count']}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'started')
+
+    def __init__(self, histogram: Histogram, labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Recorded metrics plus collectors evaluated at scrape time
+
+    A collector returns [(name, type, help, samples)] for figures kept
+    elsewhere (cache stats, queue depth, ...).
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, Samples]]]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, Samples]]]):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Exposition text of all metrics"""
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.warning("⚠️ [METRICS] Collector failed: %s", e)
+                continue
+            for name, kind, documentation, samples in families:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+# ========================================
+# METRICS
+# ========================================
+
+HTTP_REQUESTS = registry.register(Counter(
+    'linkscout_http_requests_total', 'HTTP requests handled', ['route', 'method', 'status']))
+HTTP_REQUEST_SECONDS = registry.register(Histogram(
+    'linkscout_http_request_duration_seconds', 'HTTP request latency', ['route', 'method']))
+HTTP_IN_FLIGHT = registry.register(Gauge(
+    'linkscout_http_requests_in_flight', 'HTTP requests being handled', ['route']))
+
+ANALYSIS_SECONDS = registry.register(Histogram(
+    'linkscout_analysis_duration_seconds', 'Time of completed analyses by mode (admission wait included)', ['mode']))
+
+MODEL_SECONDS = registry.register(Histogram(
+    'linkscout_model_inference_seconds', 'Model inference time (cache misses only)', ['model']))
+MODEL_BATCH_SIZE = registry.register(Histogram(
+    'linkscout_model_batch_size', 'Texts per model forward pass', ['model'], buckets=BATCH_BUCKETS))
+
+OUTBOUND_SECONDS = registry.register(Histogram(
+    'linkscout_outbound_request_duration_seconds', 'Outbound HTTP call latency (retries included)', ['service']))
+OUTBOUND_REQUESTS = registry.register(Counter(
+    'linkscout_outbound_requests_total', 'Outbound HTTP calls by final status (code, timeout or error)',
+    ['service', 'status']))
+
+
+def timed_model(model: str):
+    """Decorator recording a single-text model call (batch size 1)"""
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                MODEL_SECONDS.observe(time.perf_counter() - started, model=model)
+                MODEL_BATCH_SIZE.observe(1, model=model)
+        return wrapper
+    return decorate
+
+
+# ========================================
+# PROCESS
+# ========================================
+
+def process_rss_bytes() -> Optional[int]:
+    """Current resident set size (None if it cannot be read)"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def _collect_process():
+    rss = process_rss_bytes()
+    if rss is not None:
+        yield 'process_resident_memory_bytes', 'gauge', 'Resident memory size in bytes', [({}, rss)]
+    yield 'process_cpu_seconds_total', 'counter', 'User and system CPU time in seconds', [({}, time.process_time())]
+    yield 'process_threads', 'gauge', 'Live Python threads', [({}, threading.active_count())]
+
+
+registry.add_collector(_collect_process)
+
+
+# ========================================
+# FLASK
+# ========================================
+
+def install_flask_metrics(app):
+    """Count requests, latency and in-flight requests per route of a Flask app"""
+    from flask import g, request
+
+    def route() -> str:
+        return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+    @app.before_request
+    def _metrics_start():
+        g.metrics_started = time.perf_counter()
+        g.metrics_route = route()
+        HTTP_IN_FLIGHT.inc(route=g.metrics_route)
+
+    @app.after_request
+    def _metrics_response(response):
+        _record(response.status_code)
+        return response
+
+    @app.teardown_request
+    def _metrics_teardown(error=None):
+        _record(500)  # Only counts if after_request did not run (unhandled error)
+
+    def _record(status: int):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return
+        labels = {'route': g.metrics_route, 'method': request.method}
+        HTTP_IN_FLIGHT.dec(route=g.metrics_route)
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, **labels)
+        HTTP_REQUESTS.inc(status=str(status), **labels)
+
+
+def metrics_authorized(headers) -> bool:
+    """True if no METRICS_TOKEN is configured or the request carries it (constant-time compare)"""
+    if not METRICS_TOKEN:
+        return True
+    supplied = headers.get('Authorization', '') or ''
+    return hmac.compare_digest(supplied.encode('utf-8'), f"Bearer {METRICS_TOKEN}".encode('utf-8'))
+
+
+# Test function
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("METRICS TEST")
+    print("=" * 60)
+
+    @timed_model('emotion')
+    def classify(text):
+        time.sleep(0.02)
+
+    classify('some text')
+    with OUTBOUND_SECONDS.time(service='groq'):
+        time.sleep(0.01)
+    OUTBOUND_REQUESTS.inc(service='groq', status='429')
+    HTTP_REQUESTS.inc(route='/api/v1/analyze-chunks', method='POST', status='200')
+    registry.add_collector(lambda: [('linkscout_cache_lookups_total', 'counter', 'Cache lookups',
+                                     [({'cache': 'google_search', 'result': 'hit'}, 3)])])
+
+    text = registry.render()
+    for line in text.splitlines():
+        if not line.startswith('#') and ('_bucket' not in line or 'le="0.025"' in line or 'le="+Inf"' in line):
+            print(line)
+    print("=" * 60)
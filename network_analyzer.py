@@ -16,6 +16,10 @@ import re
 from typing import Dict, List, Set
 from collections import Counter
 from dataclasses import dataclass
+from keyword_matcher import register_keywords, scan_keywords
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
 
 @dataclass
 class NetworkAnalysisResult:
@@ -32,6 +36,40 @@ class NetworkAnalysisResult:
 class NetworkAnalyzer:
     """Analyze text for signs of coordinated misinformation campaigns"""
     
+    # Phrase lists - substring matches read from the shared keyword automaton
+    
+    # Astroturfing indicators
+    ASTROTURFING_PHRASES = [
+        'as a concerned citizen', 'as an ordinary person', 'as a taxpayer',
+        'we the people', 'grassroots movement', 'ordinary americans',
+        'regular folks like us', 'common sense tells us', 'everyone is saying',
+        'people are waking up', 'the silent majority', 'real patriots'
+    ]
+    
+    # Viral manipulation phrases
+    VIRAL_PHRASES = [
+        'share this before it\'s deleted', 'they don\'t want you to see this',
+        'going viral', 'breaking news', 'everyone needs to see this',
+        'share if you agree', 'repost', 'pass it on', 'spread the word',
+        'tag someone who needs to see this', 'share this everywhere'
+    ]
+    
+    # Coordinated messaging indicators
+    COORDINATION_PHRASES = [
+        'talking points', 'narrative', 'script', 'agenda',
+        'the same message', 'identical wording', 'coordinated effort'
+    ]
+    
+    # Generic bot-like phrases
+    GENERIC_PHRASES = [
+        'i am here to tell you', 'let me be clear', 'make no mistake',
+        'the fact is', 'the truth is', 'believe me', 'trust me',
+        'i can assure you', 'without a doubt', 'it\'s obvious that'
+    ]
+    
+    # Urgency manipulation words
+    URGENCY_WORDS = ['urgent', 'hurry', 'immediately', 'now', 'today', 'act fast', 'limited time']
+    
     def __init__(self):
         # Bot-like patterns
         self.bot_patterns = [
@@ -42,35 +80,6 @@ class NetworkAnalyzer:
             r'(dm|message)\s+(?:me|us)\s+for\s+(?:more|details|info)'
         ]
         
-        # Astroturfing indicators
-        self.astroturfing_phrases = [
-            'as a concerned citizen', 'as an ordinary person', 'as a taxpayer',
-            'we the people', 'grassroots movement', 'ordinary americans',
-            'regular folks like us', 'common sense tells us', 'everyone is saying',
-            'people are waking up', 'the silent majority', 'real patriots'
-        ]
-        
-        # Viral manipulation phrases
-        self.viral_phrases = [
-            'share this before it\'s deleted', 'they don\'t want you to see this',
-            'going viral', 'breaking news', 'everyone needs to see this',
-            'share if you agree', 'repost', 'pass it on', 'spread the word',
-            'tag someone who needs to see this', 'share this everywhere'
-        ]
-        
-        # Coordinated messaging indicators
-        self.coordination_phrases = [
-            'talking points', 'narrative', 'script', 'agenda',
-            'the same message', 'identical wording', 'coordinated effort'
-        ]
-        
-        # Generic bot-like phrases
-        self.generic_phrases = [
-            'i am here to tell you', 'let me be clear', 'make no mistake',
-            'the fact is', 'the truth is', 'believe me', 'trust me',
-            'i can assure you', 'without a doubt', 'it\'s obvious that'
-        ]
-        
         # Social proof manipulation
         self.social_proof_patterns = [
             r'(\d+)\s+(?:thousand|million|billion)\s+(?:people|views|shares|likes)',
@@ -79,11 +88,11 @@ class NetworkAnalyzer:
             r'trending\s+(?:on|now)'
         ]
         
-        print("🌐 [NETWORK] Network Analyzer initialized")
+        logger.info("🌐 [NETWORK] Network Analyzer initialized")
     
     def analyze_network_patterns(self, text: str) -> NetworkAnalysisResult:
         """Analyze text for network propagation patterns"""
-        print(f"\n🌐 [NETWORK] Analyzing text for bot/astroturfing patterns ({len(text)} chars)...")
+        logger.debug("🌐 [NETWORK] Analyzing text for bot/astroturfing patterns (%s chars)...", len(text))
         
         text_lower = text.lower()
         red_flags = []
@@ -129,10 +138,8 @@ class NetworkAnalyzer:
         else:
             verdict = "ORGANIC"
         
-        print(f"   Bot Score: {bot_score:.1f}/100")
-        print(f"   Astroturfing Score: {astroturfing_score:.1f}/100")
-        print(f"   Viral Manipulation: {viral_score:.1f}/100")
-        print(f"   Overall: {overall_score:.1f}/100 ({verdict})")
+        logger.debug("🌐 [NETWORK] Bot %.1f/100, astroturfing %.1f/100, viral manipulation %.1f/100 -> overall %.1f/100 (%s)",
+                     bot_score, astroturfing_score, viral_score, overall_score, verdict)
         
         return NetworkAnalysisResult(
             bot_score=bot_score,
@@ -164,10 +171,7 @@ class NetworkAnalyzer:
                 flags.append(f"bot_pattern: {matches[0] if isinstance(matches[0], str) else matches[0][0]}")
         
         # Check for generic phrases
-        generic_count = 0
-        for phrase in self.generic_phrases:
-            if phrase in text:
-                generic_count += 1
+        generic_count = len(scan_keywords(text).found('network.generic'))
         
         if generic_count >= 3:
             score += 20
@@ -187,8 +191,9 @@ class NetworkAnalyzer:
         flags = []
         
         # Check for astroturfing phrases
-        for phrase in self.astroturfing_phrases:
-            if phrase in text:
+        found = scan_keywords(text).found('network.astroturfing')
+        for phrase in self.ASTROTURFING_PHRASES:
+            if phrase in found:
                 score += 20
                 flags.append(f"astroturfing: '{phrase}'")
         
@@ -205,9 +210,12 @@ class NetworkAnalyzer:
         score = 0
         flags = []
         
+        scan = scan_keywords(text)
+        
         # Check for viral phrases
-        for phrase in self.viral_phrases:
-            if phrase in text:
+        found = scan.found('network.viral')
+        for phrase in self.VIRAL_PHRASES:
+            if phrase in found:
                 score += 25
                 flags.append(f"viral_manipulation: '{phrase}'")
         
@@ -219,8 +227,7 @@ class NetworkAnalyzer:
                 flags.append(f"social_proof_claim: {matches[0] if isinstance(matches[0], str) else 'numerical claim'}")
         
         # Check for urgency manipulation
-        urgency_words = ['urgent', 'hurry', 'immediately', 'now', 'today', 'act fast', 'limited time']
-        urgency_count = sum(1 for word in urgency_words if word in text)
+        urgency_count = len(scan.found('network.urgency'))
         if urgency_count >= 3:
             score += 15
             flags.append(f"urgency_manipulation: {urgency_count} instances")
@@ -233,8 +240,9 @@ class NetworkAnalyzer:
         flags = []
         
         # Check for coordination phrases
-        for phrase in self.coordination_phrases:
-            if phrase in text:
+        found = scan_keywords(text).found('network.coordination')
+        for phrase in self.COORDINATION_PHRASES:
+            if phrase in found:
                 score += 20
                 flags.append(f"coordination: '{phrase}'")
         
@@ -280,6 +288,13 @@ class NetworkAnalyzer:
         
         return min(100, score), flags
 
+# Register phrase lists with the shared keyword automaton
+register_keywords('network.astroturfing', NetworkAnalyzer.ASTROTURFING_PHRASES)
+register_keywords('network.viral', NetworkAnalyzer.VIRAL_PHRASES)
+register_keywords('network.coordination', NetworkAnalyzer.COORDINATION_PHRASES)
+register_keywords('network.generic', NetworkAnalyzer.GENERIC_PHRASES)
+register_keywords('network.urgency', NetworkAnalyzer.URGENCY_WORDS)
+
 # Singleton instance
 _network_analyzer = None
 
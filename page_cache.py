@@ -0,0 +1,250 @@
+"""
+📄 PAGE CACHE MODULE
+Shared fetch layer with an on-disk cache of extracted page text
+
+Official-source landing pages (WHO, CDC, UN, ...) change a few times a
+day at most, yet were downloaded and parsed for every mention in every
+article. This module keeps, per URL:
+
+- the pre-extracted, lower-cased visible text of the page
+- the ETag / Last-Modified validators from the last response
+
+on disk (one JSON file per URL under models_cache/page_cache/) and in
+memory. Lookups are local; registered pages are revalidated by a
+background thread with conditional requests (If-None-Match /
+If-Modified-Since), so an unchanged page costs one 304 response and no
+parsing. Stale text keeps being served if a refresh fails.
+
+Author: AI Misinformation Detector
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional
+
+import requests
+from bs4 import BeautifulSoup
+
+from http_client import get_http_session, http_timeout
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration
+PAGE_CACHE_DIR = os.getenv(
+    'PAGE_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models_cache', 'page_cache')
+)
+PAGE_REFRESH_INTERVAL = int(os.getenv('PAGE_REFRESH_INTERVAL', '3600'))  # Seconds between revalidations (0 = off)
+PAGE_FETCH_TIMEOUT = 5  # Seconds (read timeout) per request
+
+
+@dataclass
+class CachedPage:
+    """Extracted text of one page plus its HTTP validators"""
+    url: str
+    text: str  # Visible text, lower-cased
+    etag: str = ''
+    last_modified: str = ''
+    fetched_at: float = 0.0  # Last time the body changed (200)
+    checked_at: float = 0.0  # Last successful revalidation (200 or 304)
+
+
+def extract_page_text(html: bytes) -> str:
+    """Visible text of an HTML page, lower-cased"""
+    return BeautifulSoup(html, 'html.parser').get_text().lower()
+
+
+class PageCache:
+    """
+    Memory + disk cache of page text, revalidated in the background
+    """
+
+    def __init__(self, cache_dir: str = PAGE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.session = get_http_session()
+
+        self._pages: Dict[str, CachedPage] = {}
+        self._lock = threading.Lock()
+        self._registered: Dict[str, None] = {}  # Ordered set of URLs kept warm
+        self._refresher: Optional[threading.Thread] = None
+
+        self.stats = {'hits': 0, 'fetches': 0, 'not_modified': 0, 'errors': 0}
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _load(self, url: str) -> Optional[CachedPage]:
+        """Cached page from disk, if any"""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                page = CachedPage(**json.load(f))
+            return page if page.url == url else None
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store(self, page: CachedPage):
+        with self._lock:
+            self._pages[page.url] = page
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(page.url)
+            # Unique temp file per write: concurrent refreshes of a page never share one
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir,
+                                             suffix='.tmp', delete=False) as f:
+                json.dump(asdict(page), f)
+            try:
+                os.replace(f.name, path)  # Atomic on the same filesystem
+            except OSError:
+                os.unlink(f.name)
+                raise
+        except OSError as e:
+            logger.warning("⚠️ [PAGES] Could not write cache for %s: %s", page.url, e)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Cached page (memory, then disk) without any network access"""
+        with self._lock:
+            page = self._pages.get(url)
+        if page is None:
+            page = self._load(url)
+            if page is not None:
+                with self._lock:
+                    self._pages[url] = page
+        return page
+
+    def refresh(self, url: str, timeout: float = PAGE_FETCH_TIMEOUT) -> Optional[CachedPage]:
+        """
+        Revalidate a page with a conditional request
+
+        Returns:
+            The current page (new, revalidated or stale) or None if never fetched
+        """
+        cached = self.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=http_timeout(timeout))
+        except requests.RequestException as e:
+            self.stats['errors'] += 1
+            logger.warning("⚠️ [PAGES] Could not fetch %s: %s", url, e)
+            return cached
+
+        now = time.time()
+        if response.status_code == 304 and cached is not None:
+            self.stats['not_modified'] += 1
+            cached.checked_at = now
+            self._store(cached)
+            return cached
+
+        if response.status_code != 200:
+            self.stats['errors'] += 1
+            return cached
+
+        self.stats['fetches'] += 1
+        page = CachedPage(
+            url=url,
+            text=extract_page_text(response.content),
+            etag=response.headers.get('ETag', ''),
+            last_modified=response.headers.get('Last-Modified', ''),
+            fetched_at=now,
+            checked_at=now
+        )
+        self._store(page)
+        return page
+
+    def get_text(self, url: str) -> Optional[str]:
+        """
+        Lower-cased page text: a local lookup once the page has been fetched
+
+        Only a page never seen before is fetched synchronously.
+        """
+        page = self.get(url)
+        if page is not None:
+            self.stats['hits'] += 1
+            return page.text
+        page = self.refresh(url)
+        return page.text if page is not None else None
+
+    def register(self, urls: Iterable[str]):
+        """Keep these pages warm (revalidated by the background refresher)"""
+        with self._lock:
+            for url in urls:
+                self._registered[url] = None
+
+    def refresh_due(self, interval: int = PAGE_REFRESH_INTERVAL):
+        """Revalidate every registered page not checked within the interval"""
+        with self._lock:
+            urls = list(self._registered)
+        for url in urls:
+            page = self.get(url)
+            if page is None or time.time() - page.checked_at >= interval:
+                self.refresh(url)
+
+    def start_refresher(self, interval: int = PAGE_REFRESH_INTERVAL):
+        """Start a daemon thread that refreshes registered pages on a schedule"""
+        if interval <= 0 or self._refresher is not None:
+            return
+
+        def run():
+            while True:
+                try:
+                    self.refresh_due(interval)
+                except Exception as e:
+                    logger.warning("⚠️ [PAGES] Refresher error: %s", e)
+                time.sleep(min(interval, 300))
+
+        self._refresher = threading.Thread(target=run, name='page-refresher', daemon=True)
+        self._refresher.start()
+        logger.info("📄 [PAGES] Refreshing %s pages every %ss", len(self._registered), interval)
+
+    def get_stats(self) -> Dict:
+        """Hit/fetch counters"""
+        return {**self.stats, 'cached_pages': len(self._pages), 'registered_pages': len(self._registered)}
+
+
+# Singleton instance
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    """Get or create the page cache singleton"""
+    global _page_cache
+    if _page_cache is None:
+        with _page_cache_lock:
+            if _page_cache is None:
+                _page_cache = PageCache()
+    return _page_cache
+
+
+def get_page_cache_stats() -> Optional[Dict]:
+    """Page cache counters (None until the cache is created)"""
+    return _page_cache.get_stats() if _page_cache is not None else None
+
+
+# Test function
+if __name__ == "__main__":
+    cache = get_page_cache()
+    test_url = "https://www.who.int/news-room/fact-sheets"
+
+    print("\n" + "=" * 60)
+    print("PAGE CACHE TEST")
+    print("=" * 60)
+    for attempt in (1, 2):
+        start = time.time()
+        text = cache.get_text(test_url)
+        print(f"Lookup {attempt}: {len(text or '')} chars in {(time.time() - start) * 1000:.1f} ms")
+    page = cache.refresh(test_url)
+    print(f"Revalidated: etag={page.etag if page else None!r}")
+    print(f"Stats: {cache.get_stats()}")
+    print("=" * 60)
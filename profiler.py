@@ -0,0 +1,228 @@
+"""
+🔬 PROFILER MODULE
+On-demand diagnostics for a live server (admin endpoints only)
+
+- Sampling profiler: snapshots the Python stacks of every thread at a fixed
+  interval for N seconds and returns them in the collapsed-stack format read
+  by flamegraph.pl, speedscope and inferno ("frame;frame;frame count")
+- Allocation diff: traces allocations with tracemalloc for N seconds and
+  returns the allocation sites whose memory grew the most
+
+Nothing runs until an endpoint asks for it: the sampler loops in the admin
+request's own thread until the window ends, and tracemalloc is stopped again
+afterwards (unless it was already running). Only one profile of each kind runs at a
+time, and both are disabled unless PROFILING_ENABLED is set.
+
+Author: AI Misinformation Detector
+"""
+
+import math
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Configuration
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+PROFILE_MAX_SECONDS = float(os.getenv('PROFILE_MAX_SECONDS', '60'))
+PROFILE_DEFAULT_INTERVAL = 0.01  # Seconds between stack samples (100 Hz)
+PROFILE_MIN_INTERVAL = 0.001
+TRACEMALLOC_FRAMES = 10  # Frames stored per allocation (grouping uses fewer)
+
+_sampler_lock = threading.Lock()
+_tracemalloc_lock = threading.Lock()
+
+
+class ProfilerBusy(Exception):
+    """Another profile of the same kind is already running"""
+    pass
+
+
+def clamp_seconds(value, default: float = 10.0) -> float:
+    """Requested duration limited to (0, PROFILE_MAX_SECONDS]"""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        seconds = default
+    return max(0.1, min(seconds, PROFILE_MAX_SECONDS))
+
+
+def clamp_interval(value, seconds: float) -> float:
+    """
+    Requested sampling interval limited to [PROFILE_MIN_INTERVAL, seconds]
+
+    Raises:
+        ValueError: Not a finite number
+    """
+    interval = PROFILE_DEFAULT_INTERVAL if value is None else float(value)
+    if not math.isfinite(interval):
+        raise ValueError('interval must be a finite number of seconds')
+    return max(PROFILE_MIN_INTERVAL, min(interval, seconds))
+
+
+# ========================================
+# SAMPLING PROFILER
+# ========================================
+
+@dataclass
+class StackProfile:
+    """Stack samples collected over a time window"""
+    duration: float
+    interval: float
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)
+
+    def to_collapsed(self) -> str:
+        """One 'root;...;leaf count' line per distinct stack"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})".replace(';', ':')
+
+
+def _collapse(frame, thread_name: str) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name.replace(';', ':'))
+    return ';'.join(reversed(labels))
+
+
+def sample_stacks(seconds: float, interval: float = PROFILE_DEFAULT_INTERVAL,
+                  include_idle: bool = False) -> StackProfile:
+    """
+    Sample the stacks of all other threads for `seconds`
+
+    The thread name is the root frame, so request threads, job workers and
+    background refreshers can be told apart. Threads blocked in a wait
+    (idle pool workers, the accept loop) are left out unless include_idle.
+    """
+    interval = clamp_interval(interval, seconds)
+    if not _sampler_lock.acquire(blocking=False):
+        raise ProfilerBusy('A profile is already running')
+    try:
+        profile = StackProfile(duration=seconds, interval=interval)
+        own_id = threading.get_ident()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if not include_idle and _is_idle(frame):
+                    continue
+                profile.stacks[_collapse(frame, names.get(thread_id, f"thread-{thread_id}"))] += 1
+            profile.samples += 1
+            time.sleep(interval)
+        return profile
+    finally:
+        _sampler_lock.release()
+
+
+# Leaf functions of threads that are waiting rather than working
+_IDLE_LEAVES = {
+    ('threading.py', 'wait'), ('threading.py', '_wait_for_tstate_lock'),
+    ('queue.py', 'get'), ('selectors.py', 'select'), ('socketserver.py', 'serve_forever'),
+    ('socket.py', 'accept'), ('thread.py', '_worker'),
+}
+
+
+def _is_idle(frame) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in _IDLE_LEAVES
+
+
+# ========================================
+# ALLOCATION DIFF
+# ========================================
+
+def allocation_diff(seconds: float, top: int = 25, group_by: str = 'lineno') -> Dict:
+    """
+    Allocation sites whose traced memory grew most over `seconds`
+
+    group_by is 'lineno' (one entry per line) or 'traceback' (per call
+    chain). If tracemalloc was not already running it is started for the
+    window only, so the overhead is not paid in normal operation.
+    """
+    if group_by not in ('lineno', 'filename', 'traceback'):
+        group_by = 'lineno'
+    if not _tracemalloc_lock.acquire(blocking=False):
+        raise ProfilerBusy('An allocation trace is already running')
+    started_here = not tracemalloc.is_tracing()
+    try:
+        if started_here:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        before = tracemalloc.take_snapshot()
+        time.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_here:
+            tracemalloc.stop()
+        _tracemalloc_lock.release()
+
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), group_by)
+
+    sites: List[Dict] = []
+    for stat in stats[:max(1, top)]:
+        frames = stat.traceback if group_by == 'traceback' else stat.traceback[:1]
+        sites.append({
+            'size_diff_kb': round(stat.size_diff / 1024, 1),
+            'size_kb': round(stat.size / 1024, 1),
+            'count_diff': stat.count_diff,
+            'count': stat.count,
+            'trace': [f"{frame.filename}:{frame.lineno}" for frame in frames],
+        })
+
+    return {
+        'seconds': seconds,
+        'group_by': group_by,
+        'traced_current_kb': round(current / 1024, 1),
+        'traced_peak_kb': round(peak / 1024, 1),
+        'tracemalloc_was_running': not started_here,
+        'top': sites,
+    }
+
+
+# Test function
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("PROFILER TEST")
+    print("=" * 60)
+
+    stop = threading.Event()
+
+    def busy_worker():
+        data: List[Optional[str]] = []
+        while not stop.is_set():
+            data.append('x' * 1000)
+            if len(data) > 2000:
+                data = data[1000:]
+            sum(i * i for i in range(2000))
+
+    worker = threading.Thread(target=busy_worker, name='busy-worker', daemon=True)
+    worker.start()
+
+    profile = sample_stacks(0.5, 0.005)
+    print(f"Samples: {profile.samples}, distinct stacks: {len(profile.stacks)}")
+    for line in profile.to_collapsed().splitlines()[:3]:
+        print(f"  {line[-120:]}")
+
+    diff = allocation_diff(0.5, top=3)
+    print(f"Traced peak: {diff['traced_peak_kb']} KB")
+    for site in diff['top']:
+        print(f"  +{site['size_diff_kb']} KB  {site['trace'][0]}")
+
+    stop.set()
+    print("=" * 60)
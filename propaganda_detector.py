@@ -28,27 +28,54 @@ import re
 from typing import Dict, List, Tuple
 from collections import Counter
 
+from keyword_matcher import register_keywords, scan_keywords
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
 class PropagandaDetector:
     """Detect propaganda techniques in text"""
     
+    # Word lists - matched on word boundaries by the shared keyword automaton
+    
+    # 1. Loaded Language
+    LOADED_WORDS = [
+        'shocking', 'horrifying', 'devastating', 'outrageous', 'scandalous',
+        'disgraceful', 'unbelievable', 'explosive', 'bombshell', 'nightmare',
+        'crisis', 'chaos', 'disaster', 'catastrophe', 'emergency', 'urgent',
+        'critical', 'dangerous', 'deadly', 'toxic', 'poison', 'attack'
+    ]
+    
+    # 2. Name Calling
+    NAME_CALLING_WORDS = [
+        'idiot', 'fool', 'stupid', 'moron', 'lunatic', 'crazy', 'insane',
+        'radical', 'extremist', 'terrorist', 'traitor', 'corrupt', 'criminal',
+        'liar', 'fraud', 'fake', 'phony', 'puppet', 'sheep', 'shill'
+    ]
+    
+    # 4. Appeal to Fear
+    FEAR_WORDS = [
+        'danger', 'threat', 'risk', 'warning', 'alert', 'panic',
+        'terror', 'horror', 'doom', 'apocalypse', 'extinction',
+        'death', 'die', 'kill', 'destroy', 'eliminate'
+    ]
+    
+    # 7. Exaggeration
+    EXAGGERATION_WORDS = [
+        'always', 'never', 'everyone', 'nobody', 'everywhere', 'nowhere',
+        'all', 'none', 'every', 'completely', 'totally', 'absolutely',
+        'entirely', 'perfectly', 'forever', 'infinite', 'ultimate'
+    ]
+    
+    # 15. Glittering Generalities
+    GLITTERING_WORDS = [
+        'freedom', 'liberty', 'democracy', 'justice', 'truth', 'honor',
+        'glory', 'destiny', 'patriot', 'hero', 'values', 'tradition'
+    ]
+    
     def __init__(self):
         # Initialize pattern dictionaries for each technique
         
-        # 1. Loaded Language
-        self.loaded_words = [
-            'shocking', 'horrifying', 'devastating', 'outrageous', 'scandalous',
-            'disgraceful', 'unbelievable', 'explosive', 'bombshell', 'nightmare',
-            'crisis', 'chaos', 'disaster', 'catastrophe', 'emergency', 'urgent',
-            'critical', 'dangerous', 'deadly', 'toxic', 'poison', 'attack'
-        ]
-        
-        # 2. Name Calling
-        self.name_calling_words = [
-            'idiot', 'fool', 'stupid', 'moron', 'lunatic', 'crazy', 'insane',
-            'radical', 'extremist', 'terrorist', 'traitor', 'corrupt', 'criminal',
-            'liar', 'fraud', 'fake', 'phony', 'puppet', 'sheep', 'shill'
-        ]
-        
         # 3. Doubt patterns
         self.doubt_patterns = [
             r'can\s+(?:you|we)\s+trust',
@@ -60,13 +87,6 @@ class PropagandaDetector:
             r'don\'t\s+be\s+fooled'
         ]
         
-        # 4. Appeal to Fear
-        self.fear_words = [
-            'danger', 'threat', 'risk', 'warning', 'alert', 'panic',
-            'terror', 'horror', 'doom', 'apocalypse', 'extinction',
-            'death', 'die', 'kill', 'destroy', 'eliminate'
-        ]
-        
         # 5. Flag-Waving
         self.patriotic_patterns = [
             r'(?:our|the)\s+(?:great\s+)?(?:nation|country)',
@@ -79,13 +99,6 @@ class PropagandaDetector:
         
         # 6. Repetition - detected by analyzing repeated phrases
         
-        # 7. Exaggeration
-        self.exaggeration_words = [
-            'always', 'never', 'everyone', 'nobody', 'everywhere', 'nowhere',
-            'all', 'none', 'every', 'completely', 'totally', 'absolutely',
-            'entirely', 'perfectly', 'forever', 'infinite', 'ultimate'
-        ]
-        
         # 8. Causal Oversimplification
         self.oversimplification_patterns = [
             r'(?:the\s+)?(?:only|real|simple)\s+(?:reason|cause|solution)',
@@ -132,12 +145,6 @@ class PropagandaDetector:
             r'don\'t\s+be\s+left\s+(?:behind|out)'
         ]
         
-        # 15. Glittering Generalities
-        self.glittering_words = [
-            'freedom', 'liberty', 'democracy', 'justice', 'truth', 'honor',
-            'glory', 'destiny', 'patriot', 'hero', 'values', 'tradition'
-        ]
-        
         # 16. Card Stacking - difficult to detect automatically
         
         # 17. Plain Folks
@@ -150,15 +157,77 @@ class PropagandaDetector:
         
         # 18. Transfer - difficult to detect automatically
         
-        print("📣 [PROPAGANDA] Propaganda Detector initialized (18 techniques)")
+        # Compile all pattern-based techniques into one regex (one pass per document)
+        self._compile_pattern_engine()
+        
+        logger.info("📣 [PROPAGANDA] Propaganda Detector initialized (18 techniques)")
+    
+    def _compile_pattern_engine(self):
+        """
+        Compile every technique pattern into a single named-group regex
+        
+        Each pattern becomes an optional lookahead group, so one finditer pass
+        reports, at every position, which patterns match there. Hits are then
+        filtered per pattern to reproduce re.findall's non-overlapping results.
+        """
+        technique_patterns = {
+            'doubt': self.doubt_patterns,
+            'flag_waving': self.patriotic_patterns,
+            'oversimplification': self.oversimplification_patterns,
+            'appeal_to_authority': self.authority_patterns,
+            'black_white_fallacy': self.black_white_patterns,
+            'whataboutism': self.whataboutism_patterns,
+            'bandwagon': self.bandwagon_patterns,
+            'plain_folks': self.plain_folks_patterns
+        }
+        
+        self._pattern_groups = []  # (group name, technique) in pattern order
+        alternatives = []
+        captures = []
+        
+        for technique, patterns in technique_patterns.items():
+            for index, pattern in enumerate(patterns):
+                group = f'{technique}_{index}'
+                self._pattern_groups.append((group, technique))
+                alternatives.append(f'(?:{pattern})')
+                captures.append(f'(?=(?P<{group}>{pattern})|)')
+        
+        # Leading lookahead skips positions where no pattern can match
+        self._pattern_engine = re.compile(
+            '(?=' + '|'.join(alternatives) + ')' + ''.join(captures),
+            re.IGNORECASE
+        )
+    
+    def _match_patterns(self, text: str) -> Dict[str, List[str]]:
+        """Run the compiled pattern engine once; returns technique -> matches"""
+        group_matches = {group: [] for group, _ in self._pattern_groups}
+        group_ends = dict.fromkeys(group_matches, 0)
+        
+        for match in self._pattern_engine.finditer(text):
+            for group, value in match.groupdict().items():
+                if value is None:
+                    continue
+                start, end = match.span(group)
+                # Same non-overlapping semantics as re.findall per pattern
+                if start >= group_ends[group]:
+                    group_matches[group].append(value)
+                    group_ends[group] = end
+        
+        matches = {}
+        for group, technique in self._pattern_groups:
+            matches.setdefault(technique, []).extend(group_matches[group])
+        return matches
     
     def detect_propaganda(self, text: str) -> Dict:
         """Detect all propaganda techniques in text"""
-        print(f"\n📣 [PROPAGANDA] Analyzing text for propaganda ({len(text)} chars)...")
+        logger.debug("📣 [PROPAGANDA] Analyzing text for propaganda (%s chars)...", len(text))
         
         techniques_found = {}
         examples = {}
         
+        # Single pass over all pattern-based techniques
+        pattern_matches = self._match_patterns(text)
+        
         # 1. Loaded Language
         loaded = self._detect_loaded_language(text)
         if loaded['count'] > 0:
@@ -172,7 +241,7 @@ class PropagandaDetector:
             examples['name_calling'] = name_calling['examples'][:3]
         
         # 3. Doubt
-        doubt = self._detect_doubt(text)
+        doubt = self._detect_doubt(pattern_matches)
         if doubt['count'] > 0:
             techniques_found['doubt'] = doubt
             examples['doubt'] = doubt['examples'][:3]
@@ -184,7 +253,7 @@ class PropagandaDetector:
             examples['appeal_to_fear'] = fear['examples'][:3]
         
         # 5. Flag-Waving
-        flag = self._detect_flag_waving(text)
+        flag = self._detect_flag_waving(pattern_matches)
         if flag['count'] > 0:
             techniques_found['flag_waving'] = flag
             examples['flag_waving'] = flag['examples'][:3]
@@ -202,31 +271,31 @@ class PropagandaDetector:
             examples['exaggeration'] = exaggeration['examples'][:3]
         
         # 8. Causal Oversimplification
-        oversimplification = self._detect_oversimplification(text)
+        oversimplification = self._detect_oversimplification(pattern_matches)
         if oversimplification['count'] > 0:
             techniques_found['oversimplification'] = oversimplification
             examples['oversimplification'] = oversimplification['examples'][:3]
         
         # 9. Appeal to Authority
-        authority = self._detect_appeal_to_authority(text)
+        authority = self._detect_appeal_to_authority(pattern_matches)
         if authority['count'] > 0:
             techniques_found['appeal_to_authority'] = authority
             examples['appeal_to_authority'] = authority['examples'][:3]
         
         # 10. Black-and-White Fallacy
-        black_white = self._detect_black_white(text)
+        black_white = self._detect_black_white(pattern_matches)
         if black_white['count'] > 0:
             techniques_found['black_white_fallacy'] = black_white
             examples['black_white_fallacy'] = black_white['examples'][:3]
         
         # 11. Whataboutism
-        whataboutism = self._detect_whataboutism(text)
+        whataboutism = self._detect_whataboutism(pattern_matches)
         if whataboutism['count'] > 0:
             techniques_found['whataboutism'] = whataboutism
             examples['whataboutism'] = whataboutism['examples'][:3]
         
         # 14. Bandwagon
-        bandwagon = self._detect_bandwagon(text)
+        bandwagon = self._detect_bandwagon(pattern_matches)
         if bandwagon['count'] > 0:
             techniques_found['bandwagon'] = bandwagon
             examples['bandwagon'] = bandwagon['examples'][:3]
@@ -238,7 +307,7 @@ class PropagandaDetector:
             examples['glittering_generalities'] = glittering['examples'][:3]
         
         # 17. Plain Folks
-        plain = self._detect_plain_folks(text)
+        plain = self._detect_plain_folks(pattern_matches)
         if plain['count'] > 0:
             techniques_found['plain_folks'] = plain
             examples['plain_folks'] = plain['examples'][:3]
@@ -271,8 +340,8 @@ class PropagandaDetector:
         else:
             verdict = "MINIMAL_PROPAGANDA"
         
-        print(f"   ✅ Found {total_techniques} techniques ({total_instances} total instances)")
-        print(f"   Score: {propaganda_score}/100 ({verdict})")
+        logger.debug("✅ Found %s techniques (%s total instances)", total_techniques, total_instances)
+        logger.debug("📣 [PROPAGANDA] Score: %s/100 (%s)", propaganda_score, verdict)
         
         return {
             'total_techniques': total_techniques,
@@ -284,63 +353,43 @@ class PropagandaDetector:
             'technique_list': list(techniques_found.keys())
         }
     
-    def _detect_loaded_language(self, text: str) -> Dict:
-        """Detect emotionally charged language"""
+    def _find_words(self, text: str, words: List[str]) -> List[str]:
+        """Word-boundary occurrences of each word, in list order (original case)"""
+        scan = scan_keywords(text)
         found = []
-        text_lower = text.lower()
         
-        for word in self.loaded_words:
-            if word in text_lower:
-                # Find actual occurrences
-                pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-                matches = pattern.findall(text)
-                found.extend(matches)
+        for word in words:
+            found.extend(scan.matched_text(hit) for hit in scan.occurrences(word, bounded=True))
+        
+        return found
+    
+    def _detect_loaded_language(self, text: str) -> Dict:
+        """Detect emotionally charged language"""
+        found = self._find_words(text, self.LOADED_WORDS)
         
         return {'count': len(found), 'examples': found}
     
     def _detect_name_calling(self, text: str) -> Dict:
         """Detect name calling and labeling"""
-        found = []
-        text_lower = text.lower()
-        
-        for word in self.name_calling_words:
-            if word in text_lower:
-                pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-                matches = pattern.findall(text)
-                found.extend(matches)
+        found = self._find_words(text, self.NAME_CALLING_WORDS)
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_doubt(self, text: str) -> Dict:
+    def _detect_doubt(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect doubt-casting patterns"""
-        found = []
-        
-        for pattern in self.doubt_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['doubt']
         
         return {'count': len(found), 'examples': found}
     
     def _detect_fear(self, text: str) -> Dict:
         """Detect fear appeals"""
-        found = []
-        text_lower = text.lower()
-        
-        for word in self.fear_words:
-            if word in text_lower:
-                pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-                matches = pattern.findall(text)
-                found.extend(matches)
+        found = self._find_words(text, self.FEAR_WORDS)
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_flag_waving(self, text: str) -> Dict:
+    def _detect_flag_waving(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect patriotic appeals"""
-        found = []
-        
-        for pattern in self.patriotic_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['flag_waving']
         
         return {'count': len(found), 'examples': found}
     
@@ -366,90 +415,59 @@ class PropagandaDetector:
     
     def _detect_exaggeration(self, text: str) -> Dict:
         """Detect exaggeration and absolutes"""
-        found = []
-        text_lower = text.lower()
-        
-        for word in self.exaggeration_words:
-            if word in text_lower:
-                pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-                matches = pattern.findall(text)
-                found.extend(matches)
+        found = self._find_words(text, self.EXAGGERATION_WORDS)
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_oversimplification(self, text: str) -> Dict:
+    def _detect_oversimplification(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect causal oversimplification"""
-        found = []
-        
-        for pattern in self.oversimplification_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['oversimplification']
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_appeal_to_authority(self, text: str) -> Dict:
+    def _detect_appeal_to_authority(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect improper appeals to authority"""
-        found = []
-        
-        for pattern in self.authority_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['appeal_to_authority']
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_black_white(self, text: str) -> Dict:
+    def _detect_black_white(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect black-and-white fallacies"""
-        found = []
-        
-        for pattern in self.black_white_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['black_white_fallacy']
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_whataboutism(self, text: str) -> Dict:
+    def _detect_whataboutism(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect whataboutism"""
-        found = []
-        
-        for pattern in self.whataboutism_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['whataboutism']
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_bandwagon(self, text: str) -> Dict:
+    def _detect_bandwagon(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect bandwagon appeals"""
-        found = []
-        
-        for pattern in self.bandwagon_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['bandwagon']
         
         return {'count': len(found), 'examples': found}
     
     def _detect_glittering(self, text: str) -> Dict:
         """Detect glittering generalities"""
-        found = []
-        text_lower = text.lower()
-        
-        for word in self.glittering_words:
-            if word in text_lower:
-                pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-                matches = pattern.findall(text)
-                found.extend(matches)
+        found = self._find_words(text, self.GLITTERING_WORDS)
         
         return {'count': len(found), 'examples': found}
     
-    def _detect_plain_folks(self, text: str) -> Dict:
+    def _detect_plain_folks(self, pattern_matches: Dict[str, List[str]]) -> Dict:
         """Detect plain folks appeals"""
-        found = []
-        
-        for pattern in self.plain_folks_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found.extend(matches)
+        found = pattern_matches['plain_folks']
         
         return {'count': len(found), 'examples': found}
 
+# Register word lists with the shared keyword automaton
+register_keywords('propaganda.loaded_language', PropagandaDetector.LOADED_WORDS)
+register_keywords('propaganda.name_calling', PropagandaDetector.NAME_CALLING_WORDS)
+register_keywords('propaganda.appeal_to_fear', PropagandaDetector.FEAR_WORDS)
+register_keywords('propaganda.exaggeration', PropagandaDetector.EXAGGERATION_WORDS)
+register_keywords('propaganda.glittering_generalities', PropagandaDetector.GLITTERING_WORDS)
+
 # Singleton instance
 _propaganda_detector = None
 
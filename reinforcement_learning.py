@@ -23,6 +23,10 @@ import os
 from collections import deque
 import pickle
 
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
 class ReinforcementLearningAgent:
     """
     Q-Learning based RL agent that learns optimal misinformation detection strategies
@@ -60,9 +64,8 @@ class ReinforcementLearningAgent:
         self.model_path = 'models_cache/rl_agent_model.pkl'
         self.load_model()
         
-        print("🤖 [RL] Reinforcement Learning Agent initialized")
-        print(f"   State size: {state_size}, Action size: {action_size}")
-        print(f"   Learning rate: {learning_rate}, Gamma: {self.gamma}")
+        logger.info("🤖 [RL] Reinforcement Learning Agent initialized (state size: %s, action size: %s, learning rate: %s, gamma: %s)",
+                    state_size, action_size, learning_rate, self.gamma)
     
     def extract_features(self, analysis_data: Dict) -> np.ndarray:
         """
@@ -128,7 +131,7 @@ class ReinforcementLearningAgent:
             features[9] = hour / 24.0
             
         except Exception as e:
-            print(f"⚠️ [RL] Feature extraction error: {e}")
+            logger.warning("⚠️ [RL] Feature extraction error: %s", e)
         
         return features
     
@@ -295,11 +298,11 @@ class ReinforcementLearningAgent:
             if self.total_episodes % 10 == 0:
                 self.save_model()
             
-            print(f"✅ [RL] Feedback processed. Reward: {reward:.2f}, Epsilon: {self.epsilon:.3f}")
-            print(f"   Total episodes: {self.total_episodes}, Avg reward: {self.total_rewards/max(self.total_episodes, 1):.2f}")
+            logger.info("✅ [RL] Feedback processed. Reward: %.2f, Epsilon: %.3f, Total episodes: %s, Avg reward: %.2f",
+                        reward, self.epsilon, self.total_episodes, self.total_rewards / max(self.total_episodes, 1))
             
         except Exception as e:
-            print(f"❌ [RL] Error processing feedback: {e}")
+            logger.error("❌ [RL] Error processing feedback: %s", e, exc_info=True)
     
     def save_feedback_data(self, analysis_data: Dict, user_feedback: Dict, reward: float):
         """Save feedback data for future model training"""
@@ -321,7 +324,7 @@ class ReinforcementLearningAgent:
                 f.write(json.dumps(feedback_entry) + '\n')
             
         except Exception as e:
-            print(f"⚠️ [RL] Could not save feedback data: {e}")
+            logger.warning("⚠️ [RL] Could not save feedback data: %s", e)
     
     def get_statistics(self) -> Dict:
         """Get learning statistics"""
@@ -355,10 +358,10 @@ class ReinforcementLearningAgent:
             with open(self.model_path, 'wb') as f:
                 pickle.dump(model_data, f)
             
-            print(f"💾 [RL] Model saved to {self.model_path}")
+            logger.info("💾 [RL] Model saved to %s", self.model_path)
             
         except Exception as e:
-            print(f"⚠️ [RL] Could not save model: {e}")
+            logger.warning("⚠️ [RL] Could not save model: %s", e)
     
     def load_model(self):
         """Load Q-table and statistics"""
@@ -373,11 +376,12 @@ class ReinforcementLearningAgent:
                 self.epsilon = model_data.get('epsilon', 1.0)
                 self.accuracy_history = model_data.get('accuracy_history', [])
                 
-                print(f"📂 [RL] Model loaded from {self.model_path}")
-                print(f"   Episodes: {self.total_episodes}, Accuracy: {sum(self.accuracy_history)/max(len(self.accuracy_history), 1)*100:.1f}%")
+                logger.info("📂 [RL] Model loaded from %s (episodes: %s, accuracy: %.1f%%)",
+                            self.model_path, self.total_episodes,
+                            sum(self.accuracy_history) / max(len(self.accuracy_history), 1) * 100)
             
         except Exception as e:
-            print(f"⚠️ [RL] Could not load model: {e}")
+            logger.warning("⚠️ [RL] Could not load model: %s", e)
     
     def suggest_confidence_adjustment(self, analysis_data: Dict) -> Dict:
         """
@@ -427,7 +431,7 @@ class ReinforcementLearningAgent:
             }
             
         except Exception as e:
-            print(f"❌ [RL] Error generating suggestion: {e}")
+            logger.error("❌ [RL] Error generating suggestion: %s", e, exc_info=True)
             return {
                 'original_percentage': analysis_data.get('misinformation_percentage', 0),
                 'suggested_percentage': analysis_data.get('misinformation_percentage', 0),
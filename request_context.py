@@ -0,0 +1,415 @@
+"""
+⏱️ REQUEST CONTEXT MODULE
+Per-request deadline and cooperative cancellation
+
+Every analysis request gets a time budget: the X-Request-Deadline header
+or the 'deadline' body field (seconds), else REQUEST_DEADLINE_DEFAULT.
+The RequestContext is made current for the request thread (contextvars),
+so any code on that thread can see it without extra parameters:
+
+- Phases call check() before starting; once the budget is spent (or the
+  client has gone away) it raises DeadlineExceeded and the phase falls
+  back to its default result
+- The shared HTTP client caps every outbound timeout at the remaining
+  budget and refuses to start requests after the deadline
+- Retry loops use sleep() so a backoff never outlives the request
+- Finished stages are published with report() (partial job results)
+- Under load, admission control marks the context degraded and the
+  optional expensive stages (check_optional()) are skipped
+- The analysis mode (fast/standard/deep) limits which components run;
+  check_component() refuses the others and records what ran
+- A refinement of a progressive analysis carries the first-pass results
+  (prior_results); reuse_or_run() returns them instead of recomputing
+
+Work handed to thread pools keeps the context via submit().
+
+Author: AI Misinformation Detector
+"""
+
+import contextvars
+import os
+import select
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration
+REQUEST_DEADLINE_DEFAULT = float(os.getenv('REQUEST_DEADLINE_DEFAULT', '90'))  # Seconds
+REQUEST_DEADLINE_MAX = float(os.getenv('REQUEST_DEADLINE_MAX', '300'))  # Upper bound for client-supplied budgets
+DEADLINE_HEADER = 'X-Request-Deadline'
+MIN_CALL_TIMEOUT = 0.5  # Seconds; shortest timeout handed to an outbound call
+DISCONNECT_POLL_INTERVAL = 1.0  # Seconds between client connection checks
+
+Timeout = Union[None, float, Tuple[float, float]]
+
+
+class DeadlineExceeded(Exception):
+    """The request ran out of time or was cancelled"""
+
+
+class ComponentDisabled(DeadlineExceeded):
+    """The stage is not part of the request's analysis mode (falls back like a deadline skip)"""
+
+
+class RequestContext:
+    """
+    Deadline and cancellation state of one request
+    """
+
+    def __init__(self, budget: float = REQUEST_DEADLINE_DEFAULT):
+        self.budget = budget
+        self.started = time.monotonic()
+        self.deadline = self.started + budget
+        self.cancel_reason = ''
+        self.skipped: List[str] = []  # Stages not (fully) run
+        self.degraded = False  # Skip optional expensive stages (set by admission control)
+        self.mode = 'deep'
+        self.components: Optional[FrozenSet[str]] = None  # Components the mode allows (None = all)
+        self.ran: List[str] = []  # Components started
+        self.not_run: List[str] = []  # Components left out by the mode
+        self.prior_results: Dict[str, Any] = {}  # Results of an earlier pass, by result key
+        self.reused: List[str] = []  # Result keys taken from prior_results
+        self.completed: Dict[str, Any] = {}  # Results reuse_or_run() returned, by result key
+        self._listeners: List[Callable[[str, Any], None]] = []
+
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+
+    def remaining(self) -> float:
+        """Seconds left (0 once cancelled or past the deadline)"""
+        if self._cancelled.is_set():
+            return 0.0
+        return max(0.0, self.deadline - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def expired(self) -> bool:
+        """True once the deadline has passed or the request was cancelled"""
+        return self.remaining() <= 0
+
+    def cancel(self, reason: str = 'cancelled'):
+        """Stop further work (checked cooperatively)"""
+        if not self._cancelled.is_set():
+            self.cancel_reason = reason
+            self._cancelled.set()
+            logger.info("🛑 [DEADLINE] Request cancelled: %s", reason)
+
+    def skip(self, stage: str):
+        """Record a stage that was skipped or cut short"""
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+
+    def check(self, stage: str):
+        """
+        Raise DeadlineExceeded (and record the stage) if time is up
+
+        Call before starting a stage of work.
+        """
+        if self.expired():
+            self.skip(stage)
+            reason = self.cancel_reason or f"deadline of {self.budget:.0f}s reached"
+            raise DeadlineExceeded(f"{stage} skipped: {reason}")
+
+    def check_optional(self, stage: str):
+        """
+        check() for optional expensive stages, which are also skipped in degraded mode
+        """
+        if self.degraded:
+            self.skip(stage)
+            raise DeadlineExceeded(f"{stage} skipped: server under load (degraded mode)")
+        self.check(stage)
+
+    def set_mode(self, mode: str, components: Optional[FrozenSet[str]]):
+        """Limit the request to the components of an analysis mode"""
+        self.mode = mode
+        self.components = components
+
+    def allows(self, component: str) -> bool:
+        """True if the mode includes the component (nothing is recorded)"""
+        return self.components is None or component in self.components
+
+    def use(self, component: str) -> bool:
+        """
+        True if the mode allows the component; records it as run or not run
+        """
+        allowed = self.allows(component)
+        names = self.ran if allowed else self.not_run
+        if component not in names:
+            names.append(component)
+        return allowed
+
+    def check_component(self, component: str, stage: str, optional: bool = False):
+        """
+        check() (or check_optional()) for a stage that belongs to a component
+
+        Raises ComponentDisabled, without marking the result partial, if the
+        analysis mode leaves the component out.
+        """
+        if not self.allows(component):
+            self.use(component)
+            raise ComponentDisabled(f"{stage} not run in {self.mode} mode")
+        if optional:
+            self.check_optional(stage)
+        else:
+            self.check(stage)
+        self.use(component)
+
+    def reuse_or_run(self, key: str, fn: Callable, *args, **kwargs):
+        """
+        The earlier pass's result for key, else fn(*args, **kwargs)
+
+        The result is recorded in completed only once fn has returned, so a
+        phase that raised (deadline, error) leaves nothing to hand on.
+        """
+        if key in self.prior_results:
+            if key not in self.reused:
+                self.reused.append(key)
+            result = self.prior_results[key]
+        else:
+            result = fn(*args, **kwargs)
+        self.completed[key] = result
+        return result
+
+    def components_summary(self) -> Dict:
+        """Components that ran (for the response)"""
+        return {'mode': self.mode, 'ran': list(self.ran), 'not_run': list(self.not_run),
+                'reused': list(self.reused)}
+
+    def cap_timeout(self, timeout: Timeout, default: float) -> Timeout:
+        """
+        Limit a requests-style timeout (seconds or (connect, read)) to the remaining budget
+        """
+        remaining = max(MIN_CALL_TIMEOUT, self.remaining())
+        if timeout is None:
+            return min(default, remaining)
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) if t is not None else remaining for t in timeout)
+        return min(timeout, remaining)
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Sleep unless that would outlive the request
+
+        Returns:
+            True if the full sleep fit in the budget, False otherwise (no sleep)
+        """
+        if seconds >= self.remaining():
+            return False
+        return not self._cancelled.wait(seconds)
+
+    def add_listener(self, listener: Callable[[str, Any], None]):
+        """Register listener(stage, result) for progress reports"""
+        self._listeners.append(listener)
+
+    def report(self, stage: str, result: Any):
+        """Publish the result of a finished stage (partial results for job polling)"""
+        for listener in self._listeners:
+            try:
+                listener(stage, result)
+            except Exception as e:
+                logger.warning("⚠️ [DEADLINE] Progress listener failed: %s", e)
+
+    def finish(self):
+        """Mark the request done (stops the disconnect watcher)"""
+        self._finished.set()
+
+    def summary(self) -> Dict:
+        """Budget usage for the response"""
+        return {
+            'budget_seconds': round(self.budget, 1),
+            'elapsed_seconds': round(self.elapsed(), 2),
+            'partial': bool(self.skipped),
+            'degraded': self.degraded,
+            'skipped': list(self.skipped),
+            'cancelled': self.cancelled,
+            'cancel_reason': self.cancel_reason or None
+        }
+
+
+# ========================================
+# CURRENT CONTEXT
+# ========================================
+
+_current_context: contextvars.ContextVar = contextvars.ContextVar('linkscout_request_context', default=None)
+
+
+def current_context() -> Optional[RequestContext]:
+    """Context of the request running on this thread, if any"""
+    return _current_context.get()
+
+
+def activate(context: RequestContext) -> contextvars.Token:
+    """Make a context current; pass the token to deactivate()"""
+    return _current_context.set(context)
+
+
+def deactivate(token: contextvars.Token):
+    _current_context.reset(token)
+
+
+def check_deadline(stage: str):
+    """check() on the current context (no-op outside a request)"""
+    context = current_context()
+    if context is not None:
+        context.check(stage)
+
+
+def deadline_expired() -> bool:
+    """True if the current request is out of time"""
+    context = current_context()
+    return context is not None and context.expired()
+
+
+def degraded_mode() -> bool:
+    """True if the current request runs degraded (optional stages skipped)"""
+    context = _current_context.get()
+    return context is not None and context.degraded
+
+
+def component_enabled(component: str) -> bool:
+    """True if the current request's mode runs the component (always outside a request)"""
+    context = _current_context.get()
+    return context is None or context.use(component)
+
+
+def remaining_time(default: float) -> float:
+    """Remaining budget of the current request, at most default"""
+    context = current_context()
+    if context is None:
+        return default
+    return min(default, max(MIN_CALL_TIMEOUT, context.remaining()))
+
+
+def deadline_sleep(seconds: float) -> bool:
+    """Sleep within the current request's budget (see RequestContext.sleep)"""
+    context = current_context()
+    if context is None:
+        time.sleep(seconds)
+        return True
+    return context.sleep(seconds)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """executor.submit() that runs fn under the caller's request context"""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+# ========================================
+# REQUEST HELPERS
+# ========================================
+
+def request_budget(headers: Mapping, body: Optional[Dict] = None, default: float = REQUEST_DEADLINE_DEFAULT) -> float:
+    """
+    Time budget for a request: header, then body field, then default
+
+    Values are seconds, clamped to (0, REQUEST_DEADLINE_MAX].
+    """
+    value = headers.get(DEADLINE_HEADER) if headers is not None else None
+    if value is None and isinstance(body, dict):
+        value = body.get('deadline')
+    try:
+        budget = float(value)
+    except (TypeError, ValueError):
+        return default
+    if not budget > 0:  # Also rejects NaN
+        return default
+    return min(budget, REQUEST_DEADLINE_MAX)
+
+
+def _client_socket(environ: Mapping):
+    """Client socket from a WSGI environ (Werkzeug dev server or Gunicorn)"""
+    return environ.get('werkzeug.socket') or environ.get('gunicorn.socket')
+
+
+def _client_disconnected(sock) -> bool:
+    readable, _, _ = select.select([sock], [], [], 0)
+    if not readable:
+        return False
+    # Readable with no data means the peer closed the connection
+    return sock.recv(1, socket.MSG_PEEK) == b''
+
+
+def watch_disconnect(context: RequestContext, environ: Mapping,
+                     interval: float = DISCONNECT_POLL_INTERVAL) -> bool:
+    """
+    Cancel the context when the client closes its connection
+
+    Polls the client socket from a daemon thread until the request
+    finishes. Returns False if the server does not expose the socket.
+    """
+    sock = _client_socket(environ)
+    if sock is None:
+        return False
+
+    def run():
+        while not context._finished.wait(interval):
+            try:
+                if _client_disconnected(sock):
+                    context.cancel('client disconnected')
+                    return
+            except (OSError, ValueError):
+                return  # Socket closed or unsupported (e.g. TLS)
+
+    threading.Thread(target=run, name='disconnect-watcher', daemon=True).start()
+    return True
+
+
+# Test function
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("\n" + "=" * 60)
+    print("REQUEST CONTEXT TEST")
+    print("=" * 60)
+
+    print(f"Budget from header: {request_budget({DEADLINE_HEADER: '20'})}")
+    print(f"Budget from body: {request_budget({}, {'deadline': 1000})} (clamped)")
+    print(f"Default budget: {request_budget({}, {})}")
+
+    context = RequestContext(budget=0.3)
+    token = activate(context)
+    print(f"Capped timeout: {context.cap_timeout((3.05, 45), 10)}")
+    print(f"Backoff of 1s allowed: {deadline_sleep(1.0)}")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        print(f"Context in worker: {submit(executor, current_context).result() is context}")
+    time.sleep(0.35)
+    try:
+        check_deadline('Phase 2.3')
+    except DeadlineExceeded as e:
+        print(f"After deadline: {e}")
+    deactivate(token)
+    print(f"Summary: {context.summary()}")
+
+    context = RequestContext()
+    context.set_mode('fast', frozenset({'linguistic'}))
+    context.check_component('linguistic', 'Phase 1.1')
+    try:
+        context.check_component('images', 'Image analysis', optional=True)
+    except ComponentDisabled as e:
+        print(f"Mode skip: {e} (partial: {context.summary()['partial']})")
+    context.prior_results = {'linguistic_fingerprint': {'fingerprint_score': 12}}
+    context.reuse_or_run('linguistic_fingerprint', lambda: 1 / 0)
+    try:
+        context.reuse_or_run('source_credibility', lambda: 1 / 0)
+    except ZeroDivisionError:
+        pass
+    print(f"Components: {context.components_summary()}, completed: {sorted(context.completed)}")
+
+    server_side, client_side = socket.socketpair()
+    context = RequestContext()
+    watch_disconnect(context, {'werkzeug.socket': server_side}, interval=0.05)
+    client_side.close()
+    time.sleep(0.2)
+    print(f"Cancelled after disconnect: {context.cancelled} ({context.cancel_reason})")
+    context.finish()
+    print("=" * 60)
@@ -0,0 +1,122 @@
+"""
+🛫 SINGLE-FLIGHT MODULE
+Coalesce concurrent identical calls into one
+
+When a story goes viral, many users ask for the same analysis within
+seconds. SingleFlight.do(key, fn) runs fn() for the first caller of a key
+(the leader); callers that arrive with the same key while it runs wait for
+the leader and receive its result (or its exception) instead of repeating
+the work. Nothing is kept once the call finishes: this is not a cache, a
+later call with the same key runs again.
+
+Author: AI Misinformation Detector
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Call:
+    """One running call that followers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Per-key in-flight call registry
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.stats = {'leaders': 0, 'shared': 0, 'timeouts': 0}
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        Run fn() once for all concurrent callers of key
+
+        Returns:
+            (result, shared): shared is True if another caller computed it
+
+        Raises:
+            TimeoutError: a follower waited longer than `timeout`
+            Whatever fn() raised, for the leader and all its followers
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats['leaders'] += 1
+            else:
+                call.followers += 1
+                self.stats['shared'] += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                with self._lock:
+                    self.stats['timeouts'] += 1
+                raise TimeoutError(f"Timed out after {timeout:.0f}s waiting for an identical request")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self.stats,
+                'in_flight': len(self._calls),
+                'waiting': sum(call.followers for call in self._calls.values()),
+            }
+
+
+# Test function
+if __name__ == "__main__":
+    import time
+
+    print("\n" + "=" * 60)
+    print("SINGLE-FLIGHT TEST")
+    print("=" * 60)
+
+    flights = SingleFlight()
+    runs = []
+    outcomes = []
+
+    def analyze():
+        runs.append(1)
+        time.sleep(0.2)
+        return {'verdict': 'APPEARS CREDIBLE'}
+
+    def client(i):
+        result, shared = flights.do('article-hash', analyze, timeout=5)
+        outcomes.append(shared)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    print(f"While running: {flights.get_stats()}")
+    for t in threads:
+        t.join()
+
+    print(f"8 concurrent requests -> {len(runs)} run(s), {sum(outcomes)} shared")
+    flights.do('article-hash', analyze)
+    print(f"Later request runs again: {len(runs)} runs")
+    print(f"Stats: {flights.get_stats()}")
+    print("=" * 60)
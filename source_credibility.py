@@ -16,6 +16,11 @@ from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
+from source_index import get_source_index
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class SourceCredibilityResult:
@@ -35,147 +40,18 @@ class SourceCredibilityDatabase:
     Maintains database of source credibility scores
     """
     
-    # Tier 1: HIGHLY CREDIBLE (90-100) - Peer-reviewed, Official Organizations
-    TIER1_SOURCES = {
-        # Peer-reviewed journals
-        'nature.com': {'score': 98, 'category': 'peer-reviewed', 'name': 'Nature'},
-        'science.org': {'score': 98, 'category': 'peer-reviewed', 'name': 'Science'},
-        'thelancet.com': {'score': 97, 'category': 'peer-reviewed', 'name': 'The Lancet'},
-        'nejm.org': {'score': 97, 'category': 'peer-reviewed', 'name': 'New England Journal of Medicine'},
-        'bmj.com': {'score': 96, 'category': 'peer-reviewed', 'name': 'BMJ'},
-        'pnas.org': {'score': 96, 'category': 'peer-reviewed', 'name': 'PNAS'},
-        'cell.com': {'score': 96, 'category': 'peer-reviewed', 'name': 'Cell'},
-        'jamanetwork.com': {'score': 96, 'category': 'peer-reviewed', 'name': 'JAMA'},
-        
-        # Official organizations - Health
-        'who.int': {'score': 97, 'category': 'official-org', 'name': 'World Health Organization'},
-        'cdc.gov': {'score': 97, 'category': 'official-org', 'name': 'CDC'},
-        'nih.gov': {'score': 97, 'category': 'official-org', 'name': 'National Institutes of Health'},
-        'fda.gov': {'score': 96, 'category': 'official-org', 'name': 'FDA'},
-        
-        # Official organizations - Science
-        'nasa.gov': {'score': 98, 'category': 'official-org', 'name': 'NASA'},
-        'noaa.gov': {'score': 97, 'category': 'official-org', 'name': 'NOAA'},
-        'usgs.gov': {'score': 96, 'category': 'official-org', 'name': 'USGS'},
-        'ipcc.ch': {'score': 96, 'category': 'official-org', 'name': 'IPCC'},
-        
-        # Fact-checkers
-        'snopes.com': {'score': 95, 'category': 'fact-checker', 'name': 'Snopes'},
-        'factcheck.org': {'score': 95, 'category': 'fact-checker', 'name': 'FactCheck.org'},
-        'politifact.com': {'score': 94, 'category': 'fact-checker', 'name': 'PolitiFact'},
-        'fullfact.org': {'score': 94, 'category': 'fact-checker', 'name': 'Full Fact'},
-        
-        # Academic institutions
-        'harvard.edu': {'score': 95, 'category': 'academic', 'name': 'Harvard University'},
-        'mit.edu': {'score': 95, 'category': 'academic', 'name': 'MIT'},
-        'stanford.edu': {'score': 95, 'category': 'academic', 'name': 'Stanford University'},
-        'ox.ac.uk': {'score': 95, 'category': 'academic', 'name': 'Oxford University'},
-        'cam.ac.uk': {'score': 95, 'category': 'academic', 'name': 'Cambridge University'},
-    }
-    
-    # Tier 2: REPUTABLE (70-89) - Major News Agencies
-    TIER2_SOURCES = {
-        # Wire services
-        'reuters.com': {'score': 85, 'category': 'wire-service', 'name': 'Reuters'},
-        'apnews.com': {'score': 85, 'category': 'wire-service', 'name': 'Associated Press'},
-        'afp.com': {'score': 83, 'category': 'wire-service', 'name': 'AFP'},
-        
-        # International news
-        'bbc.com': {'score': 83, 'category': 'reputable-news', 'name': 'BBC'},
-        'bbc.co.uk': {'score': 83, 'category': 'reputable-news', 'name': 'BBC'},
-        'theguardian.com': {'score': 80, 'category': 'reputable-news', 'name': 'The Guardian'},
-        'economist.com': {'score': 82, 'category': 'reputable-news', 'name': 'The Economist'},
-        'ft.com': {'score': 82, 'category': 'reputable-news', 'name': 'Financial Times'},
-        
-        # US news - quality newspapers
-        'nytimes.com': {'score': 80, 'category': 'major-newspaper', 'name': 'New York Times'},
-        'washingtonpost.com': {'score': 80, 'category': 'major-newspaper', 'name': 'Washington Post'},
-        'wsj.com': {'score': 81, 'category': 'major-newspaper', 'name': 'Wall Street Journal'},
-        'latimes.com': {'score': 78, 'category': 'major-newspaper', 'name': 'LA Times'},
-        
-        # Public broadcasting
-        'pbs.org': {'score': 82, 'category': 'public-broadcasting', 'name': 'PBS'},
-        'npr.org': {'score': 82, 'category': 'public-broadcasting', 'name': 'NPR'},
-        
-        # Indian reputable news
-        'ndtv.com': {'score': 78, 'category': 'reputable-news', 'name': 'NDTV'},
-        'thehindu.com': {'score': 78, 'category': 'reputable-news', 'name': 'The Hindu'},
-        'indianexpress.com': {'score': 76, 'category': 'reputable-news', 'name': 'Indian Express'},
-        'hindustantimes.com': {'score': 74, 'category': 'reputable-news', 'name': 'Hindustan Times'},
-        
-        # Government
-        'gov.uk': {'score': 85, 'category': 'government', 'name': 'UK Government'},
-        'usa.gov': {'score': 85, 'category': 'government', 'name': 'US Government'},
-        'europa.eu': {'score': 84, 'category': 'government', 'name': 'European Union'},
-        
-        # International organizations
-        'un.org': {'score': 88, 'category': 'international-org', 'name': 'United Nations'},
-        'worldbank.org': {'score': 85, 'category': 'international-org', 'name': 'World Bank'},
-        'imf.org': {'score': 85, 'category': 'international-org', 'name': 'IMF'},
-    }
-    
-    # Tier 3: MIXED (50-69) - Mainstream with Known Bias
-    TIER3_SOURCES = {
-        # Cable news
-        'cnn.com': {'score': 65, 'category': 'cable-news', 'name': 'CNN', 'bias': 'left-leaning'},
-        'foxnews.com': {'score': 60, 'category': 'cable-news', 'name': 'Fox News', 'bias': 'right-leaning'},
-        'msnbc.com': {'score': 62, 'category': 'cable-news', 'name': 'MSNBC', 'bias': 'left-leaning'},
-        'cbsnews.com': {'score': 68, 'category': 'cable-news', 'name': 'CBS News'},
-        'abcnews.go.com': {'score': 68, 'category': 'cable-news', 'name': 'ABC News'},
-        'nbcnews.com': {'score': 68, 'category': 'cable-news', 'name': 'NBC News'},
-        
-        # Tabloids & sensational
-        'dailymail.co.uk': {'score': 55, 'category': 'tabloid', 'name': 'Daily Mail'},
-        'nypost.com': {'score': 58, 'category': 'tabloid', 'name': 'New York Post'},
-        'thesun.co.uk': {'score': 50, 'category': 'tabloid', 'name': 'The Sun'},
-        
-        # Opinion-heavy
-        'huffpost.com': {'score': 60, 'category': 'opinion-heavy', 'name': 'HuffPost', 'bias': 'left-leaning'},
-        'slate.com': {'score': 62, 'category': 'opinion-heavy', 'name': 'Slate'},
-        'vox.com': {'score': 63, 'category': 'opinion-heavy', 'name': 'Vox'},
-        
-        # Social media news
-        'buzzfeed.com': {'score': 58, 'category': 'social-media-news', 'name': 'BuzzFeed'},
-        'buzzfeednews.com': {'score': 65, 'category': 'social-media-news', 'name': 'BuzzFeed News'},
-    }
-    
-    # Tier 4: UNRELIABLE (0-49) - Known Misinformation Sites
-    TIER4_SOURCES = {
-        # Known fake news / conspiracy
-        'infowars.com': {'score': 10, 'category': 'conspiracy', 'name': 'InfoWars'},
-        'naturalnews.com': {'score': 15, 'category': 'pseudoscience', 'name': 'Natural News'},
-        'beforeitsnews.com': {'score': 20, 'category': 'fake-news', 'name': 'Before Its News'},
-        'yournewswire.com': {'score': 10, 'category': 'fake-news', 'name': 'YourNewsWire'},
-        'newspunch.com': {'score': 10, 'category': 'fake-news', 'name': 'NewsPunch'},
-        'worldnewsdailyreport.com': {'score': 5, 'category': 'satire-unmarked', 'name': 'World News Daily Report'},
-        'nationalreport.net': {'score': 5, 'category': 'satire-unmarked', 'name': 'National Report'},
-        'empireherald.com': {'score': 5, 'category': 'fake-news', 'name': 'Empire Herald'},
-        'dcgazette.com': {'score': 10, 'category': 'fake-news', 'name': 'DC Gazette'},
-        'usatoday.com.co': {'score': 5, 'category': 'impersonation', 'name': 'Fake USA Today'},
-        
-        # Extreme bias / propaganda
-        'breitbart.com': {'score': 35, 'category': 'extreme-bias', 'name': 'Breitbart', 'bias': 'far-right'},
-        'dailystormer.com': {'score': 5, 'category': 'hate-site', 'name': 'Daily Stormer'},
-        'rt.com': {'score': 40, 'category': 'state-propaganda', 'name': 'RT (Russia Today)'},
-        'sputniknews.com': {'score': 40, 'category': 'state-propaganda', 'name': 'Sputnik News'},
-        'presstv.ir': {'score': 35, 'category': 'state-propaganda', 'name': 'Press TV'},
-        
-        # Clickbait / misleading
-        'collective-evolution.com': {'score': 25, 'category': 'pseudoscience', 'name': 'Collective Evolution'},
-        'theepochtimes.com': {'score': 30, 'category': 'extreme-bias', 'name': 'The Epoch Times'},
-        'oann.com': {'score': 35, 'category': 'extreme-bias', 'name': 'OAN'},
-    }
+    # Tiered sources (domain -> score/category/name) are loaded from
+    # data/source_credibility.json into the shared source domain index:
+    # - tier1: HIGHLY CREDIBLE (90-100) - Peer-reviewed, Official Organizations
+    # - tier2: REPUTABLE (70-89) - Major News Agencies
+    # - tier3: MIXED (50-69) - Mainstream with Known Bias
+    # - tier4: UNRELIABLE (0-49) - Known Misinformation Sites
     
     def __init__(self):
         """Initialize the credibility database"""
-        # Combine all tiers
-        self.database = {}
-        self.database.update(self.TIER1_SOURCES)
-        self.database.update(self.TIER2_SOURCES)
-        self.database.update(self.TIER3_SOURCES)
-        self.database.update(self.TIER4_SOURCES)
+        index = get_source_index()
         
-        print(f"🏆 [CREDIBILITY] Database initialized with {len(self.database)} sources")
+        logger.info("🏆 [CREDIBILITY] Database initialized with %s sources", index.tier_count)
     
     def analyze_sources(self, text: str, sources: List[str] | None = None) -> SourceCredibilityResult:
         """
@@ -195,7 +71,7 @@ class SourceCredibilityDatabase:
         if len(sources) == 0:
             return self._create_empty_result()
         
-        print(f"🏆 [CREDIBILITY] Analyzing {len(sources)} sources...")
+        logger.debug("🏆 [CREDIBILITY] Analyzing %s sources...", len(sources))
         
         # Analyze each source
         source_scores = []
@@ -243,7 +119,7 @@ class SourceCredibilityDatabase:
         # Generate explanation
         explanation = self._generate_explanation(avg_credibility, tier_breakdown, red_flags, len(sources))
         
-        print(f"✅ [CREDIBILITY] Average score: {avg_credibility:.1f}/100 ({verdict})")
+        logger.debug("✅ [CREDIBILITY] Average score: %.1f/100 (%s)", avg_credibility, verdict)
         
         return SourceCredibilityResult(
             average_credibility=round(avg_credibility, 2),
@@ -257,20 +133,18 @@ class SourceCredibilityDatabase:
         )
     
     def get_source_credibility(self, domain: str) -> Dict:
-        """Get credibility info for a single domain"""
-        # Clean domain
-        domain = domain.lower().strip()
-        domain = re.sub(r'^www\.', '', domain)
+        """Get credibility info for a single domain (subdomains inherit their parent's entry)"""
+        registrable, record, _ = get_source_index().lookup(domain)
         
         # Check database
-        if domain in self.database:
-            return self.database[domain]
+        if record is not None:
+            return record.info
         
         # Unknown source - return default
         return {
             'score': 50,  # Neutral
             'category': 'unknown',
-            'name': domain
+            'name': registrable
         }
     
     def _extract_sources_from_text(self, text: str) -> List[str]:
@@ -0,0 +1,271 @@
+"""
+🌐 SOURCE DOMAIN INDEX
+Shared suffix trie behind every source credibility lookup
+
+Both credibility databases (SourceCredibilityDatabase tiers and the
+known_false_claims source overrides) are loaded from the dataset store
+into ONE trie keyed by reversed domain labels:
+
+    com -> bbc            (bbc.com)
+    uk  -> co -> bbc      (bbc.co.uk)
+
+A lookup walks the labels of the queried host from the TLD inwards, so it
+costs O(number of labels) and a subdomain inherits its parent's entry
+(edition.cnn.com -> cnn.com) while unrelated names sharing a substring
+never match (theart.com is not rt.com). Hosts are normalized first
+(scheme, port, path, "www." removed) and reduced to their registrable
+domain (eTLD+1) using a public-suffix list, which is how unknown sources
+are reported (news.example.co.uk -> example.co.uk).
+
+Author: AI Misinformation Detector
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from dataset_store import DatasetSnapshot, get_dataset_store, get_datasets
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Multi-label public suffixes (single-label TLDs are always public suffixes).
+# Compact subset of the Public Suffix List covering the regions we analyze.
+PUBLIC_SUFFIXES = frozenset({
+    # United Kingdom
+    'co.uk', 'ac.uk', 'gov.uk', 'org.uk', 'ltd.uk', 'plc.uk', 'me.uk', 'net.uk', 'nhs.uk', 'police.uk', 'sch.uk',
+    # India
+    'co.in', 'ac.in', 'gov.in', 'nic.in', 'org.in', 'net.in', 'res.in', 'edu.in', 'firm.in', 'gen.in', 'ind.in',
+    # Australia / New Zealand
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au', 'asn.au', 'id.au',
+    'co.nz', 'ac.nz', 'govt.nz', 'org.nz', 'net.nz',
+    # Asia
+    'co.jp', 'ac.jp', 'go.jp', 'or.jp', 'ne.jp', 'gr.jp', 'ed.jp',
+    'co.kr', 'ac.kr', 'go.kr', 'or.kr', 're.kr',
+    'com.cn', 'net.cn', 'org.cn', 'gov.cn', 'edu.cn', 'ac.cn',
+    'com.hk', 'org.hk', 'gov.hk', 'edu.hk', 'net.hk',
+    'com.sg', 'edu.sg', 'gov.sg', 'org.sg', 'net.sg',
+    'com.my', 'gov.my', 'edu.my', 'org.my',
+    'com.pk', 'gov.pk', 'edu.pk', 'org.pk',
+    'com.bd', 'gov.bd', 'edu.bd',
+    'co.id', 'go.id', 'ac.id', 'or.id',
+    'com.ph', 'gov.ph', 'edu.ph',
+    'co.th', 'ac.th', 'go.th', 'or.th',
+    'com.tw', 'gov.tw', 'edu.tw', 'org.tw',
+    'com.vn', 'gov.vn', 'edu.vn',
+    # Middle East / Africa
+    'co.il', 'ac.il', 'gov.il', 'org.il',
+    'com.sa', 'gov.sa', 'edu.sa',
+    'com.eg', 'gov.eg', 'edu.eg',
+    'com.tr', 'gov.tr', 'edu.tr', 'org.tr',
+    'co.za', 'gov.za', 'ac.za', 'org.za',
+    'com.ng', 'gov.ng', 'edu.ng',
+    'co.ke', 'go.ke', 'ac.ke', 'or.ke',
+    # Americas
+    'com.br', 'gov.br', 'edu.br', 'org.br', 'net.br',
+    'com.mx', 'gob.mx', 'edu.mx', 'org.mx',
+    'com.ar', 'gob.ar', 'edu.ar', 'org.ar',
+    'com.co', 'gov.co', 'edu.co', 'org.co', 'net.co',
+    'com.pe', 'gob.pe', 'edu.pe',
+    'gc.ca', 'qc.ca', 'on.ca', 'bc.ca',
+    # Europe
+    'co.at', 'or.at', 'gv.at', 'ac.at',
+    'com.pl', 'gov.pl', 'edu.pl', 'org.pl',
+    'com.ua', 'gov.ua', 'edu.ua',
+    'com.ru', 'gov.ru', 'edu.ru',
+    'gouv.fr', 'com.es', 'gob.es', 'edu.es', 'com.gr', 'gov.gr', 'edu.gr',
+    'com.pt', 'gov.pt', 'edu.pt', 'com.cy', 'gov.cy', 'co.it', 'gov.it',
+    # Shared hosting platforms (registrable per user)
+    'blogspot.com', 'github.io', 'herokuapp.com', 'netlify.app'
+})
+
+
+def normalize_host(source: str) -> str:
+    """
+    Reduce a URL or domain to a bare lower-case host name
+
+    'https://WWW.BBC.co.uk:443/news' -> 'bbc.co.uk'
+    """
+    host = source.strip().lower()
+    if not host:
+        return ''
+    if '://' not in host:
+        host = 'https://' + host
+    try:
+        host = urlparse(host).hostname or ''
+    except ValueError:
+        return ''
+    host = host.rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+def registrable_domain(host: str) -> str:
+    """
+    Registrable domain (eTLD+1) of a normalized host
+
+    'edition.cnn.com' -> 'cnn.com', 'news.bbc.co.uk' -> 'bbc.co.uk',
+    'usatoday.com.co' -> 'usatoday.com.co'. A bare public suffix returns ''.
+    """
+    labels = host.split('.') if host else []
+    # Longest public suffix wins
+    for i in range(len(labels)):
+        suffix = '.'.join(labels[i:])
+        if suffix in PUBLIC_SUFFIXES or i == len(labels) - 1:
+            if i == 0:
+                return ''  # The host itself is a public suffix
+            return '.'.join(labels[i - 1:])
+    return ''
+
+
+class DomainTrie:
+    """
+    Trie over reversed domain labels with longest-suffix lookup
+    """
+
+    __slots__ = ('_root', 'size')
+
+    def __init__(self, entries: Iterable[Tuple[str, object]] = ()):
+        self._root: Dict = {}
+        self.size = 0
+        for domain, value in entries:
+            self.insert(domain, value)
+
+    def insert(self, domain: str, value):
+        """Store a value for a domain (and, implicitly, all its subdomains)"""
+        node = self._root
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        if None not in node:
+            self.size += 1
+        node[None] = value  # None key holds the node's value (labels are never None)
+
+    def matches(self, host: str) -> List[Tuple[str, object]]:
+        """
+        Stored domains that host equals or is a subdomain of
+
+        Returns:
+            [(domain, value)] from least to most specific
+        """
+        node = self._root
+        labels = host.split('.')
+        found = []
+        for depth, label in enumerate(reversed(labels), 1):
+            node = node.get(label)
+            if node is None:
+                break
+            if None in node:
+                found.append(('.'.join(labels[-depth:]), node[None]))
+        return found
+
+    def lookup(self, host: str) -> Tuple[Optional[str], object]:
+        """
+        Most specific stored domain that host equals or is a subdomain of
+
+        Returns:
+            (matched domain, value) or (None, None)
+        """
+        found = self.matches(host)
+        return found[-1] if found else (None, None)
+
+
+@dataclass(frozen=True)
+class SourceRecord:
+    """Everything known about one domain across both credibility databases"""
+    domain: str
+    info: Optional[Dict] = None  # Tier entry: score/category/name (source_credibility)
+    override: Optional[int] = None  # Score override (known_false_claims)
+
+
+class SourceIndex:
+    """
+    Single backing store for source credibility lookups
+    """
+
+    TIERS = ('tier1', 'tier2', 'tier3', 'tier4')
+
+    def __init__(self, snapshot: DatasetSnapshot):
+        records: Dict[str, Dict] = {}
+
+        # Tiers in order; a later tier overrides an earlier one (as dict.update did)
+        for tier in self.TIERS:
+            for domain, info in snapshot.tier_sources.get(tier, {}).items():
+                records.setdefault(normalize_host(domain), {})['info'] = info
+
+        # Unreliable overrides take precedence over credible ones
+        for sources in (snapshot.credible_sources, snapshot.unreliable_sources):
+            for domain, score in sources.items():
+                records.setdefault(normalize_host(domain), {})['override'] = score
+
+        self.trie = DomainTrie(
+            (domain, SourceRecord(domain, **fields)) for domain, fields in records.items() if domain
+        )
+        self.tier_count = sum(1 for fields in records.values() if 'info' in fields)
+
+    def lookup(self, source: str) -> Tuple[str, Optional[SourceRecord], Optional[SourceRecord]]:
+        """
+        Look up a URL or domain
+
+        Returns:
+            (registrable domain, most specific record with tier info,
+             most specific record with an override)
+        """
+        host = normalize_host(source)
+        if not host:
+            return '', None, None
+
+        # One walk down the trie; the most specific entry for each field wins
+        info_record = override_record = None
+        for _, record in self.trie.matches(host):
+            if record.info is not None:
+                info_record = record
+            if record.override is not None:
+                override_record = record
+
+        return registrable_domain(host) or host, info_record, override_record
+
+
+# Singleton instance
+_source_index = None
+_index_lock = threading.Lock()
+
+
+def get_source_index() -> SourceIndex:
+    """Get or create the shared source index (rebuilt on dataset reloads)"""
+    global _source_index
+    if _source_index is None:
+        with _index_lock:
+            if _source_index is None:
+                _source_index = SourceIndex(get_datasets())
+                get_dataset_store().add_listener(_on_datasets_reloaded)
+                logger.info("🌐 [SOURCES] Domain index built: %s domains", _source_index.trie.size)
+    return _source_index
+
+
+def _on_datasets_reloaded(snapshot: DatasetSnapshot):
+    """Build the index for a new dataset snapshot; returns the swap"""
+    index = SourceIndex(snapshot)
+
+    def commit():
+        global _source_index
+        _source_index = index
+
+    return commit
+
+
+# Test function
+if __name__ == "__main__":
+    index = get_source_index()
+
+    print("\n" + "=" * 60)
+    print("SOURCE DOMAIN INDEX TEST")
+    print("=" * 60)
+    for source in ['https://www.bbc.co.uk/news', 'edition.cnn.com', 'rt.com', 'theart.com',
+                   'usatoday.com.co', 'usatoday.com', 'articles.mercola.com', 'co.uk',
+                   'cs.ox.ac.uk', 'cnn.com.evil.net']:
+        domain, info, override = index.lookup(source)
+        print(f"{source:32} eTLD+1={domain or '-':18} "
+              f"tier={info.info['score'] if info else '-':<4} override={override.override if override else '-'}")
+    print("=" * 60)
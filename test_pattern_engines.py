@@ -0,0 +1,167 @@
+"""
+Pattern Engine Regression Test - no server needed
+Checks the compiled propaganda pattern engine and the false claims index
+against the straightforward per-pattern matching they replaced
+
+Run: python test_pattern_engines.py  (or pytest test_pattern_engines.py)
+"""
+
+import re
+
+from known_false_claims import (
+    FALSE_CLAIM_PATTERNS, KNOWN_FALSE_CLAIMS, check_known_false_claim, get_false_claim_index
+)
+from keyword_matcher import scan_keywords
+from propaganda_detector import PropagandaDetector
+
+# ========================================
+# REPRESENTATIVE TEXTS
+# ========================================
+
+SAMPLE_TEXTS = [
+    # Propaganda-heavy
+    "Wake up! Can you trust the media? Open your eyes and think for yourself. "
+    "Question everything, don't be fooled. Do you really believe them? Wake up, wake up!",
+    "Our great nation was built by the founding fathers on American values. Real patriots "
+    "know that freedom and democracy, liberty and justice, are un-American to question. "
+    "The country needs real Americans.",
+    "The only reason prices rose is simple: it's all because of them. It's due to greed, "
+    "simply because they can. This is nothing more than theft and nothing less than a crime.",
+    "Experts say the cure works. Studies show, research proves, scientists agree and doctors "
+    "recommend it. Scientist claims it too, and a study confirms what an expert believes.",
+    "Either you stand with us or you don't. It's freedom or tyranny. You're either with us "
+    "or against us. There is no middle ground - pick a side.",
+    "But what about the other party? What about their scandals? How about that? "
+    "What if we said the same thing? what about what about",
+    "Everyone knows it. Most people believe it and millions of people agree. Join the movement, "
+    "join the fight, don't be left behind and don't be left out.",
+    "Just folks like you and me, ordinary citizens and hard-working families with common sense.",
+    # Mixed with false claims
+    "BREAKING: Scientists PROVE that vaccines contain microchips planted by Bill Gates to "
+    "control population! 5G towers are spreading coronavirus! Government hiding truth!",
+    "COVID-19 vaccines contain microchips for tracking. Bill Gates admitted the vaccine is for "
+    "surveillance. Natural immunity is 27 times better than vaccine immunity.",
+    "Dominion voting machines were rigged to switch votes. Dead people voted by the thousands. "
+    "Mail-in ballot fraud everywhere. The election was stolen.",
+    "Chemtrails poison our children! The moon landing was fake and the earth is flat. "
+    "Climate change is a hoax; global cooling was predicted in the 1970s.",
+    "The deep state and the new world order: the Illuminati control everything. Fluoride is "
+    "used for mind control and big pharma is hiding the cure for cancer. QAnon was right.",
+    "Vaccines cause autism. The covid vaccine changes your DNA. Bleach is a cure. "
+    "Ivermectin is a cure for covid. Masks cause hypoxia. Vaccinated people shed spike proteins.",
+    # Neutral and edge cases
+    "The central bank raised interest rates by a quarter point on Wednesday, citing inflation.",
+    "Bill Gates spoke at a conference.\nLater, a microchip company reported earnings.",
+    "",
+]
+
+
+def _claim_texts():
+    """One sentence per database claim, verbatim and with its words reordered"""
+    texts = []
+    for claim_key in KNOWN_FALSE_CLAIMS:
+        texts.append(f"Reports now say that {claim_key}, according to several posts.")
+        texts.append("People keep repeating: " + " and ".join(reversed(claim_key.split())) + ".")
+    return texts
+
+
+# ========================================
+# REFERENCE IMPLEMENTATIONS
+# ========================================
+
+def reference_pattern_matches(detector: PropagandaDetector, text: str) -> dict:
+    """Per-pattern re.findall, as the technique detectors used to run"""
+    technique_patterns = {
+        'doubt': detector.doubt_patterns,
+        'flag_waving': detector.patriotic_patterns,
+        'oversimplification': detector.oversimplification_patterns,
+        'appeal_to_authority': detector.authority_patterns,
+        'black_white_fallacy': detector.black_white_patterns,
+        'whataboutism': detector.whataboutism_patterns,
+        'bandwagon': detector.bandwagon_patterns,
+        'plain_folks': detector.plain_folks_patterns
+    }
+    matches = {}
+    for technique, patterns in technique_patterns.items():
+        found = []
+        for pattern in patterns:
+            found.extend(re.findall(pattern, text, re.IGNORECASE))
+        matches[technique] = found
+    return matches
+
+
+def reference_claim_matches(text: str) -> list:
+    """Linear scan over every claim, as check_known_false_claim used to run"""
+    scan = scan_keywords(text)
+    matched = []
+    for claim_key in KNOWN_FALSE_CLAIMS:
+        if scan.contains(claim_key):
+            matched.append((claim_key, 95))
+        elif all(scan.contains(word) for word in claim_key.split()):
+            matched.append((claim_key, 85))
+    return matched
+
+
+def reference_pattern_claims(text: str) -> list:
+    """re.search over every FALSE_CLAIM_PATTERNS entry"""
+    return [pattern for pattern in FALSE_CLAIM_PATTERNS
+            if re.search(pattern, text.lower(), re.IGNORECASE)]
+
+
+# ========================================
+# TESTS
+# ========================================
+
+def test_propaganda_pattern_engine_matches_findall():
+    detector = PropagandaDetector()
+    for text in SAMPLE_TEXTS + [' '.join(SAMPLE_TEXTS)]:
+        assert detector._match_patterns(text) == reference_pattern_matches(detector, text), text
+
+
+def test_false_claim_index_matches_linear_scan():
+    index = get_false_claim_index()
+    for text in SAMPLE_TEXTS + _claim_texts():
+        assert index.match_claims(text) == reference_claim_matches(text), text
+
+
+def test_false_claim_patterns_match_regex_search():
+    # Sample texts keep related terms within PATTERN_TERM_WINDOW, where the
+    # bounded co-occurrence check must agree with the original `.*` regexes
+    index = get_false_claim_index()
+    for text in SAMPLE_TEXTS:
+        assert index.match_patterns(text) == reference_pattern_claims(text), text
+
+
+def test_false_claim_patterns_window_is_bounded():
+    index = get_false_claim_index()
+    far_apart = "bill gates " + "x " * 200 + "microchip"
+    assert r'bill\s+gates.*microchip' in reference_pattern_claims(far_apart)
+    assert r'bill\s+gates.*microchip' not in index.match_patterns(far_apart)
+
+
+def test_check_known_false_claim_result_shape():
+    result = check_known_false_claim(SAMPLE_TEXTS[8])
+    assert result['has_false_claims']
+    assert result['total_matches'] == len(result['matched_claims'])
+    assert result['max_confidence'] == max(c['confidence'] for c in result['matched_claims'])
+    assert not check_known_false_claim(SAMPLE_TEXTS[14])['has_false_claims']
+
+
+if __name__ == "__main__":
+    tests = [
+        test_propaganda_pattern_engine_matches_findall,
+        test_false_claim_index_matches_linear_scan,
+        test_false_claim_patterns_match_regex_search,
+        test_false_claim_patterns_window_is_bounded,
+        test_check_known_false_claim_result_shape,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    raise SystemExit(1 if failed else 0)
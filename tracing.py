@@ -0,0 +1,455 @@
+"""
+🔭 TRACING MODULE
+Structured timing spans for analysis requests
+
+An analysis request starts a trace; the code it runs opens spans for
+phases, Groq agents, model forward passes and outbound HTTP calls. Each
+span records its duration plus attributes such as input size and cache
+hit/miss. Like the request deadline, the current trace and span live in
+contextvars, so spans nest without extra parameters and follow work into
+thread pools (request_context.submit).
+
+- Opt-in per request: 'timings': true in the body (or ?timings=1) adds a
+  'timings' block to the response
+- TRACE_EXPORT=jsonl appends every trace to TRACE_EXPORT_PATH, and
+  TRACE_EXPORT=otlp posts it to an OpenTelemetry collector
+  (TRACE_OTLP_ENDPOINT, OTLP/HTTP JSON); both may be given, comma separated.
+  Lines of the JSONL file use the same OTLP JSON encoding, so they can be
+  replayed into a collector.
+
+Outside a trace, span() is a no-op and costs one contextvar lookup.
+
+Author: AI Misinformation Detector
+"""
+
+import contextvars
+import functools
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from dataset_store import DATA_DIR
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration
+TRACE_EXPORT = {name.strip() for name in os.getenv('TRACE_EXPORT', '').lower().split(',') if name.strip()}
+TRACE_EXPORT_PATH = os.getenv('TRACE_EXPORT_PATH', os.path.join(DATA_DIR, 'traces.jsonl'))
+TRACE_OTLP_ENDPOINT = os.getenv('TRACE_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')
+TRACE_MAX_SPANS = 2000  # Per trace; further spans are counted as dropped
+TRACE_EXPORT_QUEUE = 1000  # Traces waiting for export
+SERVICE_NAME = 'linkscout'
+
+# OTLP span kinds
+_OTLP_KIND = {'request': 2, 'http': 3}  # SERVER, CLIENT; everything else INTERNAL (1)
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar('linkscout_trace', default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar('linkscout_span', default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation"""
+    name: str
+    kind: str  # request, phase, agent, model, http, internal
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int  # Wall clock (epoch ns)
+    duration_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    _started: int = 0  # perf_counter_ns at start
+    _token: Any = None
+
+    def set(self, **attributes):
+        """Add attributes (input size, cache hit/miss, status, ...)"""
+        self.attributes.update(attributes)
+
+    def end(self):
+        """End a span opened with start_span()"""
+        if self.duration_ns:
+            return
+        self.duration_ns = max(1, time.perf_counter_ns() - self._started)
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                pass  # Ended from another context
+            self._token = None
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+    def to_dict(self, origin_ns: int) -> Dict:
+        data = {
+            'name': self.name,
+            'kind': self.kind,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_ms': round((self.start_ns - origin_ns) / 1e6, 2),
+            'duration_ms': round(self.duration_ms, 2),
+            'attributes': dict(self.attributes)
+        }
+        if self.error:
+            data['error'] = self.error
+        return data
+
+    def to_otlp(self) -> Dict:
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': _OTLP_KIND.get(self.kind, 1),
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.start_ns + self.duration_ns),
+            'attributes': [_otlp_attribute('linkscout.kind', self.kind)] +
+                          [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            'status': {'code': 2, 'message': self.error} if self.error else {'code': 1}
+        }
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Stand-in returned when no trace is active"""
+
+    def set(self, **attributes):
+        pass
+
+    def end(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict:
+    if isinstance(value, bool):
+        encoded = {'boolValue': value}
+    elif isinstance(value, int):
+        encoded = {'intValue': str(value)}
+    elif isinstance(value, float):
+        encoded = {'doubleValue': value}
+    else:
+        encoded = {'stringValue': str(value)}
+    return {'key': key, 'value': encoded}
+
+
+class Trace:
+    """
+    Spans of one request
+    """
+
+    def __init__(self, name: str, **attributes):
+        self.trace_id = os.urandom(16).hex()
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._tokens = []
+        self.root = self._new_span(name, 'request', None, attributes)
+        self.spans: List[Span] = [self.root]
+
+    def _new_span(self, name: str, kind: str, parent_id: Optional[str], attributes: Dict) -> Span:
+        return Span(name=name, kind=kind, trace_id=self.trace_id, span_id=os.urandom(8).hex(),
+                    parent_id=parent_id, start_ns=time.time_ns(), attributes=dict(attributes),
+                    _started=time.perf_counter_ns())
+
+    def add_span(self, name: str, kind: str, parent: Optional[Span], attributes: Dict) -> Optional[Span]:
+        with self._lock:
+            if len(self.spans) >= TRACE_MAX_SPANS:
+                self.dropped += 1
+                return None
+            span = self._new_span(name, kind, parent.span_id if parent else self.root.span_id, attributes)
+            self.spans.append(span)
+            return span
+
+    def timings(self) -> Dict:
+        """Response 'timings' block: finished spans in start order, totals per kind"""
+        with self._lock:
+            spans = sorted((s for s in self.spans if s.duration_ns), key=lambda s: s.start_ns)
+        by_kind: Dict[str, Dict] = {}
+        for span in spans:
+            if span is self.root:
+                continue
+            entry = by_kind.setdefault(span.kind, {'count': 0, 'total_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] = round(entry['total_ms'] + span.duration_ms, 2)
+        total_ns = self.root.duration_ns or time.perf_counter_ns() - self.root._started  # Root may still be open
+        return {
+            'trace_id': self.trace_id,
+            'total_ms': round(total_ns / 1e6, 2),
+            'by_kind': by_kind,
+            'spans': [span.to_dict(self.root.start_ns) for span in spans],
+            'dropped_spans': self.dropped
+        }
+
+    def to_otlp(self) -> Dict:
+        """OTLP/JSON ExportTraceServiceRequest with this trace's spans"""
+        with self._lock:
+            spans = [span.to_otlp() for span in self.spans if span.duration_ns]
+        return {'resourceSpans': [{
+            'resource': {'attributes': [_otlp_attribute('service.name', SERVICE_NAME)]},
+            'scopeSpans': [{'scope': {'name': SERVICE_NAME}, 'spans': spans}]
+        }]}
+
+
+# ========================================
+# CURRENT TRACE
+# ========================================
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def tracing_enabled() -> bool:
+    """True if traces are exported (every request is traced)"""
+    return bool(TRACE_EXPORT)
+
+
+def start_trace(name: str, **attributes) -> Trace:
+    """Start a trace and make it (and its root span) current; end with finish_trace()"""
+    trace = Trace(name, **attributes)
+    trace._tokens = [_current_trace.set(trace), _current_span.set(trace.root)]
+    return trace
+
+
+def finish_trace(trace: Trace, export: bool = True):
+    """End the root span, restore the previous context and queue the export"""
+    trace.root.end()
+    for token in reversed(trace._tokens):
+        try:
+            token.var.reset(token)
+        except ValueError:
+            pass
+    trace._tokens = []
+    if export and TRACE_EXPORT:
+        _get_exporter().enqueue(trace)
+
+
+def start_span(name: str, kind: str = 'internal', **attributes):
+    """
+    Open a span and make it current; call .end() on the result
+
+    For blocks that cannot easily be wrapped in span(). Returns a no-op
+    span outside a trace.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP_SPAN
+    span = trace.add_span(name, kind, _current_span.get(), attributes)
+    if span is None:
+        return _NOOP_SPAN
+    span._token = _current_span.set(span)
+    return span
+
+
+class span:
+    """
+    Context manager timing a block as a child of the current span
+
+        with span('Phase 1.1 - Linguistic', 'phase', input_chars=len(content)) as s:
+            ...
+            s.set(cache='hit')
+    """
+
+    __slots__ = ('name', 'kind', 'attributes', '_span')
+
+    def __init__(self, name: str, kind: str = 'internal', **attributes):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self._span = None
+
+    def __enter__(self):
+        self._span = start_span(self.name, self.kind, **self.attributes)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None and self._span is not _NOOP_SPAN:
+            self._span.error = f"{exc_type.__name__}: {exc}"
+        self._span.end()
+        return False
+
+
+def annotate(**attributes):
+    """Add attributes to the current span (no-op outside a trace)"""
+    current = _current_span.get()
+    if current is not None and _current_trace.get() is not None:
+        current.set(**attributes)
+
+
+def traced(name: Optional[str] = None, kind: str = 'model'):
+    """
+    Decorator timing every call of a function as a span
+
+    Input size is taken from the first argument (characters of a string,
+    items of a list).
+    """
+    def decorate(fn: Callable) -> Callable:
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return fn(*args, **kwargs)
+            attributes = {}
+            if args and isinstance(args[0], str):
+                attributes['input_chars'] = len(args[0])
+            elif args and isinstance(args[0], (list, tuple)):
+                attributes['input_items'] = len(args[0])
+            with span(span_name, kind, **attributes):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def timings_requested(args: Mapping, body: Optional[Dict] = None) -> bool:
+    """True if the client asked for the 'timings' block (?timings=1 or body field)"""
+    value = args.get('timings') if args is not None else None
+    if value is None and isinstance(body, dict):
+        value = body.get('timings')
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+# ========================================
+# EXPORT
+# ========================================
+
+class TraceExporter:
+    """
+    Background export of finished traces (JSONL file and/or OTLP collector)
+
+    Requests never wait on export; when the queue is full traces are dropped.
+    """
+
+    def __init__(self, targets=TRACE_EXPORT, path: str = TRACE_EXPORT_PATH, endpoint: str = TRACE_OTLP_ENDPOINT):
+        self.targets = set(targets)
+        self.path = path
+        self.endpoint = endpoint
+        self.stats = {'exported': 0, 'dropped': 0, 'errors': 0}
+        self._queue: queue.Queue = queue.Queue(maxsize=TRACE_EXPORT_QUEUE)
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name='trace-exporter', daemon=True).start()
+        logger.info("🔭 [TRACE] Exporting traces to %s", ', '.join(self._describe()))
+
+    def _describe(self) -> List[str]:
+        return [self.path if target == 'jsonl' else self.endpoint if target == 'otlp' else f"unknown target '{target}'"
+                for target in sorted(self.targets)]
+
+    def enqueue(self, trace: Trace):
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            with self._lock:
+                self.stats['dropped'] += 1
+
+    def export(self, trace: Trace):
+        body = trace.to_otlp()
+        if 'jsonl' in self.targets:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(body, separators=(',', ':')) + '\n')
+        if 'otlp' in self.targets:
+            from http_client import get_http_session, http_timeout
+            response = get_http_session().post(self.endpoint, json=body, timeout=http_timeout(5))
+            response.raise_for_status()
+
+    def _run(self):
+        while True:
+            trace = self._queue.get()
+            try:
+                self.export(trace)
+                with self._lock:
+                    self.stats['exported'] += 1
+            except Exception as e:
+                with self._lock:
+                    self.stats['errors'] += 1
+                    first = self.stats['errors'] == 1
+                if first:
+                    logger.warning("⚠️ [TRACE] Export failed (further failures are only counted): %s", e)
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0):
+        """Wait until queued traces are exported (tests and shutdown)"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {**self.stats, 'targets': sorted(self.targets), 'queued': self._queue.qsize()}
+
+
+# Singleton instance
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def _get_exporter() -> TraceExporter:
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = TraceExporter()
+    return _exporter
+
+
+def get_trace_stats() -> Dict:
+    """Export counters (for /health)"""
+    if not TRACE_EXPORT:
+        return {'targets': []}
+    return _get_exporter().get_stats()
+
+
+# Test function
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+    from request_context import submit
+
+    print("\n" + "=" * 60)
+    print("TRACING TEST")
+    print("=" * 60)
+
+    @traced(kind='model')
+    def classify(text):
+        time.sleep(0.01)
+        return 0.5
+
+    trace = start_trace('analyze_chunks', paragraphs=2)
+    with span('Phase 1.1 - Linguistic', 'phase', input_chars=120):
+        classify('some paragraph text')
+    loop = start_span('Paragraph analysis', 'phase', paragraphs=2)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [submit(executor, classify, 'paragraph one'), submit(executor, classify, 'paragraph two')]:
+            future.result()
+    loop.end()
+    try:
+        with span('Phase 2.3 - Network Verification', 'phase') as s:
+            s.set(cache='miss')
+            raise TimeoutError('database timed out')
+    except TimeoutError:
+        pass
+    finish_trace(trace, export=False)
+
+    timings = trace.timings()
+    for entry in timings['spans']:
+        parent = next((s['name'] for s in timings['spans'] if s['span_id'] == entry['parent_id']), '-')
+        print(f"{entry['name']:<36} {entry['duration_ms']:>8.2f} ms  parent={parent} {entry['attributes']} {entry.get('error', '')}")
+    print(f"By kind: {timings['by_kind']}")
+    print(f"Outside a trace: {span('ignored').__enter__() is _NOOP_SPAN}")
+    print(f"OTLP spans: {len(trace.to_otlp()['resourceSpans'][0]['scopeSpans'][0]['spans'])}")
+    print("=" * 60)
@@ -9,14 +9,48 @@ This module cross-references claims across multiple authoritative databases:
 - arXiv (scientific preprints)
 
 It detects contradictions between sources and provides confidence scores.
+
+Claims are looked up in the local knowledge snapshot first (SQLite FTS of
+Wikipedia abstracts and Wikidata labels, see knowledge_snapshot.py). The
+live APIs are an opt-in fallback (VERIFICATION_LIVE_FALLBACK=true).
+
+All claims are verified together: every database search for every claim
+runs concurrently over one pooled session (with a per-host concurrency
+cap), follow-up lookups are batched (one Wikipedia extracts request for
+all titles, one PubMed esummary request for all IDs), and the whole run
+is bounded by a global deadline.
 """
 
+import os
 import re
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
 import time
 
+from http_client import HTTP_CONNECT_TIMEOUT, get_http_session, http_timeout
+from knowledge_snapshot import get_knowledge_snapshot
+from request_context import component_enabled, remaining_time
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Query the live APIs (for snapshot misses, and PubMed/arXiv) - opt-in
+VERIFICATION_LIVE_FALLBACK = os.getenv('VERIFICATION_LIVE_FALLBACK', 'false').lower() in ('1', 'true', 'yes')
+
+# Concurrency configuration
+NETWORK_MAX_WORKERS = 16  # Threads shared by all verification requests
+NETWORK_DEADLINE = 15  # Seconds for a whole verify_multiple_claims() run
+DEFAULT_HOST_CONCURRENCY = 4  # Requests in flight per host
+HOST_CONCURRENCY = {
+    'eutils.ncbi.nlm.nih.gov': 3,  # NCBI: 3 requests/second without an API key
+    'export.arxiv.org': 1  # arXiv asks for one request at a time
+}
+WIKIPEDIA_EXTRACTS_PER_REQUEST = 20  # exlimit maximum with exintro
+
 @dataclass
 class DatabaseResult:
     """Result from a single database query"""
@@ -25,6 +59,7 @@ class DatabaseResult:
     content: str
     confidence: float  # 0-100
     url: str
+    source: str = 'live'  # live API or local snapshot
 
 @dataclass
 class VerificationNetworkResult:
@@ -34,10 +69,11 @@ class VerificationNetworkResult:
     contradicted_claims: int
     unverified_claims: int
     verification_score: float  # 0-100
-    verdict: str  # VERIFIED, CONTRADICTED, UNVERIFIED, MIXED
+    verdict: str  # VERIFIED, CONTRADICTED, UNVERIFIED, MIXED, NO_SOURCES
     database_results: List[Dict]
     contradictions: List[str]
     confidence: float
+    sources: List[str] = field(default_factory=list)  # 'snapshot' and/or 'live'
 
 class VerificationNetwork:
     """Cross-reference claims across multiple authoritative databases"""
@@ -49,82 +85,77 @@ class VerificationNetwork:
             'pubmed': 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/',
             'arxiv': 'http://export.arxiv.org/api/query'
         }
-        print("🌐 [VERIFICATION] Multi-Database Verification Network initialized")
-    
-    def verify_claim(self, claim: str, timeout: int = 5) -> Dict:
-        """Verify a single claim across all databases"""
-        print(f"\n🔍 [VERIFICATION] Verifying: {claim[:80]}...")
         
-        results = []
+        # Shared pooled keep-alive session (all worker threads)
+        self.session = get_http_session()
+        self.headers = {'User-Agent': 'LinkScout/1.0 (misinformation verification)'}
         
-        # 1. Check Wikipedia
-        wiki_result = self._check_wikipedia(claim, timeout)
-        results.append(wiki_result)
-        
-        # 2. Check Wikidata
-        wikidata_result = self._check_wikidata(claim, timeout)
-        results.append(wikidata_result)
-        
-        # 3. Check PubMed (for scientific/medical claims)
-        if self._is_scientific_claim(claim):
-            pubmed_result = self._check_pubmed(claim, timeout)
-            results.append(pubmed_result)
-        
-        # 4. Check arXiv (for physics/math/CS claims)
-        if self._is_academic_claim(claim):
-            arxiv_result = self._check_arxiv(claim, timeout)
-            results.append(arxiv_result)
-        
-        # Analyze results for contradictions
-        contradictions = self._detect_contradictions(claim, results)
-        
-        # Calculate verification score
-        found_count = sum(1 for r in results if r.found)
-        total_count = len(results)
-        verification_score = (found_count / total_count) * 100 if total_count > 0 else 0
-        
-        # Calculate average confidence
-        avg_confidence = sum(r.confidence for r in results if r.found) / found_count if found_count > 0 else 0
-        
-        # Determine verdict
-        if found_count == 0:
-            verdict = "UNVERIFIED"
-        elif contradictions:
-            verdict = "CONTRADICTED"
-        elif found_count >= 2 and avg_confidence > 70:
-            verdict = "VERIFIED"
-        else:
-            verdict = "MIXED"
+        self.executor = ThreadPoolExecutor(max_workers=NETWORK_MAX_WORKERS, thread_name_prefix='verification')
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_limits_lock = threading.Lock()
         
-        print(f"   ✅ Verdict: {verdict} ({found_count}/{total_count} databases)")
+        # Local snapshot (None if not installed) and live API opt-in
+        self.snapshot = get_knowledge_snapshot()
+        self.live_fallback = VERIFICATION_LIVE_FALLBACK
         
-        return {
-            'claim': claim,
-            'verdict': verdict,
-            'verification_score': verification_score,
-            'databases_found': found_count,
-            'databases_checked': total_count,
-            'average_confidence': avg_confidence,
-            'results': [self._database_result_to_dict(r) for r in results],
-            'contradictions': contradictions
-        }
+        mode = ' + '.join(name for name, enabled in (('local snapshot', self.snapshot is not None),
+                                                     ('live APIs', self.live_fallback)) if enabled)
+        logger.info("🌐 [VERIFICATION] Multi-Database Verification Network initialized (%s)", mode or 'no sources enabled')
     
-    def verify_multiple_claims(self, claims: List[str]) -> VerificationNetworkResult:
-        """Verify multiple claims and aggregate results"""
-        print(f"\n🌐 [VERIFICATION] Verifying {len(claims)} claims across databases...")
-        
-        all_results = []
+    def available_sources(self) -> List[str]:
+        """Sources this request can check claims against ('snapshot', 'live')"""
+        sources = []
+        if self.snapshot is not None:
+            sources.append('snapshot')
+        if self.live_fallback and component_enabled('live_verification'):
+            sources.append('live')
+        return sources
+    
+    def verify_claim(self, claim: str, timeout: int = 5) -> Dict:
+        """Verify a single claim across all databases"""
+        results = self._verify_batch([claim], timeout, time.monotonic() + NETWORK_DEADLINE)
+        if not results:
+            return {'claim': claim, 'verdict': 'NO_SOURCES', 'sources': [], 'results': [], 'contradictions': []}
+        return results[0]
+    
+    def verify_multiple_claims(self, claims: List[str], timeout: int = 5,
+                               deadline_seconds: float = NETWORK_DEADLINE) -> VerificationNetworkResult:
+        """
+        Verify multiple claims and aggregate results
+        
+        Args:
+            claims: Claims to verify
+            timeout: Per-request timeout in seconds
+            deadline_seconds: Budget for the whole run; databases that have not
+                answered by then count as not found
+        """
+        sources = self.available_sources()
+        if not sources:
+            # Nothing to check against: say so instead of calling every claim unverified
+            logger.debug("⏭️ [VERIFICATION] No snapshot and no live fallback - %s claims not checked", len(claims))
+            return VerificationNetworkResult(
+                total_claims=len(claims),
+                verified_claims=0,
+                contradicted_claims=0,
+                unverified_claims=0,
+                verification_score=0,
+                verdict="NO_SOURCES",
+                database_results=[],
+                contradictions=[],
+                confidence=0,
+                sources=[]
+            )
+        
+        logger.debug("🌐 [VERIFICATION] Verifying %s claims across databases (%s)...", len(claims), ', '.join(sources))
+        
+        all_results = self._verify_batch(claims, timeout, time.monotonic() + deadline_seconds)
         all_contradictions = []
         
         verified = 0
         contradicted = 0
         unverified = 0
         
-        for i, claim in enumerate(claims, 1):
-            print(f"\n📋 [{i}/{len(claims)}] Processing claim...")
-            result = self.verify_claim(claim)
-            all_results.append(result)
-            
+        for result in all_results:
             if result['verdict'] == 'VERIFIED':
                 verified += 1
             elif result['verdict'] == 'CONTRADICTED':
@@ -132,9 +163,6 @@ class VerificationNetwork:
                 all_contradictions.extend(result['contradictions'])
             else:
                 unverified += 1
-            
-            # Rate limiting
-            time.sleep(0.5)
         
         # Calculate overall verification score
         total_claims = len(claims)
@@ -153,7 +181,7 @@ class VerificationNetwork:
         else:
             verdict = "MIXED"
         
-        print(f"\n✅ [VERIFICATION] Complete: {verified} verified, {contradicted} contradicted, {unverified} unverified")
+        logger.debug("✅ [VERIFICATION] Complete: %s verified, %s contradicted, %s unverified", verified, contradicted, unverified)
         
         return VerificationNetworkResult(
             total_claims=total_claims,
@@ -164,11 +192,220 @@ class VerificationNetwork:
             verdict=verdict,
             database_results=all_results,
             contradictions=all_contradictions,
-            confidence=avg_confidence
+            confidence=avg_confidence,
+            sources=sources
         )
     
-    def _check_wikipedia(self, claim: str, timeout: int) -> DatabaseResult:
-        """Search Wikipedia for claim verification"""
+    # ========================================
+    # CONCURRENT PIPELINE
+    # ========================================
+    
+    def _verify_batch(self, claims: List[str], timeout: float, deadline: float) -> List[Dict]:
+        """
+        Verify claims against the local snapshot, then (opt-in) the live APIs
+        
+        Stage 0 answers Wikipedia/Wikidata from the local snapshot. Stage 1
+        runs the remaining live searches in parallel; stage 2 fetches
+        Wikipedia extracts and PubMed summaries for all claims in batched
+        requests. With neither the snapshot nor the live APIs available
+        there is nothing to check: no results.
+        """
+        if not claims or not self.available_sources():
+            return []
+        
+        # Stage 0: local snapshot (milliseconds, no network)
+        local = {}
+        if self.snapshot is not None:
+            for i, claim in enumerate(claims):
+                keywords = self._extract_keywords(claim)
+                try:
+                    local[(i, 'wikipedia')] = self.snapshot.search_wikipedia(keywords)
+                    local[(i, 'wikidata')] = self.snapshot.search_wikidata(keywords)
+                except Exception as e:
+                    logger.warning("⚠️ Snapshot error: %s", e)
+        
+        # Stage 1: live searches (opt-in and deep analysis mode only; only for
+        # what the snapshot could not answer)
+        searches = {}
+        if self.live_fallback and component_enabled('live_verification'):
+            for i, claim in enumerate(claims):
+                if not local.get((i, 'wikipedia')):
+                    searches[(i, 'wikipedia')] = self.executor.submit(self._search_wikipedia, claim, timeout, deadline)
+                if not local.get((i, 'wikidata')):
+                    searches[(i, 'wikidata')] = self.executor.submit(self._check_wikidata, claim, timeout, deadline)
+                if self._is_scientific_claim(claim):
+                    searches[(i, 'pubmed')] = self.executor.submit(self._search_pubmed, claim, timeout, deadline)
+                if self._is_academic_claim(claim):
+                    searches[(i, 'arxiv')] = self.executor.submit(self._check_arxiv, claim, timeout, deadline)
+        found = self._collect(searches, deadline)
+        
+        # Stage 2: batched follow-up lookups
+        titles = [hit[0] for (_, db), hit in found.items() if db == 'wikipedia' and hit]
+        pubmed_ids = [hit for (_, db), hit in found.items() if db == 'pubmed' and hit]
+        lookups = {}
+        if titles:
+            lookups['wikipedia'] = self.executor.submit(self._get_wikipedia_extracts, titles, timeout, deadline)
+        if pubmed_ids:
+            lookups['pubmed'] = self.executor.submit(self._get_pubmed_titles, pubmed_ids, timeout, deadline)
+        details = self._collect(lookups, deadline)
+        extracts = details.get('wikipedia') or {}
+        pubmed_titles = details.get('pubmed') or {}
+        
+        verified = []
+        for i, claim in enumerate(claims):
+            logger.debug("🔍 [VERIFICATION] Verifying: %s...", claim[:80])
+            results = []
+            
+            # 1. Wikipedia
+            local_hit = local.get((i, 'wikipedia'))
+            hit = found.get((i, 'wikipedia'))
+            if local_hit:
+                title, abstract, url = local_hit
+                results.append(DatabaseResult(
+                    database="Wikipedia",
+                    found=True,
+                    content=abstract[:200],
+                    confidence=self._calculate_match_confidence(claim, abstract),
+                    url=url,
+                    source='snapshot'
+                ))
+            elif hit:
+                title, url = hit
+                content = extracts.get(title, '')
+                results.append(DatabaseResult(
+                    database="Wikipedia",
+                    found=True,
+                    content=content[:200],
+                    confidence=self._calculate_match_confidence(claim, content),
+                    url=url
+                ))
+            else:
+                results.append(DatabaseResult("Wikipedia", False, "", 0, ""))
+            
+            # 2. Wikidata
+            local_hit = local.get((i, 'wikidata'))
+            if local_hit:
+                entity_id, label, description = local_hit
+                results.append(DatabaseResult(
+                    database="Wikidata",
+                    found=True,
+                    content=f"{label}: {description}",
+                    confidence=self._calculate_match_confidence(claim, f"{label} {description}"),
+                    url=f"https://www.wikidata.org/wiki/{entity_id}",
+                    source='snapshot'
+                ))
+            else:
+                results.append(found.get((i, 'wikidata')) or DatabaseResult("Wikidata", False, "", 0, ""))
+            
+            # 3. PubMed (for scientific/medical claims)
+            if (i, 'pubmed') in searches:
+                pubmed_id = found.get((i, 'pubmed'))
+                if pubmed_id and pubmed_id in pubmed_titles:
+                    title = pubmed_titles[pubmed_id]
+                    results.append(DatabaseResult(
+                        database="PubMed",
+                        found=True,
+                        content=title[:200],
+                        confidence=self._calculate_match_confidence(claim, title),
+                        url=f"https://pubmed.ncbi.nlm.nih.gov/{pubmed_id}/"
+                    ))
+                else:
+                    results.append(DatabaseResult("PubMed", False, "", 0, ""))
+            
+            # 4. arXiv (for physics/math/CS claims)
+            if (i, 'arxiv') in searches:
+                results.append(found.get((i, 'arxiv')) or DatabaseResult("arXiv", False, "", 0, ""))
+            
+            verified.append(self._summarize_claim(claim, results))
+        
+        return verified
+    
+    def _summarize_claim(self, claim: str, results: List[DatabaseResult]) -> Dict:
+        """Verdict for one claim from its database results"""
+        # Analyze results for contradictions
+        contradictions = self._detect_contradictions(claim, results)
+        
+        # Calculate verification score
+        found_count = sum(1 for r in results if r.found)
+        total_count = len(results)
+        verification_score = (found_count / total_count) * 100 if total_count > 0 else 0
+        
+        # Calculate average confidence
+        avg_confidence = sum(r.confidence for r in results if r.found) / found_count if found_count > 0 else 0
+        
+        # Determine verdict
+        if found_count == 0:
+            verdict = "UNVERIFIED"
+        elif contradictions:
+            verdict = "CONTRADICTED"
+        elif found_count >= 2 and avg_confidence > 70:
+            verdict = "VERIFIED"
+        else:
+            verdict = "MIXED"
+        
+        logger.debug("✅ Verdict: %s (%s/%s databases)", verdict, found_count, total_count)
+        
+        return {
+            'claim': claim,
+            'verdict': verdict,
+            'verification_score': verification_score,
+            'databases_found': found_count,
+            'databases_checked': total_count,
+            'average_confidence': avg_confidence,
+            'results': [self._database_result_to_dict(r) for r in results],
+            'contradictions': contradictions
+        }
+    
+    def _collect(self, futures: Dict, deadline: float) -> Dict:
+        """Wait for futures until the deadline; late ones count as not found"""
+        if not futures:
+            return {}
+        done, pending = wait(futures.values(), timeout=max(0, deadline - time.monotonic()))
+        if pending:
+            logger.debug("⏱️ Verification deadline reached, %s queries skipped", len(pending))
+            for future in pending:
+                future.cancel()
+        
+        collected = {}
+        for key, future in futures.items():
+            if future in done and future.exception() is None:
+                collected[key] = future.result()
+        return collected
+    
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).hostname or ''
+        with self._host_limits_lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = threading.BoundedSemaphore(HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+                self._host_limits[host] = limit
+            return limit
+    
+    def _get(self, url: str, params: Optional[Dict], timeout: float, deadline: float) -> Optional[requests.Response]:
+        """GET over the pooled session within the host cap and the remaining deadline"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        
+        limit = self._host_limit(url)
+        if not limit.acquire(timeout=remaining):
+            return None
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            read_timeout = min(timeout, remaining)
+            return self.session.get(url, params=params, headers=self.headers,
+                                    timeout=http_timeout(read_timeout, min(HTTP_CONNECT_TIMEOUT, read_timeout)))
+        finally:
+            limit.release()
+    
+    # ========================================
+    # DATABASE QUERIES
+    # ========================================
+    
+    def _search_wikipedia(self, claim: str, timeout: float, deadline: float) -> Optional[Tuple[str, str]]:
+        """Search Wikipedia for the best matching article: (title, url) or None"""
         try:
             # Extract key terms from claim
             keywords = self._extract_keywords(claim)
@@ -181,60 +418,65 @@ class VerificationNetwork:
                 'format': 'json'
             }
             
-            response = requests.get(self.databases['wikipedia'], params=params, timeout=timeout)
+            response = self._get(self.databases['wikipedia'], params, timeout, deadline)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 data = response.json()
                 if len(data) > 1 and len(data[1]) > 0:
                     title = data[1][0]
                     url = data[3][0] if len(data) > 3 else ""
-                    
-                    # Get article content
-                    content = self._get_wikipedia_content(title, timeout)
-                    
-                    # Check if claim content matches article
-                    confidence = self._calculate_match_confidence(claim, content)
-                    
-                    return DatabaseResult(
-                        database="Wikipedia",
-                        found=True,
-                        content=content[:200],
-                        confidence=confidence,
-                        url=url
-                    )
+                    return title, url
             
-            return DatabaseResult("Wikipedia", False, "", 0, "")
+            return None
         
         except Exception as e:
-            print(f"   ⚠️ Wikipedia error: {e}")
-            return DatabaseResult("Wikipedia", False, "", 0, "")
+            logger.warning("⚠️ Wikipedia error: %s", e)
+            return None
     
-    def _get_wikipedia_content(self, title: str, timeout: int) -> str:
-        """Get Wikipedia article content"""
-        try:
-            params = {
-                'action': 'query',
-                'titles': title,
-                'prop': 'extracts',
-                'exintro': True,
-                'explaintext': True,
-                'format': 'json'
-            }
-            
-            response = requests.get(self.databases['wikipedia'], params=params, timeout=timeout)
+    def _get_wikipedia_extracts(self, titles: List[str], timeout: float, deadline: float) -> Dict[str, str]:
+        """Get intro extracts for many articles (batched `titles=A|B|C` requests)"""
+        extracts = {}
+        unique_titles = list(dict.fromkeys(titles))
+        
+        for start in range(0, len(unique_titles), WIKIPEDIA_EXTRACTS_PER_REQUEST):
+            batch = unique_titles[start:start + WIKIPEDIA_EXTRACTS_PER_REQUEST]
+            try:
+                params = {
+                    'action': 'query',
+                    'titles': '|'.join(batch),
+                    'prop': 'extracts',
+                    'exintro': True,
+                    'explaintext': True,
+                    'exlimit': 'max',
+                    'redirects': 1,
+                    'format': 'json'
+                }
+                
+                response = self._get(self.databases['wikipedia'], params, timeout, deadline)
+                if response is None or response.status_code != 200:
+                    continue
+                
+                query = response.json().get('query', {})
+                by_title = {page.get('title'): page.get('extract', '') for page in query.get('pages', {}).values()}
+                
+                # Map requested titles through normalization and redirects
+                aliases = {}
+                for mapping in query.get('normalized', []) + query.get('redirects', []):
+                    aliases[mapping.get('from')] = mapping.get('to')
+                for title in batch:
+                    resolved = title
+                    for _ in range(3):
+                        if resolved in by_title or resolved not in aliases:
+                            break
+                        resolved = aliases[resolved]
+                    extracts[title] = by_title.get(resolved, '')
             
-            if response.status_code == 200:
-                data = response.json()
-                pages = data.get('query', {}).get('pages', {})
-                for page_id, page in pages.items():
-                    return page.get('extract', '')
-        
-        except Exception:
-            pass
+            except Exception as e:
+                logger.warning("⚠️ Wikipedia extracts error: %s", e)
         
-        return ""
+        return extracts
     
-    def _check_wikidata(self, claim: str, timeout: int) -> DatabaseResult:
+    def _check_wikidata(self, claim: str, timeout: float, deadline: float) -> DatabaseResult:
         """Search Wikidata for structured data"""
         try:
             keywords = self._extract_keywords(claim)
@@ -248,9 +490,9 @@ class VerificationNetwork:
                 'format': 'json'
             }
             
-            response = requests.get(self.databases['wikidata'], params=params, timeout=timeout)
+            response = self._get(self.databases['wikidata'], params, timeout, deadline)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 data = response.json()
                 results = data.get('search', [])
                 
@@ -273,11 +515,11 @@ class VerificationNetwork:
             return DatabaseResult("Wikidata", False, "", 0, "")
         
         except Exception as e:
-            print(f"   ⚠️ Wikidata error: {e}")
+            logger.warning("⚠️ Wikidata error: %s", e)
             return DatabaseResult("Wikidata", False, "", 0, "")
     
-    def _check_pubmed(self, claim: str, timeout: int) -> DatabaseResult:
-        """Search PubMed for scientific/medical claims"""
+    def _search_pubmed(self, claim: str, timeout: float, deadline: float) -> Optional[str]:
+        """Search PubMed for scientific/medical claims: best article ID or None"""
         try:
             keywords = self._extract_keywords(claim)
             search_query = ' '.join(keywords[:5])
@@ -291,45 +533,44 @@ class VerificationNetwork:
                 'retmode': 'json'
             }
             
-            response = requests.get(search_url, params=params, timeout=timeout)
+            response = self._get(search_url, params, timeout, deadline)
             
-            if response.status_code == 200:
-                data = response.json()
-                id_list = data.get('esearchresult', {}).get('idlist', [])
-                
+            if response is not None and response.status_code == 200:
+                id_list = response.json().get('esearchresult', {}).get('idlist', [])
                 if id_list:
-                    # Get article details
-                    fetch_url = f"{self.databases['pubmed']}esummary.fcgi"
-                    fetch_params = {
-                        'db': 'pubmed',
-                        'id': id_list[0],
-                        'retmode': 'json'
-                    }
-                    
-                    fetch_response = requests.get(fetch_url, params=fetch_params, timeout=timeout)
-                    
-                    if fetch_response.status_code == 200:
-                        fetch_data = fetch_response.json()
-                        article = fetch_data.get('result', {}).get(id_list[0], {})
-                        title = article.get('title', '')
-                        
-                        confidence = self._calculate_match_confidence(claim, title)
-                        
-                        return DatabaseResult(
-                            database="PubMed",
-                            found=True,
-                            content=title[:200],
-                            confidence=confidence,
-                            url=f"https://pubmed.ncbi.nlm.nih.gov/{id_list[0]}/"
-                        )
+                    return id_list[0]
+            
+            return None
+        
+        except Exception as e:
+            logger.warning("⚠️ PubMed error: %s", e)
+            return None
+    
+    def _get_pubmed_titles(self, pubmed_ids: List[str], timeout: float, deadline: float) -> Dict[str, str]:
+        """Get article titles for many PubMed IDs in one esummary request"""
+        try:
+            fetch_url = f"{self.databases['pubmed']}esummary.fcgi"
+            fetch_params = {
+                'db': 'pubmed',
+                'id': ','.join(dict.fromkeys(pubmed_ids)),
+                'retmode': 'json'
+            }
             
-            return DatabaseResult("PubMed", False, "", 0, "")
+            response = self._get(fetch_url, fetch_params, timeout, deadline)
+            if response is None or response.status_code != 200:
+                return {}
+            
+            result = response.json().get('result', {})
+            return {
+                pubmed_id: result[pubmed_id].get('title', '')
+                for pubmed_id in pubmed_ids if isinstance(result.get(pubmed_id), dict)
+            }
         
         except Exception as e:
-            print(f"   ⚠️ PubMed error: {e}")
-            return DatabaseResult("PubMed", False, "", 0, "")
+            logger.warning("⚠️ PubMed error: %s", e)
+            return {}
     
-    def _check_arxiv(self, claim: str, timeout: int) -> DatabaseResult:
+    def _check_arxiv(self, claim: str, timeout: float, deadline: float) -> DatabaseResult:
         """Search arXiv for academic claims"""
         try:
             keywords = self._extract_keywords(claim)
@@ -337,9 +578,9 @@ class VerificationNetwork:
             
             url = f"{self.databases['arxiv']}?search_query=all:{search_query}&start=0&max_results=3"
             
-            response = requests.get(url, timeout=timeout)
+            response = self._get(url, None, timeout, deadline)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 content = response.text
                 
                 # Parse XML (simple regex-based parsing)
@@ -364,7 +605,7 @@ class VerificationNetwork:
             return DatabaseResult("arXiv", False, "", 0, "")
         
         except Exception as e:
-            print(f"   ⚠️ arXiv error: {e}")
+            logger.warning("⚠️ arXiv error: %s", e)
             return DatabaseResult("arXiv", False, "", 0, "")
     
     def _extract_keywords(self, text: str) -> List[str]:
@@ -440,7 +681,8 @@ class VerificationNetwork:
             'found': result.found,
             'content': result.content,
             'confidence': result.confidence,
-            'url': result.url
+            'url': result.url,
+            'source': result.source
         }
 
 # Singleton instance
@@ -454,9 +696,9 @@ def get_verification_network() -> VerificationNetwork:
     return _verification_network
 
 def verify_claims_network(claims: List[str]) -> Dict:
-    """Verify claims across multiple databases"""
+    """Verify claims across multiple databases (within the current request's deadline)"""
     network = get_verification_network()
-    result = network.verify_multiple_claims(claims)
+    result = network.verify_multiple_claims(claims, deadline_seconds=remaining_time(NETWORK_DEADLINE))
     
     return {
         'total_claims': result.total_claims,
@@ -467,7 +709,8 @@ def verify_claims_network(claims: List[str]) -> Dict:
         'verdict': result.verdict,
         'confidence': result.confidence,
         'database_results': result.database_results,
-        'contradictions': result.contradictions
+        'contradictions': result.contradictions,
+        'sources': result.sources
     }
 
 # Test function